@@ -146,24 +146,43 @@ export function GenerationGrid({
   const handleDownload = async (generation: Generation) => {
     if (!generation.storageUrl) return;
 
-    try {
-      // Add download query parameter to force download instead of inline preview
-      // Also add custom filename based on generation ID
-      const url = new URL(generation.storageUrl);
-      url.searchParams.set("download", "true");
-      url.searchParams.set("filename", `gen-${generation.id}`);
+    const isInline = generation.storageUrl.startsWith("data:");
+    let objectUrl: string | null = null;
 
+    try {
       // Create temporary anchor and trigger download
       const link = document.createElement("a");
-      link.href = url.toString();
-      link.target = "_blank";
+      if (isInline) {
+        // Small text results are inline data URLs, which browsers refuse to
+        // open as a new page, so save them through a blob URL instead
+        const blob = await (await fetch(generation.storageUrl)).blob();
+        objectUrl = URL.createObjectURL(blob);
+        link.href = objectUrl;
+        link.download = `gen-${generation.id}`;
+      } else {
+        // Add download query parameter to force download instead of inline preview
+        // Also add custom filename based on generation ID
+        const url = new URL(generation.storageUrl);
+        url.searchParams.set("download", "true");
+        url.searchParams.set("filename", `gen-${generation.id}`);
+        link.href = url.toString();
+        link.target = "_blank";
+      }
       document.body.appendChild(link);
       link.click();
       document.body.removeChild(link);
     } catch (error) {
       console.error("Failed to download file:", error);
       // Fallback to opening in new tab if download fails
-      window.open(generation.storageUrl, "_blank");
+      if (!isInline) {
+        window.open(generation.storageUrl, "_blank");
+      }
+    } finally {
+      if (objectUrl) {
+        // Revoke once the click has started the download
+        const url = objectUrl;
+        setTimeout(() => URL.revokeObjectURL(url), 0);
+      }
     }
   };
 
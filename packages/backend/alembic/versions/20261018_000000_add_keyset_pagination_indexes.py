@@ -0,0 +1,71 @@
+"""Add composite indexes backing keyset (cursor) pagination
+
+Connection fields page on (sort_key, id) with a row-value comparison, e.g.
+``WHERE board_id = :b AND (created_at, id) < (:ts, :id) ORDER BY created_at
+DESC, id DESC``. These indexes match those shapes so each page is a single
+index seek instead of an OFFSET scan.
+
+Revision ID: 3f9c1e7a2b4d
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c1e7a2b4d'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema name for all Boards tables
+SCHEMA = "boards"
+
+# (index name, table, columns)
+KEYSET_INDEXES = [
+    (
+        "idx_generations_board_created",
+        "generations",
+        ["board_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "idx_generations_tenant_user_created",
+        "generations",
+        ["tenant_id", "user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "idx_boards_owner_updated",
+        "boards",
+        ["owner_id", sa.text("updated_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "idx_boards_owner_created",
+        "boards",
+        ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "idx_boards_tenant_updated",
+        "boards",
+        ["tenant_id", sa.text("updated_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "idx_tags_tenant_name",
+        "tags",
+        ["tenant_id", "name", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create composite indexes for cursor-paginated queries."""
+    for name, table, columns in KEYSET_INDEXES:
+        op.create_index(name, table, columns, unique=False, schema=SCHEMA)
+
+
+def downgrade() -> None:
+    """Drop composite keyset pagination indexes."""
+    for name, table, _columns in reversed(KEYSET_INDEXES):
+        op.drop_index(name, table_name=table, schema=SCHEMA)
@@ -0,0 +1,75 @@
+"""Add composite and partial indexes for generation query shapes
+
+Replaces the low-selectivity single-column ``status`` index and the
+``board_id``/``tenant_id`` indexes (now left-prefixes of composite indexes)
+with indexes matched to how generations are actually queried:
+
+- board listings filtered by status, ordered by created_at
+- tenant-wide listings filtered by status, ordered by created_at
+- worker sweeps over in-flight rows (status pending/processing), served by a
+  small partial index that only contains active jobs
+
+Revision ID: 7d2a9c4f1e6b
+Revises: 3f9c1e7a2b4d
+Create Date: 2026-10-18 00:01:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2a9c4f1e6b"
+down_revision: Union[str, Sequence[str], None] = "3f9c1e7a2b4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema name for all Boards tables
+SCHEMA = "boards"
+
+ACTIVE_STATUSES_PREDICATE = "status IN ('pending', 'processing')"
+
+
+def upgrade() -> None:
+    """Create composite/partial generation indexes and drop redundant ones."""
+    op.create_index(
+        "idx_generations_board_status_created",
+        "generations",
+        ["board_id", "status", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        schema=SCHEMA,
+    )
+    op.create_index(
+        "idx_generations_tenant_status_created",
+        "generations",
+        ["tenant_id", "status", sa.text("created_at DESC")],
+        unique=False,
+        schema=SCHEMA,
+    )
+    op.create_index(
+        "idx_generations_active",
+        "generations",
+        ["updated_at"],
+        unique=False,
+        schema=SCHEMA,
+        postgresql_where=sa.text(ACTIVE_STATUSES_PREDICATE),
+    )
+
+    # Covered by idx_generations_board_created / idx_generations_tenant_user_created
+    op.drop_index("idx_generations_board", table_name="generations", schema=SCHEMA)
+    op.drop_index("idx_generations_tenant", table_name="generations", schema=SCHEMA)
+    # Covered by idx_generations_active and the (..., status, ...) composites
+    op.drop_index("idx_generations_status", table_name="generations", schema=SCHEMA)
+
+
+def downgrade() -> None:
+    """Restore single-column generation indexes."""
+    op.create_index("idx_generations_status", "generations", ["status"], schema=SCHEMA)
+    op.create_index("idx_generations_tenant", "generations", ["tenant_id"], schema=SCHEMA)
+    op.create_index("idx_generations_board", "generations", ["board_id"], schema=SCHEMA)
+
+    op.drop_index("idx_generations_active", table_name="generations", schema=SCHEMA)
+    op.drop_index("idx_generations_tenant_status_created", table_name="generations", schema=SCHEMA)
+    op.drop_index("idx_generations_board_status_created", table_name="generations", schema=SCHEMA)
@@ -0,0 +1,61 @@
+"""Add trigram board search and full-text generation prompt search indexes
+
+- pg_trgm GIN indexes on boards.title / boards.description so the existing
+  ``ILIKE '%query%'`` board search is index-backed instead of a full scan.
+- A GIN expression index over ``to_tsvector('english', input_params->>'prompt')``
+  backing the ranked ``searchGenerations`` query. The expression must stay in
+  sync with ``GENERATION_PROMPT_TSVECTOR`` in ``boards.dbmodels``.
+
+Revision ID: c5e8b2d47a91
+Revises: 7d2a9c4f1e6b
+Create Date: 2026-10-18 00:02:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e8b2d47a91"
+down_revision: Union[str, Sequence[str], None] = "7d2a9c4f1e6b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema name for all Boards tables
+SCHEMA = "boards"
+
+GENERATION_PROMPT_TSVECTOR = "to_tsvector('english', coalesce(input_params ->> 'prompt', ''))"
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and create search indexes."""
+    # Trusted extension on PostgreSQL 13+ (in public schema, accessible everywhere)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    op.create_index(
+        "idx_boards_title_trgm",
+        "boards",
+        ["title"],
+        schema=SCHEMA,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_boards_description_trgm",
+        "boards",
+        ["description"],
+        schema=SCHEMA,
+        postgresql_using="gin",
+        postgresql_ops={"description": "gin_trgm_ops"},
+    )
+    op.execute(
+        f"CREATE INDEX idx_generations_prompt_fts ON {SCHEMA}.generations "
+        f"USING gin ({GENERATION_PROMPT_TSVECTOR});"
+    )
+
+
+def downgrade() -> None:
+    """Drop search indexes (the pg_trgm extension is left installed)."""
+    op.execute(f"DROP INDEX IF EXISTS {SCHEMA}.idx_generations_prompt_fts;")
+    op.drop_index("idx_boards_description_trgm", table_name="boards", schema=SCHEMA)
+    op.drop_index("idx_boards_title_trgm", table_name="boards", schema=SCHEMA)
@@ -0,0 +1,84 @@
+"""Add generation_lineage edge table and backfill from input_artifacts
+
+Ancestry/descendant traversal previously expanded the ``input_artifacts``
+JSONB of every visited row at each recursion level. This materializes the
+same information as normalized (parent_id, child_id, role) edges so the
+recursive CTEs can walk plain B-tree indexes and carry only IDs.
+
+Revision ID: 9b4e6f1a8c27
+Revises: c5e8b2d47a91
+Create Date: 2026-10-18 00:03:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e6f1a8c27"
+down_revision: Union[str, Sequence[str], None] = "c5e8b2d47a91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema name for all Boards tables
+SCHEMA = "boards"
+
+
+def upgrade() -> None:
+    """Create generation_lineage and backfill edges from existing generations."""
+    op.create_table(
+        "generation_lineage",
+        sa.Column("parent_id", sa.Uuid(), nullable=False),
+        sa.Column("child_id", sa.Uuid(), nullable=False),
+        sa.Column("role", sa.String(length=50), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["parent_id"],
+            [f"{SCHEMA}.generations.id"],
+            name="generation_lineage_parent_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["child_id"],
+            [f"{SCHEMA}.generations.id"],
+            name="generation_lineage_child_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("parent_id", "child_id", "role", name="generation_lineage_pkey"),
+        schema=SCHEMA,
+    )
+    op.create_index(
+        "idx_generation_lineage_child",
+        "generation_lineage",
+        ["child_id", "parent_id"],
+        unique=False,
+        schema=SCHEMA,
+    )
+
+    # Backfill, skipping references to generations that no longer exist
+    op.execute(f"""
+        INSERT INTO {SCHEMA}.generation_lineage (parent_id, child_id, role)
+        SELECT DISTINCT
+            (artifact->>'generation_id')::uuid,
+            g.id,
+            COALESCE(artifact->>'role', 'input')
+        FROM {SCHEMA}.generations g
+        CROSS JOIN LATERAL jsonb_array_elements(g.input_artifacts) AS artifact
+        JOIN {SCHEMA}.generations parent
+            ON parent.id = (artifact->>'generation_id')::uuid
+        WHERE jsonb_typeof(g.input_artifacts) = 'array'
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    """Drop generation_lineage."""
+    op.drop_index("idx_generation_lineage_child", table_name="generation_lineage", schema=SCHEMA)
+    op.drop_table("generation_lineage", schema=SCHEMA)
@@ -0,0 +1,61 @@
+"""Add generation_outbox table for transactional job enqueueing
+
+New generations get an outbox row in the same transaction. A relay hands
+outbox rows to admission control / the job queue in batches and deletes them,
+so a generation committed while Redis is unavailable is enqueued later instead
+of being lost.
+
+Revision ID: 2c7f4d9e8a13
+Revises: 9b4e6f1a8c27
+Create Date: 2026-10-18 00:04:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2c7f4d9e8a13"
+down_revision: Union[str, Sequence[str], None] = "9b4e6f1a8c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema name for all Boards tables
+SCHEMA = "boards"
+
+
+def upgrade() -> None:
+    """Create generation_outbox."""
+    op.create_table(
+        "generation_outbox",
+        sa.Column("generation_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["generation_id"],
+            [f"{SCHEMA}.generations.id"],
+            name="generation_outbox_generation_id_fkey",
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("generation_id", name="generation_outbox_pkey"),
+        schema=SCHEMA,
+    )
+    op.create_index(
+        "idx_generation_outbox_created",
+        "generation_outbox",
+        ["created_at"],
+        unique=False,
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Drop generation_outbox."""
+    op.drop_index("idx_generation_outbox_created", table_name="generation_outbox", schema=SCHEMA)
+    op.drop_table("generation_outbox", schema=SCHEMA)
@@ -0,0 +1,39 @@
+"""Add generations.external_job_generator
+
+Records which generator submitted a generation's external_job_id. With
+failover a job may be served by an equivalent generator on another provider,
+and a retried attempt must resume the provider job with that generator.
+
+Revision ID: 5e1a7c3b9d42
+Revises: 2c7f4d9e8a13
+Create Date: 2026-10-18 00:05:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e1a7c3b9d42"
+down_revision: Union[str, Sequence[str], None] = "2c7f4d9e8a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Schema name for all Boards tables
+SCHEMA = "boards"
+
+
+def upgrade() -> None:
+    """Add external_job_generator to generations."""
+    op.add_column(
+        "generations",
+        sa.Column("external_job_generator", sa.String(length=100), nullable=True),
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Drop external_job_generator from generations."""
+    op.drop_column("generations", "external_job_generator", schema=SCHEMA)
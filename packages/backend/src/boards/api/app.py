@@ -2,8 +2,9 @@
 Main FastAPI application for Boards backend
 """
 
+import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,8 +12,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from ..config import initialize_generator_api_keys, settings
 from ..database import init_database
 from ..generators.loader import load_generators_from_config
+from ..http_client import close_http_client
 from ..logging import configure_logging, get_logger
-from ..middleware import LoggingContextMiddleware, TenantRoutingMiddleware
+from ..middleware import (
+    LoggingContextMiddleware,
+    TenantRoutingMiddleware,
+    UploadSizeLimitMiddleware,
+)
+from ..storage.renditions import shutdown_rendition_pool
 
 # Configure logging before creating logger
 configure_logging(debug=settings.debug, google_logging_compat=settings.google_logging_compat)
@@ -85,10 +92,24 @@ async def lifespan(app: FastAPI):
             note="Application will continue but may have configuration issues",
         )
 
+    # Enqueue generations left in the outbox (see jobs/outbox.py)
+    relay_task = None
+    if settings.generation_outbox_relay_enabled:
+        from ..workers.relay import run_relay
+
+        relay_task = asyncio.create_task(run_relay())
+        logger.info("Outbox relay started")
+
     yield
 
     # Shutdown
     logger.info("Shutting down Boards API...")
+    if relay_task is not None:
+        relay_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await relay_task
+    await close_http_client()
+    shutdown_rendition_pool()
 
 
 def create_app() -> FastAPI:
@@ -102,6 +123,10 @@ def create_app() -> FastAPI:
         debug=settings.debug,
     )
 
+    # Refuse oversized uploads while they are received (innermost, so errors
+    # raised while the body is read reach the exception handlers directly)
+    app.add_middleware(UploadSizeLimitMiddleware)
+
     # Add tenant routing middleware first (runs before logging)
     app.add_middleware(TenantRoutingMiddleware)
 
@@ -8,10 +8,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...config import settings
 from ...database.connection import get_db_session
 from ...jobs import repository as jobs_repo
+from ...jobs.admission import AdmissionController
 from ...logging import get_logger
-from ...workers.actors import process_generation
+from ...workers.relay import relay_committed_generations
 from ..auth import AuthenticatedUser, get_current_user
 
 logger = get_logger(__name__)
@@ -33,6 +35,14 @@ class SubmitGenerationResponse(BaseModel):
     generation_id: UUID
 
 
+class QueueWaitResponse(BaseModel):
+    tenant_id: str
+    samples: int
+    p50_seconds: float | None
+    p90_seconds: float | None
+    p99_seconds: float | None
+
+
 @router.post("/generations", response_model=SubmitGenerationResponse)
 async def submit_generation(
     body: SubmitGenerationRequest,
@@ -60,13 +70,12 @@ async def submit_generation(
             input_params=body.input_params,
         )
 
-        # Commit the transaction to ensure job is persisted before enqueueing
+        # Committing also commits the job's outbox row, so it cannot be lost
         await db.commit()
         logger.info(f"Created generation job {gen.id} for user {current_user.user_id}")
 
-        # Enqueue job for processing
-        process_generation.send(str(gen.id))
-        logger.info(f"Enqueued generation job {gen.id}")
+        # Enqueue job for processing (deferred if the tenant or user is at their limit)
+        await relay_committed_generations()
 
         return SubmitGenerationResponse(generation_id=gen.id)
 
@@ -74,3 +83,24 @@ async def submit_generation(
         logger.error(f"Failed to submit generation: {e}")
         await db.rollback()
         raise HTTPException(status_code=500, detail=f"Failed to submit generation: {str(e)}") from e
+
+
+@router.get("/queue-wait", response_model=QueueWaitResponse)
+async def get_queue_wait(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> QueueWaitResponse:
+    """Queue-wait percentiles for the authenticated user's tenant.
+
+    Measured from submission to a worker starting the job, so time spent
+    deferred by admission control is included.
+    """
+    stats = await AdmissionController.from_settings(settings).queue_wait_stats(
+        str(current_user.tenant_id)
+    )
+    return QueueWaitResponse(
+        tenant_id=stats.tenant_id,
+        samples=stats.samples,
+        p50_seconds=stats.p50,
+        p90_seconds=stats.p90,
+        p99_seconds=stats.p99,
+    )
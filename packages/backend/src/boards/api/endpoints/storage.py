@@ -4,16 +4,28 @@ Storage endpoints for file uploads and management
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse, RedirectResponse
 
+from ...config import settings
 from ...logging import get_logger
+from ...storage.base import SecurityException, StorageException, StorageProvider
 from ...storage.factory import create_storage_manager
 from ...storage.implementations.local import LocalStorageProvider
+from ...storage.renditions import (
+    RENDITION_FORMATS,
+    RenditionError,
+    ensure_rendition,
+    is_rendition_source,
+)
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+DEFAULT_RENDITION_FORMAT = "webp"
+# Rendition keys derive from their source key, which is never reused
+RENDITION_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 
 @router.get("/status")
 async def storage_status():
@@ -57,17 +69,153 @@ def _get_extension_from_content_type(content_type: str) -> str:
     return content_type_map.get(content_type.lower(), "")
 
 
+async def _get_rendition(
+    provider: StorageProvider, full_path: str, width: int | None, fmt: str | None
+) -> str:
+    """Validate a rendition request and return the storage key of the rendition."""
+    fmt = (fmt or DEFAULT_RENDITION_FORMAT).lower()
+    if fmt not in RENDITION_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported rendition format: {fmt}")
+    # Only a fixed set of widths, so requests cannot fill storage with renditions
+    if width is not None and width not in settings.rendition_widths:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported rendition width: {width}; use one of {settings.rendition_widths}",
+        )
+
+    metadata = await provider.get_metadata(full_path)
+    if not str(metadata.get("content_type", "")).startswith("image/"):
+        raise HTTPException(status_code=400, detail="Renditions are only available for images")
+    if not is_rendition_source(full_path, metadata):
+        raise HTTPException(
+            status_code=400, detail="Renditions are only available for original images"
+        )
+
+    try:
+        return await ensure_rendition(provider, full_path, width=width, fmt=fmt)
+    except RenditionError as e:
+        logger.warning("Failed to render image", path=full_path, error=str(e))
+        raise HTTPException(status_code=415, detail="Image could not be rendered") from e
+
+
+@router.put("/upload/{full_path:path}")
+async def upload_file(full_path: str, request: Request, expires: int, signature: str):
+    """Receive a direct upload to local storage.
+
+    This is the target of the signed URLs returned by the local provider's
+    `get_presigned_upload_url`, standing in for a cloud bucket's presigned PUT.
+    The body is streamed to disk.
+
+    Args:
+        full_path: Storage key the URL was signed for
+        request: The request whose body is the file
+        expires: Expiry of the signed URL (Unix time)
+        signature: Signature of the URL
+    """
+    local_provider = create_storage_manager().providers.get("local")
+    if not isinstance(local_provider, LocalStorageProvider):
+        raise HTTPException(status_code=404, detail="Local storage provider not configured")
+
+    content_type = request.headers.get("content-type", "application/octet-stream")
+    if not local_provider.verify_upload_signature(full_path, content_type, expires, signature):
+        raise HTTPException(status_code=403, detail="Invalid or expired upload URL")
+
+    received = 0
+
+    async def body():
+        nonlocal received
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > settings.max_upload_size:
+                raise StorageException("Upload exceeds maximum allowed size")
+            yield chunk
+
+    try:
+        await local_provider.upload(full_path, body(), content_type, {"content_type": content_type})
+    except StorageException as e:
+        if received > settings.max_upload_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds maximum allowed size of {settings.max_upload_size} bytes",
+            ) from e
+        logger.error("Direct upload failed", path=full_path, error=str(e))
+        raise HTTPException(status_code=500, detail="Upload failed") from e
+
+    logger.info("Direct upload stored", path=full_path, size=received)
+    return Response(status_code=204)
+
+
+@router.get("/renditions/{provider_name}/{full_path:path}")
+async def redirect_to_rendition(
+    provider_name: str,
+    full_path: str,
+    w: int | None = None,
+    fmt: str | None = None,
+):
+    """Redirect to a resized or transcoded rendition of an image in any provider.
+
+    Works like the `w`/`fmt` parameters of the local file route, for files
+    whose provider serves them itself (S3, GCS, Supabase, ...). The rendition
+    is rendered on first request and stored next to the original in the same
+    provider; the response redirects to its public URL.
+
+    Args:
+        provider_name: Name of the storage provider holding the image
+        full_path: Storage key of the original image
+        w: Rendition width in pixels (one of the configured rendition widths)
+        fmt: Rendition format (webp, jpeg or png; defaults to webp)
+    """
+    storage_manager = create_storage_manager()
+    provider = storage_manager.providers.get(provider_name)
+    if provider is None:
+        raise HTTPException(status_code=404, detail="Storage provider not configured")
+
+    try:
+        storage_manager._validate_storage_key(full_path)
+    except SecurityException as e:
+        logger.warning("Invalid rendition source key", requested_path=full_path)
+        raise HTTPException(status_code=403, detail="Access denied") from e
+
+    try:
+        if not await provider.exists(full_path):
+            raise HTTPException(status_code=404, detail="File not found")
+        rendition = await _get_rendition(provider, full_path, w, fmt)
+        url = await provider.get_public_url(rendition)
+    except StorageException as e:
+        logger.error(
+            "Failed to get rendition", provider=provider_name, path=full_path, error=str(e)
+        )
+        raise HTTPException(status_code=502, detail="Storage provider error") from e
+
+    # The rendition's key (and so its URL) never changes for a given request
+    return RedirectResponse(
+        url, status_code=307, headers={"Cache-Control": RENDITION_CACHE_CONTROL}
+    )
+
+
 @router.get("/{full_path:path}")
-async def serve_file(full_path: str, download: bool = False, filename: str | None = None):
+async def serve_file(
+    full_path: str,
+    download: bool = False,
+    filename: str | None = None,
+    w: int | None = None,
+    fmt: str | None = None,
+):
     """Serve a file from local storage.
 
     This endpoint serves files that were uploaded to local storage.
     The full_path includes the tenant_id/artifact_type/board_id/artifact_id/variant structure.
 
+    With `w` and/or `fmt`, a resized or transcoded rendition of an image is
+    served instead (e.g. `?w=512&fmt=webp`). It is rendered on first request,
+    stored next to the original and served with long-lived cache headers.
+
     Args:
         full_path: Path to the file in storage
         download: If True, force download with Content-Disposition: attachment
         filename: Optional custom filename (without extension) to use for download
+        w: Rendition width in pixels (one of the configured rendition widths)
+        fmt: Rendition format (webp, jpeg or png; defaults to webp)
     """
     try:
         logger.info("Serving file", full_path=full_path, download=download, filename=filename)
@@ -106,6 +254,12 @@ async def serve_file(full_path: str, download: bool = False, filename: str | Non
         if not file_path.is_file():
             raise HTTPException(status_code=400, detail="Path is not a file")
 
+        cache_control = None
+        if w is not None or fmt is not None:
+            full_path = await _get_rendition(local_provider, full_path, w, fmt)
+            file_path = Path(base_path) / full_path
+            cache_control = RENDITION_CACHE_CONTROL
+
         # Determine the proper filename with extension
         base_filename = filename if filename else file_path.stem
         final_filename = file_path.name
@@ -145,6 +299,8 @@ async def serve_file(full_path: str, download: bool = False, filename: str | Non
             # We have proper metadata, suggest filename but allow inline preview
             headers["Content-Disposition"] = f'inline; filename="{final_filename}"'
         # else: No Content-Disposition header - let browser decide based on content-type
+        if cache_control:
+            headers["Cache-Control"] = cache_control
 
         return FileResponse(file_path, filename=final_filename, headers=headers)
 
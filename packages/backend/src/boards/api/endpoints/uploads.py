@@ -1,19 +1,107 @@
 """File upload endpoints for artifact uploads."""
 
 import os
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from pydantic import BaseModel
 
 from ...auth import get_auth_context
 from ...auth.context import AuthContext
 from ...config import settings
 from ...logging import get_logger
+from ...storage.base import FileTooLargeException
+
+if TYPE_CHECKING:
+    from ...dbmodels import Generations
+    from ...graphql.types.generation import Generation as GenerationType
 
 router = APIRouter(prefix="/uploads", tags=["uploads"])
 logger = get_logger(__name__)
 
+# Uploads are streamed to storage in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _file_too_large(size: int | None = None) -> HTTPException:
+    if size is None:
+        detail = f"File exceeds maximum allowed size of {settings.max_upload_size} bytes"
+    else:
+        detail = (
+            f"File size {size} bytes exceeds maximum allowed size "
+            f"of {settings.max_upload_size} bytes"
+        )
+    return HTTPException(status_code=413, detail=detail)
+
+
+def _exceeded_size_limit(error: BaseException) -> bool:
+    """Whether an upload failed because its content went over a size limit."""
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, FileTooLargeException):
+            return True
+        cause = cause.__cause__
+    return False
+
+
+class DirectUploadRequest(BaseModel):
+    board_id: UUID
+    artifact_type: str  # image, video, audio, text
+    filename: str
+    content_type: str
+    size: int
+    # Optional hex SHA-256 digest, verified when the upload is completed
+    sha256: str | None = None
+    user_description: str | None = None
+    parent_generation_id: UUID | None = None
+
+
+def _require_user(auth_context: AuthContext) -> None:
+    if not auth_context.is_authenticated or not auth_context.user_id:
+        raise HTTPException(
+            status_code=401,
+            detail="Authentication required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def _generation_response(generation: "GenerationType") -> dict:
+    return {
+        "id": str(generation.id),
+        "status": generation.status.value,
+        "storageUrl": generation.storage_url,
+        "thumbnailUrl": generation.thumbnail_url,
+        "artifactType": generation.artifact_type.value,
+        "generatorName": generation.generator_name,
+    }
+
+
+def _generation_row_response(generation: "Generations") -> dict:
+    return {
+        "id": str(generation.id),
+        "status": generation.status,
+        "storageUrl": generation.storage_url,
+        "thumbnailUrl": generation.thumbnail_url,
+        "artifactType": generation.artifact_type,
+        "generatorName": generation.generator_name,
+    }
+
+
+async def _read_chunks(file: UploadFile, first_chunk: bytes) -> AsyncIterator[bytes]:
+    """Yield the rest of an uploaded file, enforcing the size limit as it is read."""
+    size = len(first_chunk)
+    chunk = first_chunk
+    while chunk:
+        yield chunk
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        size += len(chunk)
+        if size > settings.max_upload_size:
+            raise FileTooLargeException(
+                f"File size exceeds maximum allowed size of {settings.max_upload_size} bytes"
+            )
+
 
 @router.post("/artifact")
 async def upload_artifact_file(
@@ -27,6 +115,9 @@ async def upload_artifact_file(
     """
     Upload artifact file (synchronous).
 
+    The file is streamed to storage in chunks rather than read into memory, and
+    its MIME type is sniffed from the first chunk.
+
     Args:
         board_id: UUID of the board to upload to
         artifact_type: Type of artifact (image, video, audio, text)
@@ -42,14 +133,10 @@ async def upload_artifact_file(
         HTTPException: If validation fails or upload errors occur
     """
     from ...graphql.resolvers.upload import upload_artifact_from_file
+    from ...uploads import detect_content_type
 
     # Validate authentication
-    if not auth_context.is_authenticated or not auth_context.user_id:
-        raise HTTPException(
-            status_code=401,
-            detail="Authentication required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    _require_user(auth_context)
 
     # Validate artifact type
     valid_types = {"image", "video", "audio", "text"}
@@ -59,25 +146,9 @@ async def upload_artifact_file(
             detail=f"Invalid artifact_type. Must be one of: {', '.join(valid_types)}",
         )
 
-    # Read file content
-    try:
-        content = await file.read()
-    except Exception as e:
-        logger.error("Failed to read uploaded file", error=str(e), filename=file.filename)
-        raise HTTPException(
-            status_code=400,
-            detail="Failed to read uploaded file",
-        ) from e
-
-    # Validate file size
-    if len(content) > settings.max_upload_size:
-        raise HTTPException(
-            status_code=413,
-            detail=(
-                f"File size {len(content)} bytes exceeds maximum allowed size "
-                f"of {settings.max_upload_size} bytes"
-            ),
-        )
+    # Validate file size (the multipart parser has already counted the bytes)
+    if file.size is not None and file.size > settings.max_upload_size:
+        raise _file_too_large(file.size)
 
     # Validate extension
     file_ext = os.path.splitext(file.filename or "")[1].lower()
@@ -101,15 +172,26 @@ async def upload_artifact_file(
             detail="Invalid board_id or parent_generation_id format",
         ) from e
 
+    # Sniff the MIME type from the first chunk
+    try:
+        first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    except Exception as e:
+        logger.error("Failed to read uploaded file", error=str(e), filename=file.filename)
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to read uploaded file",
+        ) from e
+    content_type = detect_content_type(first_chunk, file.content_type)
+
     # Call resolver
     try:
         generation = await upload_artifact_from_file(
             auth_context=auth_context,
             board_id=board_uuid,
             artifact_type=artifact_type,
-            file_content=content,
+            file_content=_read_chunks(file, first_chunk),
             filename=file.filename,
-            content_type=file.content_type,
+            content_type=content_type,
             user_description=user_description,
             parent_generation_id=parent_uuid,
         )
@@ -118,19 +200,16 @@ async def upload_artifact_file(
             "File upload successful",
             generation_id=str(generation.id),
             artifact_type=artifact_type,
-            file_size=len(content),
+            file_size=generation.output_metadata.get("file_size"),
         )
 
-        return {
-            "id": str(generation.id),
-            "status": generation.status.value,
-            "storageUrl": generation.storage_url,
-            "thumbnailUrl": generation.thumbnail_url,
-            "artifactType": generation.artifact_type.value,
-            "generatorName": generation.generator_name,
-        }
+        return _generation_response(generation)
 
     except RuntimeError as e:
+        # The resolver wraps storage errors, including a stream cut off at the limit
+        if _exceeded_size_limit(e):
+            logger.warning("Upload exceeded the size limit", error=str(e))
+            raise _file_too_large() from e
         # These are expected errors (permission denied, board not found, etc.)
         # Pass through the message since these are safe, user-facing errors
         logger.warning("Upload failed", error=str(e))
@@ -147,3 +226,97 @@ async def upload_artifact_file(
             status_code=500,
             detail="An unexpected error occurred during upload",
         ) from e
+
+
+@router.post("/direct")
+async def reserve_direct_upload(
+    request: DirectUploadRequest,
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> dict:
+    """
+    Reserve a direct-to-storage upload (step 1 of 2).
+
+    Creates a pending generation and returns a presigned request for uploading
+    the file straight to the storage provider, so its bytes bypass the API.
+    Send the file as described by `upload` (a PUT of the raw file with the
+    given headers, or a multipart POST of `fields` plus the file as `file`),
+    then call POST /uploads/direct/{id}/complete.
+
+    Returns:
+        The pending generation's ID and the presigned upload
+        (url, method, fields, headers, expiresAt)
+
+    Raises:
+        HTTPException: If validation fails
+    """
+    from ...uploads import reserve_direct_upload as reserve
+
+    _require_user(auth_context)
+
+    file_ext = os.path.splitext(request.filename)[1].lower()
+    if file_ext and file_ext not in settings.allowed_upload_extensions:
+        raise HTTPException(status_code=400, detail=f"File extension '{file_ext}' is not allowed")
+    if request.size > settings.max_upload_size:
+        raise _file_too_large(request.size)
+
+    try:
+        generation, target = await reserve(
+            auth_context=auth_context,
+            board_id=request.board_id,
+            artifact_type=request.artifact_type,
+            filename=request.filename,
+            content_type=request.content_type,
+            size=request.size,
+            sha256=request.sha256,
+            user_description=request.user_description,
+            parent_generation_id=request.parent_generation_id,
+        )
+    except (RuntimeError, ValueError) as e:
+        logger.warning("Direct upload reservation failed", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return {
+        "id": str(generation.id),
+        "status": generation.status,
+        "artifactType": generation.artifact_type,
+        "generatorName": generation.generator_name,
+        "upload": {
+            "url": target.upload["url"],
+            "method": target.upload.get("method", "PUT"),
+            "fields": target.upload.get("fields") or {},
+            "headers": target.upload.get("headers") or {},
+            "expiresAt": target.upload.get("expires_at"),
+        },
+    }
+
+
+@router.post("/direct/{generation_id}/complete")
+async def complete_direct_upload(
+    generation_id: UUID,
+    auth_context: AuthContext = Depends(get_auth_context),
+) -> dict:
+    """
+    Complete a direct-to-storage upload (step 2 of 2).
+
+    Verifies the stored object's size, content type and (if one was given)
+    SHA-256 digest against the reservation and completes the generation. A
+    mismatching object is deleted and the generation fails. Completing a
+    completed upload again returns it unchanged.
+
+    Returns:
+        Generation object as JSON
+
+    Raises:
+        HTTPException: If the upload is missing or fails verification
+    """
+    from ...uploads import complete_direct_upload as complete
+
+    _require_user(auth_context)
+
+    try:
+        generation = await complete(auth_context=auth_context, generation_id=generation_id)
+    except RuntimeError as e:
+        logger.warning("Direct upload completion failed", error=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return _generation_row_response(generation)
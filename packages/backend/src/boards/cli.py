@@ -322,6 +322,70 @@ def audit_tenant_isolation(tenant_slug: str | None, output_format: str) -> None:
     asyncio.run(do_audit())
 
 
+@cli.group()
+def generators() -> None:
+    """Manage generator configuration."""
+    pass
+
+
+@generators.command("build-manifest")
+@click.option(
+    "--config",
+    "config_path",
+    default=None,
+    help="Generators config file (default: BOARDS_GENERATORS_CONFIG_PATH)",
+)
+@click.option(
+    "--output",
+    required=True,
+    type=click.Path(dir_okay=False, writable=True),
+    help="Path to write the manifest JSON to",
+)
+def build_generators_manifest(config_path: str | None, output: str) -> None:
+    """Build a generators manifest for lazy generator loading."""
+    from boards.config import settings
+    from boards.generators.loader import build_generators_manifest as build_manifest
+    from boards.generators.manifest import write_manifest
+
+    configure_logging()
+
+    config_path = config_path or settings.generators_config_path
+    if not config_path:
+        click.echo(
+            "✗ No generators config given (--config or BOARDS_GENERATORS_CONFIG_PATH)", err=True
+        )
+        sys.exit(1)
+
+    try:
+        manifest = build_manifest(config_path)
+        write_manifest(manifest, output)
+    except Exception as e:
+        logger.error("Failed to build generators manifest", error=str(e))
+        click.echo(f"✗ Error building generators manifest: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✓ Wrote {len(manifest.entries)} generator(s) to {output}")
+
+
+@cli.command("reap-jobs")
+def reap_jobs() -> None:
+    """Requeue generations whose worker stopped sending heartbeats."""
+    import asyncio
+
+    from boards.workers.reaper import reap_expired_leases
+
+    configure_logging()
+
+    try:
+        reaped = asyncio.run(reap_expired_leases())
+    except Exception as e:
+        logger.error("Failed to reap jobs", error=str(e))
+        click.echo(f"✗ Error reaping jobs: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✓ Reaped {reaped} generation(s)")
+
+
 @cli.command()
 def seed() -> None:
     """Seed the database with initial data."""
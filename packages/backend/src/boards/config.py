@@ -49,7 +49,19 @@ class Settings(BaseSettings):
 
     # Generators Configuration
     generators_config_path: str | None = None
+    # Prebuilt manifest (boards generators build-manifest) for lazy generator imports
+    generators_manifest_path: str | None = None
     generator_api_keys: dict[str, str] = {}
+    # Circuit breakers for failover between equivalent generators (the
+    # `equivalents` section of generators.yaml; see generators/failover.py)
+    generator_breaker_window: int = 20
+    generator_breaker_min_samples: int = 5
+    generator_breaker_failure_rate: float = 0.5
+    generator_breaker_slow_call_seconds: float = 900.0
+    generator_breaker_cooldown_seconds: float = 60.0
+    # Cluster-wide provider rate/concurrency limits keyed by provider or
+    # "provider:endpoint" (see generators/provider_limits.py)
+    provider_limits: dict[str, dict[str, float]] = {}
 
     # Environment
     environment: str = "development"  # 'development', 'staging', 'production'
@@ -82,9 +94,68 @@ class Settings(BaseSettings):
     # Job Queue Settings
     job_queue_name: str = "boards-jobs"
     job_timeout: int = 3600  # 1 hour default timeout
+    # How often running jobs check for a cancellation request (seconds)
+    generation_cancel_poll_interval: float = 1.0
+    # Admission control: generations beyond these in-flight limits are deferred
+    # (not rejected) and dispatched fairly across tenants as slots free up.
+    # 0 disables a limit. Off by default; enable it for multi-tenant deployments.
+    generation_admission_enabled: bool = False
+    generation_max_in_flight_per_tenant: int = 20
+    generation_max_in_flight_per_user: int = 10
+    # Cluster-wide cap (e.g. total worker threads); when reached, freed slots go
+    # to tenants in weighted fair order
+    generation_max_in_flight_total: int = 0
+    # Relative share of dispatch slots per tenant ID (tenants not listed get 1.0)
+    generation_tenant_weights: dict[str, float] = {}
+    # In-flight slots expire after this long so a crashed worker cannot leak them
+    generation_slot_ttl_seconds: int = 3600
+    # Transactional outbox (see jobs/outbox.py): API processes relay committed
+    # generations to the queue in batches of this size
+    generation_outbox_relay_enabled: bool = True
+    generation_outbox_batch_size: int = 100
+    generation_outbox_poll_interval: float = 1.0
+    # Pending generations untouched for this long are re-enqueued if their queue message was lost
+    generation_stale_pending_seconds: int = 600
+    generation_outbox_sweep_interval: float = 60.0
+    # Running generations hold a Redis lease renewed every heartbeat interval;
+    # the reaper requeues generations whose lease expired (see jobs/heartbeats.py)
+    generation_heartbeat_interval: float = 10.0
+    generation_lease_ttl_seconds: float = 60.0
+    generation_reaper_interval: float = 30.0
+    # Requeues by the reaper before the generation is marked failed
+    generation_max_reaps: int = 2
+
+    # Renditions: WebP thumbnails of completed image/video generations are
+    # rendered on the previews queue, on-demand renditions by the API; both in
+    # a process pool (see storage/renditions.py)
+    generation_thumbnails_enabled: bool = True
+    thumbnail_max_size: int = 512
+    rendition_process_workers: int = 2
+    # Widths served by the on-demand rendition endpoint (/api/storage/...?w=512)
+    rendition_widths: list[int] = [64, 128, 256, 320, 512, 640, 768, 1024, 1280, 1536, 2048]
+
+    # Shared HTTP client for artifact downloads and provider calls, one per
+    # event loop (see http_client.py). Requests beyond the per-host limit wait
+    # for a connection to that host; 0 disables it.
+    http_client_max_connections: int = 100
+    http_client_max_connections_per_host: int = 20
+    http_client_max_keepalive_connections: int = 50
+    http_client_keepalive_expiry: float = 30.0
+    http_client_http2: bool = False
+    http_client_timeout: float = 60.0
+
+    # Text results up to this many bytes are stored inline in the generation
+    # (as a data URL) instead of in object storage; 0 disables
+    inline_text_max_size: int = 4096
 
     # File Upload Settings
     max_upload_size: int = 100 * 1024 * 1024  # 100MB
+    # Lifetime of presigned URLs for direct-to-storage uploads (/uploads/direct)
+    direct_upload_expiry_seconds: int = 3600
+    # Batch uploads from URLs (uploadArtifacts): downloads in flight at once
+    # and URLs accepted per request
+    url_upload_concurrency: int = 4
+    url_upload_max_batch: int = 50
     allowed_upload_extensions: list[str] = [
         ".jpg",
         ".jpeg",
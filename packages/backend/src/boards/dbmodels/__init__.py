@@ -38,6 +38,13 @@ naming_convention = {
     "pk": "pk_%(table_name)s",
 }
 
+# Full-text search over generation prompts. Queries must use this exact expression
+# (with literal arguments) for Postgres to match the idx_generations_prompt_fts index.
+GENERATION_SEARCH_CONFIG = "english"
+GENERATION_PROMPT_TSVECTOR = (
+    f"to_tsvector('{GENERATION_SEARCH_CONFIG}', coalesce(input_params ->> 'prompt', ''))"
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all database models with type checking support."""
@@ -189,6 +196,22 @@ class Boards(Base):
         PrimaryKeyConstraint("id", name="boards_pkey"),
         Index("idx_boards_owner", "owner_id"),
         Index("idx_boards_tenant", "tenant_id"),
+        Index("idx_boards_owner_updated", "owner_id", text("updated_at DESC"), text("id DESC")),
+        Index("idx_boards_owner_created", "owner_id", text("created_at DESC"), text("id DESC")),
+        Index("idx_boards_tenant_updated", "tenant_id", text("updated_at DESC"), text("id DESC")),
+        # Trigram indexes so ILIKE '%query%' board search can use an index
+        Index(
+            "idx_boards_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_boards_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid, server_default=text("uuid_generate_v4()"))
@@ -335,15 +358,49 @@ class Generations(Base):
             name="generations_user_id_fkey",
         ),
         PrimaryKeyConstraint("id", name="generations_pkey"),
-        Index("idx_generations_board", "board_id"),
-        Index("idx_generations_status", "status"),
-        Index("idx_generations_tenant", "tenant_id"),
         Index("idx_generations_user", "user_id"),
+        Index(
+            "idx_generations_board_created",
+            "board_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_generations_tenant_user_created",
+            "tenant_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_generations_board_status_created",
+            "board_id",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_generations_tenant_status_created",
+            "tenant_id",
+            "status",
+            text("created_at DESC"),
+        ),
+        # Partial index: only in-flight jobs, for worker sweeps
+        Index(
+            "idx_generations_active",
+            "updated_at",
+            postgresql_where=text("status IN ('pending', 'processing')"),
+        ),
         Index(
             "idx_generations_input_artifacts_gin",
             "input_artifacts",
             postgresql_using="gin",
         ),
+        Index(
+            "idx_generations_prompt_fts",
+            text(GENERATION_PROMPT_TSVECTOR),
+            postgresql_using="gin",
+        ),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid, server_default=text("uuid_generate_v4()"))
@@ -366,6 +423,8 @@ class Generations(Base):
         JSONB, server_default=text("'[]'::jsonb")
     )
     external_job_id: Mapped[str | None] = mapped_column(String(255))
+    # Generator (the requested one or a failover equivalent) that submitted external_job_id
+    external_job_generator: Mapped[str | None] = mapped_column(String(100))
     progress: Mapped[Decimal] = mapped_column(Numeric(5, 2), server_default=text("0.0"))
     error_message: Mapped[str | None] = mapped_column(Text)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(True))
@@ -454,6 +513,7 @@ class Tags(Base):
         UniqueConstraint("tenant_id", "slug", name="tags_tenant_id_slug_key"),
         Index("idx_tags_tenant", "tenant_id"),
         Index("idx_tags_slug", "slug"),
+        Index("idx_tags_tenant_name", "tenant_id", "name", "id"),
     )
 
     id: Mapped[UUID] = mapped_column(Uuid, server_default=text("uuid_generate_v4()"))
@@ -515,5 +575,55 @@ class GenerationTags(Base):
     tag: Mapped["Tags"] = relationship("Tags", back_populates="generation_tags")
 
 
+class GenerationLineage(Base):
+    """Materialized parent -> child edges derived from Generations.input_artifacts."""
+
+    __tablename__ = "generation_lineage"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["parent_id"],
+            ["generations.id"],
+            ondelete="CASCADE",
+            name="generation_lineage_parent_id_fkey",
+        ),
+        ForeignKeyConstraint(
+            ["child_id"],
+            ["generations.id"],
+            ondelete="CASCADE",
+            name="generation_lineage_child_id_fkey",
+        ),
+        PrimaryKeyConstraint("parent_id", "child_id", "role", name="generation_lineage_pkey"),
+        Index("idx_generation_lineage_child", "child_id", "parent_id"),
+    )
+
+    parent_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    child_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    role: Mapped[str] = mapped_column(String(50), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(True), server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
+class GenerationOutbox(Base):
+    """Generations committed but not yet handed to the job queue (see jobs/outbox.py)."""
+
+    __tablename__ = "generation_outbox"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["generation_id"],
+            ["generations.id"],
+            ondelete="CASCADE",
+            name="generation_outbox_generation_id_fkey",
+        ),
+        PrimaryKeyConstraint("generation_id", name="generation_outbox_pkey"),
+        Index("idx_generation_outbox_created", "created_at"),
+    )
+
+    generation_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(True), server_default=text("CURRENT_TIMESTAMP")
+    )
+
+
 # Expose for Alembic
 target_metadata = Base.metadata
@@ -9,6 +9,7 @@ The main approach is to automatically detect artifact fields via type introspect
 and resolve them BEFORE Pydantic validation.
 """
 
+from functools import cache
 from typing import Any, TypeVar, get_args, get_origin
 from uuid import UUID
 
@@ -82,7 +83,15 @@ def extract_artifact_fields(
         extract_artifact_fields(MyInput)
         # Returns: {"image_source": (ImageArtifact, False), "video_sources": (VideoArtifact, True)}
     """
-    artifact_fields: dict[str, tuple[type[TArtifact], bool]] = {}
+    return dict(_artifact_fields_for_schema(schema))
+
+
+@cache
+def _artifact_fields_for_schema(
+    schema: type[BaseModel],
+) -> tuple[tuple[str, tuple[type[TArtifact], bool]], ...]:
+    """Introspect a schema's artifact fields once; cached per schema class."""
+    artifact_fields: list[tuple[str, tuple[type[TArtifact], bool]]] = []
 
     for field_name, field_info in schema.model_fields.items():
         artifact_type = _extract_artifact_type(field_info.annotation)
@@ -90,9 +99,9 @@ def extract_artifact_fields(
             # Check if the field is a list type
             origin = get_origin(field_info.annotation)
             is_list = origin is list
-            artifact_fields[field_name] = (artifact_type, is_list)
+            artifact_fields.append((field_name, (artifact_type, is_list)))
 
-    return artifact_fields
+    return tuple(artifact_fields)
 
 
 def _get_artifact_type_name[
@@ -212,11 +221,12 @@ async def resolve_generation_ids_to_artifacts[
     """Convert a list of generation IDs to typed artifact objects.
 
     This function:
-    1. Queries the database for each generation ID
-    2. Validates the generation is completed
-    3. Validates the artifact type matches
-    4. Validates the user has access (tenant_id matches)
-    5. Converts to the appropriate artifact object
+    1. Fetches all referenced generations in one tenant-scoped query
+    2. Validates each generation is completed
+    3. Validates each artifact type matches
+    4. Converts to the appropriate artifact objects, preserving input order
+
+    Every ID is checked before raising, so a single error reports all bad IDs.
 
     Args:
         generation_ids: List of generation IDs (as strings or UUIDs)
@@ -225,42 +235,54 @@ async def resolve_generation_ids_to_artifacts[
         tenant_id: Tenant ID for access validation
 
     Returns:
-        List of artifact objects
+        List of artifact objects, in the same order as generation_ids
 
     Raises:
-        ValueError: If any generation is not found, not completed, wrong type, or access denied
+        ValueError: If any generation is not found (or belongs to another tenant),
+            not completed, or of the wrong type
     """
     expected_artifact_type = _get_artifact_type_name(artifact_class)
-    artifacts: list[T] = []
+    errors: list[str] = []
 
+    parsed_ids: list[UUID | None] = []
     for gen_id in generation_ids:
-        # Query generation from database
         try:
-            generation = await jobs_repo.get_generation(session, gen_id)
-        except Exception as e:
-            raise ValueError(f"Generation {gen_id} not found") from e
+            parsed_ids.append(gen_id if isinstance(gen_id, UUID) else UUID(str(gen_id)))
+        except ValueError:
+            parsed_ids.append(None)
 
-        # Validate tenant access
-        if generation.tenant_id != tenant_id:
-            raise ValueError(f"Access denied to generation {gen_id} - tenant mismatch")
+    generations = await jobs_repo.get_generations_by_ids(
+        session, list(dict.fromkeys(i for i in parsed_ids if i is not None)), tenant_id
+    )
+
+    artifacts: list[T] = []
+    for gen_id, parsed_id in zip(generation_ids, parsed_ids, strict=True):
+        generation = generations.get(parsed_id) if parsed_id is not None else None
+        if generation is None:
+            errors.append(f"Generation {gen_id} not found")
+            continue
 
         # Validate completion status
         if generation.status != "completed":
-            raise ValueError(f"Generation {gen_id} is not completed (status: {generation.status})")
+            errors.append(f"Generation {gen_id} is not completed (status: {generation.status})")
+            continue
 
         # Validate artifact type
         if generation.artifact_type != expected_artifact_type:
-            raise ValueError(
+            errors.append(
                 f"Generation {gen_id} has wrong artifact type: "
                 f"expected {expected_artifact_type}, got {generation.artifact_type}"
             )
+            continue
 
         # Convert to artifact object
         try:
-            artifact = _generation_to_artifact(generation, artifact_class)
-            artifacts.append(artifact)
+            artifacts.append(_generation_to_artifact(generation, artifact_class))
         except ValueError as e:
-            raise ValueError(f"Failed to convert generation {gen_id} to artifact: {e}") from e
+            errors.append(f"Failed to convert generation {gen_id} to artifact: {e}")
+
+    if errors:
+        raise ValueError("; ".join(errors))
 
     return artifacts
 
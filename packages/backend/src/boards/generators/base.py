@@ -3,6 +3,7 @@ Base generator classes and interfaces for the Boards generators system.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from typing import Protocol, runtime_checkable
 
 from pydantic import BaseModel
@@ -36,6 +37,15 @@ class BaseGenerator(ABC):
     artifact_type: str  # 'image', 'video', 'audio', 'text', 'lora'
     description: str
 
+    # Optional scheduling hints (see boards.workers.queues)
+    # Typical wall-clock time of one generation, in seconds
+    expected_duration_seconds: float | None = None
+    # Worker queue override; by default the queue is chosen from artifact_type
+    queue: str | None = None
+    # Provider keying the circuit breaker (see boards.generators.failover);
+    # defaults to the name prefix, e.g. "fal" for "fal-veo3"
+    provider: str | None = None
+
     @abstractmethod
     def get_input_schema(self) -> type[BaseModel]:
         """
@@ -142,3 +152,65 @@ class GeneratorExecutionContext(Protocol):
     async def set_external_job_id(self, external_id: str) -> None:
         """Set the external job ID from the provider (e.g., Replicate prediction ID)."""
         ...
+
+    def resumable_external_job_id(self) -> str | None:
+        """External job ID submitted by a previous attempt of this generation.
+
+        When a failed job is retried, generators that can reattach to a provider
+        job should poll or fetch the result of this job instead of submitting
+        (and paying for) a new one. Contexts without retries return None.
+        """
+        return None
+
+    def resumable_generator_name(self) -> str | None:
+        """Generator that submitted the job `resumable_external_job_id` offers.
+
+        A provider job can only be resumed by the generator (and provider) that
+        submitted it, so failover routes a resumed attempt back to it.
+        Contexts without retries return None.
+        """
+        return None
+
+    def set_serving_generator(self, generator_name: str) -> None:
+        """Record which generator runs the job from now on.
+
+        Provider jobs are recorded under this generator, and a resumable job is
+        only offered to the generator that submitted it. Contexts without
+        retries ignore it.
+        """
+        return None
+
+    def mark_provider_job_failed(self) -> None:
+        """Record that the provider reported the resumed or submitted job as failed.
+
+        Call when a provider job's status says it failed (or the provider no
+        longer knows it), so a retry submits a new job instead of resuming it.
+        Contexts without retries ignore it.
+        """
+        return None
+
+    def set_cancel_handler(self, cancel: Callable[[], Awaitable[None]]) -> None:
+        """Register a callback that cancels the job on the provider side.
+
+        Called if the generation is cancelled while it is running. Contexts that
+        do not support cancellation ignore it.
+        """
+        return None
+
+    def provider_job_started(self) -> bool:
+        """Whether the generator has submitted or resumed a provider job, or began storing output.
+
+        From then on a failure is not failed over to an equivalent generator,
+        which would pay a second provider; a retry resumes the job instead.
+        Contexts without retries return False.
+        """
+        return False
+
+    async def acquire_provider_slot(self, provider: str, endpoint: str | None = None) -> None:
+        """Wait until the provider's configured rate and concurrency limits allow a submit.
+
+        Call right before submitting a job to the provider. The concurrency slot
+        is held until the generator finishes. Contexts without provider limits
+        return immediately.
+        """
+        return None
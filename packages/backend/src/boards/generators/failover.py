@@ -0,0 +1,467 @@
+"""Circuit breakers and failover between equivalent generators.
+
+Several models are served by more than one provider (e.g. Veo3 on Fal and
+Kie). generators.yaml can declare such generators as equivalent::
+
+    equivalents:
+      - [fal-veo3, kie-veo3]
+
+When equivalents are configured, every generator run feeds a per-provider
+circuit breaker with its outcome. A run counts as failed if it raised a
+provider error (see `is_provider_error`) or took longer than
+`slow_call_seconds`. Once enough of a provider's recent runs have failed the
+breaker opens and, for `cooldown_seconds`, jobs for that provider's
+generators are routed to a healthy equivalent instead (the one with the lowest
+recent median latency). After the cooldown the breaker is half-open: a single
+job takes the trial token and runs there, and its outcome either closes the
+breaker (success) or re-opens it (failure). Other jobs keep failing over
+meanwhile.
+
+A job whose generator fails with a provider error also falls over to the next
+healthy equivalent within the same attempt, unless the generator had already
+submitted a provider job or begun storing its output. Then the error is
+re-raised and the retry resumes that job (see jobs/retries.py) rather than
+paying a second provider. Other errors, such as rejected inputs or storage
+failures, are re-raised without failing over or counting against the
+provider. Inputs are carried over by field name and validated against the
+equivalent's input schema; equivalents that cannot accept them are skipped.
+Breaker state lives in Redis so all workers share it.
+
+A generator's provider is its `provider` attribute or, by convention, the
+prefix of its name (`fal-veo3` -> `fal`).
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+import httpx
+import redis.asyncio as redis
+from pydantic import BaseModel, ValidationError
+
+from ..config import Settings, settings
+from ..jobs.cancellation import GenerationCancelled
+from ..logging import get_logger
+from ..redis_pool import get_redis_client
+from ..storage.base import StorageException
+from .registry import GeneratorRegistry
+from .registry import registry as default_registry
+
+if TYPE_CHECKING:
+    from .base import BaseGenerator, GeneratorExecutionContext, GeneratorResult
+
+logger = get_logger(__name__)
+
+BreakerState = Literal["closed", "open", "half_open"]
+Permit = Literal["closed", "trial"] | None
+
+
+def provider_of(generator: BaseGenerator) -> str:
+    """Provider a generator calls, used to key its circuit breaker."""
+    return generator.provider or generator.name.split("-", 1)[0]
+
+
+# Response statuses that blame the provider rather than the request
+_PROVIDER_ERROR_STATUSES = {408, 425, 429}
+
+
+def is_provider_error(error: BaseException) -> bool:
+    """Whether an error means the provider is unavailable, overloaded or failing.
+
+    True for timeouts, connection errors and 5xx/408/429 responses anywhere in
+    the exception's cause chain. Rejected requests (other 4xx responses, e.g.
+    invalid inputs or content policy), storage failures and errors raised by
+    generator code are not: an equivalent provider would not do better.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, StorageException):
+            return False
+        if isinstance(current, TimeoutError | ConnectionError | httpx.TransportError):
+            return True
+        status = _status_code(current)
+        if status is not None:
+            return status >= 500 or status in _PROVIDER_ERROR_STATUSES
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _status_code(error: BaseException) -> int | None:
+    """HTTP status of a provider SDK or httpx error, if it carries one."""
+    response = getattr(error, "response", None)
+    for value in (
+        getattr(error, "status_code", None),
+        getattr(error, "status", None),
+        getattr(response, "status_code", None),
+    ):
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    return None
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    # Most recent runs per provider considered when deciding to open
+    window: int = 20
+    # Runs needed in the window before the breaker may open
+    min_samples: int = 5
+    # Share of failed (or slow) runs in the window that opens the breaker
+    failure_rate: float = 0.5
+    # Runs slower than this count as failures
+    slow_call_seconds: float = 900.0
+    # How long an open breaker diverts traffic before allowing a trial run
+    cooldown_seconds: float = 60.0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> BreakerConfig:
+        return cls(
+            window=settings.generator_breaker_window,
+            min_samples=settings.generator_breaker_min_samples,
+            failure_rate=settings.generator_breaker_failure_rate,
+            slow_call_seconds=settings.generator_breaker_slow_call_seconds,
+            cooldown_seconds=settings.generator_breaker_cooldown_seconds,
+        )
+
+
+class CircuitBreakers:
+    """Per-provider circuit breakers and per-generator latency stats in Redis."""
+
+    def __init__(self, client: redis.Redis, config: BreakerConfig | None = None) -> None:
+        self._client = client
+        self.config = config or BreakerConfig()
+
+    @staticmethod
+    def _outcomes_key(provider: str) -> str:
+        return f"breaker:{provider}:outcomes"
+
+    @staticmethod
+    def _open_key(provider: str) -> str:
+        return f"breaker:{provider}:open"
+
+    @staticmethod
+    def _tripped_key(provider: str) -> str:
+        # Set while the breaker is open or half-open; cleared by a successful trial run
+        return f"breaker:{provider}:tripped"
+
+    @staticmethod
+    def _trial_key(provider: str) -> str:
+        # Held by the one job running the half-open trial
+        return f"breaker:{provider}:trial"
+
+    @staticmethod
+    def _latency_key(generator_name: str) -> str:
+        return f"breaker:latency:{generator_name}"
+
+    async def state(self, provider: str) -> BreakerState:
+        if await self._client.exists(self._open_key(provider)):
+            return "open"
+        if await self._client.exists(self._tripped_key(provider)):
+            return "half_open"
+        return "closed"
+
+    async def allows(self, provider: str) -> bool:
+        """Whether jobs may currently be routed to the provider (closed or half-open)."""
+        return await self.state(provider) != "open"
+
+    async def acquire(self, provider: str) -> Permit:
+        """Ask to send a job to the provider right now.
+
+        Returns "closed" if the breaker is closed, "trial" if this job took the
+        half-open trial token, or None if the job must go elsewhere. The trial
+        token is returned by `record` or `release_trial`, or expires after
+        `slow_call_seconds` (by then the trial counts as failed anyway).
+        """
+        state = await self.state(provider)
+        if state != "half_open":
+            return "closed" if state == "closed" else None
+        acquired = await self._client.set(
+            self._trial_key(provider),
+            "1",
+            nx=True,
+            ex=max(1, int(self.config.slow_call_seconds)),
+        )
+        return "trial" if acquired else None
+
+    async def release_trial(self, provider: str) -> None:
+        """Give up the trial token without a verdict (e.g. the request was rejected)."""
+        await self._client.delete(self._trial_key(provider))
+
+    async def median_latency(self, generator_name: str) -> float | None:
+        """Median duration of the generator's recent successful runs."""
+        values = await self._client.lrange(self._latency_key(generator_name), 0, -1)
+        return statistics.median(float(value) for value in values) if values else None
+
+    async def record(self, provider: str, generator_name: str, ok: bool, latency: float) -> None:
+        """Record the outcome of a generator run and open/close the breaker."""
+        failed = not ok or latency > self.config.slow_call_seconds
+        state = await self.state(provider)
+
+        if state == "open":
+            # A run that started before the breaker opened; the decision is made
+            return
+        if state == "half_open":
+            if failed:
+                await self._open(provider, reason="trial run failed")
+            else:
+                await self._client.delete(self._tripped_key(provider))
+                await self._client.delete(self._trial_key(provider))
+                logger.info("Circuit closed", provider=provider)
+            return
+
+        outcomes_key = self._outcomes_key(provider)
+        await self._client.lpush(outcomes_key, "0" if failed else "1")
+        await self._client.ltrim(outcomes_key, 0, self.config.window - 1)
+        if ok:
+            latency_key = self._latency_key(generator_name)
+            await self._client.lpush(latency_key, f"{latency:.3f}")
+            await self._client.ltrim(latency_key, 0, self.config.window - 1)
+
+        outcomes = await self._client.lrange(outcomes_key, 0, -1)
+        if len(outcomes) < self.config.min_samples:
+            return
+        failure_rate = outcomes.count("0") / len(outcomes)
+        if failure_rate >= self.config.failure_rate:
+            await self._open(provider, reason=f"failure rate {failure_rate:.0%}")
+
+    async def _open(self, provider: str, reason: str) -> None:
+        await self._client.set(
+            self._open_key(provider), "1", ex=max(1, int(self.config.cooldown_seconds))
+        )
+        await self._client.set(self._tripped_key(provider), "1")
+        await self._client.delete(self._trial_key(provider))
+        # Start from a clean window once the breaker closes again
+        await self._client.delete(self._outcomes_key(provider))
+        logger.warning(
+            "Circuit opened",
+            provider=provider,
+            reason=reason,
+            cooldown_seconds=self.config.cooldown_seconds,
+        )
+
+
+class FailoverRouter:
+    """Routes generation runs to healthy equivalent generators."""
+
+    def __init__(
+        self,
+        groups: Iterable[Sequence[str]],
+        breakers: CircuitBreakers,
+        registry: GeneratorRegistry = default_registry,
+    ) -> None:
+        self._equivalents: dict[str, list[str]] = {}
+        for group in groups:
+            for name in group:
+                known = self._equivalents.setdefault(name, [])
+                known.extend(other for other in group if other != name and other not in known)
+        self._breakers = breakers
+        self._registry = registry
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._equivalents)
+
+    def equivalents(self, generator_name: str) -> list[str]:
+        return list(self._equivalents.get(generator_name, []))
+
+    async def candidates(self, generator: BaseGenerator) -> list[BaseGenerator]:
+        """Generators to try for a job, in order.
+
+        The requested generator comes first if its provider is healthy, followed
+        by healthy equivalents (lowest median latency first). If its provider's
+        breaker is open, the healthy equivalents come first and the requested
+        generator is kept as a last resort.
+        """
+        if not self.enabled:
+            return [generator]
+
+        alternatives: list[tuple[float, int, BaseGenerator]] = []
+        for index, name in enumerate(self.equivalents(generator.name)):
+            alternative = self._registry.get(name)
+            if alternative is None or not await self._breakers.allows(provider_of(alternative)):
+                continue
+            latency = await self._breakers.median_latency(name)
+            alternatives.append(
+                (latency if latency is not None else float("inf"), index, alternative)
+            )
+        healthy = [alternative for _, _, alternative in sorted(alternatives, key=lambda a: a[:2])]
+
+        if await self._breakers.allows(provider_of(generator)):
+            return [generator, *healthy]
+        return [*healthy, generator]
+
+    async def run(
+        self,
+        generator: BaseGenerator,
+        typed_inputs: BaseModel,
+        params: dict[str, Any],
+        context: GeneratorExecutionContext,
+    ) -> tuple[GeneratorResult, BaseGenerator]:
+        """Run a job, failing over to equivalent generators on provider errors.
+
+        Args:
+            generator: The requested generator
+            typed_inputs: Inputs validated against the requested generator's schema
+            params: Input parameters with artifacts resolved, used to build inputs
+                for equivalent generators
+            context: Execution context of the job
+
+        A retried job whose previous attempt submitted a provider job goes back
+        to the generator that submitted it, whatever its breaker says, since only
+        that provider can resume the job.
+
+        Returns:
+            The generator result and the generator that produced it
+        """
+        resuming = self._resuming(generator, context)
+        if resuming is not None:
+            candidates = [resuming]
+        else:
+            try:
+                candidates = await self.candidates(generator)
+            except redis.RedisError as e:
+                logger.warning(
+                    "Failed to read circuit breakers", generator=generator.name, error=str(e)
+                )
+                candidates = [generator]
+        last_error: Exception | None = None
+
+        while candidates:
+            candidate = candidates.pop(0)
+            permit = "closed" if candidate is resuming else await self._acquire(candidate)
+            if permit is None:
+                if candidate is not generator:
+                    continue
+                if candidates:
+                    # Another job holds the trial run; keep the requested
+                    # generator as a last resort
+                    candidates.append(candidate)
+                    continue
+
+            if candidate is generator:
+                inputs = typed_inputs
+            else:
+                inputs = _adapt_inputs(candidate, params)
+                if inputs is None:
+                    await self._release_trial(candidate, permit)
+                    continue
+                logger.info(
+                    "Routing generation to equivalent generator",
+                    generation_id=context.generation_id,
+                    requested=generator.name,
+                    generator=candidate.name,
+                )
+
+            context.set_serving_generator(candidate.name)
+            started = time.monotonic()
+            try:
+                output = await context.run_cancellable(candidate.generate(inputs, context))
+            except GenerationCancelled:
+                await self._release_trial(candidate, permit)
+                raise
+            except Exception as e:
+                if not is_provider_error(e):
+                    await self._release_trial(candidate, permit)
+                    raise
+                await self._record(candidate, ok=False, started=started)
+                if not candidates or context.provider_job_started():
+                    # Failing over now would pay a second provider for the same
+                    # job; a retry resumes it instead
+                    raise
+                logger.warning(
+                    "Generator failed; trying equivalent generators",
+                    generation_id=context.generation_id,
+                    generator=candidate.name,
+                    error=str(e),
+                )
+                last_error = e
+                continue
+
+            await self._record(candidate, ok=True, started=started)
+            return output, candidate
+
+        assert last_error is not None
+        raise last_error
+
+    def _resuming(
+        self, generator: BaseGenerator, context: GeneratorExecutionContext
+    ) -> BaseGenerator | None:
+        """The generator whose provider job a retried attempt resumes, if any."""
+        name = context.resumable_generator_name()
+        if name is None:
+            return None
+        if name == generator.name:
+            return generator
+        if name not in self.equivalents(generator.name):
+            # No longer an equivalent; the job cannot be resumed
+            return None
+        return self._registry.get(name)
+
+    async def _acquire(self, generator: BaseGenerator) -> Permit:
+        if not self.enabled:
+            return "closed"
+        try:
+            return await self._breakers.acquire(provider_of(generator))
+        except redis.RedisError as e:
+            logger.warning("Failed to read circuit breaker", generator=generator.name, error=str(e))
+            return "closed"
+
+    async def _release_trial(self, generator: BaseGenerator, permit: Permit) -> None:
+        if permit != "trial":
+            return
+        try:
+            await self._breakers.release_trial(provider_of(generator))
+        except redis.RedisError as e:
+            # The token expires on its own
+            logger.warning(
+                "Failed to release circuit breaker trial", generator=generator.name, error=str(e)
+            )
+
+    async def _record(self, generator: BaseGenerator, ok: bool, started: float) -> None:
+        if not self.enabled:
+            return
+        try:
+            await self._breakers.record(
+                provider_of(generator), generator.name, ok=ok, latency=time.monotonic() - started
+            )
+        except redis.RedisError as e:
+            logger.warning(
+                "Failed to record generator outcome", generator=generator.name, error=str(e)
+            )
+
+
+def _adapt_inputs(generator: BaseGenerator, params: dict[str, Any]) -> BaseModel | None:
+    """Validate params against an equivalent generator's schema, or None if they don't fit."""
+    schema = generator.get_input_schema()
+    try:
+        return schema.model_validate(
+            {key: value for key, value in params.items() if key in schema.model_fields}
+        )
+    except ValidationError as e:
+        logger.info(
+            "Skipping equivalent generator with incompatible inputs",
+            generator=generator.name,
+            error=str(e),
+        )
+        return None
+
+
+_equivalent_groups: list[list[str]] = []
+
+
+def configure_equivalents(groups: Iterable[Sequence[str]]) -> None:
+    """Set the equivalent generator groups (called by the generators loader)."""
+    _equivalent_groups[:] = [list(group) for group in groups]
+
+
+def get_failover_router() -> FailoverRouter:
+    """Router for the configured equivalents, sharing the Redis connection pool."""
+    return FailoverRouter(
+        _equivalent_groups,
+        CircuitBreakers(get_redis_client(), BreakerConfig.from_settings(settings)),
+    )
@@ -6,9 +6,17 @@ various AI services using their native SDKs.
 
 Generators are organized by provider (Replicate, Fal, OpenAI, etc.).
 
-Import this module to automatically register all built-in generators:
-    import boards.generators.implementations
+Provider packages are imported on first access, and their generator classes
+are re-exported lazily, so importing one generator module does not import
+every other provider's modules and SDKs. Generators are registered by the
+configuration-driven loader (see boards.generators.loader).
 """
 
-# Import all provider modules to make them available
-from . import fal, openai, replicate
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from . import fal, kie, openai, replicate
+
+__getattr__, __dir__ = lazy_exports(__name__, {}, submodules=("fal", "kie", "openai", "replicate"))
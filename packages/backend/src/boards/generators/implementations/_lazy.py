@@ -0,0 +1,43 @@
+"""Lazy (PEP 562) package exports for generator implementation packages.
+
+Provider packages re-export their generator classes for convenience, but
+importing them eagerly means that loading a single generator module pulls in
+every sibling module (and its provider SDK). Packages instead declare which
+submodule each name lives in and resolve it on first attribute access.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, Iterable[str]],
+    submodules: Iterable[str] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Mapping of relative module to the names it defines
+        submodules: Subpackage names that should also be importable as attributes
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign at package level
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+    submodule_names = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in modules:
+            return getattr(import_module(modules[name], package), name)
+        if name in submodule_names:
+            return import_module(f".{name}", package)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> list[str]:
+        return sorted({*modules, *submodule_names})
+
+    return __getattr__, __dir__
@@ -1,16 +1,21 @@
 """Fal.ai provider generators."""
 
-from . import audio, image, video
-from .image import (
-    FalFluxProUltraGenerator,
-    FalNanoBananaEditGenerator,
-    FalNanoBananaGenerator,
-)
-from .video import (
-    FalKlingVideoV25TurboProTextToVideoGenerator,
-    FalSyncLipsyncV2Generator,
-    FalVeo31FirstLastFrameToVideoGenerator,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from . import audio, image, video
+    from .image import (
+        FalFluxProUltraGenerator,
+        FalNanoBananaEditGenerator,
+        FalNanoBananaGenerator,
+    )
+    from .video import (
+        FalKlingVideoV25TurboProTextToVideoGenerator,
+        FalSyncLipsyncV2Generator,
+        FalVeo31FirstLastFrameToVideoGenerator,
+    )
 
 # Maintain alphabetical order
 __all__ = [
@@ -23,3 +28,20 @@ __all__ = [
     "FalSyncLipsyncV2Generator",
     "FalVeo31FirstLastFrameToVideoGenerator",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".image": (
+            "FalFluxProUltraGenerator",
+            "FalNanoBananaEditGenerator",
+            "FalNanoBananaGenerator",
+        ),
+        ".video": (
+            "FalKlingVideoV25TurboProTextToVideoGenerator",
+            "FalSyncLipsyncV2Generator",
+            "FalVeo31FirstLastFrameToVideoGenerator",
+        ),
+    },
+    submodules=("audio", "image", "video"),
+)
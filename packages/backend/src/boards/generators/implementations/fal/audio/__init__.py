@@ -1,13 +1,18 @@
-from .beatoven_music_generation import FalBeatovenMusicGenerationGenerator
-from .beatoven_sound_effect_generation import FalBeatovenSoundEffectGenerationGenerator
-from .chatterbox_text_to_speech import FalChatterboxTextToSpeechGenerator
-from .chatterbox_tts_turbo import FalChatterboxTtsTurboGenerator
-from .elevenlabs_sound_effects_v2 import FalElevenlabsSoundEffectsV2Generator
-from .elevenlabs_tts_eleven_v3 import FalElevenlabsTtsElevenV3Generator
-from .fal_elevenlabs_tts_turbo_v2_5 import FalElevenlabsTtsTurboV25Generator
-from .fal_minimax_speech_26_hd import FalMinimaxSpeech26HdGenerator
-from .minimax_music_v2 import FalMinimaxMusicV2Generator
-from .minimax_speech_2_6_turbo import FalMinimaxSpeech26TurboGenerator
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .beatoven_music_generation import FalBeatovenMusicGenerationGenerator
+    from .beatoven_sound_effect_generation import FalBeatovenSoundEffectGenerationGenerator
+    from .chatterbox_text_to_speech import FalChatterboxTextToSpeechGenerator
+    from .chatterbox_tts_turbo import FalChatterboxTtsTurboGenerator
+    from .elevenlabs_sound_effects_v2 import FalElevenlabsSoundEffectsV2Generator
+    from .elevenlabs_tts_eleven_v3 import FalElevenlabsTtsElevenV3Generator
+    from .fal_elevenlabs_tts_turbo_v2_5 import FalElevenlabsTtsTurboV25Generator
+    from .fal_minimax_speech_26_hd import FalMinimaxSpeech26HdGenerator
+    from .minimax_music_v2 import FalMinimaxMusicV2Generator
+    from .minimax_speech_2_6_turbo import FalMinimaxSpeech26TurboGenerator
 
 __all__ = [
     "FalBeatovenMusicGenerationGenerator",
@@ -21,3 +26,19 @@ __all__ = [
     "FalMinimaxSpeech26HdGenerator",
     "FalMinimaxSpeech26TurboGenerator",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".beatoven_music_generation": ("FalBeatovenMusicGenerationGenerator",),
+        ".beatoven_sound_effect_generation": ("FalBeatovenSoundEffectGenerationGenerator",),
+        ".chatterbox_text_to_speech": ("FalChatterboxTextToSpeechGenerator",),
+        ".chatterbox_tts_turbo": ("FalChatterboxTtsTurboGenerator",),
+        ".elevenlabs_sound_effects_v2": ("FalElevenlabsSoundEffectsV2Generator",),
+        ".elevenlabs_tts_eleven_v3": ("FalElevenlabsTtsElevenV3Generator",),
+        ".fal_elevenlabs_tts_turbo_v2_5": ("FalElevenlabsTtsTurboV25Generator",),
+        ".fal_minimax_speech_26_hd": ("FalMinimaxSpeech26HdGenerator",),
+        ".minimax_music_v2": ("FalMinimaxMusicV2Generator",),
+        ".minimax_speech_2_6_turbo": ("FalMinimaxSpeech26TurboGenerator",),
+    },
+)
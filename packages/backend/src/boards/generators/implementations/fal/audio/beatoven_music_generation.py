@@ -10,6 +10,7 @@ See: https://fal.ai/models/beatoven/music-generation
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -73,17 +74,7 @@ class FalBeatovenMusicGenerationGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBeatovenMusicGenerationGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
-        from typing import Any
 
         arguments: dict[str, Any] = {
             "prompt": inputs.prompt,
@@ -99,14 +90,10 @@ class FalBeatovenMusicGenerationGenerator(BaseGenerator):
         if inputs.negative_prompt:
             arguments["negative_prompt"] = inputs.negative_prompt
 
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "beatoven/music-generation",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("beatoven/music-generation", arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
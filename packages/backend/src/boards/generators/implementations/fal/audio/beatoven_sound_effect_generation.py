@@ -9,6 +9,7 @@ See: https://fal.ai/models/beatoven/sound-effect-generation
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -75,17 +76,7 @@ class FalBeatovenSoundEffectGenerationGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBeatovenSoundEffectGenerationGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
-        from typing import Any
 
         arguments: dict[str, Any] = {
             "prompt": inputs.prompt,
@@ -99,14 +90,10 @@ class FalBeatovenSoundEffectGenerationGenerator(BaseGenerator):
         if inputs.seed is not None:
             arguments["seed"] = inputs.seed
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "beatoven/sound-effect-generation",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("beatoven/sound-effect-generation", arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -84,15 +84,6 @@ class FalChatterboxTextToSpeechGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalChatterboxTextToSpeechGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments: dict = {
             "text": inputs.text,
@@ -107,14 +98,10 @@ class FalChatterboxTextToSpeechGenerator(BaseGenerator):
         if inputs.seed is not None:
             arguments["seed"] = inputs.seed
 
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/chatterbox/text-to-speech",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/chatterbox/text-to-speech", arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/chatterbox/text-to-speech/turbo
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -100,41 +100,32 @@ class FalChatterboxTtsTurboGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalChatterboxTtsTurboGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Prepare arguments for fal.ai API
-        arguments: dict[str, str | float | int] = {
-            "text": inputs.text,
-            "voice": inputs.voice,
-            "temperature": inputs.temperature,
-        }
-
-        # Add seed if provided
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Handle voice cloning audio upload
-        if inputs.audio_url is not None:
-            from ..utils import upload_artifacts_to_fal
-
-            audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
-            arguments["audio_url"] = audio_urls[0]
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/chatterbox/text-to-speech/turbo",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Prepare arguments for fal.ai API
+            arguments: dict[str, str | float | int] = {
+                "text": inputs.text,
+                "voice": inputs.voice,
+                "temperature": inputs.temperature,
+            }
+
+            # Add seed if provided
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+
+            # Handle voice cloning audio upload
+            if inputs.audio_url is not None:
+                from ..utils import upload_artifacts_to_fal
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+                audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
+                arguments["audio_url"] = audio_urls[0]
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/chatterbox/text-to-speech/turbo", build_arguments, context
+        )
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
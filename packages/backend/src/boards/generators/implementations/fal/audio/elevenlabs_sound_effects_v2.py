@@ -99,15 +99,6 @@ class FalElevenlabsSoundEffectsV2Generator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalElevenlabsSoundEffectsV2Generator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "text": inputs.text,
@@ -120,14 +111,10 @@ class FalElevenlabsSoundEffectsV2Generator(BaseGenerator):
         if inputs.duration_seconds is not None:
             arguments["duration_seconds"] = inputs.duration_seconds
 
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/elevenlabs/sound-effects/v2",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/elevenlabs/sound-effects/v2", arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -105,15 +105,6 @@ class FalElevenlabsTtsTurboV25Generator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalElevenlabsTtsTurboV25Generator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "text": inputs.text,
@@ -133,14 +124,10 @@ class FalElevenlabsTtsTurboV25Generator(BaseGenerator):
         if inputs.next_text is not None:
             arguments["next_text"] = inputs.next_text
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/elevenlabs/tts/turbo-v2.5",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/elevenlabs/tts/turbo-v2.5", arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
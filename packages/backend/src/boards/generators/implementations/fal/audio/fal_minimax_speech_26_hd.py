@@ -159,15 +159,6 @@ class FalMinimaxSpeech26HdGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalMinimaxSpeech26HdGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments: dict = {
             "prompt": inputs.prompt,
@@ -181,14 +172,10 @@ class FalMinimaxSpeech26HdGenerator(BaseGenerator):
         if inputs.language_boost:
             arguments["language_boost"] = inputs.language_boost
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/minimax/speech-2.6-hd",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/minimax/speech-2.6-hd", arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/minimax-music/v2
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -73,17 +73,7 @@ class FalMinimaxMusicV2Generator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalMinimaxMusicV2Generator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
-        from typing import Any
 
         arguments: dict[str, Any] = {
             "prompt": inputs.prompt,
@@ -98,14 +88,10 @@ class FalMinimaxMusicV2Generator(BaseGenerator):
                 "bitrate": inputs.audio_setting.bitrate,
             }
 
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/minimax-music/v2",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/minimax-music/v2", arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
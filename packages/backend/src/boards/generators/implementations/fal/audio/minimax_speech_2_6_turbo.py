@@ -120,15 +120,6 @@ class FalMinimaxSpeech26TurboGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalMinimaxSpeech26TurboGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "prompt": inputs.prompt,
@@ -149,14 +140,10 @@ class FalMinimaxSpeech26TurboGenerator(BaseGenerator):
             },
         }
 
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/minimax/speech-2.6-turbo",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/minimax/speech-2.6-turbo", arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -1,40 +1,45 @@
 """Fal.ai image generators."""
 
-from .bria_background_remove import FalBriaBackgroundRemoveGenerator
-from .bytedance_seedream_v5_lite_edit import FalBytedanceSeedreamV5LiteEditGenerator
-from .bytedance_seedream_v45_edit import FalBytedanceSeedreamV45EditGenerator
-from .clarity_upscaler import FalClarityUpscalerGenerator
-from .crystal_upscaler import FalCrystalUpscalerGenerator
-from .fal_ideogram_character import FalIdeogramCharacterGenerator
-from .flux_2 import FalFlux2Generator
-from .flux_2_edit import FalFlux2EditGenerator
-from .flux_2_flex import FalFlux2FlexGenerator
-from .flux_2_pro import FalFlux2ProGenerator
-from .flux_2_pro_edit import FalFlux2ProEditGenerator
-from .flux_pro_kontext import FalFluxProKontextGenerator
-from .flux_pro_ultra import FalFluxProUltraGenerator
-from .gemini_25_flash_image import FalGemini25FlashImageGenerator
-from .gemini_25_flash_image_edit import FalGemini25FlashImageEditGenerator
-from .gpt_image_1_5 import FalGptImage15Generator
-from .gpt_image_1_edit_image import FalGptImage1EditImageGenerator
-from .gpt_image_1_mini import FalGptImage1MiniGenerator
-from .gpt_image_15_edit import FalGptImage15EditGenerator
-from .ideogram_character_edit import FalIdeogramCharacterEditGenerator
-from .ideogram_v2 import FalIdeogramV2Generator
-from .imagen4_preview import FalImagen4PreviewGenerator
-from .imagen4_preview_fast import FalImagen4PreviewFastGenerator
-from .kolors_virtual_try_on import FalKolorsVirtualTryOnGenerator
-from .nano_banana import FalNanoBananaGenerator
-from .nano_banana_2 import FalNanoBanana2Generator
-from .nano_banana_edit import FalNanoBananaEditGenerator
-from .nano_banana_pro import FalNanoBananaProGenerator
-from .nano_banana_pro_edit import FalNanoBananaProEditGenerator
-from .qwen_image import FalQwenImageGenerator
-from .qwen_image_2_pro_edit import FalQwenImage2ProEditGenerator
-from .qwen_image_edit import FalQwenImageEditGenerator
-from .reve_edit import FalReveEditGenerator
-from .reve_text_to_image import FalReveTextToImageGenerator
-from .seedream_v45_text_to_image import FalSeedreamV45TextToImageGenerator
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bria_background_remove import FalBriaBackgroundRemoveGenerator
+    from .bytedance_seedream_v5_lite_edit import FalBytedanceSeedreamV5LiteEditGenerator
+    from .bytedance_seedream_v45_edit import FalBytedanceSeedreamV45EditGenerator
+    from .clarity_upscaler import FalClarityUpscalerGenerator
+    from .crystal_upscaler import FalCrystalUpscalerGenerator
+    from .fal_ideogram_character import FalIdeogramCharacterGenerator
+    from .flux_2 import FalFlux2Generator
+    from .flux_2_edit import FalFlux2EditGenerator
+    from .flux_2_flex import FalFlux2FlexGenerator
+    from .flux_2_pro import FalFlux2ProGenerator
+    from .flux_2_pro_edit import FalFlux2ProEditGenerator
+    from .flux_pro_kontext import FalFluxProKontextGenerator
+    from .flux_pro_ultra import FalFluxProUltraGenerator
+    from .gemini_25_flash_image import FalGemini25FlashImageGenerator
+    from .gemini_25_flash_image_edit import FalGemini25FlashImageEditGenerator
+    from .gpt_image_1_5 import FalGptImage15Generator
+    from .gpt_image_1_edit_image import FalGptImage1EditImageGenerator
+    from .gpt_image_1_mini import FalGptImage1MiniGenerator
+    from .gpt_image_15_edit import FalGptImage15EditGenerator
+    from .ideogram_character_edit import FalIdeogramCharacterEditGenerator
+    from .ideogram_v2 import FalIdeogramV2Generator
+    from .imagen4_preview import FalImagen4PreviewGenerator
+    from .imagen4_preview_fast import FalImagen4PreviewFastGenerator
+    from .kolors_virtual_try_on import FalKolorsVirtualTryOnGenerator
+    from .nano_banana import FalNanoBananaGenerator
+    from .nano_banana_2 import FalNanoBanana2Generator
+    from .nano_banana_edit import FalNanoBananaEditGenerator
+    from .nano_banana_pro import FalNanoBananaProGenerator
+    from .nano_banana_pro_edit import FalNanoBananaProEditGenerator
+    from .qwen_image import FalQwenImageGenerator
+    from .qwen_image_2_pro_edit import FalQwenImage2ProEditGenerator
+    from .qwen_image_edit import FalQwenImageEditGenerator
+    from .reve_edit import FalReveEditGenerator
+    from .reve_text_to_image import FalReveTextToImageGenerator
+    from .seedream_v45_text_to_image import FalSeedreamV45TextToImageGenerator
 
 __all__ = [
     "FalBriaBackgroundRemoveGenerator",
@@ -73,3 +78,44 @@ __all__ = [
     "FalReveTextToImageGenerator",
     "FalSeedreamV45TextToImageGenerator",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".bria_background_remove": ("FalBriaBackgroundRemoveGenerator",),
+        ".bytedance_seedream_v5_lite_edit": ("FalBytedanceSeedreamV5LiteEditGenerator",),
+        ".bytedance_seedream_v45_edit": ("FalBytedanceSeedreamV45EditGenerator",),
+        ".clarity_upscaler": ("FalClarityUpscalerGenerator",),
+        ".crystal_upscaler": ("FalCrystalUpscalerGenerator",),
+        ".fal_ideogram_character": ("FalIdeogramCharacterGenerator",),
+        ".flux_2": ("FalFlux2Generator",),
+        ".flux_2_edit": ("FalFlux2EditGenerator",),
+        ".flux_2_flex": ("FalFlux2FlexGenerator",),
+        ".flux_2_pro": ("FalFlux2ProGenerator",),
+        ".flux_2_pro_edit": ("FalFlux2ProEditGenerator",),
+        ".flux_pro_kontext": ("FalFluxProKontextGenerator",),
+        ".flux_pro_ultra": ("FalFluxProUltraGenerator",),
+        ".gemini_25_flash_image": ("FalGemini25FlashImageGenerator",),
+        ".gemini_25_flash_image_edit": ("FalGemini25FlashImageEditGenerator",),
+        ".gpt_image_1_5": ("FalGptImage15Generator",),
+        ".gpt_image_1_edit_image": ("FalGptImage1EditImageGenerator",),
+        ".gpt_image_1_mini": ("FalGptImage1MiniGenerator",),
+        ".gpt_image_15_edit": ("FalGptImage15EditGenerator",),
+        ".ideogram_character_edit": ("FalIdeogramCharacterEditGenerator",),
+        ".ideogram_v2": ("FalIdeogramV2Generator",),
+        ".imagen4_preview": ("FalImagen4PreviewGenerator",),
+        ".imagen4_preview_fast": ("FalImagen4PreviewFastGenerator",),
+        ".kolors_virtual_try_on": ("FalKolorsVirtualTryOnGenerator",),
+        ".nano_banana": ("FalNanoBananaGenerator",),
+        ".nano_banana_2": ("FalNanoBanana2Generator",),
+        ".nano_banana_edit": ("FalNanoBananaEditGenerator",),
+        ".nano_banana_pro": ("FalNanoBananaProGenerator",),
+        ".nano_banana_pro_edit": ("FalNanoBananaProEditGenerator",),
+        ".qwen_image": ("FalQwenImageGenerator",),
+        ".qwen_image_2_pro_edit": ("FalQwenImage2ProEditGenerator",),
+        ".qwen_image_edit": ("FalQwenImageEditGenerator",),
+        ".reve_edit": ("FalReveEditGenerator",),
+        ".reve_text_to_image": ("FalReveTextToImageGenerator",),
+        ".seedream_v45_text_to_image": ("FalSeedreamV45TextToImageGenerator",),
+    },
+)
@@ -9,6 +9,7 @@ See: https://fal.ai/models/fal-ai/bria/background/remove
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -44,34 +45,23 @@ class FalBriaBackgroundRemoveGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBriaBackgroundRemoveGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        image_url = image_urls[0]
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_url": image_url,
-        }
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/bria/background/remove",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            image_url = image_urls[0]
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_url": image_url,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/bria/background/remove", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/bytedance/seedream/v4.5/edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -92,49 +92,40 @@ class FalBytedanceSeedreamV45EditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBytedanceSeedreamV45EditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "sync_mode": inputs.sync_mode,
-            "enable_safety_checker": inputs.enable_safety_checker,
-        }
-
-        # Add optional parameters
-        if inputs.image_size is not None:
-            arguments["image_size"] = inputs.image_size
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/bytedance/seedream/v4.5/edit",
-            arguments=arguments,
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "sync_mode": inputs.sync_mode,
+                "enable_safety_checker": inputs.enable_safety_checker,
+            }
+
+            # Add optional parameters
+            if inputs.image_size is not None:
+                arguments["image_size"] = inputs.image_size
+
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/bytedance/seedream/v4.5/edit", build_arguments, context
         )
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
-
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
 
@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/bytedance/seedream/v5/lite/edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -85,43 +85,34 @@ class FalBytedanceSeedreamV5LiteEditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBytedanceSeedreamV5LiteEditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "enable_safety_checker": inputs.enable_safety_checker,
-        }
-
-        # Add optional parameters
-        if inputs.image_size is not None:
-            arguments["image_size"] = inputs.image_size
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/bytedance/seedream/v5/lite/edit",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "enable_safety_checker": inputs.enable_safety_checker,
+            }
+
+            # Add optional parameters
+            if inputs.image_size is not None:
+                arguments["image_size"] = inputs.image_size
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/bytedance/seedream/v5/lite/edit", build_arguments, context
+        )
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
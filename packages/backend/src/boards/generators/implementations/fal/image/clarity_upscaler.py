@@ -6,6 +6,7 @@ Supports upscaling factors from 1x to 4x with configurable creativity and resemb
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -89,51 +90,40 @@ class FalClarityUpscalerGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalClarityUpscalerGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        # upload_artifacts_to_fal expects a list, so wrap the single image
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        image_url = image_urls[0]  # Extract the single URL
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_url": image_url,
-            "prompt": inputs.prompt,
-            "upscale_factor": inputs.upscale_factor,
-            "negative_prompt": inputs.negative_prompt,
-            "creativity": inputs.creativity,
-            "resemblance": inputs.resemblance,
-            "guidance_scale": inputs.guidance_scale,
-            "num_inference_steps": inputs.num_inference_steps,
-            "enable_safety_checker": inputs.enable_safety_checker,
-        }
-
-        # Add seed if provided
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/clarity-upscaler",
-            arguments=arguments,
-        )
-
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            # upload_artifacts_to_fal expects a list, so wrap the single image
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            image_url = image_urls[0]  # Extract the single URL
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_url": image_url,
+                "prompt": inputs.prompt,
+                "upscale_factor": inputs.upscale_factor,
+                "negative_prompt": inputs.negative_prompt,
+                "creativity": inputs.creativity,
+                "resemblance": inputs.resemblance,
+                "guidance_scale": inputs.guidance_scale,
+                "num_inference_steps": inputs.num_inference_steps,
+                "enable_safety_checker": inputs.enable_safety_checker,
+            }
+
+            # Add seed if provided
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/clarity-upscaler", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -9,6 +9,7 @@ See: https://fal.ai/models/fal-ai/crystal-upscaler
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -52,40 +53,29 @@ class FalCrystalUpscalerGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalCrystalUpscalerGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        # upload_artifacts_to_fal expects a list, returns a list
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        image_url = image_urls[0]
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_url": image_url,
-            "scale_factor": inputs.scale_factor,
-        }
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/crystal-upscaler",
-            arguments=arguments,
-        )
-
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            # upload_artifacts_to_fal expects a list, returns a list
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            image_url = image_urls[0]
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_url": image_url,
+                "scale_factor": inputs.scale_factor,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/crystal-upscaler", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/ideogram/character
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -118,56 +118,47 @@ class FalIdeogramCharacterGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalIdeogramCharacterGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload artifact inputs to Fal's storage
-        from ..utils import upload_artifacts_to_fal
-
-        reference_image_urls = await upload_artifacts_to_fal(inputs.reference_image_urls, context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "reference_image_urls": reference_image_urls,
-            "image_size": inputs.image_size,
-            "style": inputs.style,
-            "expand_prompt": inputs.expand_prompt,
-            "rendering_speed": inputs.rendering_speed,
-            "num_images": inputs.num_images,
-            "sync_mode": inputs.sync_mode,
-        }
+        async def build_arguments() -> dict[str, Any]:
+            # Upload artifact inputs to Fal's storage
+            from ..utils import upload_artifacts_to_fal
 
-        # Add optional parameters if provided
-        if inputs.negative_prompt is not None:
-            arguments["negative_prompt"] = inputs.negative_prompt
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-        if inputs.reference_mask_urls is not None:
-            arguments["reference_mask_urls"] = await upload_artifacts_to_fal(
-                inputs.reference_mask_urls, context
+            reference_image_urls = await upload_artifacts_to_fal(
+                inputs.reference_image_urls, context
             )
-        if inputs.image_urls is not None:
-            arguments["image_urls"] = await upload_artifacts_to_fal(inputs.image_urls, context)
-        if inputs.style_codes is not None:
-            arguments["style_codes"] = inputs.style_codes
-        if inputs.color_palette is not None:
-            arguments["color_palette"] = inputs.color_palette
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/ideogram/character",
-            arguments=arguments,
-        )
-
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "reference_image_urls": reference_image_urls,
+                "image_size": inputs.image_size,
+                "style": inputs.style,
+                "expand_prompt": inputs.expand_prompt,
+                "rendering_speed": inputs.rendering_speed,
+                "num_images": inputs.num_images,
+                "sync_mode": inputs.sync_mode,
+            }
+
+            # Add optional parameters if provided
+            if inputs.negative_prompt is not None:
+                arguments["negative_prompt"] = inputs.negative_prompt
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            if inputs.reference_mask_urls is not None:
+                arguments["reference_mask_urls"] = await upload_artifacts_to_fal(
+                    inputs.reference_mask_urls, context
+                )
+            if inputs.image_urls is not None:
+                arguments["image_urls"] = await upload_artifacts_to_fal(inputs.image_urls, context)
+            if inputs.style_codes is not None:
+                arguments["style_codes"] = inputs.style_codes
+            if inputs.color_palette is not None:
+                arguments["color_palette"] = inputs.color_palette
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/ideogram/character", build_arguments, context)
 
         # Stream progress updates
         event_count = 0
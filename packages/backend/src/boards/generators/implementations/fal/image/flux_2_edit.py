@@ -7,7 +7,7 @@ Based on Black Forest Labs' FLUX.2 [dev] model.
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -108,56 +108,45 @@ class FalFlux2EditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalFlux2EditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict[str, object] = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "acceleration": inputs.acceleration,
-            "num_inference_steps": inputs.num_inference_steps,
-            "output_format": inputs.output_format,
-            "guidance_scale": inputs.guidance_scale,
-            "enable_prompt_expansion": inputs.enable_prompt_expansion,
-            "enable_safety_checker": inputs.enable_safety_checker,
-            "sync_mode": inputs.sync_mode,
-        }
-
-        # Add optional fields if provided
-        if inputs.image_size is not None:
-            if isinstance(inputs.image_size, str):
-                arguments["image_size"] = inputs.image_size
-            else:
-                # Custom size object
-                arguments["image_size"] = {
-                    "width": inputs.image_size.width,
-                    "height": inputs.image_size.height,
-                }
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/flux-2/edit",
-            arguments=arguments,
-        )
-
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict[str, object] = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "acceleration": inputs.acceleration,
+                "num_inference_steps": inputs.num_inference_steps,
+                "output_format": inputs.output_format,
+                "guidance_scale": inputs.guidance_scale,
+                "enable_prompt_expansion": inputs.enable_prompt_expansion,
+                "enable_safety_checker": inputs.enable_safety_checker,
+                "sync_mode": inputs.sync_mode,
+            }
+
+            # Add optional fields if provided
+            if inputs.image_size is not None:
+                if isinstance(inputs.image_size, str):
+                    arguments["image_size"] = inputs.image_size
+                else:
+                    # Custom size object
+                    arguments["image_size"] = {
+                        "width": inputs.image_size.width,
+                        "height": inputs.image_size.height,
+                    }
+
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/flux-2/edit", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
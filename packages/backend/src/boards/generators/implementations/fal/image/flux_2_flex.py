@@ -92,15 +92,6 @@ class FalFlux2FlexGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalFlux2FlexGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "prompt": inputs.prompt,
@@ -117,14 +108,10 @@ class FalFlux2FlexGenerator(BaseGenerator):
         if inputs.seed is not None:
             arguments["seed"] = inputs.seed
 
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/flux-2-flex",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/flux-2-flex", arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
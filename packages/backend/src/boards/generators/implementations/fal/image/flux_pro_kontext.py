@@ -6,7 +6,7 @@ and complex transformations of entire scenes using fal.ai's flux-pro/kontext mod
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -101,49 +101,38 @@ class FalFluxProKontextGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalFluxProKontextGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        image_url = image_urls[0]  # Extract single URL from list
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "image_url": image_url,
-            "num_images": inputs.num_images,
-            "output_format": inputs.output_format,
-            "sync_mode": inputs.sync_mode,
-            "safety_tolerance": inputs.safety_tolerance,
-            "guidance_scale": inputs.guidance_scale,
-            "enhance_prompt": inputs.enhance_prompt,
-        }
-
-        # Add optional fields if provided
-        if inputs.aspect_ratio is not None:
-            arguments["aspect_ratio"] = inputs.aspect_ratio
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/flux-pro/kontext",
-            arguments=arguments,
-        )
-
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            image_url = image_urls[0]  # Extract single URL from list
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "image_url": image_url,
+                "num_images": inputs.num_images,
+                "output_format": inputs.output_format,
+                "sync_mode": inputs.sync_mode,
+                "safety_tolerance": inputs.safety_tolerance,
+                "guidance_scale": inputs.guidance_scale,
+                "enhance_prompt": inputs.enhance_prompt,
+            }
+
+            # Add optional fields if provided
+            if inputs.aspect_ratio is not None:
+                arguments["aspect_ratio"] = inputs.aspect_ratio
+
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/flux-pro/kontext", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
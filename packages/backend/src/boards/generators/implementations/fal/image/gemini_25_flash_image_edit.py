@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/gemini-25-flash-image/edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -91,47 +91,38 @@ class FalGemini25FlashImageEditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalGemini25FlashImageEditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "output_format": inputs.output_format,
-            "sync_mode": inputs.sync_mode,
-            "limit_generations": inputs.limit_generations,
-        }
-
-        # Add aspect_ratio if provided
-        if inputs.aspect_ratio is not None:
-            arguments["aspect_ratio"] = inputs.aspect_ratio
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/gemini-25-flash-image/edit",
-            arguments=arguments,
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_sources, context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "output_format": inputs.output_format,
+                "sync_mode": inputs.sync_mode,
+                "limit_generations": inputs.limit_generations,
+            }
+
+            # Add aspect_ratio if provided
+            if inputs.aspect_ratio is not None:
+                arguments["aspect_ratio"] = inputs.aspect_ratio
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/gemini-25-flash-image/edit", build_arguments, context
         )
 
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
-
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
 
@@ -7,7 +7,7 @@ See: https://fal.ai/models/fal-ai/gpt-image-1.5/edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -82,51 +82,40 @@ class FalGptImage15EditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalGptImage15EditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
-
-        # Upload mask image if provided
-        mask_image_url = None
-        if inputs.mask_image_url is not None:
-            mask_urls = await upload_artifacts_to_fal([inputs.mask_image_url], context)
-            mask_image_url = mask_urls[0] if mask_urls else None
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "image_size": inputs.image_size,
-            "quality": inputs.quality,
-            "input_fidelity": inputs.input_fidelity,
-            "output_format": inputs.output_format,
-            "background": inputs.background,
-        }
-
-        # Add mask image if provided
-        if mask_image_url is not None:
-            arguments["mask_image_url"] = mask_image_url
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/gpt-image-1.5/edit",
-            arguments=arguments,
-        )
-
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
+
+            # Upload mask image if provided
+            mask_image_url = None
+            if inputs.mask_image_url is not None:
+                mask_urls = await upload_artifacts_to_fal([inputs.mask_image_url], context)
+                mask_image_url = mask_urls[0] if mask_urls else None
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "image_size": inputs.image_size,
+                "quality": inputs.quality,
+                "input_fidelity": inputs.input_fidelity,
+                "output_format": inputs.output_format,
+                "background": inputs.background,
+            }
+
+            # Add mask image if provided
+            if mask_image_url is not None:
+                arguments["mask_image_url"] = mask_image_url
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/gpt-image-1.5/edit", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -7,7 +7,7 @@ See: https://fal.ai/models/fal-ai/gpt-image-1/edit-image
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -70,39 +70,28 @@ class FalGptImage1EditImageGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalGptImage1EditImageGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "image_size": inputs.image_size,
-            "input_fidelity": inputs.input_fidelity,
-            "quality": inputs.quality,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/gpt-image-1/edit-image",
-            arguments=arguments,
-        )
-
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "image_size": inputs.image_size,
+                "input_fidelity": inputs.input_fidelity,
+                "quality": inputs.quality,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/gpt-image-1/edit-image", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
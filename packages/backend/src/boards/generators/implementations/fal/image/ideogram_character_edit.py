@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/ideogram/character/edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -160,70 +160,63 @@ class FalIdeogramCharacterEditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalIdeogramCharacterEditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        # Upload required artifacts
-        image_url = await upload_artifacts_to_fal([inputs.image_url], context)
-        mask_url = await upload_artifacts_to_fal([inputs.mask_url], context)
-        reference_image_urls = await upload_artifacts_to_fal(inputs.reference_image_urls, context)
-
-        # Upload optional artifacts
-        reference_mask_urls = None
-        if inputs.reference_mask_urls:
-            reference_mask_urls = await upload_artifacts_to_fal(inputs.reference_mask_urls, context)
-
-        style_reference_urls = None
-        if inputs.image_urls:
-            style_reference_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "image_url": image_url[0],  # Single URL
-            "mask_url": mask_url[0],  # Single URL
-            "reference_image_urls": reference_image_urls,  # Array
-            "style": inputs.style,
-            "expand_prompt": inputs.expand_prompt,
-            "rendering_speed": inputs.rendering_speed,
-            "num_images": inputs.num_images,
-            "sync_mode": inputs.sync_mode,
-        }
-
-        # Add optional parameters
-        if reference_mask_urls:
-            arguments["reference_mask_urls"] = reference_mask_urls
-
-        if style_reference_urls:
-            arguments["image_urls"] = style_reference_urls
-
-        if inputs.style_codes:
-            arguments["style_codes"] = inputs.style_codes
-
-        if inputs.color_palette:
-            # Convert Pydantic model to dict for API
-            arguments["color_palette"] = inputs.color_palette.model_dump(exclude_none=True)
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/ideogram/character/edit",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            # Upload required artifacts
+            image_url = await upload_artifacts_to_fal([inputs.image_url], context)
+            mask_url = await upload_artifacts_to_fal([inputs.mask_url], context)
+            reference_image_urls = await upload_artifacts_to_fal(
+                inputs.reference_image_urls, context
+            )
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+            # Upload optional artifacts
+            reference_mask_urls = None
+            if inputs.reference_mask_urls:
+                reference_mask_urls = await upload_artifacts_to_fal(
+                    inputs.reference_mask_urls, context
+                )
+
+            style_reference_urls = None
+            if inputs.image_urls:
+                style_reference_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "image_url": image_url[0],  # Single URL
+                "mask_url": mask_url[0],  # Single URL
+                "reference_image_urls": reference_image_urls,  # Array
+                "style": inputs.style,
+                "expand_prompt": inputs.expand_prompt,
+                "rendering_speed": inputs.rendering_speed,
+                "num_images": inputs.num_images,
+                "sync_mode": inputs.sync_mode,
+            }
+
+            # Add optional parameters
+            if reference_mask_urls:
+                arguments["reference_mask_urls"] = reference_mask_urls
+
+            if style_reference_urls:
+                arguments["image_urls"] = style_reference_urls
+
+            if inputs.style_codes:
+                arguments["style_codes"] = inputs.style_codes
+
+            if inputs.color_palette:
+                # Convert Pydantic model to dict for API
+                arguments["color_palette"] = inputs.color_palette.model_dump(exclude_none=True)
+
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/ideogram/character/edit", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,6 +9,7 @@ See: https://fal.ai/models/fal-ai/kling/v1-5/kolors-virtual-try-on
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -54,40 +55,31 @@ class FalKolorsVirtualTryOnGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalKolorsVirtualTryOnGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        human_image_urls = await upload_artifacts_to_fal([inputs.human_image_url], context)
-        garment_image_urls = await upload_artifacts_to_fal([inputs.garment_image_url], context)
-
-        human_image_url = human_image_urls[0]
-        garment_image_url = garment_image_urls[0]
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "human_image_url": human_image_url,
-            "garment_image_url": garment_image_url,
-            "sync_mode": inputs.sync_mode,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/kling/v1-5/kolors-virtual-try-on",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            human_image_urls = await upload_artifacts_to_fal([inputs.human_image_url], context)
+            garment_image_urls = await upload_artifacts_to_fal([inputs.garment_image_url], context)
+
+            human_image_url = human_image_urls[0]
+            garment_image_url = garment_image_urls[0]
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "human_image_url": human_image_url,
+                "garment_image_url": garment_image_url,
+                "sync_mode": inputs.sync_mode,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/kling/v1-5/kolors-virtual-try-on", build_arguments, context
+        )
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -7,7 +7,7 @@ See: https://fal.ai/models/fal-ai/qwen-image-2/pro/edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -112,54 +112,43 @@ class FalQwenImage2ProEditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalQwenImage2ProEditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "image_urls": image_urls,
-            "num_images": inputs.num_images,
-            "negative_prompt": inputs.negative_prompt,
-            "enable_prompt_expansion": inputs.enable_prompt_expansion,
-            "output_format": inputs.output_format,
-            "enable_safety_checker": inputs.enable_safety_checker,
-            "sync_mode": inputs.sync_mode,
-        }
-
-        # Add optional fields if provided
-        if inputs.image_size is not None:
-            if isinstance(inputs.image_size, ImageSize):
-                arguments["image_size"] = {
-                    "width": inputs.image_size.width,
-                    "height": inputs.image_size.height,
-                }
-            else:
-                arguments["image_size"] = inputs.image_size
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/qwen-image-2/pro/edit",
-            arguments=arguments,
-        )
-
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "image_urls": image_urls,
+                "num_images": inputs.num_images,
+                "negative_prompt": inputs.negative_prompt,
+                "enable_prompt_expansion": inputs.enable_prompt_expansion,
+                "output_format": inputs.output_format,
+                "enable_safety_checker": inputs.enable_safety_checker,
+                "sync_mode": inputs.sync_mode,
+            }
+
+            # Add optional fields if provided
+            if inputs.image_size is not None:
+                if isinstance(inputs.image_size, ImageSize):
+                    arguments["image_size"] = {
+                        "width": inputs.image_size.width,
+                        "height": inputs.image_size.height,
+                    }
+                else:
+                    arguments["image_size"] = inputs.image_size
+
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/qwen-image-2/pro/edit", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
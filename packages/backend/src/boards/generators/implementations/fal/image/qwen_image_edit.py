@@ -7,7 +7,7 @@ See: https://fal.ai/models/fal-ai/qwen-image-edit
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -114,58 +114,47 @@ class FalQwenImageEditGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalQwenImageEditGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        image_url = image_urls[0]
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "image_url": image_url,
-            "num_images": inputs.num_images,
-            "acceleration": inputs.acceleration,
-            "output_format": inputs.output_format,
-            "guidance_scale": inputs.guidance_scale,
-            "num_inference_steps": inputs.num_inference_steps,
-            "negative_prompt": inputs.negative_prompt,
-            "sync_mode": inputs.sync_mode,
-            "enable_safety_checker": inputs.enable_safety_checker,
-        }
-
-        # Add optional fields if provided
-        if inputs.image_size is not None:
-            # If ImageSize object, convert to dict; otherwise use string directly
-            if isinstance(inputs.image_size, ImageSize):
-                arguments["image_size"] = {
-                    "width": inputs.image_size.width,
-                    "height": inputs.image_size.height,
-                }
-            else:
-                arguments["image_size"] = inputs.image_size
-
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job and get handler
-        handler = await fal_client.submit_async(
-            "fal-ai/qwen-image-edit",
-            arguments=arguments,
-        )
-
-        # Store the external job ID for tracking
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            image_url = image_urls[0]
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "image_url": image_url,
+                "num_images": inputs.num_images,
+                "acceleration": inputs.acceleration,
+                "output_format": inputs.output_format,
+                "guidance_scale": inputs.guidance_scale,
+                "num_inference_steps": inputs.num_inference_steps,
+                "negative_prompt": inputs.negative_prompt,
+                "sync_mode": inputs.sync_mode,
+                "enable_safety_checker": inputs.enable_safety_checker,
+            }
+
+            # Add optional fields if provided
+            if inputs.image_size is not None:
+                # If ImageSize object, convert to dict; otherwise use string directly
+                if isinstance(inputs.image_size, ImageSize):
+                    arguments["image_size"] = {
+                        "width": inputs.image_size.width,
+                        "height": inputs.image_size.height,
+                    }
+                else:
+                    arguments["image_size"] = inputs.image_size
+
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/qwen-image-edit", build_arguments, context)
 
         # Stream progress updates (sample every 3rd event to avoid spam)
         from .....progress.models import ProgressUpdate
@@ -5,10 +5,15 @@ Provides helper functions for common operations across Fal generators.
 """
 
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
 from ...artifacts import AudioArtifact, DigitalArtifact, ImageArtifact, VideoArtifact
 from ...base import GeneratorExecutionContext
 
+if TYPE_CHECKING:
+    from fal_client import AsyncRequestHandle
+
 
 async def upload_artifacts_to_fal[T: DigitalArtifact](
     artifacts: list[ImageArtifact] | list[VideoArtifact] | list[AudioArtifact] | list[T],
@@ -59,3 +64,139 @@ async def upload_artifacts_to_fal[T: DigitalArtifact](
     urls = await asyncio.gather(*[upload_single_artifact(artifact) for artifact in artifacts])
 
     return list(urls)
+
+
+class ResumedFalRequest:
+    """Handle of a resumed Fal request that reports provider failures to the context.
+
+    Delegates to the wrapped `AsyncRequestHandle`. If fetching the result or
+    streaming status fails with an HTTP error from Fal, the request is marked
+    failed so that a retry submits a new one instead of resuming it again.
+    """
+
+    def __init__(
+        self,
+        handle: "AsyncRequestHandle",
+        context: GeneratorExecutionContext,
+        http_error: type[Exception],
+    ) -> None:
+        self._handle = handle
+        self._context = context
+        self._http_error = http_error
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._handle, name)
+
+    async def get(self) -> dict[str, Any]:
+        try:
+            return await self._handle.get()
+        except self._http_error:
+            self._context.mark_provider_job_failed()
+            raise
+
+    async def iter_events(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        try:
+            async for event in self._handle.iter_events(*args, **kwargs):
+                yield event
+        except self._http_error:
+            self._context.mark_provider_job_failed()
+            raise
+
+
+async def resume_fal_request(
+    endpoint: str,
+    context: GeneratorExecutionContext,
+) -> "AsyncRequestHandle | ResumedFalRequest | None":
+    """
+    Reattach to the Fal request submitted by a previous attempt of this generation.
+
+    When a failed generation is retried, the request submitted by the earlier
+    attempt (see `context.resumable_external_job_id()`) is usually still running
+    or already finished on Fal. Polling it and fetching its result avoids paying
+    for the generation twice.
+
+    Args:
+        endpoint: Fal endpoint ID the request was submitted to
+        context: Generator execution context
+
+    Returns:
+        Handle of the existing request (with its cancel handler registered), or
+        None if there is none to resume, Fal no longer knows it, or it finished
+        with an error. The caller then submits a new request. The last two
+        cases, and a resumed request whose result Fal rejects, are reported
+        with `context.mark_provider_job_failed()`.
+
+    Raises:
+        ImportError: If fal_client is not installed
+    """
+    request_id = context.resumable_external_job_id()
+    if request_id is None:
+        return None
+
+    try:
+        import fal_client
+    except ImportError as e:
+        raise ImportError(
+            "fal.ai SDK is required for Fal generators. "
+            "Install with: pip install weirdfingers-boards[generators-fal]"
+        ) from e
+
+    handler = await fal_client.async_client.get_handle(endpoint, request_id)
+    try:
+        status = await handler.status()
+    except fal_client.FalClientHTTPError:
+        # Unknown or expired request (or one submitted to another endpoint)
+        context.mark_provider_job_failed()
+        return None
+    if isinstance(status, fal_client.Completed) and status.error:
+        context.mark_provider_job_failed()
+        return None
+
+    context.set_cancel_handler(handler.cancel)
+    return ResumedFalRequest(handler, context, fal_client.FalClientHTTPError)
+
+
+async def submit_or_resume(
+    endpoint: str,
+    arguments: dict[str, Any] | Callable[[], Awaitable[dict[str, Any]]],
+    context: GeneratorExecutionContext,
+) -> "AsyncRequestHandle | ResumedFalRequest":
+    """
+    Submit a Fal request, or reattach to the one a previous attempt submitted.
+
+    A new request waits for a provider slot first, and is recorded as the
+    generation's external job with its cancel handler registered. A resumed
+    request (see `resume_fal_request`) skips both the slot and building the
+    arguments, so pass inputs that need uploading as an async callable that
+    uploads them and returns the arguments.
+
+    Args:
+        endpoint: Fal endpoint ID
+        arguments: Request arguments, or an async callable returning them
+        context: Generator execution context
+
+    Returns:
+        Handle of the submitted or resumed request
+
+    Raises:
+        ImportError: If fal_client is not installed
+    """
+    handler = await resume_fal_request(endpoint, context)
+    if handler is not None:
+        return handler
+
+    try:
+        import fal_client
+    except ImportError as e:
+        raise ImportError(
+            "fal.ai SDK is required for Fal generators. "
+            "Install with: pip install weirdfingers-boards[generators-fal]"
+        ) from e
+
+    if callable(arguments):
+        arguments = await arguments()
+    await context.acquire_provider_slot("fal", endpoint)
+    submitted = await fal_client.submit_async(endpoint, arguments=arguments)
+    await context.set_external_job_id(submitted.request_id)
+    context.set_cancel_handler(submitted.cancel)
+    return submitted
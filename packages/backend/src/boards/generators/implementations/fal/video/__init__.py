@@ -1,78 +1,83 @@
 """Fal.ai video generators."""
 
-from .bytedance_seedance_v1_pro_text_to_video import (
-    FalBytedanceSeedanceV1ProTextToVideoGenerator,
-)
-from .creatify_lipsync import FalCreatifyLipsyncGenerator
-from .fal_bytedance_seedance_v1_5_pro_image_to_video import (
-    FalBytedanceSeedanceV15ProImageToVideoGenerator,
-)
-from .fal_bytedance_seedance_v1_5_pro_text_to_video import (
-    FalBytedanceSeedanceV15ProTextToVideoGenerator,
-)
-from .fal_bytedance_seedance_v1_pro_image_to_video import (
-    FalBytedanceSeedanceV1ProImageToVideoGenerator,
-)
-from .fal_minimax_hailuo_02_standard_text_to_video import (
-    FalMinimaxHailuo02StandardTextToVideoGenerator,
-)
-from .fal_pixverse_lipsync import FalPixverseLipsyncGenerator
-from .fal_sora_2_text_to_video import FalSora2TextToVideoGenerator
-from .grok_imagine_video_extend_video import (
-    FalGrokImagineVideoExtendVideoGenerator,
-)
-from .grok_imagine_video_reference_to_video import (
-    FalGrokImagineVideoReferenceToVideoGenerator,
-)
-from .infinitalk import FalInfinitalkGenerator
-from .kling_motion_control import FalKlingMotionControlGenerator
-from .kling_video_ai_avatar_v2_pro import FalKlingVideoAiAvatarV2ProGenerator
-from .kling_video_ai_avatar_v2_standard import (
-    FalKlingVideoAiAvatarV2StandardGenerator,
-)
-from .kling_video_o3_standard_image_to_video import (
-    FalKlingVideoO3StandardImageToVideoGenerator,
-)
-from .kling_video_v2_5_turbo_pro_image_to_video import (
-    FalKlingVideoV25TurboProImageToVideoGenerator,
-)
-from .kling_video_v2_5_turbo_pro_text_to_video import (
-    FalKlingVideoV25TurboProTextToVideoGenerator,
-)
-from .kling_video_v3_pro_image_to_video import (
-    FalKlingVideoV3ProImageToVideoGenerator,
-)
-from .kling_video_v3_pro_text_to_video import (
-    FalKlingVideoV3ProTextToVideoGenerator,
-)
-from .kling_video_v26_pro_image_to_video import (
-    FalKlingVideoV26ProImageToVideoGenerator,
-)
-from .kling_video_v26_pro_motion_control import (
-    FalKlingVideoV26ProMotionControlGenerator,
-)
-from .ltx_23_image_to_video import FalLtx23ImageToVideoGenerator
-from .ltx_23_text_to_video import FalLtx23TextToVideoGenerator
-from .minimax_hailuo_2_3_pro_image_to_video import (
-    FalMinimaxHailuo23ProImageToVideoGenerator,
-)
-from .sora2_image_to_video import FalSora2ImageToVideoGenerator
-from .sora_2_image_to_video_pro import FalSora2ImageToVideoProGenerator
-from .sora_2_text_to_video_pro import FalSora2TextToVideoProGenerator
-from .sync_lipsync_v2 import FalSyncLipsyncV2Generator
-from .sync_lipsync_v2_pro import FalSyncLipsyncV2ProGenerator
-from .veed_fabric_1_0 import FalVeedFabric10Generator
-from .veed_lipsync import FalVeedLipsyncGenerator
-from .veo3 import FalVeo3Generator
-from .veo31 import FalVeo31Generator
-from .veo31_fast import FalVeo31FastGenerator
-from .veo31_fast_image_to_video import FalVeo31FastImageToVideoGenerator
-from .veo31_first_last_frame_to_video import FalVeo31FirstLastFrameToVideoGenerator
-from .veo31_image_to_video import FalVeo31ImageToVideoGenerator
-from .veo31_reference_to_video import FalVeo31ReferenceToVideoGenerator
-from .wan_25_preview_image_to_video import FalWan25PreviewImageToVideoGenerator
-from .wan_25_preview_text_to_video import FalWan25PreviewTextToVideoGenerator
-from .wan_pro_image_to_video import FalWanProImageToVideoGenerator
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .bytedance_seedance_v1_pro_text_to_video import (
+        FalBytedanceSeedanceV1ProTextToVideoGenerator,
+    )
+    from .creatify_lipsync import FalCreatifyLipsyncGenerator
+    from .fal_bytedance_seedance_v1_5_pro_image_to_video import (
+        FalBytedanceSeedanceV15ProImageToVideoGenerator,
+    )
+    from .fal_bytedance_seedance_v1_5_pro_text_to_video import (
+        FalBytedanceSeedanceV15ProTextToVideoGenerator,
+    )
+    from .fal_bytedance_seedance_v1_pro_image_to_video import (
+        FalBytedanceSeedanceV1ProImageToVideoGenerator,
+    )
+    from .fal_minimax_hailuo_02_standard_text_to_video import (
+        FalMinimaxHailuo02StandardTextToVideoGenerator,
+    )
+    from .fal_pixverse_lipsync import FalPixverseLipsyncGenerator
+    from .fal_sora_2_text_to_video import FalSora2TextToVideoGenerator
+    from .grok_imagine_video_extend_video import (
+        FalGrokImagineVideoExtendVideoGenerator,
+    )
+    from .grok_imagine_video_reference_to_video import (
+        FalGrokImagineVideoReferenceToVideoGenerator,
+    )
+    from .infinitalk import FalInfinitalkGenerator
+    from .kling_motion_control import FalKlingMotionControlGenerator
+    from .kling_video_ai_avatar_v2_pro import FalKlingVideoAiAvatarV2ProGenerator
+    from .kling_video_ai_avatar_v2_standard import (
+        FalKlingVideoAiAvatarV2StandardGenerator,
+    )
+    from .kling_video_o3_standard_image_to_video import (
+        FalKlingVideoO3StandardImageToVideoGenerator,
+    )
+    from .kling_video_v2_5_turbo_pro_image_to_video import (
+        FalKlingVideoV25TurboProImageToVideoGenerator,
+    )
+    from .kling_video_v2_5_turbo_pro_text_to_video import (
+        FalKlingVideoV25TurboProTextToVideoGenerator,
+    )
+    from .kling_video_v3_pro_image_to_video import (
+        FalKlingVideoV3ProImageToVideoGenerator,
+    )
+    from .kling_video_v3_pro_text_to_video import (
+        FalKlingVideoV3ProTextToVideoGenerator,
+    )
+    from .kling_video_v26_pro_image_to_video import (
+        FalKlingVideoV26ProImageToVideoGenerator,
+    )
+    from .kling_video_v26_pro_motion_control import (
+        FalKlingVideoV26ProMotionControlGenerator,
+    )
+    from .ltx_23_image_to_video import FalLtx23ImageToVideoGenerator
+    from .ltx_23_text_to_video import FalLtx23TextToVideoGenerator
+    from .minimax_hailuo_2_3_pro_image_to_video import (
+        FalMinimaxHailuo23ProImageToVideoGenerator,
+    )
+    from .sora2_image_to_video import FalSora2ImageToVideoGenerator
+    from .sora_2_image_to_video_pro import FalSora2ImageToVideoProGenerator
+    from .sora_2_text_to_video_pro import FalSora2TextToVideoProGenerator
+    from .sync_lipsync_v2 import FalSyncLipsyncV2Generator
+    from .sync_lipsync_v2_pro import FalSyncLipsyncV2ProGenerator
+    from .veed_fabric_1_0 import FalVeedFabric10Generator
+    from .veed_lipsync import FalVeedLipsyncGenerator
+    from .veo3 import FalVeo3Generator
+    from .veo31 import FalVeo31Generator
+    from .veo31_fast import FalVeo31FastGenerator
+    from .veo31_fast_image_to_video import FalVeo31FastImageToVideoGenerator
+    from .veo31_first_last_frame_to_video import FalVeo31FirstLastFrameToVideoGenerator
+    from .veo31_image_to_video import FalVeo31ImageToVideoGenerator
+    from .veo31_reference_to_video import FalVeo31ReferenceToVideoGenerator
+    from .wan_25_preview_image_to_video import FalWan25PreviewImageToVideoGenerator
+    from .wan_25_preview_text_to_video import FalWan25PreviewTextToVideoGenerator
+    from .wan_pro_image_to_video import FalWanProImageToVideoGenerator
 
 __all__ = [
     "FalInfinitalkGenerator",
@@ -117,3 +122,66 @@ __all__ = [
     "FalWan25PreviewTextToVideoGenerator",
     "FalWanProImageToVideoGenerator",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".bytedance_seedance_v1_pro_text_to_video": (
+            "FalBytedanceSeedanceV1ProTextToVideoGenerator",
+        ),
+        ".creatify_lipsync": ("FalCreatifyLipsyncGenerator",),
+        ".fal_bytedance_seedance_v1_5_pro_image_to_video": (
+            "FalBytedanceSeedanceV15ProImageToVideoGenerator",
+        ),
+        ".fal_bytedance_seedance_v1_5_pro_text_to_video": (
+            "FalBytedanceSeedanceV15ProTextToVideoGenerator",
+        ),
+        ".fal_bytedance_seedance_v1_pro_image_to_video": (
+            "FalBytedanceSeedanceV1ProImageToVideoGenerator",
+        ),
+        ".fal_minimax_hailuo_02_standard_text_to_video": (
+            "FalMinimaxHailuo02StandardTextToVideoGenerator",
+        ),
+        ".fal_pixverse_lipsync": ("FalPixverseLipsyncGenerator",),
+        ".fal_sora_2_text_to_video": ("FalSora2TextToVideoGenerator",),
+        ".grok_imagine_video_extend_video": ("FalGrokImagineVideoExtendVideoGenerator",),
+        ".grok_imagine_video_reference_to_video": ("FalGrokImagineVideoReferenceToVideoGenerator",),
+        ".infinitalk": ("FalInfinitalkGenerator",),
+        ".kling_motion_control": ("FalKlingMotionControlGenerator",),
+        ".kling_video_ai_avatar_v2_pro": ("FalKlingVideoAiAvatarV2ProGenerator",),
+        ".kling_video_ai_avatar_v2_standard": ("FalKlingVideoAiAvatarV2StandardGenerator",),
+        ".kling_video_o3_standard_image_to_video": (
+            "FalKlingVideoO3StandardImageToVideoGenerator",
+        ),
+        ".kling_video_v2_5_turbo_pro_image_to_video": (
+            "FalKlingVideoV25TurboProImageToVideoGenerator",
+        ),
+        ".kling_video_v2_5_turbo_pro_text_to_video": (
+            "FalKlingVideoV25TurboProTextToVideoGenerator",
+        ),
+        ".kling_video_v3_pro_image_to_video": ("FalKlingVideoV3ProImageToVideoGenerator",),
+        ".kling_video_v3_pro_text_to_video": ("FalKlingVideoV3ProTextToVideoGenerator",),
+        ".kling_video_v26_pro_image_to_video": ("FalKlingVideoV26ProImageToVideoGenerator",),
+        ".kling_video_v26_pro_motion_control": ("FalKlingVideoV26ProMotionControlGenerator",),
+        ".ltx_23_image_to_video": ("FalLtx23ImageToVideoGenerator",),
+        ".ltx_23_text_to_video": ("FalLtx23TextToVideoGenerator",),
+        ".minimax_hailuo_2_3_pro_image_to_video": ("FalMinimaxHailuo23ProImageToVideoGenerator",),
+        ".sora2_image_to_video": ("FalSora2ImageToVideoGenerator",),
+        ".sora_2_image_to_video_pro": ("FalSora2ImageToVideoProGenerator",),
+        ".sora_2_text_to_video_pro": ("FalSora2TextToVideoProGenerator",),
+        ".sync_lipsync_v2": ("FalSyncLipsyncV2Generator",),
+        ".sync_lipsync_v2_pro": ("FalSyncLipsyncV2ProGenerator",),
+        ".veed_fabric_1_0": ("FalVeedFabric10Generator",),
+        ".veed_lipsync": ("FalVeedLipsyncGenerator",),
+        ".veo3": ("FalVeo3Generator",),
+        ".veo31": ("FalVeo31Generator",),
+        ".veo31_fast": ("FalVeo31FastGenerator",),
+        ".veo31_fast_image_to_video": ("FalVeo31FastImageToVideoGenerator",),
+        ".veo31_first_last_frame_to_video": ("FalVeo31FirstLastFrameToVideoGenerator",),
+        ".veo31_image_to_video": ("FalVeo31ImageToVideoGenerator",),
+        ".veo31_reference_to_video": ("FalVeo31ReferenceToVideoGenerator",),
+        ".wan_25_preview_image_to_video": ("FalWan25PreviewImageToVideoGenerator",),
+        ".wan_25_preview_text_to_video": ("FalWan25PreviewTextToVideoGenerator",),
+        ".wan_pro_image_to_video": ("FalWanProImageToVideoGenerator",),
+    },
+)
@@ -67,15 +67,6 @@ class FalBytedanceSeedanceV1ProTextToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBytedanceSeedanceV1ProTextToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "prompt": inputs.prompt,
@@ -90,14 +81,12 @@ class FalBytedanceSeedanceV1ProTextToVideoGenerator(BaseGenerator):
         if inputs.seed is not None:
             arguments["seed"] = inputs.seed
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/bytedance/seedance/v1/pro/text-to-video",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/bytedance/seedance/v1/pro/text-to-video", arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/bytedance/seedance/v1.5/pro/image-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -79,50 +79,41 @@ class FalBytedanceSeedanceV15ProImageToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalBytedanceSeedanceV15ProImageToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image], context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "image_url": image_urls[0],
-            "aspect_ratio": inputs.aspect_ratio,
-            "resolution": inputs.resolution,
-            "duration": inputs.duration,
-            "generate_audio": inputs.generate_audio,
-            "camera_fixed": inputs.camera_fixed,
-        }
-
-        # Upload end image if provided
-        if inputs.end_image is not None:
-            end_image_urls = await upload_artifacts_to_fal([inputs.end_image], context)
-            arguments["end_image_url"] = end_image_urls[0]
-
-        # Add seed if provided
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/bytedance/seedance/v1.5/pro/image-to-video",
-            arguments=arguments,
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image], context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "image_url": image_urls[0],
+                "aspect_ratio": inputs.aspect_ratio,
+                "resolution": inputs.resolution,
+                "duration": inputs.duration,
+                "generate_audio": inputs.generate_audio,
+                "camera_fixed": inputs.camera_fixed,
+            }
+
+            # Upload end image if provided
+            if inputs.end_image is not None:
+                end_image_urls = await upload_artifacts_to_fal([inputs.end_image], context)
+                arguments["end_image_url"] = end_image_urls[0]
+
+            # Add seed if provided
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/bytedance/seedance/v1.5/pro/image-to-video", build_arguments, context
         )
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
-
         # Stream progress updates
         from .....progress.models import ProgressUpdate
 
@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/pixverse/lipsync
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -71,43 +71,34 @@ class FalPixverseLipsyncGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalPixverseLipsyncGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload video artifact to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        video_urls = await upload_artifacts_to_fal([inputs.video_url], context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "video_url": video_urls[0],
-            "voice_id": inputs.voice_id,
-        }
-
-        # Add audio_url if provided, otherwise add text for TTS
-        if inputs.audio_url is not None:
-            audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
-            arguments["audio_url"] = audio_urls[0]
-        elif inputs.text is not None:
-            arguments["text"] = inputs.text
-        else:
-            raise ValueError("Either audio_url or text must be provided for lip-sync generation")
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/pixverse/lipsync",
-            arguments=arguments,
-        )
-
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload video artifact to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            video_urls = await upload_artifacts_to_fal([inputs.video_url], context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "video_url": video_urls[0],
+                "voice_id": inputs.voice_id,
+            }
+
+            # Add audio_url if provided, otherwise add text for TTS
+            if inputs.audio_url is not None:
+                audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
+                arguments["audio_url"] = audio_urls[0]
+            elif inputs.text is not None:
+                arguments["text"] = inputs.text
+            else:
+                raise ValueError(
+                    "Either audio_url or text must be provided for lip-sync generation"
+                )
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/pixverse/lipsync", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,6 +9,7 @@ See: https://fal.ai/models/xai/grok-imagine-video/extend-video
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -57,35 +58,26 @@ class FalGrokImagineVideoExtendVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalGrokImagineVideoExtendVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload video artifact to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        video_urls = await upload_artifacts_to_fal([inputs.video], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "video_url": video_urls[0],
-            "duration": inputs.duration,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "xai/grok-imagine-video/extend-video",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload video artifact to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            video_urls = await upload_artifacts_to_fal([inputs.video], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "video_url": video_urls[0],
+                "duration": inputs.duration,
+            }
+            return arguments
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "xai/grok-imagine-video/extend-video", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,7 +9,7 @@ See: https://fal.ai/models/xai/grok-imagine-video/reference-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -77,37 +77,28 @@ class FalGrokImagineVideoReferenceToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalGrokImagineVideoReferenceToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        reference_image_urls = await upload_artifacts_to_fal(inputs.reference_images, context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "reference_image_urls": reference_image_urls,
-            "duration": inputs.duration,
-            "aspect_ratio": inputs.aspect_ratio,
-            "resolution": inputs.resolution,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "xai/grok-imagine-video/reference-to-video",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            reference_image_urls = await upload_artifacts_to_fal(inputs.reference_images, context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "reference_image_urls": reference_image_urls,
+                "duration": inputs.duration,
+                "aspect_ratio": inputs.aspect_ratio,
+                "resolution": inputs.resolution,
+            }
+            return arguments
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "xai/grok-imagine-video/reference-to-video", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
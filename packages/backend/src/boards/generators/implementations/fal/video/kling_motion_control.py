@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/kling-video/v2.6/standard/motion-control
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -70,42 +70,33 @@ class FalKlingMotionControlGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalKlingMotionControlGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image and video artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        video_urls = await upload_artifacts_to_fal([inputs.video_url], context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "image_url": image_urls[0],
-            "video_url": video_urls[0],
-            "character_orientation": inputs.character_orientation,
-            "keep_original_sound": inputs.keep_original_sound,
-        }
-
-        # Add optional prompt if provided
-        if inputs.prompt is not None:
-            arguments["prompt"] = inputs.prompt
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/kling-video/v2.6/standard/motion-control",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image and video artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            video_urls = await upload_artifacts_to_fal([inputs.video_url], context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "image_url": image_urls[0],
+                "video_url": video_urls[0],
+                "character_orientation": inputs.character_orientation,
+                "keep_original_sound": inputs.keep_original_sound,
+            }
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+            # Add optional prompt if provided
+            if inputs.prompt is not None:
+                arguments["prompt"] = inputs.prompt
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/kling-video/v2.6/standard/motion-control", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -10,6 +10,7 @@ See: https://fal.ai/models/fal-ai/kling-video/ai-avatar/v2/standard
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -50,41 +51,32 @@ class FalKlingVideoAiAvatarV2StandardGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalKlingVideoAiAvatarV2StandardGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image and audio artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        # Upload image and audio separately
-        image_urls = await upload_artifacts_to_fal([inputs.image], context)
-        audio_urls = await upload_artifacts_to_fal([inputs.audio], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_url": image_urls[0],
-            "audio_url": audio_urls[0],
-        }
-
-        # Add prompt only if provided and not the default empty value
-        if inputs.prompt and inputs.prompt != ".":
-            arguments["prompt"] = inputs.prompt
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/kling-video/ai-avatar/v2/standard",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image and audio artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            # Upload image and audio separately
+            image_urls = await upload_artifacts_to_fal([inputs.image], context)
+            audio_urls = await upload_artifacts_to_fal([inputs.audio], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_url": image_urls[0],
+                "audio_url": audio_urls[0],
+            }
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+            # Add prompt only if provided and not the default empty value
+            if inputs.prompt and inputs.prompt != ".":
+                arguments["prompt"] = inputs.prompt
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/kling-video/ai-avatar/v2/standard", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/kling-video/o3/standard/image-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -73,44 +73,35 @@ class FalKlingVideoO3StandardImageToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalKlingVideoO3StandardImageToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        artifacts_to_upload = [inputs.start_frame]
-        if inputs.end_frame is not None:
-            artifacts_to_upload.append(inputs.end_frame)
-
-        uploaded_urls = await upload_artifacts_to_fal(artifacts_to_upload, context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "prompt": inputs.prompt,
-            "image_url": uploaded_urls[0],
-            "duration": inputs.duration,
-            "negative_prompt": inputs.negative_prompt,
-            "cfg_scale": inputs.cfg_scale,
-        }
-
-        if inputs.end_frame is not None:
-            arguments["tail_image_url"] = uploaded_urls[1]
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/kling-video/o3/standard/image-to-video",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
+
+            artifacts_to_upload = [inputs.start_frame]
+            if inputs.end_frame is not None:
+                artifacts_to_upload.append(inputs.end_frame)
+
+            uploaded_urls = await upload_artifacts_to_fal(artifacts_to_upload, context)
+
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "prompt": inputs.prompt,
+                "image_url": uploaded_urls[0],
+                "duration": inputs.duration,
+                "negative_prompt": inputs.negative_prompt,
+                "cfg_scale": inputs.cfg_scale,
+            }
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+            if inputs.end_frame is not None:
+                arguments["tail_image_url"] = uploaded_urls[1]
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/kling-video/o3/standard/image-to-video", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
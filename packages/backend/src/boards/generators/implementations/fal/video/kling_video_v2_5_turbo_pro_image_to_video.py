@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/kling-video/v2.5-turbo/pro/image-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -69,38 +69,29 @@ class FalKlingVideoV25TurboProImageToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalKlingVideoV25TurboProImageToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "prompt": inputs.prompt,
-            "image_url": image_urls[0],
-            "duration": inputs.duration,
-            "negative_prompt": inputs.negative_prompt,
-            "cfg_scale": inputs.cfg_scale,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/kling-video/v2.5-turbo/pro/image-to-video",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "prompt": inputs.prompt,
+                "image_url": image_urls[0],
+                "duration": inputs.duration,
+                "negative_prompt": inputs.negative_prompt,
+                "cfg_scale": inputs.cfg_scale,
+            }
+            return arguments
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/kling-video/v2.5-turbo/pro/image-to-video", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
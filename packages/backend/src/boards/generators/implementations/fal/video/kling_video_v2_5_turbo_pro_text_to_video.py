@@ -65,15 +65,6 @@ class FalKlingVideoV25TurboProTextToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalKlingVideoV25TurboProTextToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "prompt": inputs.prompt,
@@ -83,14 +74,12 @@ class FalKlingVideoV25TurboProTextToVideoGenerator(BaseGenerator):
             "cfg_scale": inputs.cfg_scale,
         }
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/kling-video/v2.5-turbo/pro/text-to-video",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/kling-video/v2.5-turbo/pro/text-to-video", arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/ltx-2.3/image-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -81,42 +81,33 @@ class FalLtx23ImageToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalLtx23ImageToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        artifacts_to_upload = [inputs.image]
-        if inputs.end_image is not None:
-            artifacts_to_upload.append(inputs.end_image)
-
-        image_urls = await upload_artifacts_to_fal(artifacts_to_upload, context)
-
-        arguments: dict = {
-            "image_url": image_urls[0],
-            "prompt": inputs.prompt,
-            "duration": inputs.duration,
-            "resolution": inputs.resolution,
-            "aspect_ratio": inputs.aspect_ratio,
-            "fps": inputs.fps,
-            "generate_audio": inputs.generate_audio,
-        }
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
 
-        if inputs.end_image is not None:
-            arguments["end_image_url"] = image_urls[1]
+            artifacts_to_upload = [inputs.image]
+            if inputs.end_image is not None:
+                artifacts_to_upload.append(inputs.end_image)
 
-        handler = await fal_client.submit_async(
-            "fal-ai/ltx-2.3/image-to-video",
-            arguments=arguments,
-        )
+            image_urls = await upload_artifacts_to_fal(artifacts_to_upload, context)
+
+            arguments: dict = {
+                "image_url": image_urls[0],
+                "prompt": inputs.prompt,
+                "duration": inputs.duration,
+                "resolution": inputs.resolution,
+                "aspect_ratio": inputs.aspect_ratio,
+                "fps": inputs.fps,
+                "generate_audio": inputs.generate_audio,
+            }
+
+            if inputs.end_image is not None:
+                arguments["end_image_url"] = image_urls[1]
+            return arguments
+
+        from ..utils import submit_or_resume
 
-        await context.set_external_job_id(handler.request_id)
+        handler = await submit_or_resume("fal-ai/ltx-2.3/image-to-video", build_arguments, context)
 
         from .....progress.models import ProgressUpdate
 
@@ -51,7 +51,7 @@ class FalLtx23TextToVideoGenerator(BaseGenerator):
 
     name = "fal-ltx-23-text-to-video"
     description = (
-        "Fal: LTX-2.3 Pro - High-quality text-to-video generation " "with audio support up to 2160p"
+        "Fal: LTX-2.3 Pro - High-quality text-to-video generation with audio support up to 2160p"
     )
     artifact_type = "video"
 
@@ -66,14 +66,6 @@ class FalLtx23TextToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalLtx23TextToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         arguments: dict = {
             "prompt": inputs.prompt,
             "duration": inputs.duration,
@@ -83,12 +75,9 @@ class FalLtx23TextToVideoGenerator(BaseGenerator):
             "generate_audio": inputs.generate_audio,
         }
 
-        handler = await fal_client.submit_async(
-            "fal-ai/ltx-2.3/text-to-video",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        await context.set_external_job_id(handler.request_id)
+        handler = await submit_or_resume("fal-ai/ltx-2.3/text-to-video", arguments, context)
 
         from .....progress.models import ProgressUpdate
 
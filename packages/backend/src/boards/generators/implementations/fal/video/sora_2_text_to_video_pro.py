@@ -57,15 +57,6 @@ class FalSora2TextToVideoProGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalSora2TextToVideoProGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "prompt": inputs.prompt,
@@ -74,14 +65,10 @@ class FalSora2TextToVideoProGenerator(BaseGenerator):
             "duration": inputs.duration,
         }
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/sora-2/text-to-video/pro",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/sora-2/text-to-video/pro", arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
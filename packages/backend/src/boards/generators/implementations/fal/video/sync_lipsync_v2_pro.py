@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/sync-lipsync/v2/pro
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -51,38 +51,27 @@ class FalSyncLipsyncV2ProGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalSyncLipsyncV2ProGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload video and audio artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        from ..utils import upload_artifacts_to_fal
-
-        # Upload video and audio separately
-        video_urls = await upload_artifacts_to_fal([inputs.video], context)
-        audio_urls = await upload_artifacts_to_fal([inputs.audio], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "video_url": video_urls[0],
-            "audio_url": audio_urls[0],
-            "sync_mode": inputs.sync_mode,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/sync-lipsync/v2/pro",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload video and audio artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            from ..utils import upload_artifacts_to_fal
+
+            # Upload video and audio separately
+            video_urls = await upload_artifacts_to_fal([inputs.video], context)
+            audio_urls = await upload_artifacts_to_fal([inputs.audio], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "video_url": video_urls[0],
+                "audio_url": audio_urls[0],
+                "sync_mode": inputs.sync_mode,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/sync-lipsync/v2/pro", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
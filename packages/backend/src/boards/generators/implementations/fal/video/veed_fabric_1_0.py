@@ -10,13 +10,13 @@ See: https://fal.ai/models/veed/fabric-1.0
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 from ....artifacts import AudioArtifact, ImageArtifact
 from ....base import BaseGenerator, GeneratorExecutionContext, GeneratorResult
-from ..utils import upload_artifacts_to_fal
+from ..utils import submit_or_resume, upload_artifacts_to_fal
 
 
 class VeedFabric10Input(BaseModel):
@@ -52,35 +52,22 @@ class FalVeedFabric10Generator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalVeedFabric10Generator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image and audio artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
-        audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_url": image_urls[0],
-            "audio_url": audio_urls[0],
-            "resolution": inputs.resolution,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "veed/fabric-1.0",
-            arguments=arguments,
-        )
-
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image and audio artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            image_urls = await upload_artifacts_to_fal([inputs.image_url], context)
+            audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_url": image_urls[0],
+                "audio_url": audio_urls[0],
+                "resolution": inputs.resolution,
+            }
+            return arguments
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("veed/fabric-1.0", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
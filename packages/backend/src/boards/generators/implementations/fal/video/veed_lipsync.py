@@ -9,12 +9,13 @@ See: https://fal.ai/models/veed/lipsync
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
 from ....artifacts import AudioArtifact, VideoArtifact
 from ....base import BaseGenerator, GeneratorExecutionContext, GeneratorResult
-from ..utils import upload_artifacts_to_fal
+from ..utils import submit_or_resume, upload_artifacts_to_fal
 
 
 class VeedLipsyncInput(BaseModel):
@@ -47,35 +48,22 @@ class FalVeedLipsyncGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalVeedLipsyncGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload video and audio artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs
-        # Upload video and audio separately
-        video_urls = await upload_artifacts_to_fal([inputs.video_url], context)
-        audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "video_url": video_urls[0],
-            "audio_url": audio_urls[0],
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "veed/lipsync",
-            arguments=arguments,
-        )
-
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        async def build_arguments() -> dict[str, Any]:
+            # Upload video and audio artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs
+            # Upload video and audio separately
+            video_urls = await upload_artifacts_to_fal([inputs.video_url], context)
+            audio_urls = await upload_artifacts_to_fal([inputs.audio_url], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "video_url": video_urls[0],
+                "audio_url": audio_urls[0],
+            }
+            return arguments
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("veed/lipsync", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -73,15 +73,6 @@ class FalVeo31FastGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalVeo31FastGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
         # Prepare arguments for fal.ai API
         arguments = {
             "prompt": inputs.prompt,
@@ -99,14 +90,10 @@ class FalVeo31FastGenerator(BaseGenerator):
         if inputs.negative_prompt is not None:
             arguments["negative_prompt"] = inputs.negative_prompt
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/veo3.1/fast",
-            arguments=arguments,
-        )
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/veo3.1/fast", arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/veo3.1/first-last-frame-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -66,45 +66,36 @@ class FalVeo31FirstLastFrameToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalVeo31FirstLastFrameToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        first_frame_urls = await upload_artifacts_to_fal([inputs.first_frame], context)
-        last_frame_urls = await upload_artifacts_to_fal([inputs.last_frame], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "first_frame_url": first_frame_urls[0],
-            "last_frame_url": last_frame_urls[0],
-            "prompt": inputs.prompt,
-            "duration": inputs.duration,
-            "aspect_ratio": inputs.aspect_ratio,
-            "resolution": inputs.resolution,
-            "generate_audio": inputs.generate_audio,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/veo3.1/first-last-frame-to-video",
-            arguments=arguments,
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            first_frame_urls = await upload_artifacts_to_fal([inputs.first_frame], context)
+            last_frame_urls = await upload_artifacts_to_fal([inputs.last_frame], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "first_frame_url": first_frame_urls[0],
+                "last_frame_url": last_frame_urls[0],
+                "prompt": inputs.prompt,
+                "duration": inputs.duration,
+                "aspect_ratio": inputs.aspect_ratio,
+                "resolution": inputs.resolution,
+                "generate_audio": inputs.generate_audio,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/veo3.1/first-last-frame-to-video", build_arguments, context
         )
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
-
         # Stream progress updates
         from .....progress.models import ProgressUpdate
 
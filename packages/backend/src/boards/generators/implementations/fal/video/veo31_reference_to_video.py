@@ -9,7 +9,7 @@ See: https://fal.ai/models/fal-ai/veo3.1/reference-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -61,42 +61,33 @@ class FalVeo31ReferenceToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalVeo31ReferenceToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifacts to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        reference_image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_urls": reference_image_urls,
-            "prompt": inputs.prompt,
-            "duration": inputs.duration,
-            "resolution": inputs.resolution,
-            "generate_audio": inputs.generate_audio,
-        }
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/veo3.1/reference-to-video",
-            arguments=arguments,
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifacts to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            reference_image_urls = await upload_artifacts_to_fal(inputs.image_urls, context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_urls": reference_image_urls,
+                "prompt": inputs.prompt,
+                "duration": inputs.duration,
+                "resolution": inputs.resolution,
+                "generate_audio": inputs.generate_audio,
+            }
+            return arguments
+
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/veo3.1/reference-to-video", build_arguments, context
         )
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
-
         # Stream progress updates
         from .....progress.models import ProgressUpdate
 
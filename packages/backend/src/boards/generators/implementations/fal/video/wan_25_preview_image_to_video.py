@@ -10,7 +10,7 @@ See: https://fal.ai/models/fal-ai/wan-25-preview/image-to-video
 """
 
 import os
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -87,48 +87,39 @@ class FalWan25PreviewImageToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalWan25PreviewImageToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image], context)
-
-        # Prepare arguments for fal.ai API
-        arguments: dict = {
-            "image_url": image_urls[0],
-            "prompt": inputs.prompt,
-            "duration": inputs.duration,
-            "resolution": inputs.resolution,
-            "enable_prompt_expansion": inputs.enable_prompt_expansion,
-            "enable_safety_checker": inputs.enable_safety_checker,
-        }
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            from ..utils import upload_artifacts_to_fal
 
-        # Only add optional parameters if provided
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
+            image_urls = await upload_artifacts_to_fal([inputs.image], context)
 
-        if inputs.negative_prompt is not None:
-            arguments["negative_prompt"] = inputs.negative_prompt
+            # Prepare arguments for fal.ai API
+            arguments: dict = {
+                "image_url": image_urls[0],
+                "prompt": inputs.prompt,
+                "duration": inputs.duration,
+                "resolution": inputs.resolution,
+                "enable_prompt_expansion": inputs.enable_prompt_expansion,
+                "enable_safety_checker": inputs.enable_safety_checker,
+            }
 
-        if inputs.audio_url is not None:
-            arguments["audio_url"] = inputs.audio_url
+            # Only add optional parameters if provided
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
 
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/wan-25-preview/image-to-video",
-            arguments=arguments,
-        )
+            if inputs.negative_prompt is not None:
+                arguments["negative_prompt"] = inputs.negative_prompt
+
+            if inputs.audio_url is not None:
+                arguments["audio_url"] = inputs.audio_url
+            return arguments
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        from ..utils import submit_or_resume
+
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume(
+            "fal-ai/wan-25-preview/image-to-video", build_arguments, context
+        )
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
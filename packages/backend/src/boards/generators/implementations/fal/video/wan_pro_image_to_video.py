@@ -10,6 +10,7 @@ See: https://fal.ai/models/fal-ai/wan-pro/image-to-video
 """
 
 import os
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -55,43 +56,32 @@ class FalWanProImageToVideoGenerator(BaseGenerator):
         if not os.getenv("FAL_KEY"):
             raise ValueError("API configuration invalid. Missing FAL_KEY environment variable")
 
-        # Import fal_client
-        try:
-            import fal_client
-        except ImportError as e:
-            raise ImportError(
-                "fal.ai SDK is required for FalWanProImageToVideoGenerator. "
-                "Install with: pip install weirdfingers-boards[generators-fal]"
-            ) from e
-
-        # Upload image artifact to Fal's public storage
-        # Fal API requires publicly accessible URLs, but our storage_url might be:
-        # - Localhost URLs (not publicly accessible)
-        # - Private S3 buckets (not publicly accessible)
-        # So we upload to Fal's temporary storage first
-        from ..utils import upload_artifacts_to_fal
-
-        image_urls = await upload_artifacts_to_fal([inputs.image], context)
-
-        # Prepare arguments for fal.ai API
-        arguments = {
-            "image_url": image_urls[0],
-            "prompt": inputs.prompt,
-            "enable_safety_checker": inputs.enable_safety_checker,
-        }
-
-        # Only add seed if provided (allow API to use random if not specified)
-        if inputs.seed is not None:
-            arguments["seed"] = inputs.seed
-
-        # Submit async job
-        handler = await fal_client.submit_async(
-            "fal-ai/wan-pro/image-to-video",
-            arguments=arguments,
-        )
+        async def build_arguments() -> dict[str, Any]:
+            # Upload image artifact to Fal's public storage
+            # Fal API requires publicly accessible URLs, but our storage_url might be:
+            # - Localhost URLs (not publicly accessible)
+            # - Private S3 buckets (not publicly accessible)
+            # So we upload to Fal's temporary storage first
+            from ..utils import upload_artifacts_to_fal
+
+            image_urls = await upload_artifacts_to_fal([inputs.image], context)
+
+            # Prepare arguments for fal.ai API
+            arguments = {
+                "image_url": image_urls[0],
+                "prompt": inputs.prompt,
+                "enable_safety_checker": inputs.enable_safety_checker,
+            }
+
+            # Only add seed if provided (allow API to use random if not specified)
+            if inputs.seed is not None:
+                arguments["seed"] = inputs.seed
+            return arguments
+
+        from ..utils import submit_or_resume
 
-        # Store external job ID
-        await context.set_external_job_id(handler.request_id)
+        # Submit async job, or reattach to the request of a previous attempt
+        handler = await submit_or_resume("fal-ai/wan-pro/image-to-video", build_arguments, context)
 
         # Stream progress updates
         from .....progress.models import ProgressUpdate
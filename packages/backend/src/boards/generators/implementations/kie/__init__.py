@@ -1,13 +1,18 @@
 """Kie.ai generator implementations."""
 
-from .audio.suno_sounds import KieSunoSoundsGenerator, SunoSoundsInput
-from .audio.suno_v5_5 import KieSunoV55Generator, SunoV55Input
-from .image.nano_banana_edit import KieNanoBananaEditGenerator, NanoBananaEditInput
-from .image.qwen_image_2 import KieQwenImage2Generator, QwenImage2Input
-from .video.runway_aleph import KieRunwayAlephGenerator, KieRunwayAlephInput
-from .video.seedance2 import KieSeedance2Generator, KieSeedance2Input
-from .video.seedance2_fast import KieSeedance2FastGenerator, KieSeedance2FastInput
-from .video.veo3 import KieVeo3Generator, KieVeo3Input
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .audio.suno_sounds import KieSunoSoundsGenerator, SunoSoundsInput
+    from .audio.suno_v5_5 import KieSunoV55Generator, SunoV55Input
+    from .image.nano_banana_edit import KieNanoBananaEditGenerator, NanoBananaEditInput
+    from .image.qwen_image_2 import KieQwenImage2Generator, QwenImage2Input
+    from .video.runway_aleph import KieRunwayAlephGenerator, KieRunwayAlephInput
+    from .video.seedance2 import KieSeedance2Generator, KieSeedance2Input
+    from .video.seedance2_fast import KieSeedance2FastGenerator, KieSeedance2FastInput
+    from .video.veo3 import KieVeo3Generator, KieVeo3Input
 
 __all__ = [
     "KieSunoSoundsGenerator",
@@ -27,3 +32,41 @@ __all__ = [
     "KieVeo3Generator",
     "KieVeo3Input",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".audio.suno_sounds": (
+            "KieSunoSoundsGenerator",
+            "SunoSoundsInput",
+        ),
+        ".audio.suno_v5_5": (
+            "KieSunoV55Generator",
+            "SunoV55Input",
+        ),
+        ".image.nano_banana_edit": (
+            "KieNanoBananaEditGenerator",
+            "NanoBananaEditInput",
+        ),
+        ".image.qwen_image_2": (
+            "KieQwenImage2Generator",
+            "QwenImage2Input",
+        ),
+        ".video.runway_aleph": (
+            "KieRunwayAlephGenerator",
+            "KieRunwayAlephInput",
+        ),
+        ".video.seedance2": (
+            "KieSeedance2Generator",
+            "KieSeedance2Input",
+        ),
+        ".video.seedance2_fast": (
+            "KieSeedance2FastGenerator",
+            "KieSeedance2FastInput",
+        ),
+        ".video.veo3": (
+            "KieVeo3Generator",
+            "KieVeo3Input",
+        ),
+    },
+)
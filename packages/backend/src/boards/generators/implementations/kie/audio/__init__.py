@@ -1,5 +1,10 @@
-from .suno_sounds import KieSunoSoundsGenerator, SunoSoundsInput
-from .suno_v5_5 import KieSunoV55Generator, SunoV55Input
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .suno_sounds import KieSunoSoundsGenerator, SunoSoundsInput
+    from .suno_v5_5 import KieSunoV55Generator, SunoV55Input
 
 __all__ = [
     "KieSunoSoundsGenerator",
@@ -7,3 +12,17 @@ __all__ = [
     "KieSunoV55Generator",
     "SunoV55Input",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".suno_sounds": (
+            "KieSunoSoundsGenerator",
+            "SunoSoundsInput",
+        ),
+        ".suno_v5_5": (
+            "KieSunoV55Generator",
+            "SunoV55Input",
+        ),
+    },
+)
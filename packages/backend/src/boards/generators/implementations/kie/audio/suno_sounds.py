@@ -10,12 +10,12 @@ See: https://docs.kie.ai/suno-api/generate-sounds
 import asyncio
 from typing import Any, Literal
 
-import httpx
 from pydantic import BaseModel, Field
 
+from .....http_client import get_http_client
 from .....progress.models import ProgressUpdate
 from ....base import GeneratorExecutionContext, GeneratorResult
-from ..base import KieDedicatedAPIGenerator
+from ..base import KieAPIError, KieDedicatedAPIGenerator
 
 # All valid sound key values
 SoundKey = Literal[
@@ -128,48 +128,49 @@ class KieSunoSoundsGenerator(KieDedicatedAPIGenerator):
         """
         status_url = self._get_status_url(task_id)
 
-        async with httpx.AsyncClient() as client:
-            for poll_count in range(max_polls):
-                if poll_count > 0:
-                    await asyncio.sleep(poll_interval)
+        client = await get_http_client()
+        for poll_count in range(max_polls):
+            if poll_count > 0:
+                await asyncio.sleep(poll_interval)
 
-                status_response = await client.get(
-                    status_url,
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=30.0,
+            status_response = await client.get(
+                status_url,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=30.0,
+            )
+
+            if status_response.status_code != 200:
+                raise KieAPIError(
+                    f"Status check failed: {status_response.status_code} {status_response.text}",
+                    status_response.status_code,
                 )
 
-                if status_response.status_code != 200:
-                    raise ValueError(
-                        f"Status check failed: {status_response.status_code} {status_response.text}"
-                    )
-
-                status_result = status_response.json()
-                self._validate_response(status_result)
-
-                task_data = status_result.get("data", {})
-                status = task_data.get("status")
-                callback_type = task_data.get("callbackType")
-
-                if status == "SUCCESS" or callback_type == "complete":
-                    return task_data
-                elif status in _FAILED_STATUSES:
-                    error_msg = task_data.get("errorMsg") or task_data.get("failMsg") or status
-                    raise ValueError(f"Generation failed: {error_msg}")
-
-                # Publish progress
-                progress = min(90, (poll_count / max_polls) * 100)
-                await context.publish_progress(
-                    ProgressUpdate(
-                        job_id=task_id,
-                        status="processing",
-                        progress=progress,
-                        phase="processing",
-                    )
+            status_result = status_response.json()
+            self._validate_response(status_result)
+
+            task_data = status_result.get("data", {})
+            status = task_data.get("status")
+            callback_type = task_data.get("callbackType")
+
+            if status == "SUCCESS" or callback_type == "complete":
+                return task_data
+            elif status in _FAILED_STATUSES:
+                error_msg = task_data.get("errorMsg") or task_data.get("failMsg") or status
+                raise ValueError(f"Generation failed: {error_msg}")
+
+            # Publish progress
+            progress = min(90, (poll_count / max_polls) * 100)
+            await context.publish_progress(
+                ProgressUpdate(
+                    job_id=task_id,
+                    status="processing",
+                    progress=progress,
+                    phase="processing",
                 )
-            else:
-                timeout_minutes = (max_polls * poll_interval) / 60
-                raise ValueError(f"Generation timed out after {timeout_minutes} minutes")
+            )
+        else:
+            timeout_minutes = (max_polls * poll_interval) / 60
+            raise TimeoutError(f"Generation timed out after {timeout_minutes} minutes")
 
     async def generate(
         self, inputs: SunoSoundsInput, context: GeneratorExecutionContext
@@ -191,20 +192,24 @@ class KieSunoSoundsGenerator(KieDedicatedAPIGenerator):
         if inputs.sound_tempo is not None:
             body["soundTempo"] = inputs.sound_tempo
 
-        # Submit task to Suno Sounds endpoint
-        submit_url = "https://api.kie.ai/api/v1/generate/sounds"
-        result = await self._make_request(submit_url, "POST", api_key, json=body)
+        # Reattach to the task of a previous attempt instead of resubmitting
+        task_id = context.resumable_external_job_id()
+        if task_id is None:
+            # Submit task to Suno Sounds endpoint
+            submit_url = "https://api.kie.ai/api/v1/generate/sounds"
+            await context.acquire_provider_slot("kie", self.model_id)
+            result = await self._make_request(submit_url, "POST", api_key, json=body)
 
-        # Extract task ID
-        task_id = result.get("taskId")
-        if not task_id:
-            data = result.get("data", {})
-            task_id = data.get("taskId")
+            # Extract task ID
+            task_id = result.get("taskId")
+            if not task_id:
+                data = result.get("data", {})
+                task_id = data.get("taskId")
 
-        if not task_id:
-            raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
+            if not task_id:
+                raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
 
-        await context.set_external_job_id(task_id)
+            await context.set_external_job_id(task_id)
 
         # Poll for completion
         result_data = await self._poll_for_completion(task_id, api_key, context)
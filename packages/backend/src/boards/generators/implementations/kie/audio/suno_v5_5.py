@@ -11,13 +11,13 @@ See: https://docs.kie.ai/suno-api/generate-music
 import asyncio
 from typing import Any, Literal
 
-import httpx
 from pydantic import BaseModel, Field
 
+from boards.http_client import get_http_client
 from boards.progress.models import ProgressUpdate
 
 from ....base import GeneratorExecutionContext, GeneratorResult
-from ..base import KieBaseGenerator
+from ..base import KieAPIError, KieBaseGenerator
 
 
 class SunoV55Input(BaseModel):
@@ -112,23 +112,27 @@ class KieSunoV55Generator(KieBaseGenerator):
         if inputs.persona_id is not None:
             body["personaId"] = inputs.persona_id
 
-        # Submit task to Suno API endpoint
-        submit_url = "https://api.kie.ai/api/v1/generate"
-        result = await self._make_request(submit_url, "POST", api_key, json=body)
+        # Reattach to the task of a previous attempt instead of resubmitting
+        task_id = context.resumable_external_job_id()
+        if task_id is None:
+            # Submit task to Suno API endpoint
+            submit_url = "https://api.kie.ai/api/v1/generate"
+            await context.acquire_provider_slot("kie", self.model_id)
+            result = await self._make_request(submit_url, "POST", api_key, json=body)
 
-        # Extract task ID from response
-        data = result.get("data", {})
-        task_id = data.get("taskId")
+            # Extract task ID from response
+            data = result.get("data", {})
+            task_id = data.get("taskId")
 
-        if not task_id:
-            # Fallback: check top-level taskId
-            task_id = result.get("taskId")
+            if not task_id:
+                # Fallback: check top-level taskId
+                task_id = result.get("taskId")
 
-        if not task_id:
-            raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
+            if not task_id:
+                raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
 
-        # Store external job ID
-        await context.set_external_job_id(task_id)
+            # Store external job ID
+            await context.set_external_job_id(task_id)
 
         # Poll for completion using Suno-specific status endpoint
         result_data = await self._poll_for_completion(task_id, api_key, context)
@@ -185,52 +189,55 @@ class KieSunoV55Generator(KieBaseGenerator):
             The completed task data from the "data" field
 
         Raises:
-            ValueError: If task fails or times out
+            KieAPIError: If a status check fails
+            ValueError: If task fails
+            TimeoutError: If the task does not finish in time
         """
         status_url = f"https://api.kie.ai/api/v1/generate/record-info?taskId={task_id}"
 
-        async with httpx.AsyncClient() as client:
-            for poll_count in range(max_polls):
-                # Don't sleep on first poll
-                if poll_count > 0:
-                    await asyncio.sleep(poll_interval)
+        client = await get_http_client()
+        for poll_count in range(max_polls):
+            # Don't sleep on first poll
+            if poll_count > 0:
+                await asyncio.sleep(poll_interval)
 
-                status_response = await client.get(
-                    status_url,
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=30.0,
+            status_response = await client.get(
+                status_url,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=30.0,
+            )
+
+            if status_response.status_code != 200:
+                raise KieAPIError(
+                    f"Status check failed: {status_response.status_code} {status_response.text}",
+                    status_response.status_code,
                 )
 
-                if status_response.status_code != 200:
-                    raise ValueError(
-                        f"Status check failed: {status_response.status_code} {status_response.text}"
-                    )
-
-                status_result = status_response.json()
-                self._validate_response(status_result)
-
-                task_data = status_result.get("data", {})
-                status = task_data.get("status")
-
-                if status == "SUCCESS":
-                    return task_data
-                elif status and "FAIL" in status.upper():
-                    error_msg = task_data.get("errorMsg", "Unknown error")
-                    raise ValueError(f"Generation failed: {error_msg}")
-
-                # Publish progress
-                progress = min(90, (poll_count / max_polls) * 100)
-                await context.publish_progress(
-                    ProgressUpdate(
-                        job_id=task_id,
-                        status="processing",
-                        progress=progress,
-                        phase="processing",
-                    )
+            status_result = status_response.json()
+            self._validate_response(status_result)
+
+            task_data = status_result.get("data", {})
+            status = task_data.get("status")
+
+            if status == "SUCCESS":
+                return task_data
+            elif status and "FAIL" in status.upper():
+                error_msg = task_data.get("errorMsg", "Unknown error")
+                raise ValueError(f"Generation failed: {error_msg}")
+
+            # Publish progress
+            progress = min(90, (poll_count / max_polls) * 100)
+            await context.publish_progress(
+                ProgressUpdate(
+                    job_id=task_id,
+                    status="processing",
+                    progress=progress,
+                    phase="processing",
                 )
-            else:
-                timeout_minutes = (max_polls * poll_interval) / 60
-                raise ValueError(f"Generation timed out after {timeout_minutes} minutes")
+            )
+        else:
+            timeout_minutes = (max_polls * poll_interval) / 60
+            raise TimeoutError(f"Generation timed out after {timeout_minutes} minutes")
 
     def get_input_schema(self) -> type[SunoV55Input]:
         return SunoV55Input
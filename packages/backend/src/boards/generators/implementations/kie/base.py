@@ -13,12 +13,19 @@ import os
 from abc import abstractmethod
 from typing import Any, ClassVar, Literal
 
-import httpx
-
+from ....http_client import get_http_client
 from ....progress.models import ProgressUpdate
 from ...base import BaseGenerator, GeneratorExecutionContext
 
 
+class KieAPIError(ValueError):
+    """A Kie.ai request failed; `status_code` tells outages from rejected requests."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class KieBaseGenerator(BaseGenerator):
     """Base class for all Kie.ai generators with common functionality.
 
@@ -57,11 +64,14 @@ class KieBaseGenerator(BaseGenerator):
             response: The JSON response from Kie.ai API
 
         Raises:
-            ValueError: If the response code is not 200
+            KieAPIError: If the response code is not 200
         """
-        if response.get("code") != 200:
+        code = response.get("code")
+        if code != 200:
             error_msg = response.get("msg", "Unknown error")
-            raise ValueError(f"Kie.ai API error: {error_msg}")
+            raise KieAPIError(
+                f"Kie.ai API error: {error_msg}", code if isinstance(code, int) else None
+            )
 
     async def _make_request(
         self,
@@ -84,34 +94,35 @@ class KieBaseGenerator(BaseGenerator):
             The validated JSON response
 
         Raises:
-            ValueError: If the request fails or returns an error response
+            KieAPIError: If the request fails or returns an error response
         """
-        async with httpx.AsyncClient() as client:
-            if method == "POST":
-                response = await client.post(
-                    url,
-                    json=json,
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    timeout=timeout,
-                )
-            else:
-                response = await client.get(
-                    url,
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=timeout,
-                )
-
-            if response.status_code != 200:
-                raise ValueError(
-                    f"Kie.ai API request failed: {response.status_code} {response.text}"
-                )
-
-            result = response.json()
-            self._validate_response(result)
-            return result
+        client = await get_http_client()
+        if method == "POST":
+            response = await client.post(
+                url,
+                json=json,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                timeout=timeout,
+            )
+        else:
+            response = await client.get(
+                url,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=timeout,
+            )
+
+        if response.status_code != 200:
+            raise KieAPIError(
+                f"Kie.ai API request failed: {response.status_code} {response.text}",
+                response.status_code,
+            )
+
+        result = response.json()
+        self._validate_response(result)
+        return result
 
     @abstractmethod
     async def _poll_for_completion(
@@ -170,56 +181,60 @@ class KieMarketAPIGenerator(KieBaseGenerator):
             The completed task data from the "data" field
 
         Raises:
-            ValueError: If task fails or times out
+            KieAPIError: If a status check fails
+            ValueError: If task fails
+            TimeoutError: If the task does not finish in time
         """
         status_url = f"https://api.kie.ai/api/v1/jobs/recordInfo?taskId={task_id}"
 
-        async with httpx.AsyncClient() as client:
-            for poll_count in range(max_polls):
-                # Don't sleep on first poll - check status immediately
-                if poll_count > 0:
-                    await asyncio.sleep(poll_interval)
+        client = await get_http_client()
+        for poll_count in range(max_polls):
+            # Don't sleep on first poll - check status immediately
+            if poll_count > 0:
+                await asyncio.sleep(poll_interval)
+
+            status_response = await client.get(
+                status_url,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=30.0,
+            )
+
+            if status_response.status_code != 200:
+                raise KieAPIError(
+                    f"Status check failed: {status_response.status_code} {status_response.text}",
+                    status_response.status_code,
+                )
+
+            status_result = status_response.json()
+            self._validate_response(status_result)
 
-                status_response = await client.get(
-                    status_url,
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=30.0,
+            task_data = status_result.get("data", {})
+            state = task_data.get("state")
+
+            if state == "success":
+                return task_data
+            elif state in ["failed", "fail"]:
+                error_msg = task_data.get("failMsg", "Unknown error")
+                context.mark_provider_job_failed()
+                raise ValueError(f"Generation failed: {error_msg}")
+            elif state not in ["waiting", "pending", "processing", None]:
+                raise ValueError(
+                    f"Unknown state '{state}' from Kie.ai API. Full response: {status_result}"
                 )
 
-                if status_response.status_code != 200:
-                    raise ValueError(
-                        f"Status check failed: {status_response.status_code} {status_response.text}"
-                    )
-
-                status_result = status_response.json()
-                self._validate_response(status_result)
-
-                task_data = status_result.get("data", {})
-                state = task_data.get("state")
-
-                if state == "success":
-                    return task_data
-                elif state in ["failed", "fail"]:
-                    error_msg = task_data.get("failMsg", "Unknown error")
-                    raise ValueError(f"Generation failed: {error_msg}")
-                elif state not in ["waiting", "pending", "processing", None]:
-                    raise ValueError(
-                        f"Unknown state '{state}' from Kie.ai API. Full response: {status_result}"
-                    )
-
-                # Publish progress
-                progress = min(90, (poll_count / max_polls) * 100)
-                await context.publish_progress(
-                    ProgressUpdate(
-                        job_id=task_id,
-                        status="processing",
-                        progress=progress,
-                        phase="processing",
-                    )
+            # Publish progress
+            progress = min(90, (poll_count / max_polls) * 100)
+            await context.publish_progress(
+                ProgressUpdate(
+                    job_id=task_id,
+                    status="processing",
+                    progress=progress,
+                    phase="processing",
                 )
-            else:
-                timeout_minutes = (max_polls * poll_interval) / 60
-                raise ValueError(f"Generation timed out after {timeout_minutes} minutes")
+            )
+        else:
+            timeout_minutes = (max_polls * poll_interval) / 60
+            raise TimeoutError(f"Generation timed out after {timeout_minutes} minutes")
 
 
 class KieDedicatedAPIGenerator(KieBaseGenerator):
@@ -268,49 +283,53 @@ class KieDedicatedAPIGenerator(KieBaseGenerator):
             The completed task data from the "data" field
 
         Raises:
-            ValueError: If task fails or times out
+            KieAPIError: If a status check fails
+            ValueError: If task fails
+            TimeoutError: If the task does not finish in time
         """
         status_url = self._get_status_url(task_id)
 
-        async with httpx.AsyncClient() as client:
-            for poll_count in range(max_polls):
-                # Don't sleep on first poll - check status immediately
-                if poll_count > 0:
-                    await asyncio.sleep(poll_interval)
-
-                status_response = await client.get(
-                    status_url,
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=30.0,
+        client = await get_http_client()
+        for poll_count in range(max_polls):
+            # Don't sleep on first poll - check status immediately
+            if poll_count > 0:
+                await asyncio.sleep(poll_interval)
+
+            status_response = await client.get(
+                status_url,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=30.0,
+            )
+
+            if status_response.status_code != 200:
+                raise KieAPIError(
+                    f"Status check failed: {status_response.status_code} {status_response.text}",
+                    status_response.status_code,
                 )
 
-                if status_response.status_code != 200:
-                    raise ValueError(
-                        f"Status check failed: {status_response.status_code} {status_response.text}"
-                    )
-
-                status_result = status_response.json()
-                self._validate_response(status_result)
-
-                task_data = status_result.get("data", {})
-                success_flag = task_data.get("successFlag")
-
-                if success_flag == 1:
-                    return task_data
-                elif success_flag in [2, 3]:
-                    error_msg = task_data.get("errorMsg", "Unknown error")
-                    raise ValueError(f"Generation failed: {error_msg}")
-
-                # Publish progress
-                progress = min(90, (poll_count / max_polls) * 100)
-                await context.publish_progress(
-                    ProgressUpdate(
-                        job_id=task_id,
-                        status="processing",
-                        progress=progress,
-                        phase="processing",
-                    )
+            status_result = status_response.json()
+            self._validate_response(status_result)
+
+            task_data = status_result.get("data", {})
+            success_flag = task_data.get("successFlag")
+
+            if success_flag == 1:
+                return task_data
+            elif success_flag in [2, 3]:
+                error_msg = task_data.get("errorMsg", "Unknown error")
+                context.mark_provider_job_failed()
+                raise ValueError(f"Generation failed: {error_msg}")
+
+            # Publish progress
+            progress = min(90, (poll_count / max_polls) * 100)
+            await context.publish_progress(
+                ProgressUpdate(
+                    job_id=task_id,
+                    status="processing",
+                    progress=progress,
+                    phase="processing",
                 )
-            else:
-                timeout_minutes = (max_polls * poll_interval) / 60
-                raise ValueError(f"Generation timed out after {timeout_minutes} minutes")
+            )
+        else:
+            timeout_minutes = (max_polls * poll_interval) / 60
+            raise TimeoutError(f"Generation timed out after {timeout_minutes} minutes")
@@ -1,4 +1,17 @@
-from .nano_banana_edit import KieNanoBananaEditGenerator
-from .qwen_image_2 import KieQwenImage2Generator
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .nano_banana_edit import KieNanoBananaEditGenerator
+    from .qwen_image_2 import KieQwenImage2Generator
 
 __all__ = ["KieNanoBananaEditGenerator", "KieQwenImage2Generator"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".nano_banana_edit": ("KieNanoBananaEditGenerator",),
+        ".qwen_image_2": ("KieQwenImage2Generator",),
+    },
+)
@@ -38,8 +38,7 @@ class QwenImage2Input(BaseModel):
     image_sources: list[ImageArtifact] | None = Field(
         default=None,
         description=(
-            "Optional input images for editing mode"
-            " (JPEG, PNG, WEBP; max 10MB each; max 3 images)"
+            "Optional input images for editing mode (JPEG, PNG, WEBP; max 10MB each; max 3 images)"
         ),
         min_length=1,
         max_length=3,
@@ -55,7 +54,7 @@ class QwenImage2Input(BaseModel):
     seed: int | None = Field(
         default=None,
         description=(
-            "Random seed for reproducibility." " Same seed and prompt produce identical output"
+            "Random seed for reproducibility. Same seed and prompt produce identical output"
         ),
     )
 
@@ -114,17 +113,21 @@ class KieQwenImage2Generator(KieMarketAPIGenerator):
             "input": input_params,
         }
 
-        # Submit task
-        submit_url = "https://api.kie.ai/api/v1/jobs/createTask"
-        result = await self._make_request(submit_url, "POST", api_key, json=body)
+        # Reattach to the task of a previous attempt instead of resubmitting
+        task_id = context.resumable_external_job_id()
+        if task_id is None:
+            # Submit task
+            submit_url = "https://api.kie.ai/api/v1/jobs/createTask"
+            await context.acquire_provider_slot("kie", self.model_id)
+            result = await self._make_request(submit_url, "POST", api_key, json=body)
 
-        data = result.get("data", {})
-        task_id = data.get("taskId")
+            data = result.get("data", {})
+            task_id = data.get("taskId")
 
-        if not task_id:
-            raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
+            if not task_id:
+                raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
 
-        await context.set_external_job_id(task_id)
+            await context.set_external_job_id(task_id)
 
         # Poll for completion
         task_data = await self._poll_for_completion(task_id, api_key, context)
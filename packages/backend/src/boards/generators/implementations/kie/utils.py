@@ -7,8 +7,7 @@ Provides helper functions for common operations across Kie generators.
 import asyncio
 import os
 
-import httpx
-
+from ....http_client import get_http_client
 from ...artifacts import AudioArtifact, DigitalArtifact, ImageArtifact, VideoArtifact
 from ...base import GeneratorExecutionContext
 
@@ -51,46 +50,46 @@ async def upload_artifacts_to_kie[T: DigitalArtifact](
 
         # Upload to Kie.ai's temporary storage
         # Using file stream upload API
-        async with httpx.AsyncClient() as client:
-            with open(file_path_str, "rb") as f:
-                files = {"file": f}
-                # uploadPath is required by Kie.ai API - specifies the storage path
-                data = {"uploadPath": "boards/temp"}
-                response = await client.post(
-                    "https://kieai.redpandaai.co/api/file-stream-upload",
-                    files=files,
-                    data=data,
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    timeout=120.0,  # 2 minute timeout for uploads
-                )
-
-            if response.status_code != 200:
-                raise ValueError(f"File upload failed: {response.status_code} {response.text}")
-
-            result = response.json()
-
-            if not result.get("success"):
-                raise ValueError(f"File upload failed: {result.get('msg')}")
-
-            # Extract the public URL from response data
-            data = result.get("data", {})
-
-            # The actual field name is 'downloadUrl' based on API response
-            file_url = data.get("downloadUrl")
-
-            if not file_url:
-                # Fallback to other possible field names
-                file_url = data.get("fileUrl") or data.get("file_url") or data.get("url")
-
-            if not file_url:
-                # If we still can't find the URL, provide detailed error message
-                raise ValueError(
-                    f"File upload succeeded but couldn't find URL in response. "
-                    f"Response data keys: {list(data.keys())}, "
-                    f"Full response: {result}"
-                )
-
-            return file_url
+        client = await get_http_client()
+        with open(file_path_str, "rb") as f:
+            files = {"file": f}
+            # uploadPath is required by Kie.ai API - specifies the storage path
+            data = {"uploadPath": "boards/temp"}
+            response = await client.post(
+                "https://kieai.redpandaai.co/api/file-stream-upload",
+                files=files,
+                data=data,
+                headers={"Authorization": f"Bearer {api_key}"},
+                timeout=120.0,  # 2 minute timeout for uploads
+            )
+
+        if response.status_code != 200:
+            raise ValueError(f"File upload failed: {response.status_code} {response.text}")
+
+        result = response.json()
+
+        if not result.get("success"):
+            raise ValueError(f"File upload failed: {result.get('msg')}")
+
+        # Extract the public URL from response data
+        data = result.get("data", {})
+
+        # The actual field name is 'downloadUrl' based on API response
+        file_url = data.get("downloadUrl")
+
+        if not file_url:
+            # Fallback to other possible field names
+            file_url = data.get("fileUrl") or data.get("file_url") or data.get("url")
+
+        if not file_url:
+            # If we still can't find the URL, provide detailed error message
+            raise ValueError(
+                f"File upload succeeded but couldn't find URL in response. "
+                f"Response data keys: {list(data.keys())}, "
+                f"Full response: {result}"
+            )
+
+        return file_url
 
     # Upload all artifacts in parallel for performance
     urls = await asyncio.gather(*[upload_single_artifact(artifact) for artifact in artifacts])
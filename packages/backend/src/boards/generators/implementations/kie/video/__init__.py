@@ -1,9 +1,14 @@
 """Kie.ai video generators."""
 
-from .runway_aleph import KieRunwayAlephGenerator, KieRunwayAlephInput
-from .seedance2 import KieSeedance2Generator, KieSeedance2Input
-from .seedance2_fast import KieSeedance2FastGenerator, KieSeedance2FastInput
-from .veo3 import KieVeo3Generator, KieVeo3Input
+from typing import TYPE_CHECKING
+
+from ..._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .runway_aleph import KieRunwayAlephGenerator, KieRunwayAlephInput
+    from .seedance2 import KieSeedance2Generator, KieSeedance2Input
+    from .seedance2_fast import KieSeedance2FastGenerator, KieSeedance2FastInput
+    from .veo3 import KieVeo3Generator, KieVeo3Input
 
 __all__ = [
     "KieRunwayAlephGenerator",
@@ -15,3 +20,25 @@ __all__ = [
     "KieVeo3Generator",
     "KieVeo3Input",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".runway_aleph": (
+            "KieRunwayAlephGenerator",
+            "KieRunwayAlephInput",
+        ),
+        ".seedance2": (
+            "KieSeedance2Generator",
+            "KieSeedance2Input",
+        ),
+        ".seedance2_fast": (
+            "KieSeedance2FastGenerator",
+            "KieSeedance2FastInput",
+        ),
+        ".veo3": (
+            "KieVeo3Generator",
+            "KieVeo3Input",
+        ),
+    },
+)
@@ -95,20 +95,24 @@ class KieRunwayAlephGenerator(KieDedicatedAPIGenerator):
             image_urls = await upload_artifacts_to_kie([inputs.reference_image], context)
             body["referenceImage"] = image_urls[0]
 
-        # Submit task
-        submit_url = "https://api.kie.ai/api/v1/aleph/generate"
-        result = await self._make_request(submit_url, "POST", api_key, json=body)
-
-        # Extract task ID
-        task_id = result.get("taskId")
-        if not task_id:
-            data = result.get("data", {})
-            task_id = data.get("taskId")
-
-        if not task_id:
-            raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
-
-        await context.set_external_job_id(task_id)
+        # Reattach to the task of a previous attempt instead of resubmitting
+        task_id = context.resumable_external_job_id()
+        if task_id is None:
+            # Submit task
+            submit_url = "https://api.kie.ai/api/v1/aleph/generate"
+            await context.acquire_provider_slot("kie", self.model_id)
+            result = await self._make_request(submit_url, "POST", api_key, json=body)
+
+            # Extract task ID
+            task_id = result.get("taskId")
+            if not task_id:
+                data = result.get("data", {})
+                task_id = data.get("taskId")
+
+            if not task_id:
+                raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
+
+            await context.set_external_job_id(task_id)
 
         # Poll for completion
         result_data = await self._poll_for_completion(task_id, api_key, context)
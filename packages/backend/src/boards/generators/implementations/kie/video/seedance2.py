@@ -140,18 +140,22 @@ class KieSeedance2Generator(KieMarketAPIGenerator):
             "input": input_params,
         }
 
-        # Submit task using Market API endpoint
-        submit_url = "https://api.kie.ai/api/v1/jobs/createTask"
-        result = await self._make_request(submit_url, "POST", api_key, json=body)
-
-        # Extract task ID
-        data = result.get("data", {})
-        task_id = data.get("taskId")
-
-        if not task_id:
-            raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
-
-        await context.set_external_job_id(task_id)
+        # Reattach to the task of a previous attempt instead of resubmitting
+        task_id = context.resumable_external_job_id()
+        if task_id is None:
+            # Submit task using Market API endpoint
+            submit_url = "https://api.kie.ai/api/v1/jobs/createTask"
+            await context.acquire_provider_slot("kie", self.model_id)
+            result = await self._make_request(submit_url, "POST", api_key, json=body)
+
+            # Extract task ID
+            data = result.get("data", {})
+            task_id = data.get("taskId")
+
+            if not task_id:
+                raise ValueError(f"No taskId returned from Kie.ai API. Response: {result}")
+
+            await context.set_external_job_id(task_id)
 
         # Poll for completion using Market API base class method
         task_data = await self._poll_for_completion(task_id, api_key, context)
@@ -46,6 +46,7 @@ class OpenAIWhisperGenerator(BaseGenerator):
         audio_file_path = await context.resolve_artifact(inputs.audio_source)
 
         # Use OpenAI SDK for transcription
+        await context.acquire_provider_slot("openai", "whisper-1")
         with open(audio_file_path, "rb") as audio_file:
             transcript = await client.audio.transcriptions.create(
                 model="whisper-1",
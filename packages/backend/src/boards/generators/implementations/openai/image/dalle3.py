@@ -54,6 +54,7 @@ class OpenAIDallE3Generator(BaseGenerator):
         client = AsyncOpenAI()
 
         # Use OpenAI SDK directly
+        await context.acquire_provider_slot("openai", "dall-e-3")
         response = await client.images.generate(
             model="dall-e-3",
             prompt=inputs.prompt,
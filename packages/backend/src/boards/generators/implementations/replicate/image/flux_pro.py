@@ -56,6 +56,7 @@ class ReplicateFluxProGenerator(BaseGenerator):
             ) from e
 
         # Use Replicate SDK directly
+        await context.acquire_provider_slot("replicate", "black-forest-labs/flux-1.1-pro")
         prediction: FileOutput | AsyncIterator[FileOutput] = await replicate.async_run(
             "black-forest-labs/flux-1.1-pro",
             input={
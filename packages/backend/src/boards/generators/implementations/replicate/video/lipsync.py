@@ -47,6 +47,7 @@ class ReplicateLipsyncGenerator(BaseGenerator):
         video_file = await context.resolve_artifact(inputs.video_source)
 
         # Use Replicate SDK directly with proper file handling
+        await context.acquire_provider_slot("replicate", "cjwbw/wav2lip")
         with open(audio_file, "rb") as audio_f, open(video_file, "rb") as video_f:
             result = await replicate.async_run(
                 "cjwbw/wav2lip",
@@ -5,12 +5,17 @@ File path is specified via settings.generators_config_path.
 
 Supports three declaration forms: import, class, entrypoint.
 Strict mode is enabled by default and will fail startup on errors.
+
+When a prebuilt manifest is available (settings.generators_manifest_path, see
+boards.generators.manifest), `class` declarations found in it are registered
+lazily and only imported on first lookup.
 """
 
 from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import partial
 from importlib import import_module
 from importlib import metadata as importlib_metadata
 from pathlib import Path
@@ -22,6 +27,8 @@ from boards.config import settings
 from boards.logging import get_logger
 
 from .base import BaseGenerator
+from .failover import configure_equivalents
+from .manifest import GeneratorManifest, ManifestEntry, load_manifest
 from .registry import registry
 
 logger = get_logger(__name__)
@@ -37,6 +44,7 @@ class LoaderConfig:
     strict_mode: bool = True
     allow_unlisted: bool = False
     declarations: list[dict[str, Any]] | None = None
+    equivalents: list[Any] | None = None
 
 
 def _load_file_config(path: str) -> LoaderConfig | None:
@@ -49,11 +57,13 @@ def _load_file_config(path: str) -> LoaderConfig | None:
     strict_mode = bool(data.get("strict_mode", True))
     allow_unlisted = bool(data.get("allow_unlisted", False))
     declarations = list(data.get("generators", []) or [])
+    equivalents = list(data.get("equivalents", []) or [])
 
     return LoaderConfig(
         strict_mode=strict_mode,
         allow_unlisted=allow_unlisted,
         declarations=declarations,
+        equivalents=equivalents,
     )
 
 
@@ -115,7 +125,7 @@ def _validate_artifact_type(instance: BaseGenerator) -> None:
         raise ValueError(f"Invalid artifact_type: {artifact_type}")
 
 
-def _register_instance(instance: BaseGenerator, name_override: str | None) -> None:
+def _apply_name_override(instance: BaseGenerator, name_override: str | None) -> None:
     if name_override:
         # Override instance name if provided
         try:
@@ -124,9 +134,22 @@ def _register_instance(instance: BaseGenerator, name_override: str | None) -> No
             raise ValueError(f"Failed to set generator name override: {e}") from e
 
     _validate_artifact_type(instance)
+
+
+def _register_instance(instance: BaseGenerator, name_override: str | None) -> None:
+    _apply_name_override(instance, name_override)
     registry.register(instance)
 
 
+def _instantiate_class(
+    qualified_name: str, options: dict[str, Any], name_override: str | None
+) -> BaseGenerator:
+    cls = _resolve_class(qualified_name)
+    instance = cls(**options) if options else cls()
+    _apply_name_override(instance, name_override)
+    return instance
+
+
 def _enforce_unlisted_policy(
     allowed_names: set[str], strict_mode: bool, allow_unlisted: bool
 ) -> None:
@@ -153,7 +176,78 @@ def _enforce_unlisted_policy(
         logger.error(msg)
 
 
-def load_generators_from_config(config_path: str | None = None) -> None:
+def _configure_equivalents(groups: list[Any], strict_mode: bool) -> None:
+    """Register groups of interchangeable generators for failover routing.
+
+    Names of generators that are not registered (e.g. disabled ones) are
+    dropped; groups left with fewer than two generators are ignored.
+    """
+    valid: list[list[str]] = []
+    for group in groups:
+        if not isinstance(group, list) or not all(isinstance(name, str) for name in group):
+            msg = f"Invalid equivalents group (expected a list of generator names): {group!r}"
+            if strict_mode:
+                raise ValueError(msg)
+            logger.error(msg)
+            continue
+
+        available = [name for name in group if name in registry]
+        missing = sorted(set(group) - set(available))
+        if missing:
+            logger.warning("Equivalent generators not registered", missing=missing)
+        if len(available) >= 2:
+            valid.append(available)
+
+    configure_equivalents(valid)
+    if valid:
+        logger.info("Configured equivalent generators", groups=valid)
+
+
+def _discover_manifest(manifest_path: str | None) -> GeneratorManifest | None:
+    path = manifest_path or settings.generators_manifest_path
+    if not path:
+        return None
+
+    manifest = load_manifest(path)
+    if manifest:
+        logger.info("Loaded generators manifest", path=str(path), entries=len(manifest.entries))
+    return manifest
+
+
+def build_generators_manifest(config_path: str) -> GeneratorManifest:
+    """Build a manifest for the `class` declarations in a generators config.
+
+    Every enabled `class` declaration is imported and instantiated once to
+    capture its metadata. `import` and `entrypoint` declarations are not
+    included; they are always loaded eagerly.
+
+    Raises on any declaration that fails to load.
+    """
+    cfg = _load_file_config(config_path)
+    if cfg is None:
+        raise FileNotFoundError(f"Generators config not found: {config_path}")
+
+    entries: list[ManifestEntry] = []
+    for decl in cfg.declarations or []:
+        if not isinstance(decl, dict) or decl.get("enabled") is False or "class" not in decl:
+            continue
+
+        qualified = decl["class"]
+        name_override = decl.get("name")
+        options = decl.get("options", {}) or {}
+        instance = _instantiate_class(qualified, options, name_override)
+        entries.append(
+            ManifestEntry.from_generator(
+                instance, qualified, declared_name=name_override, options=options
+            )
+        )
+
+    return GeneratorManifest(entries=tuple(entries))
+
+
+def load_generators_from_config(
+    config_path: str | None = None, manifest_path: str | None = None
+) -> None:
     """Load and register generators according to configuration.
 
     Raises on errors when strict mode is enabled (default).
@@ -176,6 +270,14 @@ def load_generators_from_config(config_path: str | None = None) -> None:
     strict_mode = cfg.strict_mode
     allow_unlisted = cfg.allow_unlisted
 
+    try:
+        manifest = _discover_manifest(manifest_path)
+    except ValueError as e:
+        if strict_mode:
+            raise RuntimeError(f"Failed to load generators manifest: {e}") from e
+        logger.error("Failed to load generators manifest; loading eagerly", error=str(e))
+        manifest = None
+
     requested_names: set[str] = set()
 
     # Process declarations in order
@@ -202,9 +304,24 @@ def load_generators_from_config(config_path: str | None = None) -> None:
             elif "class" in decl:
                 qualified = decl["class"]
                 options = decl.get("options", {}) or {}
-                cls = _resolve_class(qualified)
-                instance = cls(**options) if options else cls()
-                _register_instance(instance, name_override)
+                entry = manifest.find(qualified, name_override, options) if manifest else None
+                if entry is not None:
+                    if entry.artifact_type not in VALID_ARTIFACT_TYPES:
+                        raise ValueError(f"Invalid artifact_type: {entry.artifact_type}")
+                    registry.register_lazy(
+                        entry.catalog_entry(),
+                        partial(_instantiate_class, qualified, options, name_override),
+                    )
+                    requested_names.add(entry.name)
+                    logger.debug(
+                        "Registered generator lazily from manifest",
+                        class_path=qualified,
+                        name=entry.name,
+                    )
+                    continue
+
+                instance = _instantiate_class(qualified, options, name_override)
+                registry.register(instance)
                 requested_names.add(instance.name)
                 logger.debug(
                     "Registered generator via class",
@@ -241,13 +358,19 @@ def load_generators_from_config(config_path: str | None = None) -> None:
         requested_names.add(name)
 
     _enforce_unlisted_policy(requested_names, strict_mode, allow_unlisted)
+    _configure_equivalents(cfg.equivalents or [], strict_mode)
+
+    # Precompute the catalog (input JSON schemas etc.) once, before serving requests
+    catalog = registry.catalog()
 
     # Final summary
     logger.info(
         "Generators loading complete",
         requested=len(cfg.declarations or []),
         registered=len(registry),
+        lazy=sum(not registry.is_loaded(name) for name in registry.list_names()),
         names=registry.list_names(),
+        catalog_version=catalog.version,
         strict_mode=strict_mode,
         allow_unlisted=allow_unlisted,
     )
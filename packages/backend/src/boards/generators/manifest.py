@@ -0,0 +1,170 @@
+"""Prebuilt generators manifest for lazy generator loading.
+
+Importing every configured generator at boot means each API pod and worker
+process pays for every provider module (and its SDK) before serving traffic.
+The manifest records what the registry needs to *list* a generator -- name,
+artifact type, description, input schema and class path -- so the loader can
+register generators without importing them. The real module is imported on
+first `registry.get()`.
+
+The manifest is built from a generators config at build time, e.g.:
+
+    boards generators build-manifest --config generators.yaml --output generators.manifest.json
+
+and used at runtime via ``BOARDS_GENERATORS_MANIFEST_PATH``. Declarations that
+are not in the manifest are loaded eagerly as before.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from boards.logging import get_logger
+
+from .base import BaseGenerator
+from .registry import GeneratorCatalogEntry
+
+logger = get_logger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+
+
+def _options_key(options: dict[str, Any]) -> str:
+    return json.dumps(options, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Manifest record for one `class` generator declaration."""
+
+    name: str
+    artifact_type: str
+    description: str
+    class_path: str
+    input_schema: dict[str, Any]
+    # The declaration's `name` override and `options`, used to match it at load time
+    declared_name: str | None = None
+    options: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_generator(
+        cls,
+        generator: BaseGenerator,
+        class_path: str,
+        declared_name: str | None = None,
+        options: dict[str, Any] | None = None,
+    ) -> ManifestEntry:
+        """Describe a constructed generator instance."""
+        return cls(
+            name=generator.name,
+            artifact_type=generator.artifact_type,
+            description=generator.description,
+            class_path=class_path,
+            input_schema=generator.get_input_schema().model_json_schema(),
+            declared_name=declared_name,
+            options=dict(options or {}),
+        )
+
+    def catalog_entry(self) -> GeneratorCatalogEntry:
+        """Return the registry catalog description for this entry."""
+        return GeneratorCatalogEntry(
+            name=self.name,
+            description=self.description,
+            artifact_type=self.artifact_type,
+            input_schema=self.input_schema,
+        )
+
+
+@dataclass(frozen=True)
+class GeneratorManifest:
+    """A set of manifest entries, matched to declarations by class path, name and options."""
+
+    entries: tuple[ManifestEntry, ...]
+
+    def find(
+        self, class_path: str, declared_name: str | None, options: dict[str, Any]
+    ) -> ManifestEntry | None:
+        """Find the entry built from an identical `class` declaration."""
+        key = (class_path, declared_name, _options_key(options))
+        for entry in self.entries:
+            if (entry.class_path, entry.declared_name, _options_key(entry.options)) == key:
+                return entry
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": MANIFEST_FORMAT_VERSION,
+            "generators": [
+                {
+                    "name": entry.name,
+                    "artifact_type": entry.artifact_type,
+                    "description": entry.description,
+                    "class": entry.class_path,
+                    "declared_name": entry.declared_name,
+                    "options": entry.options,
+                    "input_schema": entry.input_schema,
+                }
+                for entry in self.entries
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GeneratorManifest:
+        """
+        Parse a manifest document.
+
+        Raises:
+            ValueError: If the document is not a supported manifest
+        """
+        version = data.get("version")
+        if version != MANIFEST_FORMAT_VERSION:
+            raise ValueError(f"Unsupported generators manifest version: {version}")
+
+        try:
+            entries = tuple(
+                ManifestEntry(
+                    name=item["name"],
+                    artifact_type=item["artifact_type"],
+                    description=item.get("description", ""),
+                    class_path=item["class"],
+                    input_schema=item.get("input_schema") or {},
+                    declared_name=item.get("declared_name"),
+                    options=item.get("options") or {},
+                )
+                for item in data.get("generators", [])
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid generators manifest entry: {e}") from e
+
+        return cls(entries=entries)
+
+
+def write_manifest(manifest: GeneratorManifest, path: str | Path) -> None:
+    """Write a manifest as JSON."""
+    Path(path).write_text(json.dumps(manifest.to_dict(), indent=2, default=str), encoding="utf-8")
+
+
+def load_manifest(path: str | Path) -> GeneratorManifest | None:
+    """
+    Load a manifest from disk.
+
+    Returns:
+        The manifest, or None if the file does not exist
+
+    Raises:
+        ValueError: If the file is not a valid manifest
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.warning("Generators manifest path set but not found", path=str(path))
+        return None
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid generators manifest JSON: {e}") from e
+
+    if not isinstance(data, dict):
+        raise ValueError("Invalid generators manifest: expected a JSON object")
+    return GeneratorManifest.from_dict(data)
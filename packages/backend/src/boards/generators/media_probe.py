@@ -0,0 +1,463 @@
+"""
+Header-only probing of generated media for dimensions and durations.
+
+Providers often omit dimensions, durations or sample rates, and some
+generators fill in defaults (e.g. 1024x1024) instead. `probe_media` reads the
+real values from the file's own headers when a result is stored, so clients
+can lay out artifacts without downloading them. It never decodes pixels or
+samples and only reads the first few KB, except for MP4s whose index (the
+`moov` box) was written after the media data.
+
+Supported: PNG, JPEG, GIF and WebP images; MP4/MOV video and audio; WAV and
+MP3 audio. Anything else (or a malformed header) yields an empty MediaInfo.
+
+`sniff_mime_type` identifies the container format from the first bytes of a
+file, so uploads can be typed by their content rather than the client's claim.
+"""
+
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class MediaInfo:
+    """Properties read from a media file's headers (None when unknown)."""
+
+    width: int | None = None
+    height: int | None = None
+    duration: float | None = None
+    fps: float | None = None
+    sample_rate: int | None = None
+    channels: int | None = None
+
+
+def probe_media(content: bytes) -> MediaInfo:
+    """
+    Read dimensions and durations from the headers of an image, video or audio file.
+
+    Args:
+        content: The complete file
+
+    Returns:
+        MediaInfo with whatever could be determined; never raises
+    """
+    for matches, probe in _PROBES:
+        if not matches(content):
+            continue
+        try:
+            return probe(content)
+        except (struct.error, ValueError, IndexError) as e:
+            logger.debug("Failed to probe media headers", probe=probe.__name__, error=str(e))
+            return MediaInfo()
+    return MediaInfo()
+
+
+# Images
+
+
+def _probe_png(data: bytes) -> MediaInfo:
+    # IHDR is always the first chunk
+    width, height = struct.unpack_from(">II", data, 16)
+    return MediaInfo(width=width, height=height)
+
+
+def _probe_gif(data: bytes) -> MediaInfo:
+    width, height = struct.unpack_from("<HH", data, 6)
+    return MediaInfo(width=width, height=height)
+
+
+def _probe_webp(data: bytes) -> MediaInfo:
+    chunk = data[12:16]
+    if chunk == b"VP8X":
+        # Extended format: 24-bit canvas size minus one
+        width = 1 + int.from_bytes(data[24:27], "little")
+        height = 1 + int.from_bytes(data[27:30], "little")
+    elif chunk == b"VP8 ":
+        # Lossy: 14-bit sizes after the frame tag and start code
+        width, height = struct.unpack_from("<HH", data, 26)
+        width, height = width & 0x3FFF, height & 0x3FFF
+    elif chunk == b"VP8L":
+        # Lossless: 14-bit sizes minus one, packed after the signature byte
+        bits = int.from_bytes(data[21:25], "little")
+        width, height = (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    else:
+        return MediaInfo()
+    return MediaInfo(width=width, height=height)
+
+
+# Start-of-frame markers carry the image size (DHT, JPG and DAC share the range)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_STANDALONE_MARKERS = frozenset({0x01, *range(0xD0, 0xD9)})
+
+
+def _probe_jpeg(data: bytes) -> MediaInfo:
+    orientation = 1
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            raise ValueError(f"Expected JPEG marker at offset {offset}")
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            # Fill byte
+            offset += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            offset += 2
+            continue
+        (length,) = struct.unpack_from(">H", data, offset + 2)
+        if marker == 0xE1 and data[offset + 4 : offset + 10] == b"Exif\x00\x00":
+            orientation = _exif_orientation(data, offset + 10)
+        elif marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", data, offset + 5)
+            if orientation in (5, 6, 7, 8):
+                # Stored rotated by 90 degrees; report the size as displayed
+                width, height = height, width
+            return MediaInfo(width=width, height=height)
+        elif marker == 0xDA:
+            # Start of scan: no frame header follows
+            break
+        offset += 2 + length
+    return MediaInfo()
+
+
+def _exif_orientation(data: bytes, tiff: int) -> int:
+    """Read the Orientation tag from IFD0 of the TIFF structure at `tiff`."""
+    endian = {b"II": "<", b"MM": ">"}.get(data[tiff : tiff + 2])
+    if endian is None:
+        return 1
+    (ifd,) = struct.unpack_from(f"{endian}I", data, tiff + 4)
+    (count,) = struct.unpack_from(f"{endian}H", data, tiff + ifd)
+    for i in range(count):
+        entry = tiff + ifd + 2 + 12 * i
+        tag, _, _, value = struct.unpack_from(f"{endian}HHIH", data, entry)
+        if tag == 0x0112:
+            return value
+    return 1
+
+
+# Audio
+
+
+def _probe_wav(data: bytes) -> MediaInfo:
+    info = MediaInfo()
+    byte_rate = 0
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk = data[offset : offset + 4]
+        (size,) = struct.unpack_from("<I", data, offset + 4)
+        if chunk == b"fmt ":
+            _, info.channels, info.sample_rate, byte_rate = struct.unpack_from(
+                "<HHII", data, offset + 8
+            )
+        elif chunk == b"data":
+            if size in (0, 0xFFFFFFFF):
+                # Written while streaming; the data runs to the end of the file
+                size = len(data) - offset - 8
+            if byte_rate:
+                info.duration = size / byte_rate
+            break
+        # Chunks are padded to an even size
+        offset += 8 + size + (size & 1)
+    return info
+
+
+# kbps by (MPEG version 1 or 2, layer), indexed by the header's bitrate index - 1
+_MP3_BITRATES = {
+    (1, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Hz by the header's version bits (MPEG 1, 2 and 2.5)
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+# How far past the ID3 tag to look for the first frame
+_MP3_SYNC_SEARCH_BYTES = 4096
+
+
+def _is_mp3_sync(data: bytes, offset: int) -> bool:
+    return data[offset] == 0xFF and data[offset + 1] & 0xE0 == 0xE0
+
+
+def _probe_mp3(data: bytes) -> MediaInfo:
+    offset = 0
+    if data[:3] == b"ID3":
+        # Tag size is a 28-bit "synchsafe" integer, plus an optional footer
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        offset = 10 + size + (10 if data[5] & 0x10 else 0)
+    limit = min(len(data) - 4, offset + _MP3_SYNC_SEARCH_BYTES)
+    while offset < limit and not _is_mp3_sync(data, offset):
+        offset += 1
+    if offset >= limit:
+        return MediaInfo()
+
+    (header,) = struct.unpack_from(">I", data, offset)
+    version_bits = (header >> 19) & 0x3
+    layer = 4 - ((header >> 17) & 0x3)
+    bitrate_index = (header >> 12) & 0xF
+    rate_index = (header >> 10) & 0x3
+    if version_bits == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return MediaInfo()
+
+    mpeg1 = version_bits == 3
+    table = (1, layer) if mpeg1 else (2, 1 if layer == 1 else 2)
+    bitrate = _MP3_BITRATES[table][bitrate_index - 1] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version_bits][rate_index]
+    channels = 1 if (header >> 6) & 0x3 == 3 else 2
+    samples_per_frame = 384 if layer == 1 else 1152 if (layer == 2 or mpeg1) else 576
+
+    # VBR encoders put a frame count in a Xing/Info or VBRI header in the first frame
+    frames = None
+    side_info = (17 if channels == 1 else 32) if mpeg1 else (9 if channels == 1 else 17)
+    xing = offset + 4 + side_info
+    if data[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", data, xing + 4)
+        if flags & 0x1:
+            (frames,) = struct.unpack_from(">I", data, xing + 8)
+    elif data[offset + 36 : offset + 40] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", data, offset + 50)
+
+    if frames:
+        duration = frames * samples_per_frame / sample_rate
+    else:
+        # Constant bitrate
+        duration = (len(data) - offset) * 8 / bitrate
+    return MediaInfo(duration=duration, sample_rate=sample_rate, channels=channels)
+
+
+# MP4 / QuickTime
+
+
+def _mp4_boxes(data: bytes, start: int, end: int) -> Iterator[tuple[bytes, int, int]]:
+    """Yield (type, payload start, box end) for each box between start and end."""
+    offset = start
+    while offset + 8 <= end:
+        (size,) = struct.unpack_from(">I", data, offset)
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack_from(">Q", data, offset + 8)
+            header = 16
+        elif size == 0:
+            # Extends to the end of the enclosing box
+            size = end - offset
+        if size < header:
+            return
+        yield data[offset + 4 : offset + 8], offset + header, min(offset + size, end)
+        offset += size
+
+
+def _mp4_find(data: bytes, start: int, end: int, *path: bytes) -> tuple[int, int] | None:
+    """Payload range of the first box at `path` below start..end."""
+    for box_type in path:
+        for found, payload, box_end in _mp4_boxes(data, start, end):
+            if found == box_type:
+                start, end = payload, box_end
+                break
+        else:
+            return None
+    return start, end
+
+
+def _mp4_timing(data: bytes, start: int) -> tuple[int, int]:
+    """Timescale and duration from an mvhd or mdhd payload."""
+    if data[start] == 1:
+        timescale, duration = struct.unpack_from(">IQ", data, start + 20)
+    else:
+        timescale, duration = struct.unpack_from(">II", data, start + 12)
+    return timescale, duration
+
+
+def _probe_mp4(data: bytes) -> MediaInfo:
+    info = MediaInfo()
+    moov = _mp4_find(data, 0, len(data), b"moov")
+    if moov is None:
+        return info
+    for box_type, start, end in _mp4_boxes(data, *moov):
+        if box_type == b"mvhd":
+            timescale, duration = _mp4_timing(data, start)
+            if timescale:
+                info.duration = duration / timescale
+        elif box_type == b"trak":
+            _probe_mp4_track(data, start, end, info)
+    return info
+
+
+def _probe_mp4_track(data: bytes, start: int, end: int, info: MediaInfo) -> None:
+    hdlr = _mp4_find(data, start, end, b"mdia", b"hdlr")
+    mdhd = _mp4_find(data, start, end, b"mdia", b"mdhd")
+    if hdlr is None or mdhd is None:
+        return
+    handler = data[hdlr[0] + 8 : hdlr[0] + 12]
+    timescale, duration = _mp4_timing(data, mdhd[0])
+    stbl = _mp4_find(data, start, end, b"mdia", b"minf", b"stbl")
+
+    if handler == b"vide" and info.width is None:
+        tkhd = _mp4_find(data, start, end, b"tkhd")
+        if tkhd is not None:
+            # Display size as 16.16 fixed point, at the end of the box
+            width, height = struct.unpack_from(">II", data, tkhd[1] - 8)
+            info.width, info.height = width >> 16, height >> 16
+        stts = _mp4_find(data, *stbl, b"stts") if stbl else None
+        if stts is not None and timescale and duration:
+            (entries,) = struct.unpack_from(">I", data, stts[0] + 4)
+            samples = sum(
+                struct.unpack_from(">I", data, stts[0] + 8 + 8 * i)[0] for i in range(entries)
+            )
+            info.fps = round(samples * timescale / duration, 3)
+    elif handler == b"soun" and info.sample_rate is None:
+        info.sample_rate = timescale or None
+        stsd = _mp4_find(data, *stbl, b"stsd") if stbl else None
+        if stsd is not None:
+            # First sample entry: 8-byte box header, 8 reserved/reference bytes,
+            # 8 version/vendor bytes, then channel count and 16.16 sample rate
+            entry = stsd[0] + 8
+            (info.channels,) = struct.unpack_from(">H", data, entry + 24)
+            (rate,) = struct.unpack_from(">I", data, entry + 32)
+            info.sample_rate = (rate >> 16) or info.sample_rate
+        if info.duration is None and timescale:
+            info.duration = duration / timescale
+
+
+def read_mp4_moov(blocks: Iterable[bytes]) -> bytes:
+    """
+    Pick the `moov` box out of an MP4 that arrives block by block.
+
+    Top-level boxes before it (usually `mdat`) are skipped rather than kept,
+    so a file whose index follows its media data can be probed without being
+    held in memory as a whole. Stops reading once the box is complete.
+
+    Args:
+        blocks: Consecutive blocks of the file
+
+    Returns:
+        The moov box, which probe_media accepts on its own, or b"" if the
+        blocks are not an MP4 or have no moov box
+    """
+    buffer = bytearray()
+    moov = bytearray()
+    skip = keep = 0
+    first = True
+    for block in blocks:
+        buffer += block
+        while buffer:
+            if skip:
+                consumed = min(skip, len(buffer))
+                skip -= consumed
+                del buffer[:consumed]
+                continue
+            if keep < 0:
+                moov += buffer
+                buffer.clear()
+                continue
+            if keep:
+                consumed = min(keep, len(buffer))
+                keep -= consumed
+                moov += buffer[:consumed]
+                del buffer[:consumed]
+                if not keep:
+                    return bytes(moov)
+                continue
+            if len(buffer) < 8:
+                break
+            (size,) = struct.unpack_from(">I", buffer)
+            if size == 1 and len(buffer) < 16:
+                break
+            box_type = bytes(buffer[4:8])
+            if first and box_type not in _MP4_FIRST_BOXES:
+                return b""
+            first = False
+            if size == 1:
+                (size,) = struct.unpack_from(">Q", buffer, 8)
+            elif size == 0:
+                # The last box, which extends to the end of the file
+                if box_type != b"moov":
+                    return b""
+                keep = -1
+                continue
+            if size < 8:
+                return b""
+            if box_type == b"moov":
+                keep = size
+            else:
+                skip = size
+    return bytes(moov) if keep < 0 else b""
+
+
+_MP4_FIRST_BOXES = frozenset({b"ftyp", b"moov", b"mdat", b"free", b"skip", b"wide"})
+
+_PROBES: list[tuple[Callable[[bytes], bool], Callable[[bytes], MediaInfo]]] = [
+    (lambda d: d.startswith(b"\x89PNG\r\n\x1a\n"), _probe_png),
+    (lambda d: d.startswith(b"\xff\xd8"), _probe_jpeg),
+    (lambda d: d.startswith((b"GIF87a", b"GIF89a")), _probe_gif),
+    (lambda d: d[:4] == b"RIFF" and d[8:12] == b"WEBP", _probe_webp),
+    (lambda d: d[:4] == b"RIFF" and d[8:12] == b"WAVE", _probe_wav),
+    (lambda d: d[4:8] in _MP4_FIRST_BOXES, _probe_mp4),
+    (lambda d: d[:3] == b"ID3" or (len(d) > 4 and _is_mp3_sync(d, 0)), _probe_mp3),
+]
+
+
+# MIME sniffing
+
+# Major brands of ISO base media files that hold audio only
+_MP4_AUDIO_BRANDS = frozenset({b"M4A ", b"M4B ", b"M4P ", b"F4A "})
+
+
+def _sniff_mp4(head: bytes) -> str:
+    if head[4:8] == b"ftyp":
+        brand = head[8:12]
+        if brand == b"qt  ":
+            return "video/quicktime"
+        if brand in _MP4_AUDIO_BRANDS:
+            return "audio/mp4"
+    return "video/mp4"
+
+
+def _sniff_matroska(head: bytes) -> str:
+    # The EBML header's DocType comes within the first few dozen bytes
+    return "video/webm" if b"webm" in head[:64] else "video/x-matroska"
+
+
+_SNIFFERS: list[tuple[Callable[[bytes], bool], Callable[[bytes], str]]] = [
+    (lambda d: d.startswith(b"\x89PNG\r\n\x1a\n"), lambda d: "image/png"),
+    (lambda d: d.startswith(b"\xff\xd8\xff"), lambda d: "image/jpeg"),
+    (lambda d: d.startswith((b"GIF87a", b"GIF89a")), lambda d: "image/gif"),
+    (lambda d: d[:4] == b"RIFF" and d[8:12] == b"WEBP", lambda d: "image/webp"),
+    (lambda d: d[:4] == b"RIFF" and d[8:12] == b"WAVE", lambda d: "audio/wav"),
+    (lambda d: d[:4] == b"RIFF" and d[8:12] == b"AVI ", lambda d: "video/x-msvideo"),
+    (
+        lambda d: d.startswith(b"BM") and len(d) > 14 and d[6:10] == b"\x00" * 4,
+        lambda d: "image/bmp",
+    ),
+    (lambda d: d[4:8] in _MP4_FIRST_BOXES, _sniff_mp4),
+    (lambda d: d.startswith(b"\x1a\x45\xdf\xa3"), _sniff_matroska),
+    (lambda d: d.startswith(b"OggS"), lambda d: "audio/ogg"),
+    (lambda d: d.startswith(b"\x00\x00\x01\xba"), lambda d: "video/mpeg"),
+    (lambda d: d[:3] == b"ID3" or (len(d) > 4 and _is_mp3_sync(d, 0)), lambda d: "audio/mpeg"),
+]
+
+
+def sniff_mime_type(head: bytes) -> str | None:
+    """
+    Identify a media file's MIME type from its leading bytes.
+
+    Args:
+        head: The start of the file; the first 64 bytes are enough
+
+    Returns:
+        The MIME type, or None for formats without a signature (e.g. text)
+    """
+    for matches, mime_type in _SNIFFERS:
+        if matches(head):
+            return mime_type(head)
+    return None
@@ -0,0 +1,220 @@
+"""Cluster-wide rate limits and concurrency caps for generation providers.
+
+Fal, Kie, Replicate and OpenAI enforce account-level limits on requests per
+second and on concurrently running jobs. Every worker thread submitting blindly
+only discovers those limits through 429s and retries. Generators instead call
+`context.acquire_provider_slot(provider, endpoint)` right before submitting,
+which waits until the job fits within the configured limits:
+
+- a token bucket (`requests_per_second`, `burst`) paces submissions, and
+- a semaphore (`max_concurrency`) caps provider jobs in flight. The slot is a
+  lease held until the generator finishes (or `lease_seconds` pass, so a
+  crashed worker cannot leak it).
+
+Both live in Redis and are updated by Lua scripts, so limits hold across all
+worker processes. Limits are configured per provider and, optionally, per
+model endpoint via `BOARDS_PROVIDER_LIMITS`, e.g.::
+
+    {"fal": {"requests_per_second": 10, "burst": 20, "max_concurrency": 40},
+     "fal:fal-ai/veo3": {"max_concurrency": 4}}
+
+An endpoint entry applies in addition to its provider's entry. Providers
+without an entry are not limited.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any
+from uuid import uuid4
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+from ..config import settings
+from ..logging import get_logger
+from ..redis_pool import get_redis_client
+
+logger = get_logger(__name__)
+
+# How often a job waiting for a concurrency slot checks again (seconds)
+CONCURRENCY_POLL_INTERVAL = 0.5
+
+# KEYS[1]: bucket hash; ARGV: rate (tokens/s), burst. Returns the seconds to
+# wait before a token is available ("0" if one was taken). Uses the Redis clock
+# so workers with skewed clocks share one bucket correctly.
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+# KEYS[1]: lease sorted set; ARGV: limit, lease id, lease seconds. Returns 1 if
+# a lease was granted, 0 if the limit is reached.
+_SEMAPHORE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= limit then
+  return 0
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[2])
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[3])) + 1)
+return 1
+"""
+
+
+@dataclass(frozen=True)
+class ProviderLimit:
+    """Limits for one provider or model endpoint. None means unlimited."""
+
+    requests_per_second: float | None = None
+    burst: int | None = None
+    max_concurrency: int | None = None
+
+    @classmethod
+    def from_mapping(cls, key: str, values: Mapping[str, Any]) -> ProviderLimit:
+        known = {f.name for f in fields(cls)}
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(
+                f"Unknown provider limit option(s) for {key!r}: {', '.join(sorted(unknown))}. "
+                f"Expected: {', '.join(sorted(known))}"
+            )
+        return cls(**values)
+
+    @property
+    def bucket_size(self) -> float:
+        """Token bucket capacity; defaults to one second's worth of requests."""
+        assert self.requests_per_second is not None
+        return float(self.burst or max(1.0, self.requests_per_second))
+
+
+@dataclass
+class ProviderSlot:
+    """Concurrency leases held by one job, released when it finishes."""
+
+    lease_id: str
+    lease_keys: list[str] = field(default_factory=list)
+
+
+def limit_key(provider: str, endpoint: str | None = None) -> str:
+    """Config key (and Redis key suffix) for a provider or one of its endpoints."""
+    return f"{provider}:{endpoint}" if endpoint else provider
+
+
+class ProviderLimiter:
+    """Acquires provider rate and concurrency limits stored in Redis."""
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        limits: Mapping[str, ProviderLimit],
+        lease_seconds: float = 3600,
+    ) -> None:
+        self._client = client
+        self.limits = dict(limits)
+        self.lease_seconds = lease_seconds
+        self._token_bucket: AsyncScript = client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._semaphore: AsyncScript = client.register_script(_SEMAPHORE_SCRIPT)
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Mapping[str, Mapping[str, Any]],
+        lease_seconds: float = 3600,
+        client: redis.Redis | None = None,
+    ) -> ProviderLimiter:
+        limits = {key: ProviderLimit.from_mapping(key, values) for key, values in config.items()}
+        return cls(client or get_redis_client(), limits, lease_seconds)
+
+    def limits_for(
+        self, provider: str, endpoint: str | None = None
+    ) -> list[tuple[str, ProviderLimit]]:
+        """Limits that apply to a provider endpoint: the provider's, then the endpoint's."""
+        keys = [limit_key(provider)]
+        if endpoint:
+            keys.append(limit_key(provider, endpoint))
+        return [(key, self.limits[key]) for key in keys if key in self.limits]
+
+    async def acquire(self, provider: str, endpoint: str | None = None) -> ProviderSlot:
+        """Wait until a job may be submitted to the provider endpoint.
+
+        Takes a concurrency lease for every applicable `max_concurrency`, then a
+        token from every applicable bucket. The returned slot must be passed to
+        `release` once the provider job has finished.
+        """
+        slot = ProviderSlot(lease_id=uuid4().hex)
+        try:
+            for key, limit in self.limits_for(provider, endpoint):
+                if limit.max_concurrency:
+                    await self._acquire_lease(slot, key, limit.max_concurrency)
+            for key, limit in self.limits_for(provider, endpoint):
+                if limit.requests_per_second:
+                    await self._take_token(key, limit)
+        except BaseException:
+            await self.release(slot)
+            raise
+        return slot
+
+    async def release(self, slot: ProviderSlot) -> None:
+        """Give back a slot's concurrency leases."""
+        lease_keys, slot.lease_keys = slot.lease_keys, []
+        for lease_key in lease_keys:
+            await self._client.zrem(lease_key, slot.lease_id)
+
+    async def _acquire_lease(self, slot: ProviderSlot, key: str, limit: int) -> None:
+        lease_key = f"provider:{key}:leases"
+        waited = False
+        while not await self._semaphore(
+            keys=[lease_key], args=[limit, slot.lease_id, self.lease_seconds]
+        ):
+            if not waited:
+                logger.info("Waiting for provider concurrency slot", limit_key=key, limit=limit)
+                waited = True
+            await asyncio.sleep(CONCURRENCY_POLL_INTERVAL)
+        slot.lease_keys.append(lease_key)
+
+    async def _take_token(self, key: str, limit: ProviderLimit) -> None:
+        bucket_key = f"provider:{key}:bucket"
+        while True:
+            wait = float(
+                await self._token_bucket(
+                    keys=[bucket_key], args=[limit.requests_per_second, limit.bucket_size]
+                )
+            )
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+_limiter: ProviderLimiter | None = None
+
+
+def get_provider_limiter() -> ProviderLimiter | None:
+    """Shared limiter built from settings, or None if no limits are configured."""
+    global _limiter
+    if not settings.provider_limits:
+        return None
+    if _limiter is None:
+        _limiter = ProviderLimiter.from_config(
+            settings.provider_limits, lease_seconds=settings.job_timeout
+        )
+    return _limiter
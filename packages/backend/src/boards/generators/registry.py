@@ -2,6 +2,14 @@
 Generator registry system for discovering and managing generators.
 """
 
+import hashlib
+import json
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
 from boards.logging import get_logger
 
 from .base import BaseGenerator
@@ -9,16 +17,107 @@ from .base import BaseGenerator
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class GeneratorCatalogEntry:
+    """Precomputed, serializable description of one registered generator."""
+
+    name: str
+    description: str
+    artifact_type: str
+    input_schema: dict[str, Any]
+
+    @classmethod
+    def from_generator(cls, generator: BaseGenerator) -> "GeneratorCatalogEntry":
+        """Describe a generator instance."""
+        return cls(
+            name=generator.name,
+            description=generator.description,
+            artifact_type=generator.artifact_type,
+            input_schema=generator.get_input_schema().model_json_schema(),
+        )
+
+
+@dataclass(frozen=True)
+class GeneratorCatalog:
+    """
+    Immutable snapshot of the registered generators.
+
+    Input JSON schemas are generated once when the snapshot is built rather than
+    on every request. `version` is a content hash of the whole snapshot, so
+    clients can cache the catalog and only refetch when it changes.
+    """
+
+    entries: tuple[GeneratorCatalogEntry, ...]
+    by_artifact_type: Mapping[str, tuple[GeneratorCatalogEntry, ...]]
+    version: str
+
+    @classmethod
+    def build(cls, generators: list[BaseGenerator]) -> "GeneratorCatalog":
+        """Build a snapshot from generator instances (in registration order)."""
+        return cls.from_entries(
+            [GeneratorCatalogEntry.from_generator(generator) for generator in generators]
+        )
+
+    @classmethod
+    def from_entries(cls, entries: list[GeneratorCatalogEntry]) -> "GeneratorCatalog":
+        """Build a snapshot from already-described generators (in registration order)."""
+        grouped: dict[str, list[GeneratorCatalogEntry]] = {}
+        for entry in entries:
+            grouped.setdefault(entry.artifact_type, []).append(entry)
+
+        payload = json.dumps(
+            [
+                [entry.name, entry.description, entry.artifact_type, entry.input_schema]
+                for entry in entries
+            ],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+
+        return cls(
+            entries=tuple(entries),
+            by_artifact_type=MappingProxyType({k: tuple(v) for k, v in grouped.items()}),
+            version=hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16],
+        )
+
+    def list(self, artifact_type: str | None = None) -> tuple[GeneratorCatalogEntry, ...]:
+        """Return all entries, or the entries for one artifact type."""
+        if artifact_type is None:
+            return self.entries
+        return self.by_artifact_type.get(artifact_type, ())
+
+
+@dataclass(frozen=True)
+class LazyGenerator:
+    """
+    A registered generator that has not been imported yet.
+
+    `entry` describes the generator (typically read from a prebuilt manifest) so
+    it can be listed without importing its module; `factory` imports the module
+    and constructs the instance.
+    """
+
+    entry: GeneratorCatalogEntry
+    factory: Callable[[], BaseGenerator]
+
+
 class GeneratorRegistry:
     """
     Central registry for generator discovery and management.
 
     Provides methods to register generators, look them up by name,
     and list available generators by various criteria.
+
+    Generators may be registered lazily (see `register_lazy`); they are
+    materialized on first lookup.
     """
 
     def __init__(self):
-        self._generators: dict[str, BaseGenerator] = {}
+        self._generators: dict[str, BaseGenerator | LazyGenerator] = {}
+        self._by_artifact_type: dict[str, dict[str, BaseGenerator | LazyGenerator]] = {}
+        self._catalog: GeneratorCatalog | None = None
+        self._materialize_lock = threading.Lock()
 
     def register(self, generator: BaseGenerator) -> None:
         """
@@ -34,28 +133,90 @@ class GeneratorRegistry:
         if generator.name in self._generators:
             raise ValueError(f"Generator '{generator.name}' is already registered")
 
-        self._generators[generator.name] = generator
+        self._add(generator.name, generator.artifact_type, generator)
+
+    def register_lazy(
+        self, entry: GeneratorCatalogEntry, factory: Callable[[], BaseGenerator]
+    ) -> None:
+        """
+        Register a generator without importing it.
+
+        The generator is listed (and included in the catalog) using `entry`;
+        `factory` is called on first `get()` to construct the real instance.
+
+        Args:
+            entry: Description of the generator
+            factory: Callable that imports and constructs the generator
+
+        Raises:
+            ValueError: If a generator with the same name is already registered
+        """
+        logger.debug("Registering lazy generator", name=entry.name)
+        if entry.name in self._generators:
+            raise ValueError(f"Generator '{entry.name}' is already registered")
+
+        self._add(entry.name, entry.artifact_type, LazyGenerator(entry=entry, factory=factory))
+
+    def _add(self, name: str, artifact_type: str, value: BaseGenerator | LazyGenerator) -> None:
+        self._generators[name] = value
+        self._by_artifact_type.setdefault(artifact_type, {})[name] = value
+        self._catalog = None
+
+    def _materialize(self, name: str, lazy: LazyGenerator) -> BaseGenerator:
+        """Import and construct a lazily registered generator, replacing its placeholder."""
+        with self._materialize_lock:
+            current = self._generators.get(name)
+            if isinstance(current, BaseGenerator):
+                # Materialized by another thread while we waited
+                return current
+
+            generator = lazy.factory()
+            if (generator.name, generator.artifact_type) != (name, lazy.entry.artifact_type):
+                raise ValueError(
+                    f"Generator '{name}' does not match its manifest entry "
+                    f"(got name={generator.name!r}, artifact_type={generator.artifact_type!r}); "
+                    "rebuild the generators manifest"
+                )
+
+            if current is lazy:
+                self._generators[name] = generator
+                self._by_artifact_type[lazy.entry.artifact_type][name] = generator
+            logger.debug("Materialized lazy generator", name=name)
+            return generator
+
+    def _resolve(self, name: str, value: BaseGenerator | LazyGenerator) -> BaseGenerator:
+        if isinstance(value, LazyGenerator):
+            return self._materialize(name, value)
+        return value
 
     def get(self, name: str) -> BaseGenerator | None:
         """
         Get a generator by name.
 
+        Lazily registered generators are imported on first access.
+
         Args:
             name: Name of the generator to retrieve
 
         Returns:
             BaseGenerator instance or None if not found
         """
-        return self._generators.get(name)
+        value = self._generators.get(name)
+        if value is None:
+            return None
+        return self._resolve(name, value)
 
     def list_all(self) -> list[BaseGenerator]:
         """
         List all registered generators.
 
+        This materializes any lazily registered generators; use `catalog()` to
+        describe generators without importing them.
+
         Returns:
             List of all generator instances
         """
-        return list(self._generators.values())
+        return [self._resolve(name, value) for name, value in list(self._generators.items())]
 
     def list_by_artifact_type(self, artifact_type: str) -> list[BaseGenerator]:
         """
@@ -67,11 +228,8 @@ class GeneratorRegistry:
         Returns:
             List of generators that produce the specified artifact type
         """
-        return [
-            generator
-            for generator in self._generators.values()
-            if generator.artifact_type == artifact_type
-        ]
+        by_name = self._by_artifact_type.get(artifact_type, {})
+        return [self._resolve(name, value) for name, value in list(by_name.items())]
 
     def list_names(self) -> list[str]:
         """
@@ -92,14 +250,53 @@ class GeneratorRegistry:
         Returns:
             True if the generator was found and removed, False otherwise
         """
-        if name in self._generators:
-            del self._generators[name]
-            return True
-        return False
+        value = self._generators.pop(name, None)
+        if value is None:
+            return False
+
+        artifact_type = (
+            value.entry.artifact_type if isinstance(value, LazyGenerator) else value.artifact_type
+        )
+        self._by_artifact_type.get(artifact_type, {}).pop(name, None)
+        self._catalog = None
+        return True
 
     def clear(self) -> None:
         """Clear all registered generators."""
         self._generators.clear()
+        self._by_artifact_type.clear()
+        self._catalog = None
+
+    def catalog(self) -> GeneratorCatalog:
+        """
+        Get the catalog snapshot for the currently registered generators.
+
+        Built on first access and reused until the registry changes. Lazily
+        registered generators are described from their manifest entry and are
+        not imported.
+
+        Returns:
+            Immutable GeneratorCatalog
+        """
+        if self._catalog is None:
+            self._catalog = GeneratorCatalog.from_entries(
+                [
+                    value.entry
+                    if isinstance(value, LazyGenerator)
+                    else GeneratorCatalogEntry.from_generator(value)
+                    for value in self._generators.values()
+                ]
+            )
+            logger.debug(
+                "Built generator catalog",
+                generator_count=len(self._catalog.entries),
+                version=self._catalog.version,
+            )
+        return self._catalog
+
+    def is_loaded(self, name: str) -> bool:
+        """Check whether a registered generator has been imported and constructed."""
+        return isinstance(self._generators.get(name), BaseGenerator)
 
     def __len__(self) -> int:
         """Return the number of registered generators."""
@@ -2,15 +2,17 @@
 Artifact resolution utilities for converting Generation references to actual files.
 """
 
-import base64
+import binascii
+import itertools
 import os
 import tempfile
 import uuid
-from urllib.parse import urlparse
+from collections.abc import AsyncIterator, Callable, Iterator
+from urllib.parse import quote, unquote, urlparse
 
 import aiofiles
-import httpx
 
+from ..http_client import get_http_client
 from ..logging import get_logger
 from ..storage.base import StorageManager
 from .artifacts import (
@@ -20,9 +22,18 @@ from .artifacts import (
     TextArtifact,
     VideoArtifact,
 )
+from .media_probe import probe_media, read_mp4_moov
 
 logger = get_logger(__name__)
 
+# Decoded bytes per block when streaming a base64 data URL into storage
+DATA_URL_CHUNK_SIZE = 1024 * 1024
+
+# Bytes that base64.b64decode skips over by default (whitespace, line breaks, ...)
+_NON_BASE64 = bytes(
+    set(range(256)) - set(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
+)
+
 
 def _rewrite_storage_url(storage_url: str) -> str:
     """
@@ -102,8 +113,9 @@ async def resolve_artifact(
     # This prevents potential security issues with paths like /etc/passwd
     parsed = urlparse(artifact.storage_url)
 
-    # Check if it's a valid URL with a scheme (http, https, s3, etc.)
-    if parsed.scheme in ("http", "https", "s3", "gs"):
+    # Check if it's a valid URL with a scheme (http, https, s3, etc.), or an
+    # inline artifact that carries its content in a data URL
+    if parsed.scheme in ("http", "https", "s3", "gs", "data"):
         # It's a remote URL, download it
         return await download_artifact_to_temp(artifact)
 
@@ -146,38 +158,50 @@ async def download_artifact_to_temp(
     os.chmod(temp_path, 0o600)
 
     try:
+        if artifact.storage_url.startswith("data:"):
+            # Inline artifact: decode it instead of downloading
+            os.close(temp_fd)
+            total_bytes = 0
+            async with aiofiles.open(temp_path, "wb") as temp_file:
+                for block in iter_data_url(artifact.storage_url):
+                    await temp_file.write(block)
+                    total_bytes += len(block)
+            if total_bytes == 0:
+                raise ValueError("Decoded data URL is empty")
+            return temp_path
+
         # Rewrite URL for Docker internal networking
         download_url = _rewrite_storage_url(artifact.storage_url)
 
         # Stream the download to avoid loading large files into memory
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            logger.info(
-                "Attempting to download artifact",
-                original_url=artifact.storage_url,
-                download_url=download_url,
-            )
-            async with client.stream("GET", download_url) as response:
-                response.raise_for_status()
+        client = await get_http_client()
+        logger.info(
+            "Attempting to download artifact",
+            original_url=artifact.storage_url,
+            download_url=download_url,
+        )
+        async with client.stream("GET", download_url, timeout=300.0) as response:
+            response.raise_for_status()
 
-                # Close the file descriptor returned by mkstemp and use aiofiles
-                os.close(temp_fd)
+            # Close the file descriptor returned by mkstemp and use aiofiles
+            os.close(temp_fd)
 
-                # Stream content to file using async I/O
-                total_bytes = 0
-                async with aiofiles.open(temp_path, "wb") as temp_file:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        await temp_file.write(chunk)
-                        total_bytes += len(chunk)
+            # Stream content to file using async I/O
+            total_bytes = 0
+            async with aiofiles.open(temp_path, "wb") as temp_file:
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    await temp_file.write(chunk)
+                    total_bytes += len(chunk)
 
-                # Validate that we downloaded something
-                if total_bytes == 0:
-                    raise ValueError("Downloaded file is empty")
+            # Validate that we downloaded something
+            if total_bytes == 0:
+                raise ValueError("Downloaded file is empty")
 
-                logger.debug(
-                    "Successfully downloaded artifact to temp file",
-                    temp_path=temp_path,
-                    size_bytes=total_bytes,
-                )
+            logger.debug(
+                "Successfully downloaded artifact to temp file",
+                temp_path=temp_path,
+                size_bytes=total_bytes,
+            )
 
         return temp_path
 
@@ -211,17 +235,12 @@ def _get_file_extension(
     return format_ext
 
 
-def _decode_data_url(data_url: str) -> bytes:
+def _split_data_url(data_url: str) -> tuple[str, int]:
     """
-    Decode a data URL to bytes.
-
-    Supports data URLs in the format: data:[<mediatype>][;base64],<data>
-
-    Args:
-        data_url: Data URL string (e.g., "data:image/png;base64,iVBORw0KGgo...")
+    Parse the header of a data URL: data:[<mediatype>][;base64],<data>
 
     Returns:
-        bytes: Decoded content
+        tuple: The header and the offset at which the data starts
 
     Raises:
         ValueError: If data URL is malformed or empty
@@ -229,29 +248,88 @@ def _decode_data_url(data_url: str) -> bytes:
     if not data_url.startswith("data:"):
         raise ValueError("Invalid data URL: must start with 'data:'")
 
-    # Split off the "data:" prefix
-    try:
-        # Format: data:[<mediatype>][;base64],<data>
-        header, data = data_url[5:].split(",", 1)
-    except ValueError as e:
-        raise ValueError("Invalid data URL format: missing comma separator") from e
-
-    if not data:
+    # Find the separator rather than splitting, which would copy the data
+    comma = data_url.find(",", 5)
+    if comma == -1:
+        raise ValueError("Invalid data URL format: missing comma separator")
+    if comma == len(data_url) - 1:
         raise ValueError("Data URL contains no data after comma")
 
-    # Check if base64 encoded
-    is_base64 = ";base64" in header
+    return data_url[5:comma], comma + 1
+
 
-    if is_base64:
+def iter_data_url(data_url: str, chunk_size: int = DATA_URL_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Decode a data URL incrementally, in blocks of about `chunk_size` bytes.
+
+    Base64 data is decoded a slice at a time, so only a block or two of
+    encoded and decoded bytes are held at once besides the URL itself.
+    Characters outside the base64 alphabet are skipped, as base64.b64decode does.
+
+    Args:
+        data_url: Data URL string (e.g., "data:image/png;base64,iVBORw0KGgo...")
+        chunk_size: Approximate number of decoded bytes per block
+
+    Yields:
+        bytes: Consecutive non-empty blocks of the decoded content
+
+    Raises:
+        ValueError: If data URL is malformed or its base64 data is invalid
+    """
+    header, start = _split_data_url(data_url)
+
+    if ";base64" not in header:
+        # URL-encoded data (rare for binary content)
+        decoded = unquote(data_url[start:]).encode("utf-8")
+        if decoded:
+            yield decoded
+        return
+
+    # Every 4 base64 characters decode to 3 bytes on their own
+    block_size = max(chunk_size // 3, 1) * 4
+    pending = b""
+    for offset in range(start, len(data_url), block_size):
         try:
-            decoded = base64.b64decode(data)
-        except Exception as e:
+            encoded = data_url[offset : offset + block_size].encode("ascii")
+        except UnicodeEncodeError as e:
             raise ValueError(f"Failed to decode base64 data: {e}") from e
-    else:
-        # URL-encoded data (rare for binary content)
-        from urllib.parse import unquote
+        encoded = pending + encoded.translate(None, _NON_BASE64)
+        aligned = len(encoded) - len(encoded) % 4
+        pending = encoded[aligned:]
+        if aligned:
+            decoded = _decode_base64(memoryview(encoded)[:aligned])
+            if decoded:
+                yield decoded
+
+    if pending:
+        # Fewer than 4 characters left over means the padding is missing
+        yield _decode_base64(pending)
+
+
+def _decode_base64(encoded: bytes | memoryview) -> bytes:
+    try:
+        return binascii.a2b_base64(encoded)
+    except binascii.Error as e:
+        raise ValueError(f"Failed to decode base64 data: {e}") from e
+
+
+def _decode_data_url(data_url: str) -> bytes:
+    """
+    Decode a data URL to bytes.
+
+    Supports data URLs in the format: data:[<mediatype>][;base64],<data>
+
+    Args:
+        data_url: Data URL string (e.g., "data:image/png;base64,iVBORw0KGgo...")
 
-        decoded = unquote(data).encode("utf-8")
+    Returns:
+        bytes: Decoded content
+
+    Raises:
+        ValueError: If data URL is malformed or empty
+    """
+    header, _ = _split_data_url(data_url)
+    decoded = b"".join(iter_data_url(data_url))
 
     if len(decoded) == 0:
         raise ValueError("Decoded data URL is empty")
@@ -259,7 +337,7 @@ def _decode_data_url(data_url: str) -> bytes:
     logger.info(
         "Successfully decoded data URL",
         size_bytes=len(decoded),
-        is_base64=is_base64,
+        is_base64=";base64" in header,
     )
     return decoded
 
@@ -293,27 +371,27 @@ async def download_from_url(url: str) -> bytes:
         return _decode_data_url(url)
 
     # Stream download to avoid loading entire file into memory at once
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        async with client.stream("GET", url) as response:
-            response.raise_for_status()
-
-            # Collect chunks
-            chunks = []
-            total_bytes = 0
-            async for chunk in response.aiter_bytes(chunk_size=8192):
-                chunks.append(chunk)
-                total_bytes += len(chunk)
-
-            # Validate content
-            if total_bytes == 0:
-                raise ValueError(f"Downloaded file from {url} is empty")
-
-            logger.info(
-                "Successfully downloaded content",
-                url=url,
-                size_bytes=total_bytes,
-            )
-            return b"".join(chunks)
+    client = await get_http_client()
+    async with client.stream("GET", url, timeout=60.0) as response:
+        response.raise_for_status()
+
+        # Collect chunks
+        chunks = []
+        total_bytes = 0
+        async for chunk in response.aiter_bytes(chunk_size=8192):
+            chunks.append(chunk)
+            total_bytes += len(chunk)
+
+        # Validate content
+        if total_bytes == 0:
+            raise ValueError(f"Downloaded file from {url} is empty")
+
+        logger.info(
+            "Successfully downloaded content",
+            url=url,
+            size_bytes=total_bytes,
+        )
+        return b"".join(chunks)
 
 
 def _get_content_type_from_format(artifact_type: str, format: str) -> str:
@@ -321,8 +399,8 @@ def _get_content_type_from_format(artifact_type: str, format: str) -> str:
     Get MIME content type from artifact type and format.
 
     Args:
-        artifact_type: Type of artifact ('image', 'video', 'audio')
-        format: Format string (e.g., 'png', 'mp4', 'mp3')
+        artifact_type: Type of artifact ('image', 'video', 'audio', 'text')
+        format: Format string (e.g., 'png', 'mp4', 'mp3', 'markdown')
 
     Returns:
         str: MIME content type
@@ -348,10 +426,60 @@ def _get_content_type_from_format(artifact_type: str, format: str) -> str:
             "wav": "audio/wav",
             "ogg": "audio/ogg",
         },
+        "text": {
+            "plain": "text/plain",
+            "txt": "text/plain",
+            "markdown": "text/markdown",
+            "md": "text/markdown",
+            "json": "application/json",
+        },
     }
 
     type_map = content_type_map.get(artifact_type, {})
-    return type_map.get(format_lower, "application/octet-stream")
+    # Other text (e.g. html) is served as plain text rather than rendered
+    default = "text/plain" if artifact_type == "text" else "application/octet-stream"
+    return type_map.get(format_lower, default)
+
+
+async def _fetch_result(
+    storage_url: str,
+) -> tuple[bytes | Callable[[], AsyncIterator[bytes]], bytes]:
+    """
+    Fetch a provider result for uploading to storage.
+
+    Data URLs are decoded block by block as they are uploaded instead of up
+    front, so a large inline result never exists in memory as a whole. They
+    are returned as a function that starts decoding afresh, so that a failed
+    upload can be retried. Their headers are probed from the first block,
+    which is the whole file unless it is larger than DATA_URL_CHUNK_SIZE,
+    except for MP4s, whose `moov` box is read from wherever it is.
+
+    Args:
+        storage_url: Provider's temporary URL (HTTP(S) or data URL)
+
+    Returns:
+        tuple: The content to upload and the bytes to probe
+
+    Raises:
+        httpx.HTTPError: If download fails
+        ValueError: If content is empty or data URL is malformed
+    """
+    if not storage_url.startswith("data:"):
+        content = await download_from_url(storage_url)
+        return content, content
+
+    blocks = iter_data_url(storage_url)
+    head = next(blocks, b"")
+    if not head:
+        raise ValueError("Decoded data URL is empty")
+    # The moov box may follow the media data, well past the first block
+    moov = read_mp4_moov(itertools.chain([head], blocks))
+    return lambda: _stream_data_url(storage_url), moov or head
+
+
+async def _stream_data_url(data_url: str) -> AsyncIterator[bytes]:
+    for block in iter_data_url(data_url):
+        yield block
 
 
 async def store_image_result(
@@ -367,6 +495,9 @@ async def store_image_result(
     """
     Store an image result by downloading from provider URL and uploading to storage.
 
+    The dimensions read from the file's headers (see media_probe.py) take
+    precedence over the values passed in, which providers often omit or default.
+
     Args:
         storage_manager: Storage manager instance
         generation_id: ID of the generation
@@ -391,8 +522,11 @@ async def store_image_result(
         format=format,
     )
 
-    # Download content from provider URL
-    content = await download_from_url(storage_url)
+    # Download content from provider URL (data URLs are streamed as they decode)
+    content, probe_bytes = await _fetch_result(storage_url)
+
+    # Prefer the file's own headers to provider-reported (or defaulted) values
+    probed = probe_media(probe_bytes)
 
     # Determine content type
     content_type = _get_content_type_from_format("image", format)
@@ -418,8 +552,8 @@ async def store_image_result(
     return ImageArtifact(
         generation_id=generation_id,
         storage_url=artifact_ref.storage_url,
-        width=width,
-        height=height,
+        width=probed.width or width,
+        height=probed.height or height,
         format=format,
     )
 
@@ -439,6 +573,10 @@ async def store_video_result(
     """
     Store a video result by downloading from provider URL and uploading to storage.
 
+    The dimensions, duration and fps read from the file's headers (see
+    media_probe.py) take precedence over the values passed in, which providers
+    often omit or default.
+
     Args:
         storage_manager: Storage manager instance
         generation_id: ID of the generation
@@ -465,8 +603,11 @@ async def store_video_result(
         format=format,
     )
 
-    # Download content from provider URL
-    content = await download_from_url(storage_url)
+    # Download content from provider URL (data URLs are streamed as they decode)
+    content, probe_bytes = await _fetch_result(storage_url)
+
+    # Prefer the file's own headers to provider-reported (or defaulted) values
+    probed = probe_media(probe_bytes)
 
     # Determine content type
     content_type = _get_content_type_from_format("video", format)
@@ -492,11 +633,11 @@ async def store_video_result(
     return VideoArtifact(
         generation_id=generation_id,
         storage_url=artifact_ref.storage_url,
-        width=width,
-        height=height,
+        width=probed.width or width,
+        height=probed.height or height,
         format=format,
-        duration=duration,
-        fps=fps,
+        duration=probed.duration or duration,
+        fps=probed.fps or fps,
     )
 
 
@@ -514,6 +655,10 @@ async def store_audio_result(
     """
     Store an audio result by downloading from provider URL and uploading to storage.
 
+    The duration, sample rate and channels read from the file's headers (see
+    media_probe.py) take precedence over the values passed in, which providers
+    often omit or default.
+
     Args:
         storage_manager: Storage manager instance
         generation_id: ID of the generation
@@ -539,8 +684,11 @@ async def store_audio_result(
         format=format,
     )
 
-    # Download content from provider URL
-    content = await download_from_url(storage_url)
+    # Download content from provider URL (data URLs are streamed as they decode)
+    content, probe_bytes = await _fetch_result(storage_url)
+
+    # Prefer the file's own headers to provider-reported (or defaulted) values
+    probed = probe_media(probe_bytes)
 
     # Determine content type
     content_type = _get_content_type_from_format("audio", format)
@@ -567,9 +715,9 @@ async def store_audio_result(
         generation_id=generation_id,
         storage_url=artifact_ref.storage_url,
         format=format,
-        duration=duration,
-        sample_rate=sample_rate,
-        channels=channels,
+        duration=probed.duration or duration,
+        sample_rate=probed.sample_rate or sample_rate,
+        channels=probed.channels or channels,
     )
 
 
@@ -584,6 +732,11 @@ async def store_text_result(
     """
     Store a text result by uploading to storage.
 
+    Results of up to `settings.inline_text_max_size` bytes (UTF-8) are not
+    uploaded but stored inline: the artifact's storage URL is a data URL
+    holding the text, so it is persisted with the generation and served by
+    GraphQL and resolve_artifact without a storage round-trip.
+
     Args:
         storage_manager: Storage manager instance
         generation_id: ID of the generation
@@ -606,12 +759,29 @@ async def store_text_result(
         format=format,
     )
 
+    from ..config import settings
+
+    content_type = _get_content_type_from_format("text", format)
+    encoded = content.encode("utf-8")
+    if 0 < len(encoded) <= settings.inline_text_max_size:
+        logger.info(
+            "Text stored inline",
+            generation_id=generation_id,
+            size_bytes=len(encoded),
+        )
+        return TextArtifact(
+            generation_id=generation_id,
+            storage_url=f"data:{content_type};charset=utf-8,{quote(content)}",
+            content=content,
+            format=format,
+        )
+
     # Upload to storage system
     artifact_ref = await storage_manager.store_artifact(
         artifact_id=generation_id,
-        content=content.encode("utf-8"),
+        content=encoded,
         artifact_type="text",
-        content_type="text/plain",
+        content_type=content_type,
         tenant_id=tenant_id,
         board_id=board_id,
     )
@@ -0,0 +1,36 @@
+"""Test helper generator that simulates a slow, I/O-bound provider (for worker benchmarks)."""
+
+import asyncio
+
+from pydantic import BaseModel
+
+from ..base import BaseGenerator
+
+
+class _Input(BaseModel):
+    text: str = "hello"
+    # Simulated provider submit + polling time
+    delay_seconds: float = 0.5
+
+
+class _Output(BaseModel):
+    text: str
+
+
+class SlowGen(BaseGenerator):
+    name = "slow-gen"
+    artifact_type = "text"
+    description = "Test generator that waits on a fake provider"
+
+    def get_input_schema(self) -> type[_Input]:
+        return _Input
+
+    def get_output_schema(self) -> type[_Output]:
+        return _Output
+
+    async def generate(self, inputs: _Input, context) -> _Output:  # type: ignore[override]
+        await asyncio.sleep(inputs.delay_seconds)
+        return _Output(text=inputs.text)
+
+    async def estimate_cost(self, inputs: _Input) -> float:  # type: ignore[override]
+        return 0.0
@@ -6,6 +6,7 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 import strawberry
+from sqlalchemy import ColumnElement, or_, select
 
 from ..auth.middleware import get_auth_context_optional
 from ..logging import get_logger
@@ -85,6 +86,28 @@ def can_access_board(board: "Boards", auth_context: "AuthContext | None") -> boo
     return any(member.user_id == auth_context.user_id for member in board.board_members)
 
 
+def board_access_condition(auth_context: "AuthContext | None") -> ColumnElement[bool]:
+    """
+    SQL counterpart of `can_access_board` for filtering queries over Boards.
+
+    Matches public boards, plus boards the authenticated user owns or is a member of.
+    """
+    from ..dbmodels import BoardMembers, Boards
+
+    if not auth_context or not auth_context.is_authenticated:
+        # Unauthenticated users can only see public boards
+        return Boards.is_public
+
+    member_board_ids = select(BoardMembers.board_id).where(
+        BoardMembers.user_id == auth_context.user_id
+    )
+    return or_(
+        Boards.is_public,
+        Boards.owner_id == auth_context.user_id,
+        Boards.id.in_(member_board_ids),
+    )
+
+
 def can_access_board_details(board: "Boards", auth_context: "AuthContext | None") -> bool:
     """
     Check if a user can access detailed board information (members, owner, etc).
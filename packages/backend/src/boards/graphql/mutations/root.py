@@ -7,7 +7,12 @@ from uuid import UUID
 import strawberry
 
 from ..types.board import Board, BoardRole
-from ..types.generation import ArtifactType, Generation, UploadArtifactInput
+from ..types.generation import (
+    ArtifactType,
+    Generation,
+    UploadArtifactInput,
+    UploadArtifactResult,
+)
 from ..types.tag import Tag
 
 
@@ -169,6 +174,15 @@ class Mutation:
 
         return await upload_artifact_from_url(info, input)
 
+    @strawberry.mutation(name="uploadArtifacts")
+    async def upload_artifacts(
+        self, info: strawberry.Info, inputs: list[UploadArtifactInput]
+    ) -> list[UploadArtifactResult]:
+        """Upload several artifacts from URLs concurrently (synchronous)."""
+        from ..resolvers.upload import upload_artifacts_from_urls
+
+        return await upload_artifacts_from_urls(info, inputs)
+
     # Tag mutations
     @strawberry.mutation(name="createTag")
     async def create_tag(self, info: strawberry.Info, input: CreateTagInput) -> Tag:
@@ -0,0 +1,107 @@
+"""
+Keyset (cursor) pagination helpers for GraphQL connection fields.
+
+Offset pagination makes Postgres scan and discard every skipped row, so deep
+pages on large boards get slower the further a client scrolls. Connection
+fields instead page on the tuple ``(sort_key, id)``: each cursor encodes the
+last row a client has seen, and the next page is fetched with a row-value
+comparison that a composite ``(…, sort_key DESC, id DESC)`` index can seek to
+directly.
+
+Cursors are opaque to clients (URL-safe base64 of a small JSON payload).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import DateTime, Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from .types.pagination import PageInfo
+
+# Upper bound for `first` on connection fields
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(sort_value: datetime | str, row_id: UUID) -> str:
+    """Encode a (sort key, id) pair into an opaque cursor string."""
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else sort_value
+    payload = json.dumps({"k": value, "id": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, UUID]:
+    """
+    Decode a cursor into its raw sort key and row id.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(payload["k"]), UUID(payload["id"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def clamp_page_size(first: int) -> int:
+    """Clamp a requested page size to [1, MAX_PAGE_SIZE]."""
+    return max(1, min(first, MAX_PAGE_SIZE))
+
+
+def apply_keyset_pagination(
+    stmt: Select[Any],
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[Any],
+    *,
+    first: int,
+    after: str | None,
+    descending: bool = True,
+) -> Select[Any]:
+    """
+    Order a statement by (sort_column, id_column) and seek past the `after` cursor.
+
+    One extra row beyond `first` is fetched so callers can compute
+    ``has_next_page`` without a separate COUNT query (see `split_page`).
+    """
+    if after:
+        raw_value, after_id = decode_cursor(after)
+        after_value: datetime | str = raw_value
+        if isinstance(sort_column.type, DateTime):
+            try:
+                after_value = datetime.fromisoformat(raw_value)
+            except ValueError as e:
+                raise ValueError("Invalid pagination cursor") from e
+
+        row = tuple_(sort_column, id_column)
+        bound = tuple_(after_value, after_id)
+        stmt = stmt.where(row < bound if descending else row > bound)
+
+    if descending:
+        stmt = stmt.order_by(sort_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(sort_column.asc(), id_column.asc())
+
+    return stmt.limit(first + 1)
+
+
+def split_page[T](rows: Sequence[T], first: int) -> tuple[list[T], bool]:
+    """Trim the look-ahead row fetched by `apply_keyset_pagination`."""
+    return list(rows[:first]), len(rows) > first
+
+
+def build_page_info(cursors: Sequence[str], has_next_page: bool, after: str | None) -> PageInfo:
+    """Build PageInfo for a forward-paginated page of edge cursors."""
+    return PageInfo(
+        has_next_page=has_next_page,
+        has_previous_page=after is not None,
+        start_cursor=cursors[0] if cursors else None,
+        end_cursor=cursors[-1] if cursors else None,
+    )
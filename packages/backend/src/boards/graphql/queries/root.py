@@ -7,10 +7,10 @@ from uuid import UUID
 import strawberry
 
 from ..access_control import BoardQueryRole, SortOrder
-from ..types.board import Board
-from ..types.generation import ArtifactType, Generation, GenerationStatus
-from ..types.generator import GeneratorInfo
-from ..types.tag import Tag
+from ..types.board import Board, BoardConnection
+from ..types.generation import ArtifactType, Generation, GenerationConnection, GenerationStatus
+from ..types.generator import GeneratorCatalog, GeneratorInfo
+from ..types.tag import Tag, TagConnection
 from ..types.user import User
 
 
@@ -59,6 +59,26 @@ class Query:
             sort or SortOrder.UPDATED_DESC,
         )
 
+    @strawberry.field
+    async def my_boards_connection(
+        self,
+        info: strawberry.Info,
+        first: int | None = 50,
+        after: str | None = None,
+        role: BoardQueryRole | None = None,
+        sort: SortOrder | None = None,
+    ) -> BoardConnection:
+        """Get boards owned by or shared with the current user, cursor-paginated."""
+        from ..resolvers.board import resolve_my_boards_connection
+
+        return await resolve_my_boards_connection(
+            info,
+            first or 50,
+            after,
+            role or BoardQueryRole.ANY,
+            sort or SortOrder.UPDATED_DESC,
+        )
+
     @strawberry.field
     async def public_boards(
         self,
@@ -98,6 +118,23 @@ class Query:
             info, board_id, status, artifact_type, limit or 50, offset or 0
         )
 
+    @strawberry.field
+    async def recent_generations_connection(
+        self,
+        info: strawberry.Info,
+        board_id: UUID | None = None,
+        status: GenerationStatus | None = None,
+        artifact_type: ArtifactType | None = None,
+        first: int | None = 50,
+        after: str | None = None,
+    ) -> GenerationConnection:
+        """Get recent generations with optional filters, cursor-paginated."""
+        from ..resolvers.generation import resolve_recent_generations_connection
+
+        return await resolve_recent_generations_connection(
+            info, board_id, status, artifact_type, first or 50, after
+        )
+
     @strawberry.field
     async def search_boards(
         self, info: strawberry.Info, query: str, limit: int | None = 50, offset: int | None = 0
@@ -107,6 +144,29 @@ class Query:
 
         return await search_boards(info, query, limit or 50, offset or 0)
 
+    @strawberry.field
+    async def search_boards_connection(
+        self, info: strawberry.Info, query: str, first: int | None = 50, after: str | None = None
+    ) -> BoardConnection:
+        """Search for boards by title or description, cursor-paginated."""
+        from ..resolvers.board import search_boards_connection
+
+        return await search_boards_connection(info, query, first or 50, after)
+
+    @strawberry.field
+    async def search_generations(
+        self,
+        info: strawberry.Info,
+        query: str,
+        board_id: UUID | None = None,
+        limit: int | None = 50,
+        offset: int | None = 0,
+    ) -> list[Generation]:
+        """Search generations by prompt text, ranked by relevance."""
+        from ..resolvers.generation import search_generations
+
+        return await search_generations(info, query, board_id, limit or 50, offset or 0)
+
     @strawberry.field
     async def generators(
         self, info: strawberry.Info, artifact_type: str | None = None
@@ -116,6 +176,18 @@ class Query:
 
         return await resolve_generators(info, artifact_type)
 
+    @strawberry.field
+    async def generator_catalog(
+        self,
+        info: strawberry.Info,
+        artifact_type: str | None = None,
+        if_none_match: str | None = None,
+    ) -> GeneratorCatalog:
+        """Get the versioned generator catalog; pass a known version to skip refetching."""
+        from ..resolvers.generator import resolve_generator_catalog
+
+        return await resolve_generator_catalog(info, artifact_type, if_none_match)
+
     @strawberry.field
     async def tags(
         self,
@@ -128,6 +200,18 @@ class Query:
 
         return await resolve_tags(info, limit or 100, offset or 0)
 
+    @strawberry.field
+    async def tags_connection(
+        self,
+        info: strawberry.Info,
+        first: int | None = 100,
+        after: str | None = None,
+    ) -> TagConnection:
+        """Get tags for the current tenant, cursor-paginated."""
+        from ..resolvers.tag import resolve_tags_connection
+
+        return await resolve_tags_connection(info, first or 100, after)
+
     @strawberry.field
     async def tag(self, info: strawberry.Info, id: UUID) -> Tag | None:
         """Get a tag by ID."""
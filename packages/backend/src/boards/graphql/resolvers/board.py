@@ -1,28 +1,39 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 import strawberry
-from sqlalchemy import and_, or_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import ColumnElement, and_, or_, select
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
 
+from ...auth.context import AuthContext
 from ...database.connection import get_async_session
 from ...dbmodels import BoardMembers, Boards, Generations, Users
 from ...logging import get_logger
 from ..access_control import (
     BoardQueryRole,
     SortOrder,
+    board_access_condition,
     can_access_board,
     can_access_board_details,
     ensure_preloaded,
     get_auth_context_from_info,
 )
+from ..pagination import (
+    apply_keyset_pagination,
+    build_page_info,
+    clamp_page_size,
+    encode_cursor,
+    split_page,
+)
 
 if TYPE_CHECKING:
     from ..mutations.root import AddBoardMemberInput, CreateBoardInput, UpdateBoardInput
-    from ..types.board import Board, BoardMember, BoardRole
-    from ..types.generation import Generation
+    from ..types.board import Board, BoardConnection, BoardMember, BoardRole
+    from ..types.generation import Generation, GenerationConnection
     from ..types.user import User
 
 logger = get_logger(__name__)
@@ -87,6 +98,71 @@ async def resolve_board_by_id(info: strawberry.Info, id: UUID) -> Board | None:
         )
 
 
+def _my_boards_condition(auth_context: AuthContext, role: BoardQueryRole) -> ColumnElement[bool]:
+    """Build the WHERE condition for boards the user owns and/or is a member of."""
+    if role == BoardQueryRole.OWNER:
+        # Only boards owned by user
+        return Boards.owner_id == auth_context.user_id
+
+    member_board_ids = select(BoardMembers.board_id).where(
+        BoardMembers.user_id == auth_context.user_id
+    )
+    if role == BoardQueryRole.MEMBER:
+        # Only boards where user is a member (not owner)
+        return and_(Boards.id.in_(member_board_ids), Boards.owner_id != auth_context.user_id)
+
+    # BoardQueryRole.ANY: boards where user is owner OR member
+    return or_(Boards.owner_id == auth_context.user_id, Boards.id.in_(member_board_ids))
+
+
+def _search_boards_condition(auth_context: AuthContext | None, query: str) -> ColumnElement[bool]:
+    """Build the WHERE condition for a board text search, including access control."""
+    search_pattern = f"%{query}%"
+
+    # Base condition for text search (served by the pg_trgm indexes on title/description)
+    search_condition = or_(
+        Boards.title.ilike(search_pattern), Boards.description.ilike(search_pattern)
+    )
+
+    return and_(search_condition, board_access_condition(auth_context))
+
+
+def _board_connection_from_db_models(
+    boards: Sequence[Boards],
+    sort_column: InstrumentedAttribute[datetime],
+    has_next_page: bool,
+    after: str | None,
+) -> BoardConnection:
+    """Build a BoardConnection from a page of boards with owner/members preloaded."""
+    from ..types.board import BoardConnection as BoardConnectionType
+    from ..types.board import BoardEdge, board_from_db_model, board_member_from_db_model
+    from ..types.user import user_from_db_model
+
+    edges = [
+        BoardEdge(
+            cursor=encode_cursor(getattr(board, sort_column.key), board.id),
+            node=board_from_db_model(
+                board,
+                preloaded_owner=user_from_db_model(board.owner) if board.owner else None,
+                preloaded_members=[
+                    board_member_from_db_model(
+                        member,
+                        preloaded_user=(user_from_db_model(member.user) if member.user else None),
+                    )
+                    for member in board.board_members
+                ]
+                if board.board_members
+                else None,
+            ),
+        )
+        for board in boards
+    ]
+    return BoardConnectionType(
+        edges=edges,
+        page_info=build_page_info([edge.cursor for edge in edges], has_next_page, after),
+    )
+
+
 async def resolve_my_boards(
     info: strawberry.Info,
     limit: int,
@@ -107,26 +183,7 @@ async def resolve_my_boards(
         return []
 
     async with get_async_session() as session:
-        # Build the query based on role filter
-        if role == BoardQueryRole.OWNER:
-            # Only boards owned by user
-            boards_condition = Boards.owner_id == auth_context.user_id
-        elif role == BoardQueryRole.MEMBER:
-            # Only boards where user is a member (not owner)
-            member_board_ids = select(BoardMembers.board_id).where(
-                BoardMembers.user_id == auth_context.user_id
-            )
-            boards_condition = and_(
-                Boards.id.in_(member_board_ids), Boards.owner_id != auth_context.user_id
-            )
-        else:  # BoardQueryRole.ANY
-            # Boards where user is owner OR member
-            member_board_ids = select(BoardMembers.board_id).where(
-                BoardMembers.user_id == auth_context.user_id
-            )
-            boards_condition = or_(
-                Boards.owner_id == auth_context.user_id, Boards.id.in_(member_board_ids)
-            )
+        boards_condition = _my_boards_condition(auth_context, role)
 
         # Add sorting
         if sort == SortOrder.CREATED_ASC:
@@ -175,6 +232,52 @@ async def resolve_my_boards(
         ]
 
 
+async def resolve_my_boards_connection(
+    info: strawberry.Info,
+    first: int,
+    after: str | None,
+    role: BoardQueryRole = BoardQueryRole.ANY,
+    sort: SortOrder = SortOrder.UPDATED_DESC,
+) -> BoardConnection:
+    """
+    Resolve the user's boards as a cursor-paginated connection.
+
+    Pages on (created_at | updated_at, id) according to `sort`.
+    """
+    from ..types.board import BoardConnection as BoardConnectionType
+
+    auth_context = await get_auth_context_from_info(info)
+    if not auth_context or not auth_context.is_authenticated:
+        logger.info("Unauthenticated access to my_boards_connection")
+        return BoardConnectionType(edges=[], page_info=build_page_info([], False, after))
+
+    first = clamp_page_size(first)
+
+    if sort in (SortOrder.CREATED_ASC, SortOrder.CREATED_DESC):
+        sort_column = Boards.created_at
+    else:
+        sort_column = Boards.updated_at
+    descending = sort in (SortOrder.CREATED_DESC, SortOrder.UPDATED_DESC)
+
+    async with get_async_session() as session:
+        stmt = (
+            select(Boards)
+            .where(_my_boards_condition(auth_context, role))
+            .options(
+                selectinload(Boards.owner),
+                selectinload(Boards.board_members).selectinload(BoardMembers.user),
+            )
+        )
+        stmt = apply_keyset_pagination(
+            stmt, sort_column, Boards.id, first=first, after=after, descending=descending
+        )
+
+        result = await session.execute(stmt)
+        boards, has_next_page = split_page(result.scalars().all(), first)
+
+        return _board_connection_from_db_models(boards, sort_column, has_next_page, after)
+
+
 async def resolve_public_boards(
     info: strawberry.Info,
     limit: int,
@@ -245,32 +348,9 @@ async def search_boards(info: strawberry.Info, query: str, limit: int, offset: i
     auth_context = await get_auth_context_from_info(info)
 
     async with get_async_session() as session:
-        # Build base query with case-insensitive search
-        search_pattern = f"%{query}%"
-
-        # Base condition for text search
-        search_condition = or_(
-            Boards.title.ilike(search_pattern), Boards.description.ilike(search_pattern)
-        )
-
-        # Add access control conditions
-        if auth_context and auth_context.is_authenticated:
-            # User can see: public boards OR boards they own OR boards they're a member of
-            member_board_ids = select(BoardMembers.board_id).where(
-                BoardMembers.user_id == auth_context.user_id
-            )
-            access_condition = or_(
-                Boards.is_public,
-                Boards.owner_id == auth_context.user_id,
-                Boards.id.in_(member_board_ids),
-            )
-        else:
-            # Unauthenticated users can only see public boards
-            access_condition = Boards.is_public
-
         stmt = (
             select(Boards)
-            .where(and_(search_condition, access_condition))
+            .where(_search_boards_condition(auth_context, query))
             .options(
                 selectinload(Boards.owner),
                 selectinload(Boards.board_members).selectinload(BoardMembers.user),
@@ -305,6 +385,34 @@ async def search_boards(info: strawberry.Info, query: str, limit: int, offset: i
         ]
 
 
+async def search_boards_connection(
+    info: strawberry.Info, query: str, first: int, after: str | None
+) -> BoardConnection:
+    """
+    Search boards as a cursor-paginated connection (most recently updated first).
+
+    Same matching and access rules as `search_boards`.
+    """
+    auth_context = await get_auth_context_from_info(info)
+    first = clamp_page_size(first)
+
+    async with get_async_session() as session:
+        stmt = (
+            select(Boards)
+            .where(_search_boards_condition(auth_context, query))
+            .options(
+                selectinload(Boards.owner),
+                selectinload(Boards.board_members).selectinload(BoardMembers.user),
+            )
+        )
+        stmt = apply_keyset_pagination(stmt, Boards.updated_at, Boards.id, first=first, after=after)
+
+        result = await session.execute(stmt)
+        boards, has_next_page = split_page(result.scalars().all(), first)
+
+        return _board_connection_from_db_models(boards, Boards.updated_at, has_next_page, after)
+
+
 # Board field resolvers
 async def resolve_board_owner(board: Board, info: strawberry.Info) -> User:
     """
@@ -463,6 +571,49 @@ async def resolve_board_generations(
         ]
 
 
+async def resolve_board_generations_connection(
+    board: Board, info: strawberry.Info, first: int, after: str | None
+) -> GenerationConnection:
+    """
+    Resolve a board's generations as a cursor-paginated connection (newest first).
+
+    Served by the (board_id, created_at DESC, id DESC) index.
+    """
+    from .generation import generation_connection_from_db_models
+
+    auth_context = await get_auth_context_from_info(info)
+    first = clamp_page_size(first)
+
+    async with get_async_session() as session:
+        # First check board access
+        stmt = (
+            select(Boards)
+            .where(Boards.id == board.id)
+            .options(
+                selectinload(Boards.board_members),
+            )
+        )
+        result = await session.execute(stmt)
+        db_board = result.scalar_one_or_none()
+
+        if not db_board or not can_access_board(db_board, auth_context):
+            logger.info("Access denied to board generations", board_id=str(board.id))
+            return generation_connection_from_db_models([], False, after)
+
+        generations_stmt = apply_keyset_pagination(
+            select(Generations).where(Generations.board_id == board.id),
+            Generations.created_at,
+            Generations.id,
+            first=first,
+            after=after,
+        )
+
+        generations_result = await session.execute(generations_stmt)
+        generations, has_next_page = split_page(generations_result.scalars().all(), first)
+
+        return generation_connection_from_db_models(generations, has_next_page, after)
+
+
 async def resolve_board_generation_count(board: Board, info: strawberry.Info) -> int:
     """
     Get the total count of generations for a board.
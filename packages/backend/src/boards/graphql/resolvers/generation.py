@@ -1,24 +1,50 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 from uuid import UUID
 
 import strawberry
-from sqlalchemy import or_, select
+from sqlalchemy import Select, func, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ...auth.context import AuthContext
 from ...database.connection import get_async_session
-from ...dbmodels import BoardMembers, Boards, Generations
+from ...dbmodels import (
+    GENERATION_PROMPT_TSVECTOR,
+    GENERATION_SEARCH_CONFIG,
+    BoardMembers,
+    Boards,
+    Generations,
+)
 from ...generators.registry import registry as generator_registry
 from ...jobs import repository as jobs_repo
+from ...jobs.cancellation import request_cancellation
 from ...logging import get_logger
-from ...workers.actors import process_generation
-from ..access_control import can_access_board, get_auth_context_from_info
+from ...workers.relay import relay_committed_generations
+from ..access_control import (
+    board_access_condition,
+    can_access_board,
+    get_auth_context_from_info,
+)
+from ..pagination import (
+    apply_keyset_pagination,
+    build_page_info,
+    clamp_page_size,
+    encode_cursor,
+    split_page,
+)
 
 if TYPE_CHECKING:
     from ..mutations.root import CreateGenerationInput
     from ..types.board import Board
-    from ..types.generation import ArtifactType, Generation, GenerationStatus
+    from ..types.generation import (
+        ArtifactType,
+        Generation,
+        GenerationConnection,
+        GenerationStatus,
+    )
     from ..types.user import User
 
 logger = get_logger(__name__)
@@ -92,6 +118,70 @@ async def resolve_generation_by_id(info: strawberry.Info, id: UUID) -> Generatio
         )
 
 
+async def _build_recent_generations_query(
+    session: AsyncSession,
+    auth_context: AuthContext,
+    board_id: UUID | None,
+    status: GenerationStatus | None,
+    artifact_type: ArtifactType | None,
+) -> Select[tuple[Generations]] | None:
+    """
+    Build the filtered (unordered, unpaginated) query behind recentGenerations.
+
+    Returns None when the user has no access to any matching board.
+    """
+    generations_query = select(Generations)
+
+    # Apply filters
+    if board_id is not None:
+        # Check access to specific board
+        board_stmt = (
+            select(Boards).where(Boards.id == board_id).options(selectinload(Boards.board_members))
+        )
+        board_result = await session.execute(board_stmt)
+        board = board_result.scalar_one_or_none()
+
+        if not board or not can_access_board(board, auth_context):
+            logger.info(
+                "Access denied to board for recent generations",
+                board_id=str(board_id),
+                user_id=str(auth_context.user_id),
+            )
+            return None
+
+        generations_query = generations_query.where(Generations.board_id == board_id)
+    else:
+        # Get all boards user has access to
+        member_board_ids = select(BoardMembers.board_id).where(
+            BoardMembers.user_id == auth_context.user_id
+        )
+        accessible_boards_condition = or_(
+            Boards.owner_id == auth_context.user_id,
+            Boards.id.in_(member_board_ids),
+            Boards.is_public,
+        )
+        accessible_boards_stmt = select(Boards.id).where(accessible_boards_condition)
+        accessible_boards_result = await session.execute(accessible_boards_stmt)
+        accessible_board_ids = [row[0] for row in accessible_boards_result.all()]
+
+        if not accessible_board_ids:
+            return None
+
+        generations_query = generations_query.where(Generations.board_id.in_(accessible_board_ids))
+
+    # Apply status filter
+    if status is not None:
+        generations_query = generations_query.where(Generations.status == status.value)
+
+    # Apply artifact_type filter
+    if artifact_type is not None:
+        generations_query = generations_query.where(
+            Generations.artifact_type == artifact_type.value
+        )
+
+    return generations_query
+
+
 async def resolve_recent_generations(
     info: strawberry.Info,
     board_id: UUID | None,
@@ -111,59 +201,11 @@ async def resolve_recent_generations(
         return []
 
     async with get_async_session() as session:
-        # Build base query
-        generations_query = select(Generations)
-
-        # Apply filters
-        if board_id is not None:
-            # Check access to specific board
-            board_stmt = (
-                select(Boards)
-                .where(Boards.id == board_id)
-                .options(selectinload(Boards.board_members))
-            )
-            board_result = await session.execute(board_stmt)
-            board = board_result.scalar_one_or_none()
-
-            if not board or not can_access_board(board, auth_context):
-                logger.info(
-                    "Access denied to board for recent generations",
-                    board_id=str(board_id),
-                    user_id=str(auth_context.user_id),
-                )
-                return []
-
-            generations_query = generations_query.where(Generations.board_id == board_id)
-        else:
-            # Get all boards user has access to
-            member_board_ids = select(BoardMembers.board_id).where(
-                BoardMembers.user_id == auth_context.user_id
-            )
-            accessible_boards_condition = or_(
-                Boards.owner_id == auth_context.user_id,
-                Boards.id.in_(member_board_ids),
-                Boards.is_public,
-            )
-            accessible_boards_stmt = select(Boards.id).where(accessible_boards_condition)
-            accessible_boards_result = await session.execute(accessible_boards_stmt)
-            accessible_board_ids = [row[0] for row in accessible_boards_result.all()]
-
-            if not accessible_board_ids:
-                return []
-
-            generations_query = generations_query.where(
-                Generations.board_id.in_(accessible_board_ids)
-            )
-
-        # Apply status filter
-        if status is not None:
-            generations_query = generations_query.where(Generations.status == status.value)
-
-        # Apply artifact_type filter
-        if artifact_type is not None:
-            generations_query = generations_query.where(
-                Generations.artifact_type == artifact_type.value
-            )
+        generations_query = await _build_recent_generations_query(
+            session, auth_context, board_id, status, artifact_type
+        )
+        if generations_query is None:
+            return []
 
         # Order by created_at DESC and apply pagination
         generations_query = (
@@ -204,6 +246,117 @@ async def resolve_recent_generations(
         ]
 
 
+async def resolve_recent_generations_connection(
+    info: strawberry.Info,
+    board_id: UUID | None,
+    status: GenerationStatus | None,
+    artifact_type: ArtifactType | None,
+    first: int,
+    after: str | None,
+) -> GenerationConnection:
+    """
+    Resolve recent generations as a cursor-paginated connection (newest first).
+
+    Pages on (created_at, id) instead of OFFSET so deep pages stay index seeks.
+    """
+    from ..types.generation import GenerationConnection as GenerationConnectionType
+
+    auth_context = await get_auth_context_from_info(info)
+    if not auth_context or not auth_context.is_authenticated:
+        logger.info("Unauthenticated access to recent_generations_connection")
+        return GenerationConnectionType(edges=[], page_info=build_page_info([], False, after))
+
+    first = clamp_page_size(first)
+
+    async with get_async_session() as session:
+        generations_query = await _build_recent_generations_query(
+            session, auth_context, board_id, status, artifact_type
+        )
+        if generations_query is None:
+            return GenerationConnectionType(edges=[], page_info=build_page_info([], False, after))
+
+        generations_query = apply_keyset_pagination(
+            generations_query,
+            Generations.created_at,
+            Generations.id,
+            first=first,
+            after=after,
+        )
+
+        result = await session.execute(generations_query)
+        generations, has_next_page = split_page(result.scalars().all(), first)
+
+        return generation_connection_from_db_models(generations, has_next_page, after)
+
+
+def generation_connection_from_db_models(
+    generations: Sequence[Generations], has_next_page: bool, after: str | None
+) -> GenerationConnection:
+    """Build a GenerationConnection from a page of rows ordered by (created_at, id)."""
+    from ..types.generation import GenerationConnection as GenerationConnectionType
+    from ..types.generation import GenerationEdge, generation_from_db_model
+
+    edges = [
+        GenerationEdge(
+            cursor=encode_cursor(gen.created_at, gen.id),
+            node=generation_from_db_model(gen),
+        )
+        for gen in generations
+    ]
+    return GenerationConnectionType(
+        edges=edges,
+        page_info=build_page_info([edge.cursor for edge in edges], has_next_page, after),
+    )
+
+
+async def search_generations(
+    info: strawberry.Info,
+    query: str,
+    board_id: UUID | None,
+    limit: int,
+    offset: int,
+) -> list[Generation]:
+    """
+    Full-text search over generation prompts, ranked by relevance.
+
+    Accepts web-search syntax ("quoted phrases", OR, -exclusions). Only returns
+    generations on boards the user has access to.
+    """
+    auth_context = await get_auth_context_from_info(info)
+    limit = clamp_page_size(limit)
+
+    # Literal expression so the planner matches idx_generations_prompt_fts
+    prompt_vector = literal_column(GENERATION_PROMPT_TSVECTOR)
+    ts_query = func.websearch_to_tsquery(literal_column(f"'{GENERATION_SEARCH_CONFIG}'"), query)
+    rank = func.ts_rank_cd(prompt_vector, ts_query)
+
+    async with get_async_session() as session:
+        stmt = (
+            select(Generations)
+            .join(Boards, Boards.id == Generations.board_id)
+            .where(
+                prompt_vector.op("@@")(ts_query),
+                Generations.tenant_id == auth_context.tenant_id,
+                board_access_condition(auth_context),
+            )
+        )
+        if board_id is not None:
+            stmt = stmt.where(Generations.board_id == board_id)
+
+        stmt = (
+            stmt.order_by(rank.desc(), Generations.created_at.desc(), Generations.id.desc())
+            .limit(limit)
+            .offset(max(offset, 0))
+        )
+
+        result = await session.execute(stmt)
+        generations = result.scalars().all()
+
+        from ..types.generation import generation_from_db_model
+
+        return [generation_from_db_model(gen) for gen in generations]
+
+
 # Field resolvers
 async def resolve_generation_board(generation: Generation, info: strawberry.Info) -> Board:
     """Resolve the board this generation belongs to."""
@@ -343,14 +496,8 @@ async def create_generation(info: strawberry.Info, input: CreateGenerationInput)
             generator_name=input.generator_name,
         )
 
-        # Enqueue job for processing
-        message = process_generation.send(str(gen.id))
-        logger.info(
-            "Generation job enqueued",
-            generation_id=str(gen.id),
-            message_id=message.message_id,
-            queue_name=message.queue_name,
-        )
+        # Enqueue job for processing (deferred if the tenant or user is at their limit)
+        await relay_committed_generations()
 
         # Convert to GraphQL type
         from ..types.generation import ArtifactType, GenerationStatus
@@ -441,6 +588,17 @@ async def cancel_generation(info: strawberry.Info, id: UUID) -> Generation:
         )
         await session.commit()
 
+        # Signal the worker (if the job is running or queued) to stop and cancel
+        # the provider-side job
+        try:
+            await request_cancellation(str(id))
+        except Exception as e:
+            logger.warning(
+                "Failed to signal generation cancellation to workers",
+                generation_id=str(id),
+                error=str(e),
+            )
+
         # Refresh to get updated data
         await session.refresh(gen)
 
@@ -624,9 +782,8 @@ async def regenerate(info: strawberry.Info, id: UUID) -> Generation:
             user_id=str(auth_context.user_id),
         )
 
-        # Enqueue job for processing
-        process_generation.send(str(new_gen.id))
-        logger.info("Regeneration job enqueued", generation_id=str(new_gen.id))
+        # Enqueue job for processing (deferred if the tenant or user is at their limit)
+        await relay_committed_generations()
 
         # Convert to GraphQL type
         from ..types.generation import ArtifactType, GenerationStatus
@@ -4,9 +4,18 @@ Generator resolvers for GraphQL API
 
 import strawberry
 
-from ...generators.registry import registry
+from ...generators.registry import GeneratorCatalogEntry, registry
 from ..types.generation import ArtifactType
-from ..types.generator import GeneratorInfo
+from ..types.generator import GeneratorCatalog, GeneratorInfo
+
+
+def _generator_info(entry: GeneratorCatalogEntry) -> GeneratorInfo:
+    return GeneratorInfo(
+        name=entry.name,
+        description=entry.description,
+        artifact_type=ArtifactType(entry.artifact_type),
+        input_schema=entry.input_schema,
+    )
 
 
 async def resolve_generators(
@@ -15,6 +24,9 @@ async def resolve_generators(
 ) -> list[GeneratorInfo]:
     """Get all available generators, optionally filtered by artifact type.
 
+    Served from the registry's precomputed catalog, so input JSON schemas are not
+    regenerated per request.
+
     Args:
         info: GraphQL info context
         artifact_type: Optional filter by artifact type (image, video, audio, text)
@@ -24,27 +36,35 @@ async def resolve_generators(
     """
     _ = info  # Unused but required by GraphQL interface
 
-    # Get generators from registry
-    if artifact_type:
-        generators = registry.list_by_artifact_type(artifact_type)
-    else:
-        generators = registry.list_all()
-
-    # Convert to GraphQL types
-    result = []
-    for gen in generators:
-        input_schema_class = gen.get_input_schema()
-
-        # Convert string artifact_type to enum
-        artifact_type_enum = ArtifactType(gen.artifact_type)
-
-        result.append(
-            GeneratorInfo(
-                name=gen.name,
-                description=gen.description,
-                artifact_type=artifact_type_enum,
-                input_schema=input_schema_class.model_json_schema(),
-            )
-        )
-
-    return result
+    return [_generator_info(entry) for entry in registry.catalog().list(artifact_type or None)]
+
+
+async def resolve_generator_catalog(
+    info: strawberry.Info,
+    artifact_type: str | None = None,
+    if_none_match: str | None = None,
+) -> GeneratorCatalog:
+    """Get the versioned generator catalog.
+
+    Clients pass the last version they saw as `if_none_match`; when it is still
+    current the generator list is omitted and `not_modified` is set.
+
+    Args:
+        info: GraphQL info context
+        artifact_type: Optional filter by artifact type (image, video, audio, text)
+        if_none_match: Catalog version already held by the client
+
+    Returns:
+        GeneratorCatalog with version and (unless unchanged) generator information
+    """
+    _ = info  # Unused but required by GraphQL interface
+
+    catalog = registry.catalog()
+    if if_none_match is not None and if_none_match == catalog.version:
+        return GeneratorCatalog(version=catalog.version, not_modified=True, generators=[])
+
+    return GeneratorCatalog(
+        version=catalog.version,
+        not_modified=False,
+        generators=[_generator_info(entry) for entry in catalog.list(artifact_type or None)],
+    )
@@ -2,10 +2,13 @@
 Lineage resolvers for ancestry and descendants tracking
 """
 
+from collections import defaultdict
+from collections.abc import Iterable
 from uuid import UUID
 
 import strawberry
 from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database.connection import get_async_session
 from ...dbmodels import Boards, Generations
@@ -101,10 +104,25 @@ async def resolve_generation_by_id(info: strawberry.Info, generation_id: UUID) -
         return convert_db_to_graphql_generation(gen)
 
 
+async def _hydrate_generations(
+    session: AsyncSession, ids: Iterable[UUID], tenant_id: UUID
+) -> dict[UUID, Generations]:
+    """Load the given generations (scoped to tenant) in a single batch query."""
+    stmt = select(Generations).where(
+        Generations.id.in_(list(ids)), Generations.tenant_id == tenant_id
+    )
+    result = await session.execute(stmt)
+    return {gen.id: gen for gen in result.scalars().all()}
+
+
 async def resolve_ancestry(
     generation: Generation, info: strawberry.Info, max_depth: int = 25
 ) -> AncestryNode:
-    """Build recursive ancestry tree using recursive CTE."""
+    """Build recursive ancestry tree.
+
+    A recursive CTE walks generation_lineage edges by ID only; the nodes it
+    reaches are then hydrated in one batch query.
+    """
     auth_context = await get_auth_context_from_info(info)
 
     if not auth_context:
@@ -112,34 +130,15 @@ async def resolve_ancestry(
         return AncestryNode(generation=generation, depth=0, role=None, parents=[])
 
     async with get_async_session() as session:
-        # Use recursive CTE to fetch entire ancestry tree in one query
         cte_query = text("""
             WITH RECURSIVE ancestry_tree AS (
                 -- Base case: starting generation
                 SELECT
                     id,
-                    tenant_id,
-                    board_id,
-                    user_id,
-                    generator_name,
-                    artifact_type,
-                    storage_url,
-                    thumbnail_url,
-                    additional_files,
-                    input_params,
-                    output_metadata,
-                    external_job_id,
-                    status,
-                    progress,
-                    error_message,
-                    started_at,
-                    completed_at,
-                    created_at,
-                    updated_at,
-                    input_artifacts,
-                    0 as depth,
-                    NULL::text as role,
-                    ARRAY[id] as path  -- cycle detection
+                    NULL::uuid AS child_id,
+                    0 AS depth,
+                    NULL::text AS role,
+                    ARRAY[id] AS path  -- cycle detection
                 FROM boards.generations
                 WHERE id = :gen_id AND tenant_id = :tenant_id
 
@@ -147,38 +146,17 @@ async def resolve_ancestry(
 
                 -- Recursive case: parent generations
                 SELECT
-                    g.id,
-                    g.tenant_id,
-                    g.board_id,
-                    g.user_id,
-                    g.generator_name,
-                    g.artifact_type,
-                    g.storage_url,
-                    g.thumbnail_url,
-                    g.additional_files,
-                    g.input_params,
-                    g.output_metadata,
-                    g.external_job_id,
-                    g.status,
-                    g.progress,
-                    g.error_message,
-                    g.started_at,
-                    g.completed_at,
-                    g.created_at,
-                    g.updated_at,
-                    g.input_artifacts,
+                    l.parent_id,
+                    l.child_id,
                     at.depth + 1,
-                    artifact->>'role' as role,
-                    at.path || g.id
+                    l.role,
+                    at.path || l.parent_id
                 FROM ancestry_tree at
-                CROSS JOIN LATERAL jsonb_array_elements(at.input_artifacts) AS artifact
-                JOIN boards.generations g ON
-                    g.id = (artifact->>'generation_id')::uuid
-                    AND NOT (g.id = ANY(at.path))  -- prevent cycles
+                JOIN boards.generation_lineage l ON l.child_id = at.id
+                WHERE NOT (l.parent_id = ANY(at.path))  -- prevent cycles
                     AND at.depth < :max_depth
-                WHERE g.tenant_id = :tenant_id
             )
-            SELECT * FROM ancestry_tree ORDER BY depth, id
+            SELECT id, child_id, role FROM ancestry_tree ORDER BY depth, id
         """)
 
         result = await session.execute(
@@ -195,56 +173,49 @@ async def resolve_ancestry(
             # Return root node with no parents
             return AncestryNode(generation=generation, depth=0, role=None, parents=[])
 
-        # Build tree from flat results
-        nodes_by_id: dict[UUID, tuple[Generations, int, str | None]] = {}
+        # child id -> [(parent id, role)]
+        parents_by_child: dict[UUID, list[tuple[UUID, str]]] = defaultdict(list)
         for row in rows:
-            gen_obj = Generations()
-            gen_obj.id = row.id
-            gen_obj.tenant_id = row.tenant_id
-            gen_obj.board_id = row.board_id
-            gen_obj.user_id = row.user_id
-            gen_obj.generator_name = row.generator_name
-            gen_obj.artifact_type = row.artifact_type
-            gen_obj.storage_url = row.storage_url
-            gen_obj.thumbnail_url = row.thumbnail_url
-            gen_obj.additional_files = row.additional_files
-            gen_obj.input_params = row.input_params
-            gen_obj.output_metadata = row.output_metadata
-            gen_obj.external_job_id = row.external_job_id
-            gen_obj.status = row.status
-            gen_obj.progress = row.progress
-            gen_obj.error_message = row.error_message
-            gen_obj.started_at = row.started_at
-            gen_obj.completed_at = row.completed_at
-            gen_obj.created_at = row.created_at
-            gen_obj.updated_at = row.updated_at
-            gen_obj.input_artifacts = row.input_artifacts
-            nodes_by_id[row.id] = (gen_obj, row.depth, row.role)
-
-        # Build tree structure recursively
-        def build_node(gen_id: UUID) -> AncestryNode:
-            gen_obj, depth, role = nodes_by_id[gen_id]
-            gen_graphql = convert_db_to_graphql_generation(gen_obj)
-
-            # Find parent nodes
-            parent_nodes = []
-            if gen_obj.input_artifacts:
-                for artifact_data in gen_obj.input_artifacts:
-                    parent_id = UUID(artifact_data["generation_id"])
-                    if parent_id in nodes_by_id:
-                        parent_nodes.append(build_node(parent_id))
-
-            return AncestryNode(
-                generation=gen_graphql, depth=depth, role=role, parents=parent_nodes
-            )
+            if (
+                row.child_id is not None
+                and (row.id, row.role) not in parents_by_child[row.child_id]
+            ):
+                parents_by_child[row.child_id].append((row.id, row.role))
+
+        nodes_by_id = await _hydrate_generations(
+            session, {row.id for row in rows}, auth_context.tenant_id
+        )
+
+    # Build tree structure recursively
+    def build_node(
+        gen_id: UUID, depth: int, role: str | None, path: frozenset[UUID]
+    ) -> AncestryNode:
+        parent_nodes = [
+            build_node(parent_id, depth + 1, parent_role, path | {parent_id})
+            for parent_id, parent_role in parents_by_child.get(gen_id, [])
+            if parent_id in nodes_by_id and parent_id not in path
+        ]
+        return AncestryNode(
+            generation=convert_db_to_graphql_generation(nodes_by_id[gen_id]),
+            depth=depth,
+            role=role,
+            parents=parent_nodes,
+        )
 
-        return build_node(generation.id)
+    if generation.id not in nodes_by_id:
+        return AncestryNode(generation=generation, depth=0, role=None, parents=[])
+
+    return build_node(generation.id, 0, None, frozenset({generation.id}))
 
 
 async def resolve_descendants(
     generation: Generation, info: strawberry.Info, max_depth: int = 25
 ) -> DescendantNode:
-    """Build recursive descendants tree using recursive CTE."""
+    """Build recursive descendants tree.
+
+    A recursive CTE walks generation_lineage edges by ID only; the nodes it
+    reaches are then hydrated in one batch query.
+    """
     auth_context = await get_auth_context_from_info(info)
 
     if not auth_context:
@@ -252,35 +223,15 @@ async def resolve_descendants(
         return DescendantNode(generation=generation, depth=0, role=None, children=[])
 
     async with get_async_session() as session:
-        # Use recursive CTE to fetch entire descendants tree in one query
         cte_query = text("""
             WITH RECURSIVE descendants_tree AS (
                 -- Base case: starting generation
                 SELECT
                     id,
-                    tenant_id,
-                    board_id,
-                    user_id,
-                    generator_name,
-                    artifact_type,
-                    storage_url,
-                    thumbnail_url,
-                    additional_files,
-                    input_params,
-                    output_metadata,
-                    external_job_id,
-                    status,
-                    progress,
-                    error_message,
-                    started_at,
-                    completed_at,
-                    created_at,
-                    updated_at,
-                    input_artifacts,
-                    0 as depth,
-                    NULL::text as role,
-                    NULL::uuid as parent_id,
-                    ARRAY[id] as path  -- cycle detection
+                    NULL::uuid AS parent_id,
+                    0 AS depth,
+                    NULL::text AS role,
+                    ARRAY[id] AS path  -- cycle detection
                 FROM boards.generations
                 WHERE id = :gen_id AND tenant_id = :tenant_id
 
@@ -288,39 +239,17 @@ async def resolve_descendants(
 
                 -- Recursive case: child generations
                 SELECT
-                    g.id,
-                    g.tenant_id,
-                    g.board_id,
-                    g.user_id,
-                    g.generator_name,
-                    g.artifact_type,
-                    g.storage_url,
-                    g.thumbnail_url,
-                    g.additional_files,
-                    g.input_params,
-                    g.output_metadata,
-                    g.external_job_id,
-                    g.status,
-                    g.progress,
-                    g.error_message,
-                    g.started_at,
-                    g.completed_at,
-                    g.created_at,
-                    g.updated_at,
-                    g.input_artifacts,
+                    l.child_id,
+                    l.parent_id,
                     dt.depth + 1,
-                    artifact->>'role' as role,
-                    dt.id as parent_id,
-                    dt.path || g.id
-                FROM boards.generations g
-                CROSS JOIN LATERAL jsonb_array_elements(g.input_artifacts) AS artifact
-                JOIN descendants_tree dt ON
-                    dt.id = (artifact->>'generation_id')::uuid
-                    AND NOT (g.id = ANY(dt.path))  -- prevent cycles
+                    l.role,
+                    dt.path || l.child_id
+                FROM descendants_tree dt
+                JOIN boards.generation_lineage l ON l.parent_id = dt.id
+                WHERE NOT (l.child_id = ANY(dt.path))  -- prevent cycles
                     AND dt.depth < :max_depth
-                WHERE g.tenant_id = :tenant_id
             )
-            SELECT * FROM descendants_tree ORDER BY depth, id
+            SELECT id, parent_id, role FROM descendants_tree ORDER BY depth, id
         """)
 
         result = await session.execute(
@@ -337,45 +266,36 @@ async def resolve_descendants(
             # Return root node with no children
             return DescendantNode(generation=generation, depth=0, role=None, children=[])
 
-        # Build tree from flat results
-        nodes_by_id: dict[UUID, tuple[Generations, int, str | None, UUID | None]] = {}
+        # parent id -> [(child id, role)]
+        children_by_parent: dict[UUID, list[tuple[UUID, str]]] = defaultdict(list)
         for row in rows:
-            gen_obj = Generations()
-            gen_obj.id = row.id
-            gen_obj.tenant_id = row.tenant_id
-            gen_obj.board_id = row.board_id
-            gen_obj.user_id = row.user_id
-            gen_obj.generator_name = row.generator_name
-            gen_obj.artifact_type = row.artifact_type
-            gen_obj.storage_url = row.storage_url
-            gen_obj.thumbnail_url = row.thumbnail_url
-            gen_obj.additional_files = row.additional_files
-            gen_obj.input_params = row.input_params
-            gen_obj.output_metadata = row.output_metadata
-            gen_obj.external_job_id = row.external_job_id
-            gen_obj.status = row.status
-            gen_obj.progress = row.progress
-            gen_obj.error_message = row.error_message
-            gen_obj.started_at = row.started_at
-            gen_obj.completed_at = row.completed_at
-            gen_obj.created_at = row.created_at
-            gen_obj.updated_at = row.updated_at
-            gen_obj.input_artifacts = row.input_artifacts
-            nodes_by_id[row.id] = (gen_obj, row.depth, row.role, row.parent_id)
-
-        # Build tree structure recursively
-        def build_node(gen_id: UUID) -> DescendantNode:
-            gen_obj, depth, role, _ = nodes_by_id[gen_id]
-            gen_graphql = convert_db_to_graphql_generation(gen_obj)
-
-            # Find child nodes (nodes that have this as parent_id)
-            child_nodes = []
-            for child_id, (_, _, _, parent_id) in nodes_by_id.items():
-                if parent_id == gen_id:
-                    child_nodes.append(build_node(child_id))
-
-            return DescendantNode(
-                generation=gen_graphql, depth=depth, role=role, children=child_nodes
-            )
+            if (
+                row.parent_id is not None
+                and (row.id, row.role) not in children_by_parent[row.parent_id]
+            ):
+                children_by_parent[row.parent_id].append((row.id, row.role))
+
+        nodes_by_id = await _hydrate_generations(
+            session, {row.id for row in rows}, auth_context.tenant_id
+        )
+
+    # Build tree structure recursively
+    def build_node(
+        gen_id: UUID, depth: int, role: str | None, path: frozenset[UUID]
+    ) -> DescendantNode:
+        child_nodes = [
+            build_node(child_id, depth + 1, child_role, path | {child_id})
+            for child_id, child_role in children_by_parent.get(gen_id, [])
+            if child_id in nodes_by_id and child_id not in path
+        ]
+        return DescendantNode(
+            generation=convert_db_to_graphql_generation(nodes_by_id[gen_id]),
+            depth=depth,
+            role=role,
+            children=child_nodes,
+        )
+
+    if generation.id not in nodes_by_id:
+        return DescendantNode(generation=generation, depth=0, role=None, children=[])
 
-        return build_node(generation.id)
+    return build_node(generation.id, 0, None, frozenset({generation.id}))
@@ -18,10 +18,17 @@ from ...database.connection import get_async_session
 from ...dbmodels import Boards, Generations, GenerationTags, Tags
 from ...logging import get_logger
 from ..access_control import can_access_board, get_auth_context_from_info
+from ..pagination import (
+    apply_keyset_pagination,
+    build_page_info,
+    clamp_page_size,
+    encode_cursor,
+    split_page,
+)
 
 if TYPE_CHECKING:
     from ..mutations.root import CreateTagInput, UpdateTagInput
-    from ..types.tag import Tag
+    from ..types.tag import Tag, TagConnection
 
 logger = get_logger(__name__)
 
@@ -74,6 +81,49 @@ async def resolve_tags(
         return [tag_from_db_model(tag) for tag in tags]
 
 
+async def resolve_tags_connection(
+    info: strawberry.Info,
+    first: int = 100,
+    after: str | None = None,
+) -> TagConnection:
+    """
+    Resolve the current tenant's tags as a cursor-paginated connection.
+
+    Tags are ordered alphabetically by (name, id).
+    """
+    from ..types.tag import TagConnection as TagConnectionType
+    from ..types.tag import TagEdge, tag_from_db_model
+
+    auth_context = await get_auth_context_from_info(info)
+    if not auth_context or not auth_context.is_authenticated:
+        logger.info("Unauthenticated access to tags_connection")
+        return TagConnectionType(edges=[], page_info=build_page_info([], False, after))
+
+    first = clamp_page_size(first)
+
+    async with get_async_session() as session:
+        stmt = apply_keyset_pagination(
+            select(Tags).where(Tags.tenant_id == auth_context.tenant_id),
+            Tags.name,
+            Tags.id,
+            first=first,
+            after=after,
+            descending=False,
+        )
+
+        result = await session.execute(stmt)
+        tags, has_next_page = split_page(result.scalars().all(), first)
+
+        edges = [
+            TagEdge(cursor=encode_cursor(tag.name, tag.id), node=tag_from_db_model(tag))
+            for tag in tags
+        ]
+        return TagConnectionType(
+            edges=edges,
+            page_info=build_page_info([edge.cursor for edge in edges], has_next_page, after),
+        )
+
+
 async def resolve_tag_by_id(info: strawberry.Info, id: UUID) -> Tag | None:
     """
     Resolve a tag by its ID.
@@ -11,10 +11,12 @@ from uuid import UUID
 
 import strawberry
 
+from .pagination import PageInfo
+
 if TYPE_CHECKING:
     from ...dbmodels import BoardMembers as BoardMembersDB
     from ...dbmodels import Boards as BoardsDB
-    from .generation import Generation
+    from .generation import Generation, GenerationConnection
     from .user import User
 
 
@@ -120,6 +122,18 @@ class Board:
 
         return await resolve_board_generations(self, info, limit or 50, offset or 0)
 
+    @strawberry.field
+    async def generations_connection(
+        self,
+        info: strawberry.Info,
+        first: int | None = 50,
+        after: str | None = None,
+    ) -> Annotated[GenerationConnection, strawberry.lazy(".generation")]:
+        """Get generations in this board using cursor pagination (newest first)."""
+        from ..resolvers.board import resolve_board_generations_connection
+
+        return await resolve_board_generations_connection(self, info, first or 50, after)
+
     @strawberry.field
     async def generation_count(self, info: strawberry.Info) -> int:
         """Get total number of generations in this board."""
@@ -128,6 +142,22 @@ class Board:
         return await resolve_board_generation_count(self, info)
 
 
+@strawberry.type
+class BoardEdge:
+    """An edge in a board connection."""
+
+    cursor: str
+    node: Board
+
+
+@strawberry.type
+class BoardConnection:
+    """Cursor-paginated list of boards."""
+
+    edges: list[BoardEdge]
+    page_info: PageInfo
+
+
 def board_member_from_db_model(
     db_member: BoardMembersDB,
     preloaded_user: User | None = None,
@@ -9,7 +9,10 @@ from uuid import UUID
 
 import strawberry
 
+from .pagination import PageInfo
+
 if TYPE_CHECKING:
+    from ...dbmodels import Generations as GenerationsDB
     from .board import Board
     from .tag import Tag
     from .user import User
@@ -59,6 +62,15 @@ class UploadArtifactInput:
     parent_generation_id: UUID | None = None
 
 
+@strawberry.type
+class UploadArtifactResult:
+    """Outcome of one upload in a batch: the generation, or why it failed."""
+
+    file_url: str | None
+    generation: Annotated["Generation", strawberry.lazy(".generation")] | None = None
+    error: str | None = None
+
+
 @strawberry.type
 class ArtifactLineage:
     """Represents a single input artifact relationship with role metadata."""
@@ -172,3 +184,44 @@ class Generation:
         from ..resolvers.tag import resolve_generation_tags
 
         return await resolve_generation_tags(self.id, info)
+
+
+@strawberry.type
+class GenerationEdge:
+    """An edge in a generation connection."""
+
+    cursor: str
+    node: Generation
+
+
+@strawberry.type
+class GenerationConnection:
+    """Cursor-paginated list of generations."""
+
+    edges: list[GenerationEdge]
+    page_info: PageInfo
+
+
+def generation_from_db_model(gen: "GenerationsDB") -> Generation:
+    """Convert a database Generation model to GraphQL Generation type."""
+    return Generation(
+        id=gen.id,
+        tenant_id=gen.tenant_id,
+        board_id=gen.board_id,
+        user_id=gen.user_id,
+        generator_name=gen.generator_name,
+        artifact_type=ArtifactType(gen.artifact_type),
+        storage_url=gen.storage_url,
+        thumbnail_url=gen.thumbnail_url,
+        additional_files=gen.additional_files or [],
+        input_params=gen.input_params or {},
+        output_metadata=gen.output_metadata or {},
+        external_job_id=gen.external_job_id,
+        status=GenerationStatus(gen.status),
+        progress=float(gen.progress or 0.0),
+        error_message=gen.error_message,
+        started_at=gen.started_at,
+        completed_at=gen.completed_at,
+        created_at=gen.created_at,
+        updated_at=gen.updated_at,
+    )
@@ -15,3 +15,16 @@ class GeneratorInfo:
     description: str
     artifact_type: ArtifactType
     input_schema: strawberry.scalars.JSON  # type: ignore[reportInvalidTypeForm]
+
+
+@strawberry.type
+class GeneratorCatalog:
+    """Versioned snapshot of available generators."""
+
+    version: str = strawberry.field(
+        description="Content hash of the catalog; changes whenever any generator changes."
+    )
+    not_modified: bool = strawberry.field(
+        description="True when if_none_match equals version; generators is then empty."
+    )
+    generators: list[GeneratorInfo]
@@ -0,0 +1,15 @@
+"""
+Pagination GraphQL type definitions
+"""
+
+import strawberry
+
+
+@strawberry.type
+class PageInfo:
+    """Relay-style page information for connection fields."""
+
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: str | None
+    end_cursor: str | None
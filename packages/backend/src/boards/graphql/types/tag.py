@@ -10,6 +10,8 @@ from uuid import UUID
 
 import strawberry
 
+from .pagination import PageInfo
+
 if TYPE_CHECKING:
     from ...dbmodels import Tags as TagsDB
 
@@ -28,6 +30,22 @@ class Tag:
     updated_at: datetime
 
 
+@strawberry.type
+class TagEdge:
+    """An edge in a tag connection."""
+
+    cursor: str
+    node: Tag
+
+
+@strawberry.type
+class TagConnection:
+    """Cursor-paginated list of tags."""
+
+    edges: list[TagEdge]
+    page_info: PageInfo
+
+
 def tag_from_db_model(db_tag: TagsDB) -> Tag:
     """Convert a database Tag model to GraphQL Tag type."""
     return Tag(
@@ -0,0 +1,138 @@
+"""Shared pooled HTTP client for artifact downloads and provider calls.
+
+Creating an `httpx.AsyncClient` per call means every artifact transfer and
+provider request pays for DNS, TCP and TLS setup again. `get_http_client()`
+instead returns one client per event loop whose connections are kept alive
+and reused. A client's connections belong to the loop they were opened on, so
+each loop (the API's, a worker's) gets its own client. Close it with
+`close_http_client()` when the loop's application shuts down.
+
+The client is tuned with the `http_client_*` settings: the size of the pool,
+how many connections a single host may use at once (so one slow provider
+cannot take the whole pool), keep-alive expiry and optional HTTP/2.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from .config import settings
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _LoopClient:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    stack: AsyncExitStack = field(default_factory=AsyncExitStack)
+    client: httpx.AsyncClient | None = None
+
+
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClient] = WeakKeyDictionary()
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client of the running event loop, creating it on first use.
+
+    Do not close the returned client; pass per-request options (e.g. `timeout`)
+    to its methods instead of configuring a new client.
+    """
+    entry = _clients.setdefault(asyncio.get_running_loop(), _LoopClient())
+    if entry.client is not None:
+        return entry.client
+
+    async with entry.lock:
+        if entry.client is None:
+            entry.client = await entry.stack.enter_async_context(_create_client())
+            logger.debug(
+                "Shared HTTP client created",
+                max_connections=settings.http_client_max_connections,
+                max_connections_per_host=settings.http_client_max_connections_per_host,
+                http2=settings.http_client_http2,
+            )
+    return entry.client
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's shared HTTP client, if it was created."""
+    entry = _clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None and entry.client is not None:
+        await entry.stack.aclose()
+        logger.info("Shared HTTP client closed")
+
+
+def _create_client() -> httpx.AsyncClient:
+    transport = httpx.AsyncHTTPTransport(
+        http2=settings.http_client_http2,
+        limits=httpx.Limits(
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, settings.http_client_max_connections_per_host),
+        timeout=settings.http_client_timeout,
+    )
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that allows at most `max_per_host` requests in flight per origin.
+
+    A request holds its slot until its response is closed, so streamed
+    downloads count for as long as they are being read. 0 disables the limit.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._slots: dict[tuple[bytes, bytes, int | None], asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._max_per_host <= 0:
+            return await self._transport.handle_async_request(request)
+
+        origin = (request.url.raw_scheme, request.url.raw_host, request.url.port)
+        slots = self._slots.get(origin)
+        if slots is None:
+            slots = self._slots[origin] = asyncio.Semaphore(self._max_per_host)
+
+        await slots.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slots.release()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _SlotReleasingStream(response.stream, slots)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _SlotReleasingStream(httpx.AsyncByteStream):
+    """Response body that gives its request's slot back when it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, slots: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._slots: asyncio.Semaphore | None = slots
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+                self._slots = None
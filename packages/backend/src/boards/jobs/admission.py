@@ -0,0 +1,342 @@
+"""Per-tenant admission control and fair scheduling for generation jobs.
+
+Without admission control one tenant submitting hundreds of jobs fills every
+worker queue and everyone else waits behind it. New generations are instead
+parked in a per-tenant pending list in Redis and only handed to Dramatiq while
+both the tenant and the submitting user are below their in-flight limits. Jobs
+over a limit are deferred, never rejected.
+
+An optional cluster-wide limit caps the total number of in-flight jobs (e.g.
+at the number of worker threads). Whenever a job is submitted or finishes,
+deferred jobs are dispatched across tenants by stride scheduling: each tenant
+has a "pass" value that advances by 1/weight per dispatched job, and the
+admissible tenant with the lowest pass goes next. Heavier tenants therefore get
+a proportionally larger share of slots, and a tenant that shows up later starts
+at the current lowest pass rather than at zero, so it cannot bank credit while
+idle.
+
+In-flight slots are leases (sorted-set members scored by expiry) so a worker
+that dies without releasing its slot only holds it for `slot_ttl_seconds`.
+The time from submission to a worker starting each job is sampled per tenant
+for queue-wait percentiles.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+import redis.asyncio as redis
+
+from ..logging import get_logger
+from ..redis_pool import get_redis_client
+
+if TYPE_CHECKING:
+    from redis.asyncio.lock import Lock
+
+    from ..config import Settings
+
+logger = get_logger(__name__)
+
+# Sorted set of tenants with deferred jobs, scored by their stride "pass"
+TENANTS_KEY = "admission:tenants"
+# Hash of generation_id -> "tenant_id:user_id" for jobs holding a slot
+ADMITTED_KEY = "admission:admitted"
+# Hash of generation_id -> "tenant_id:submitted_at" for jobs not yet started
+SUBMITTED_KEY = "admission:submitted"
+# Sorted set of all in-flight generations, scored by lease expiry
+ALL_SLOTS_KEY = "admission:slots:all"
+LOCK_KEY = "admission:lock"
+
+LOCK_TIMEOUT_SECONDS = 10
+# Deferred jobs scanned per tenant when looking for one whose user has a free slot
+PENDING_SCAN_DEPTH = 50
+# Most recent queue-wait samples kept per tenant
+WAIT_SAMPLE_LIMIT = 1000
+
+
+def pending_key(tenant_id: str) -> str:
+    """Redis list of a tenant's deferred jobs, oldest first."""
+    return f"admission:pending:{tenant_id}"
+
+
+def tenant_slots_key(tenant_id: str) -> str:
+    """Redis sorted set of a tenant's in-flight generations, scored by lease expiry."""
+    return f"admission:slots:tenant:{tenant_id}"
+
+
+def user_slots_key(user_id: str) -> str:
+    """Redis sorted set of a user's in-flight generations, scored by lease expiry."""
+    return f"admission:slots:user:{user_id}"
+
+
+def wait_samples_key(tenant_id: str) -> str:
+    """Redis list of a tenant's most recent queue-wait samples (seconds)."""
+    return f"admission:wait:{tenant_id}"
+
+
+@dataclass(frozen=True)
+class PendingJob:
+    """A generation waiting for (or just granted) an in-flight slot."""
+
+    generation_id: str
+    tenant_id: str
+    user_id: str
+    generator_name: str
+    submitted_at: float
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, raw: str) -> PendingJob:
+        return cls(**json.loads(raw))
+
+
+@dataclass(frozen=True)
+class QueueWaitStats:
+    """Queue-wait percentiles (seconds) over a tenant's recent jobs."""
+
+    tenant_id: str
+    samples: int
+    p50: float | None
+    p90: float | None
+    p99: float | None
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    index = max(0, math.ceil(q * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class AdmissionController:
+    """Redis-backed in-flight limits and weighted fair dispatch across tenants.
+
+    `submit` and `release` return the jobs that were granted a slot; the caller
+    is responsible for enqueueing them (this module does not depend on Dramatiq).
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        *,
+        max_per_tenant: int = 0,
+        max_per_user: int = 0,
+        max_total: int = 0,
+        tenant_weights: dict[str, float] | None = None,
+        slot_ttl_seconds: int = 3600,
+    ) -> None:
+        self._client = client
+        self.max_per_tenant = max_per_tenant
+        self.max_per_user = max_per_user
+        self.max_total = max_total
+        self.tenant_weights = tenant_weights or {}
+        self.slot_ttl_seconds = slot_ttl_seconds
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, client: redis.Redis | None = None
+    ) -> AdmissionController:
+        return cls(
+            client or get_redis_client(),
+            max_per_tenant=settings.generation_max_in_flight_per_tenant,
+            max_per_user=settings.generation_max_in_flight_per_user,
+            max_total=settings.generation_max_in_flight_total,
+            tenant_weights=settings.generation_tenant_weights,
+            slot_ttl_seconds=settings.generation_slot_ttl_seconds,
+        )
+
+    def weight(self, tenant_id: str) -> float:
+        weight = self.tenant_weights.get(tenant_id, 1.0)
+        return weight if weight > 0 else 1.0
+
+    async def submit(self, job: PendingJob) -> list[PendingJob]:
+        """Defer a new job, then dispatch whatever now fits within the limits."""
+        return await self.submit_many([job])
+
+    async def submit_many(self, jobs: list[PendingJob]) -> list[PendingJob]:
+        """Defer several new jobs under one lock, then dispatch what fits.
+
+        Jobs that were already submitted and have not started yet are skipped,
+        so a relay retrying a batch does not defer the same job twice.
+        """
+        async with self._lock():
+            for job in jobs:
+                if await self._client.hget(SUBMITTED_KEY, job.generation_id) is not None:
+                    continue
+                await self._client.rpush(pending_key(job.tenant_id), job.to_json())
+                await self._client.hset(
+                    SUBMITTED_KEY, job.generation_id, f"{job.tenant_id}:{job.submitted_at}"
+                )
+                if await self._client.zscore(TENANTS_KEY, job.tenant_id) is None:
+                    lowest = await self._client.zrange(TENANTS_KEY, 0, 0, withscores=True)
+                    start = lowest[0][1] if lowest else 0.0
+                    await self._client.zadd(TENANTS_KEY, {job.tenant_id: start})
+            return await self._dispatch()
+
+    async def deferred(self, generation_ids: list[str]) -> set[str]:
+        """The given jobs that are still waiting for a slot (submitted, not admitted)."""
+        waiting = set()
+        for generation_id in generation_ids:
+            if await self._client.hget(SUBMITTED_KEY, generation_id) is None:
+                continue
+            if await self._client.hget(ADMITTED_KEY, generation_id) is None:
+                waiting.add(generation_id)
+        return waiting
+
+    async def release(self, generation_id: str) -> list[PendingJob]:
+        """Free a finished job's slot, then dispatch deferred jobs into free slots.
+
+        Safe to call for jobs that never held a slot; expired leases are
+        reclaimed on every call.
+        """
+        async with self._lock():
+            owner = await self._client.hget(ADMITTED_KEY, generation_id)
+            if owner is not None:
+                tenant_id, user_id = owner.split(":", 1)
+                await self._client.hdel(ADMITTED_KEY, generation_id)
+                await self._client.zrem(tenant_slots_key(tenant_id), generation_id)
+                await self._client.zrem(user_slots_key(user_id), generation_id)
+                await self._client.zrem(ALL_SLOTS_KEY, generation_id)
+            return await self._dispatch()
+
+    async def dispatch(self) -> list[PendingJob]:
+        """Dispatch deferred jobs into free slots, reclaiming expired leases.
+
+        `submit` and `release` do this too; calling it periodically keeps
+        deferred jobs from waiting for unrelated traffic when a release was
+        lost or a slot lease expired.
+        """
+        async with self._lock():
+            return await self._dispatch()
+
+    async def record_start(self, generation_id: str) -> float | None:
+        """Record the queue wait of a job a worker has just started.
+
+        Returns the wait in seconds, or None for jobs not submitted through
+        admission control.
+        """
+        raw = await self._client.hget(SUBMITTED_KEY, generation_id)
+        if raw is None:
+            return None
+        await self._client.hdel(SUBMITTED_KEY, generation_id)
+
+        tenant_id, submitted_at = raw.split(":", 1)
+        wait = max(0.0, time.time() - float(submitted_at))
+        key = wait_samples_key(tenant_id)
+        await self._client.lpush(key, f"{wait:.3f}")
+        await self._client.ltrim(key, 0, WAIT_SAMPLE_LIMIT - 1)
+        return wait
+
+    async def queue_wait_stats(self, tenant_id: str) -> QueueWaitStats:
+        """Queue-wait percentiles over the tenant's most recent jobs."""
+        samples = sorted(
+            float(value) for value in await self._client.lrange(wait_samples_key(tenant_id), 0, -1)
+        )
+        if not samples:
+            return QueueWaitStats(tenant_id=tenant_id, samples=0, p50=None, p90=None, p99=None)
+        return QueueWaitStats(
+            tenant_id=tenant_id,
+            samples=len(samples),
+            p50=_percentile(samples, 0.50),
+            p90=_percentile(samples, 0.90),
+            p99=_percentile(samples, 0.99),
+        )
+
+    def _lock(self) -> Lock:
+        # Dispatch reads and updates several keys; serialize it across API
+        # processes and workers
+        return self._client.lock(
+            LOCK_KEY, timeout=LOCK_TIMEOUT_SECONDS, blocking_timeout=LOCK_TIMEOUT_SECONDS
+        )
+
+    async def _dispatch(self) -> list[PendingJob]:
+        """Grant slots to deferred jobs, lowest tenant pass first. Caller holds the lock."""
+        now = time.time()
+        await self._reclaim_expired(now)
+        passes = dict(await self._client.zrange(TENANTS_KEY, 0, -1, withscores=True))
+        in_flight: dict[str, int] = {}
+        dispatched: list[PendingJob] = []
+
+        while passes:
+            if self.max_total and (
+                await self._in_flight(ALL_SLOTS_KEY, now, in_flight) >= self.max_total
+            ):
+                break
+
+            tenant_id = min(passes, key=passes.__getitem__)
+            job = await self._next_admissible(tenant_id, now, in_flight)
+            if job is None:
+                # Tenant is at its limit (or all its users are); skip it this round
+                del passes[tenant_id]
+                continue
+
+            await self._admit(job, now, in_flight)
+            dispatched.append(job)
+
+            passes[tenant_id] += 1.0 / self.weight(tenant_id)
+            if await self._client.llen(pending_key(tenant_id)):
+                await self._client.zadd(TENANTS_KEY, {tenant_id: passes[tenant_id]})
+            else:
+                await self._client.zrem(TENANTS_KEY, tenant_id)
+                del passes[tenant_id]
+
+        if dispatched:
+            logger.info(
+                "Dispatched deferred generations",
+                generation_ids=[job.generation_id for job in dispatched],
+            )
+        return dispatched
+
+    async def _next_admissible(
+        self, tenant_id: str, now: float, in_flight: dict[str, int]
+    ) -> PendingJob | None:
+        """Pop the tenant's oldest deferred job whose user has a free slot."""
+        if self.max_per_tenant and (
+            await self._in_flight(tenant_slots_key(tenant_id), now, in_flight)
+            >= self.max_per_tenant
+        ):
+            return None
+
+        raw_jobs = await self._client.lrange(pending_key(tenant_id), 0, PENDING_SCAN_DEPTH - 1)
+        if not raw_jobs:
+            await self._client.zrem(TENANTS_KEY, tenant_id)
+            return None
+
+        for raw in raw_jobs:
+            job = PendingJob.from_json(raw)
+            if self.max_per_user and (
+                await self._in_flight(user_slots_key(job.user_id), now, in_flight)
+                >= self.max_per_user
+            ):
+                continue
+            await self._client.lrem(pending_key(tenant_id), 1, raw)
+            return job
+        return None
+
+    async def _reclaim_expired(self, now: float) -> None:
+        """Forget the owners of expired slots, whose jobs never released them."""
+        expired = await self._client.zrangebyscore(ALL_SLOTS_KEY, "-inf", now)
+        for generation_id in expired:
+            await self._client.hdel(ADMITTED_KEY, generation_id)
+        if expired:
+            await self._client.zremrangebyscore(ALL_SLOTS_KEY, "-inf", now)
+
+    async def _in_flight(self, key: str, now: float, in_flight: dict[str, int]) -> int:
+        """Count unexpired slots in a slot set, cached for one dispatch round."""
+        if key not in in_flight:
+            await self._client.zremrangebyscore(key, "-inf", now)
+            in_flight[key] = await self._client.zcard(key)
+        return in_flight[key]
+
+    async def _admit(self, job: PendingJob, now: float, in_flight: dict[str, int]) -> None:
+        expires_at = now + self.slot_ttl_seconds
+        for key in (ALL_SLOTS_KEY, tenant_slots_key(job.tenant_id), user_slots_key(job.user_id)):
+            await self._in_flight(key, now, in_flight)
+            await self._client.zadd(key, {job.generation_id: expires_at})
+            in_flight[key] += 1
+        await self._client.hset(ADMITTED_KEY, job.generation_id, f"{job.tenant_id}:{job.user_id}")
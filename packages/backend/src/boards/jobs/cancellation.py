@@ -0,0 +1,71 @@
+"""Cross-process cancellation signal for running generations.
+
+`cancel_generation` marks a generation cancelled in the database, but the
+Dramatiq job runs in a worker process that never re-reads that row. The API
+therefore also sets a short-lived Redis key per generation; the worker watches
+that key, aborts the generator task and asks the provider to cancel the
+upstream job (see GeneratorExecutionContext.run_cancellable).
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import redis.asyncio as redis
+
+from ..logging import get_logger
+from ..redis_pool import get_redis_client
+
+logger = get_logger(__name__)
+
+# Long enough to outlive any queued or running job; the key is only a signal
+CANCEL_KEY_TTL_SECONDS = 24 * 60 * 60
+
+
+class GenerationCancelled(Exception):
+    """Raised inside a worker when its generation has been cancelled."""
+
+    def __init__(self, generation_id: str) -> None:
+        super().__init__(f"Generation {generation_id} was cancelled")
+        self.generation_id = generation_id
+
+
+def cancel_key(generation_id: str) -> str:
+    """Redis key that signals cancellation of a generation."""
+    return f"job:{generation_id}:cancel"
+
+
+async def request_cancellation(generation_id: str, client: redis.Redis | None = None) -> None:
+    """Signal workers that a generation has been cancelled."""
+    client = client or get_redis_client()
+    await client.set(cancel_key(generation_id), "1", ex=CANCEL_KEY_TTL_SECONDS)
+    logger.info("Cancellation requested", generation_id=generation_id)
+
+
+async def is_cancellation_requested(generation_id: str, client: redis.Redis | None = None) -> bool:
+    """Check whether cancellation has been requested for a generation."""
+    client = client or get_redis_client()
+    return bool(await client.exists(cancel_key(generation_id)))
+
+
+async def wait_for_cancellation(
+    generation_id: str,
+    poll_interval: float,
+    client: redis.Redis | None = None,
+) -> None:
+    """
+    Return once cancellation has been requested for a generation.
+
+    Polls a single key rather than holding a pub/sub connection per running job.
+    Transient Redis errors are logged and retried on the next poll.
+    """
+    client = client or get_redis_client()
+    while True:
+        try:
+            if await is_cancellation_requested(generation_id, client):
+                return
+        except redis.RedisError as e:
+            logger.warning(
+                "Failed to check cancellation signal", generation_id=generation_id, error=str(e)
+            )
+        await asyncio.sleep(poll_interval)
@@ -0,0 +1,207 @@
+"""Heartbeat leases for running generations.
+
+A worker that is OOM-killed or loses its host mid-job never marks its
+generation failed, so the generation stays `processing` and SSE subscribers
+wait forever. While a worker runs a generation it therefore holds a lease: a
+Redis key with a short TTL that a background task keeps renewing. Every lease
+is also indexed in a sorted set scored by its expiry, so the reaper
+(workers/reaper.py) can find leases whose worker stopped renewing them.
+
+The lease also deduplicates deliveries. Dramatiq redelivers the unacked
+messages of dead workers, and the reaper requeues their jobs too, so a
+worker only runs a generation if it can take the lease. A finished job
+leaves a `finished` marker in place of its lease so late duplicates are
+skipped; a job that fails and will be retried drops its lease instead.
+
+Renewing and releasing check the lease's token first, so a worker that
+stalled past its TTL cannot extend or drop the lease another worker has
+since taken. Such a worker's job is cancelled when its renewal fails.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+from ..logging import get_logger
+from ..redis_pool import get_redis_client
+
+logger = get_logger(__name__)
+
+# Sorted set of generation_id -> lease expiry (unix time)
+LEASES_KEY = "job:leases"
+# Hash of generation_id -> number of times the reaper requeued it
+REAPS_KEY = "job:reaps"
+# Lease value left behind by a finished job
+FINISHED = "finished"
+# How long the finished marker blocks duplicate deliveries
+FINISHED_TTL_SECONDS = 24 * 60 * 60
+
+
+# KEYS: lease key, lease index; ARGV: token, TTL (ms), expiry, generation ID.
+# Returns 1 if the lease was renewed, 0 if it lapsed or another worker holds it.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+  return 0
+end
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[4])
+return 1
+"""
+
+# KEYS: lease key, lease index, reap counts; ARGV: token, finished ("1"/"0"),
+# finished marker TTL (s), generation ID. A lapsed lease nobody took since is
+# still released. Returns 0 if another worker holds the lease.
+_RELEASE_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder and holder ~= ARGV[1] then
+  return 0
+end
+if ARGV[2] == '1' then
+  redis.call('SET', KEYS[1], 'finished', 'EX', ARGV[3])
+  redis.call('HDEL', KEYS[3], ARGV[4])
+else
+  redis.call('DEL', KEYS[1])
+end
+redis.call('ZREM', KEYS[2], ARGV[4])
+return 1
+"""
+
+
+def lease_key(generation_id: str) -> str:
+    """Redis key holding the token of the worker running a generation."""
+    return f"job:{generation_id}:lease"
+
+
+class GenerationLease:
+    """A worker's claim on a running generation, renewed by a heartbeat task."""
+
+    def __init__(
+        self,
+        generation_id: str,
+        *,
+        ttl_seconds: float,
+        interval_seconds: float,
+        client: redis.Redis | None = None,
+    ) -> None:
+        self.generation_id = generation_id
+        self.ttl_seconds = ttl_seconds
+        self.interval_seconds = interval_seconds
+        self.token = uuid.uuid4().hex
+        # Set once the lease was lost to another worker and the job cancelled
+        self.lost = False
+        self._client = client or get_redis_client()
+        self._renew: AsyncScript = self._client.register_script(_RENEW_SCRIPT)
+        self._release: AsyncScript = self._client.register_script(_RELEASE_SCRIPT)
+        self._heartbeat: asyncio.Task[None] | None = None
+        self._job: asyncio.Task[object] | None = None
+
+    async def acquire(self) -> bool:
+        """Take the lease and start renewing it.
+
+        The heartbeat cancels the calling task if the lease is lost.
+
+        Returns False if another worker holds the lease or the generation has
+        already finished.
+        """
+        key = lease_key(self.generation_id)
+        if not await self._client.set(key, self.token, px=self._ttl_ms(), nx=True):
+            return False
+        await self._client.zadd(LEASES_KEY, {self.generation_id: self._expiry()})
+        self._job = asyncio.current_task()
+        self._heartbeat = asyncio.create_task(self._keep_alive())
+        return True
+
+    async def renew(self) -> bool:
+        """Extend the lease. Returns False if it expired or another worker holds it."""
+        renewed = await self._renew(
+            keys=[lease_key(self.generation_id), LEASES_KEY],
+            args=[self.token, self._ttl_ms(), self._expiry(), self.generation_id],
+        )
+        return bool(renewed)
+
+    async def release(self, *, finished: bool) -> None:
+        """Stop the heartbeat and give up the lease.
+
+        A finished job keeps blocking duplicate deliveries of its message;
+        otherwise (e.g. the job will be retried) the lease is simply dropped.
+        A lease another worker has taken since is left alone.
+        """
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        released = await self._release(
+            keys=[lease_key(self.generation_id), LEASES_KEY, REAPS_KEY],
+            args=[self.token, int(finished), FINISHED_TTL_SECONDS, self.generation_id],
+        )
+        if not released:
+            logger.warning(
+                "Generation lease is held by another worker; not releasing it",
+                generation_id=self.generation_id,
+            )
+
+    async def _keep_alive(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                if not await self.renew():
+                    # Another delivery may be running the job by now; stop this one
+                    logger.warning(
+                        "Generation lease was lost; cancelling this run",
+                        generation_id=self.generation_id,
+                    )
+                    self.lost = True
+                    self._heartbeat = None
+                    if self._job is not None:
+                        self._job.cancel()
+                    return
+            except redis.RedisError as e:
+                # The lease survives until its TTL; the next heartbeat retries
+                logger.warning(
+                    "Failed to renew generation lease",
+                    generation_id=self.generation_id,
+                    error=str(e),
+                )
+
+    def _ttl_ms(self) -> int:
+        return int(self.ttl_seconds * 1000)
+
+    def _expiry(self) -> float:
+        return time.time() + self.ttl_seconds
+
+
+async def expired_leases(client: redis.Redis | None = None, limit: int = 100) -> list[str]:
+    """Generations whose lease index entry has expired (their worker stopped renewing)."""
+    client = client or get_redis_client()
+    return await client.zrangebyscore(LEASES_KEY, "-inf", time.time(), start=0, num=limit)
+
+
+async def claim_expired_lease(generation_id: str, client: redis.Redis | None = None) -> bool:
+    """Claim an expired lease for reaping.
+
+    Returns False if the lease is still live (it was renewed late) or another
+    reaper claimed it first.
+    """
+    client = client or get_redis_client()
+    if await client.exists(lease_key(generation_id)):
+        # Renewed after the index was read; leave it alone
+        return False
+    return bool(await client.zrem(LEASES_KEY, generation_id))
+
+
+async def record_reap(generation_id: str, client: redis.Redis | None = None) -> int:
+    """Count a requeue by the reaper; returns how often the generation was reaped."""
+    client = client or get_redis_client()
+    reaps = await client.hincrby(REAPS_KEY, generation_id, 1)
+    return int(reaps)
+
+
+async def mark_finished(generation_id: str, client: redis.Redis | None = None) -> None:
+    """Block further deliveries of a generation the reaper gave up on."""
+    client = client or get_redis_client()
+    await client.set(lease_key(generation_id), FINISHED, ex=FINISHED_TTL_SECONDS)
+    await client.hdel(REAPS_KEY, generation_id)
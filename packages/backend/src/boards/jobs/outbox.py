@@ -0,0 +1,125 @@
+"""Transactional outbox for generation jobs.
+
+Enqueueing a job after committing its generation row loses the job if Redis
+is unavailable at that moment, leaving the generation `pending` forever. New
+generations instead get a `generation_outbox` row in the same transaction as
+the generation itself. A relay (workers/relay.py) claims outbox rows in
+batches, hands them to admission control / the job queue and deletes them in
+the same transaction, so a row only disappears once its job was handed off.
+
+Generations that are still `pending` long after their outbox row was relayed
+are found by `find_stale_pending`. The relay's sweeper re-enqueues those whose
+queue message was lost (see workers/queues.py).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..dbmodels import GenerationOutbox, Generations
+from .admission import PendingJob
+
+USER_UPLOAD_GENERATOR_PREFIX = "user-upload-"
+
+
+def add_to_outbox(session: AsyncSession, generation_id: UUID) -> None:
+    """Queue a generation for enqueueing when the session's transaction commits."""
+    entry = GenerationOutbox()
+    entry.generation_id = generation_id
+    session.add(entry)
+
+
+async def claim_batch(session: AsyncSession, limit: int) -> list[PendingJob]:
+    """Lock up to `limit` of the oldest outbox rows and return their jobs.
+
+    Rows locked by a concurrent relay are skipped. The locks are held until
+    the session's transaction ends; delete the relayed rows with
+    `remove_from_outbox` before committing.
+    """
+    stmt = (
+        select(
+            GenerationOutbox.generation_id,
+            GenerationOutbox.created_at,
+            Generations.tenant_id,
+            Generations.user_id,
+            Generations.generator_name,
+        )
+        .join(Generations, Generations.id == GenerationOutbox.generation_id)
+        .order_by(GenerationOutbox.created_at)
+        .limit(limit)
+        .with_for_update(of=GenerationOutbox, skip_locked=True)
+    )
+    res = await session.execute(stmt)
+    return [_pending_job(*row) for row in res.all()]
+
+
+async def remove_from_outbox(session: AsyncSession, generation_ids: list[str]) -> None:
+    await session.execute(
+        delete(GenerationOutbox).where(
+            GenerationOutbox.generation_id.in_([UUID(gid) for gid in generation_ids])
+        )
+    )
+
+
+async def find_stale_pending(
+    session: AsyncSession, stale_after: timedelta, limit: int
+) -> list[PendingJob]:
+    """Pending generations not touched for `stale_after` and no longer in the outbox.
+
+    These are only candidates: most are still waiting in a queue. Callers must
+    check that the job was actually lost before re-enqueueing it.
+
+    The rows are locked (skipping rows locked elsewhere) and their updated_at
+    is bumped, so a generation is only picked up again after another
+    `stale_after` without progress.
+    """
+    now = datetime.now(UTC)
+    stmt = (
+        select(
+            Generations.id,
+            Generations.updated_at,
+            Generations.tenant_id,
+            Generations.user_id,
+            Generations.generator_name,
+        )
+        .where(
+            Generations.status == "pending",
+            Generations.updated_at < now - stale_after,
+            # User uploads are never queued; direct uploads wait pending for
+            # the client to finish uploading
+            Generations.generator_name.not_like(f"{USER_UPLOAD_GENERATOR_PREFIX}%"),
+            ~exists().where(GenerationOutbox.generation_id == Generations.id),
+        )
+        .order_by(Generations.updated_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    res = await session.execute(stmt)
+    jobs = [_pending_job(*row) for row in res.all()]
+    if jobs:
+        await session.execute(
+            update(Generations)
+            .where(Generations.id.in_([UUID(job.generation_id) for job in jobs]))
+            .values(updated_at=now)
+        )
+    return jobs
+
+
+def _pending_job(
+    generation_id: UUID,
+    created_at: datetime,
+    tenant_id: UUID,
+    user_id: UUID,
+    generator_name: str,
+) -> PendingJob:
+    return PendingJob(
+        generation_id=str(generation_id),
+        tenant_id=str(tenant_id),
+        user_id=str(user_id),
+        generator_name=generator_name,
+        submitted_at=created_at.timestamp(),
+    )
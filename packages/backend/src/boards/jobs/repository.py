@@ -2,24 +2,50 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
-from uuid import UUID
+from uuid import NAMESPACE_OID, UUID, uuid5
 
-from sqlalchemy import select, update
+from sqlalchemy import Uuid, any_, bindparam, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..dbmodels import Generations
+from .outbox import add_to_outbox
 
 
-async def get_generation(session: AsyncSession, generation_id: str | UUID) -> Generations:
+async def get_generation(
+    session: AsyncSession, generation_id: str | UUID, *, for_update: bool = False
+) -> Generations:
     stmt = select(Generations).where(Generations.id == str(generation_id))
+    if for_update:
+        # Held until the session commits, serializing concurrent updates of the row
+        stmt = stmt.with_for_update()
     res = await session.execute(stmt)
     row = res.scalar_one()
     return row
 
 
+async def get_generations_by_ids(
+    session: AsyncSession, generation_ids: Sequence[UUID], tenant_id: UUID
+) -> dict[UUID, Generations]:
+    """Fetch several generations of one tenant in a single round trip.
+
+    Returns a mapping keyed by ID; IDs that do not exist (or belong to another
+    tenant) are simply absent.
+    """
+    if not generation_ids:
+        return {}
+    stmt = select(Generations).where(
+        Generations.id == any_(bindparam("ids", list(generation_ids), type_=ARRAY(Uuid))),
+        Generations.tenant_id == tenant_id,
+    )
+    res = await session.execute(stmt)
+    return {gen.id: gen for gen in res.scalars().all()}
+
+
 async def update_progress(
     session: AsyncSession,
     generation_id: str | UUID,
@@ -65,16 +91,33 @@ async def create_generation(
     gen.progress = Decimal(0.0)
     session.add(gen)
     await session.flush()
+    # Enqueued by the outbox relay once this transaction commits (see jobs/outbox.py)
+    add_to_outbox(session, gen.id)
     return gen
 
 
 async def set_external_job_id(
-    session: AsyncSession, generation_id: str | UUID, external_job_id: str
+    session: AsyncSession,
+    generation_id: str | UUID,
+    external_job_id: str | None,
+    generator_name: str | None = None,
 ) -> None:
+    """Record the provider job of a generation and the generator that submitted it."""
     stmt = (
         update(Generations)
         .where(Generations.id == str(generation_id))
-        .values(external_job_id=external_job_id)
+        .values(external_job_id=external_job_id, external_job_generator=generator_name)
+    )
+    await session.execute(stmt)
+
+
+async def set_thumbnail_url(
+    session: AsyncSession, generation_id: str | UUID, thumbnail_url: str | None
+) -> None:
+    stmt = (
+        update(Generations)
+        .where(Generations.id == str(generation_id))
+        .values(thumbnail_url=thumbnail_url)
     )
     await session.execute(stmt)
 
@@ -102,6 +145,91 @@ async def finalize_success(
         )
     )
     await session.execute(stmt)
+    await record_lineage(session, generation_id)
+
+
+async def record_lineage(session: AsyncSession, generation_id: str | UUID) -> None:
+    """Materialize a generation's input_artifacts as generation_lineage edges.
+
+    Idempotent: existing edges are left untouched, and references to
+    generations that no longer exist are skipped, as are input_artifacts that
+    are not a JSON array.
+    """
+    await session.execute(
+        text("""
+            INSERT INTO boards.generation_lineage (parent_id, child_id, role)
+            SELECT DISTINCT
+                (artifact->>'generation_id')::uuid,
+                g.id,
+                COALESCE(artifact->>'role', 'input')
+            FROM boards.generations g
+            CROSS JOIN LATERAL jsonb_array_elements(g.input_artifacts) AS artifact
+            JOIN boards.generations parent
+                ON parent.id = (artifact->>'generation_id')::uuid
+            WHERE g.id = :generation_id
+              AND jsonb_typeof(g.input_artifacts) = 'array'
+            ON CONFLICT DO NOTHING
+        """),
+        {"generation_id": str(generation_id)},
+    )
+
+
+def batch_id_for(generation_id: str | UUID) -> str:
+    """Return the batch ID of a generation's extra outputs.
+
+    It is derived from the primary generation, so every attempt of a retried
+    or reaped job finds the batch rows an earlier attempt created.
+    """
+    return str(uuid5(NAMESPACE_OID, str(generation_id)))
+
+
+async def get_batch_generation(
+    session: AsyncSession,
+    *,
+    tenant_id: UUID,
+    board_id: UUID,
+    batch_id: str,
+    batch_index: int,
+) -> str | None:
+    """Return the ID of the batch generation for this output, if one exists."""
+    stmt = (
+        select(Generations.id)
+        .where(
+            Generations.tenant_id == tenant_id,
+            Generations.board_id == board_id,
+            Generations.output_metadata.contains(
+                {"batch_id": batch_id, "batch_index": batch_index}
+            ),
+        )
+        .order_by(Generations.created_at)
+        .limit(1)
+    )
+    gen_id = (await session.execute(stmt)).scalar_one_or_none()
+    return str(gen_id) if gen_id is not None else None
+
+
+async def fail_batch_generations(
+    session: AsyncSession,
+    generation_id: str | UUID,
+    *,
+    error_message: str,
+) -> None:
+    """Mark the unfinished batch generations of a failed primary generation failed."""
+    now = datetime.now(UTC)
+    stmt = (
+        update(Generations)
+        .where(
+            Generations.output_metadata.contains({"batch_id": batch_id_for(generation_id)}),
+            Generations.status.in_(("pending", "processing")),
+        )
+        .values(
+            status="failed",
+            error_message=error_message,
+            updated_at=now,
+            completed_at=now,
+        )
+    )
+    await session.execute(stmt)
 
 
 async def create_batch_generation(
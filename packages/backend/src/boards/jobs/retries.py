@@ -0,0 +1,48 @@
+"""Retry bookkeeping for generation jobs.
+
+`process_generation` re-raises failures so Dramatiq retries the message with
+backoff. A retry must not pay the provider twice: the first attempt persists
+the provider's request ID (`external_job_id`), and the next attempt reattaches
+to that job, polling it or fetching its result, instead of resubmitting (see
+GeneratorExecutionContext.resumable_external_job_id). A failure in storage
+after the provider finished is therefore cheap to retry.
+
+Dramatiq tracks attempts in the message options, which async actors cannot
+see (they run on the worker's event loop thread). The GenerationRetries
+middleware records the attempt here before the actor runs so the actor can
+tell whether a failure is final. Only final failures mark the generation
+failed; earlier ones leave it processing while the retry is pending.
+"""
+
+from __future__ import annotations
+
+import threading
+
+
+class PermanentGenerationError(Exception):
+    """A generation failure that retrying cannot fix (e.g. invalid inputs)."""
+
+
+_lock = threading.Lock()
+_remaining: dict[str, int] = {}
+
+
+def record_attempt(generation_id: str, retries: int, max_retries: int) -> None:
+    """Record how many retries are left for the message now being processed."""
+    with _lock:
+        _remaining[generation_id] = max(0, max_retries - retries)
+
+
+def forget_attempt(generation_id: str) -> None:
+    with _lock:
+        _remaining.pop(generation_id, None)
+
+
+def remaining_retries(generation_id: str) -> int:
+    """Retries left after the current attempt of a generation.
+
+    Returns 0 when the attempt was not recorded (e.g. the actor was called
+    directly), so its failure is treated as final.
+    """
+    with _lock:
+        return _remaining.get(generation_id, 0)
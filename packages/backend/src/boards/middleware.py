@@ -7,8 +7,10 @@ import re
 from collections.abc import Callable
 from typing import Any
 
-from fastapi import Request, Response
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .config import settings
 from .logging import (
@@ -337,3 +339,51 @@ class TenantRoutingMiddleware(BaseHTTPMiddleware):
             return "Tenant slug cannot start or end with hyphen"
 
         return None  # Valid
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject upload request bodies larger than `max_upload_size` as they arrive.
+
+    The multipart parser spools a file to disk before the endpoint runs, so an
+    oversized upload would otherwise be received in full before it is refused.
+    Requests that declare a larger Content-Length are refused before their body
+    is read; others fail once the bytes received pass the limit.
+    """
+
+    # Allowance for the multipart boundaries and form fields around the file
+    FORM_OVERHEAD = 1024 * 1024
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: tuple[str, ...] = ("/api/uploads/", "/api/storage/upload/"),
+    ):
+        self.app = app
+        self.path_prefixes = path_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.max_upload_size + self.FORM_OVERHEAD
+        detail = f"Request body exceeds maximum allowed size of {settings.max_upload_size} bytes"
+        content_length = Request(scope).headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse({"detail": detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
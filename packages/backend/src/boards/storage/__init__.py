@@ -10,15 +10,18 @@ Main components:
 - StorageProvider: Abstract base class for storage implementations
 - StorageManager: Central coordinator for routing and operations
 - ArtifactReference: Metadata about stored artifacts
+- UploadTarget: Presigned destination for direct client uploads
 """
 
 from .base import (
     ArtifactReference,
+    FileTooLargeException,
     SecurityException,
     StorageConfig,
     StorageException,
     StorageManager,
     StorageProvider,
+    UploadTarget,
     ValidationException,
 )
 from .config import (
@@ -38,9 +41,11 @@ __all__ = [
     "StorageManager",
     "StorageConfig",
     "ArtifactReference",
+    "UploadTarget",
     "StorageException",
     "SecurityException",
     "ValidationException",
+    "FileTooLargeException",
     # Factory functions
     "create_storage_provider",
     "create_storage_manager",
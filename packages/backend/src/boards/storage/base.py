@@ -4,7 +4,7 @@ import asyncio
 import re
 import uuid
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -13,6 +13,9 @@ from ..logging import get_logger
 
 logger = get_logger(__name__)
 
+# Storage variant that direct uploads are written to until they are completed
+UPLOAD_VARIANT = "upload"
+
 
 @dataclass
 class StorageConfig:
@@ -61,6 +64,16 @@ class ArtifactReference:
             self.created_at = datetime.now(UTC)
 
 
+@dataclass
+class UploadTarget:
+    """Where a client uploads an artifact directly, bypassing the API."""
+
+    storage_key: str
+    storage_provider: str
+    # Presigned request: url, method, fields or headers, expires_at
+    upload: dict[str, Any]
+
+
 class StorageException(Exception):
     """Base exception for storage operations."""
 
@@ -79,6 +92,48 @@ class ValidationException(StorageException):
     pass
 
 
+class FileTooLargeException(ValidationException):
+    """The content exceeds the allowed size."""
+
+    pass
+
+
+class _MeteredStream(AsyncIterator[bytes]):
+    """Async byte stream that counts what passes through and enforces a size limit."""
+
+    def __init__(self, content: AsyncIterator[bytes], max_size: int):
+        self._content = content
+        self._max_size = max_size
+        self.size = 0
+
+    async def __anext__(self) -> bytes:
+        chunk = await anext(self._content)
+        self.size += len(chunk)
+        if self.size > self._max_size:
+            raise FileTooLargeException(
+                f"File size exceeds limit {self._max_size} after {self.size} bytes"
+            )
+        return chunk
+
+
+class _MeteredSource:
+    """Factory of metered streams, so that a streamed upload can be retried from the start."""
+
+    def __init__(self, open_stream: Callable[[], AsyncIterator[bytes]], max_size: int):
+        self._open_stream = open_stream
+        self._max_size = max_size
+        self._stream: _MeteredStream | None = None
+
+    def __call__(self) -> _MeteredStream:
+        self._stream = _MeteredStream(self._open_stream(), self._max_size)
+        return self._stream
+
+    @property
+    def size(self) -> int:
+        """Bytes passed through by the latest stream."""
+        return self._stream.size if self._stream else 0
+
+
 class StorageProvider(ABC):
     """Abstract base class for all storage providers."""
 
@@ -112,6 +167,22 @@ class StorageProvider(ABC):
         """Download content by storage key."""
         pass
 
+    async def download_range(self, key: str, start: int, length: int) -> bytes:
+        """Download `length` bytes starting at `start` (fewer at the end of the file).
+
+        Providers that support ranged reads override this; the default downloads
+        the whole file.
+        """
+        return (await self.download(key))[start : start + length]
+
+    async def download_stream(self, key: str) -> AsyncIterator[bytes]:
+        """Download content in chunks, without holding the whole file in memory.
+
+        Providers that support streamed reads override this; the default yields
+        the whole file as one chunk.
+        """
+        yield await self.download(key)
+
     @abstractmethod
     async def get_presigned_upload_url(
         self, key: str, content_type: str, expires_in: timedelta | None = None
@@ -126,11 +197,28 @@ class StorageProvider(ABC):
         """Generate presigned URL for secure downloads."""
         pass
 
+    async def get_public_url(self, key: str) -> str:
+        """Get the permanent URL of a stored file, as returned by `upload`."""
+        raise StorageException(f"{type(self).__name__} does not provide public URLs")
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete file by storage key."""
         pass
 
+    async def move(self, source_key: str, dest_key: str) -> None:
+        """Move a file to another key, replacing any file there.
+
+        Providers with a server-side copy or rename override this; the default
+        downloads the file, uploads it to `dest_key` and deletes the source.
+        """
+        metadata = await self.get_metadata(source_key)
+        content_type = metadata.get("content_type") or "application/octet-stream"
+        await self.upload(
+            dest_key, await self.download(source_key), content_type, {"content_type": content_type}
+        )
+        await self.delete(source_key)
+
     @abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if file exists."""
@@ -178,7 +266,7 @@ class StorageManager:
     def _validate_file_size(self, content_size: int) -> None:
         """Validate file size against limits."""
         if content_size > self.config.max_file_size:
-            raise ValidationException(
+            raise FileTooLargeException(
                 f"File size {content_size} exceeds limit {self.config.max_file_size}"
             )
 
@@ -189,24 +277,38 @@ class StorageManager:
     async def store_artifact(
         self,
         artifact_id: str,
-        content: bytes | AsyncIterator[bytes],
+        content: bytes | AsyncIterator[bytes] | Callable[[], AsyncIterator[bytes]],
         artifact_type: str,
         content_type: str,
         tenant_id: str | None = None,
         board_id: str | None = None,
+        variant: str = "original",
     ) -> ArtifactReference:
-        """Store artifact with comprehensive validation and error handling."""
+        """Store artifact with comprehensive validation and error handling.
+
+        `variant` names a derived rendition (e.g. "thumbnail") stored alongside
+        the original upload. Streamed content is passed through to the provider
+        chunk by chunk and fails once it exceeds the size limit. A stream can
+        only be uploaded once; pass a function that opens it instead to have
+        failed uploads retried like bytes are.
+        """
 
         try:
             # Validate content type
             self._validate_content_type(content_type)
 
-            # Validate content size if it's bytes
+            # Validate content size if it's bytes; count it as it streams otherwise
             if isinstance(content, bytes):
                 self._validate_file_size(len(content))
+            elif callable(content):
+                content = _MeteredSource(content, self.config.max_file_size)
+            else:
+                content = _MeteredStream(content, self.config.max_file_size)
 
             # Generate and validate storage key
-            key = self._generate_storage_key(artifact_id, artifact_type, tenant_id, board_id)
+            key = self._generate_storage_key(
+                artifact_id, artifact_type, tenant_id, board_id, variant=variant
+            )
             validated_key = self._validate_storage_key(key)
 
             # Select provider based on routing rules
@@ -224,6 +326,7 @@ class StorageManager:
                 "board_id": board_id,
                 "uploaded_at": datetime.now(UTC).isoformat(),
                 "content_type": content_type,
+                "variant": variant,
             }
 
             # Store the content with retry logic
@@ -239,7 +342,7 @@ class StorageManager:
                 storage_provider=provider_name,
                 storage_url=storage_url,
                 content_type=content_type,
-                size=len(content) if isinstance(content, bytes) else 0,
+                size=len(content) if isinstance(content, bytes) else content.size,
                 created_at=datetime.now(UTC),
             )
 
@@ -254,19 +357,24 @@ class StorageManager:
         self,
         provider: StorageProvider,
         key: str,
-        content: bytes | AsyncIterator[bytes],
+        content: bytes | AsyncIterator[bytes] | Callable[[], AsyncIterator[bytes]],
         content_type: str,
         metadata: dict[str, Any],
         max_retries: int = 3,
     ) -> str:
-        """Upload with exponential backoff retry logic."""
+        """Upload with exponential backoff retry logic.
+
+        Each attempt opens a fresh stream when `content` is a function.
+        """
 
-        if max_retries <= 0:
+        if max_retries <= 0 or not (isinstance(content, bytes) or callable(content)):
+            # A stream is consumed by the first attempt and cannot be replayed
             max_retries = 1
 
         for attempt in range(max_retries):
             try:
-                return await provider.upload(key, content, content_type, metadata)
+                body = content() if callable(content) else content
+                return await provider.upload(key, body, content_type, metadata)
             except Exception as e:
                 if attempt == max_retries - 1:
                     raise
@@ -304,9 +412,20 @@ class StorageManager:
             # Global artifact (like LoRA models)
             return f"{tenant}/{artifact_type}/{artifact_id}_{timestamp}_{unique_suffix}/{variant}"
 
-    def _select_provider(self, artifact_type: str, content: bytes | AsyncIterator[bytes]) -> str:
-        """Select storage provider based on routing rules."""
-        content_size = len(content) if isinstance(content, bytes) else 0
+    def _select_provider(
+        self,
+        artifact_type: str,
+        content: bytes | AsyncIterator[bytes] | Callable[[], AsyncIterator[bytes]] | None = None,
+        *,
+        size: int | None = None,
+    ) -> str:
+        """Select storage provider based on routing rules.
+
+        `size` gives the content size when the content itself is not at hand.
+        """
+        if size is None and isinstance(content, bytes):
+            size = len(content)
+        content_size = size or 0
 
         for rule in self.routing_rules:
             condition = rule.get("condition", {})
@@ -321,7 +440,7 @@ class StorageManager:
                 size_limit = self._parse_size(condition["size_gt"])
                 if content_size <= size_limit:
                     continue
-                elif not isinstance(content, bytes):
+                elif size is None:
                     logger.warning(
                         f"Size-based routing rule ignored for {artifact_type} - "
                         f"content size unknown for async iterator"
@@ -346,6 +465,87 @@ class StorageManager:
         else:
             return int(size_str)
 
+    async def create_upload_target(
+        self,
+        artifact_id: str,
+        artifact_type: str,
+        content_type: str,
+        size: int,
+        tenant_id: str | None = None,
+        board_id: str | None = None,
+        expires_in: timedelta | None = None,
+    ) -> UploadTarget:
+        """Reserve a storage key and presign a direct upload of the artifact to it.
+
+        The client uploads the file itself, to an upload key next to the
+        artifact's permanent key. Move it there with `finalize_upload`, then
+        verify the stored object (e.g. with `get_artifact_metadata`) before
+        trusting it.
+        """
+        self._validate_content_type(content_type)
+        self._validate_file_size(size)
+
+        key = self._generate_storage_key(
+            artifact_id, artifact_type, tenant_id, board_id, variant=UPLOAD_VARIANT
+        )
+        validated_key = self._validate_storage_key(key)
+
+        provider_name = self._select_provider(artifact_type, size=size)
+        if provider_name not in self.providers:
+            raise StorageException(f"Provider not found: {provider_name}")
+
+        upload = await self.providers[provider_name].get_presigned_upload_url(
+            validated_key, content_type, expires_in
+        )
+        return UploadTarget(
+            storage_key=validated_key, storage_provider=provider_name, upload=upload
+        )
+
+    async def finalize_upload(self, storage_key: str, provider_name: str) -> str:
+        """Move a direct upload from its upload key to the artifact's permanent key.
+
+        The client's presigned upload stays valid until it expires. Once the
+        file is moved, uploading again only writes the upload key and cannot
+        replace the artifact. If the file was already moved (a retried
+        completion), the permanent key is returned as is.
+
+        Returns:
+            The permanent storage key
+
+        Raises:
+            StorageException: If no file was uploaded
+        """
+        if provider_name not in self.providers:
+            raise StorageException(f"Provider not found: {provider_name}")
+
+        provider = self.providers[provider_name]
+        directory, _, variant = storage_key.rpartition("/")
+        if variant != UPLOAD_VARIANT:
+            # Reserved before uploads had their own key
+            return storage_key
+        final_key = self._validate_storage_key(f"{directory}/original")
+        if await provider.exists(storage_key):
+            await provider.move(storage_key, final_key)
+        elif not await provider.exists(final_key):
+            raise StorageException(f"File not found: {storage_key}")
+        return final_key
+
+    async def get_artifact_metadata(self, storage_key: str, provider_name: str) -> dict[str, Any]:
+        """Get metadata (size, content type, etc.) of a stored artifact."""
+        if provider_name not in self.providers:
+            raise StorageException(f"Provider not found: {provider_name}")
+
+        provider = self.providers[provider_name]
+        return await provider.get_metadata(storage_key)
+
+    async def get_artifact_url(self, storage_key: str, provider_name: str) -> str:
+        """Get the permanent URL of a stored artifact."""
+        if provider_name not in self.providers:
+            raise StorageException(f"Provider not found: {provider_name}")
+
+        provider = self.providers[provider_name]
+        return await provider.get_public_url(storage_key)
+
     async def get_download_url(self, storage_key: str, provider_name: str) -> str:
         """Get download URL for a stored artifact."""
         if provider_name not in self.providers:
@@ -121,8 +121,14 @@ def _create_local_provider(config: dict[str, Any]) -> LocalStorageProvider:
     """Create local storage provider."""
     base_path = config.get("base_path", "/tmp/boards/storage")
     public_url_base = config.get("public_url_base")
+    # Signs direct upload URLs; set it when several API processes share storage
+    signing_secret = config.get("signing_secret")
 
-    return LocalStorageProvider(base_path=Path(base_path), public_url_base=public_url_base)
+    return LocalStorageProvider(
+        base_path=Path(base_path),
+        public_url_base=public_url_base,
+        signing_secret=signing_secret,
+    )
 
 
 def _create_supabase_provider(config: dict[str, Any]) -> StorageProvider:
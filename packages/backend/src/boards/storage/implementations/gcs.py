@@ -171,11 +171,7 @@ class GCSStorageProvider(StorageProvider):
             # Upload using thread pool to avoid blocking
             await self._run_sync(blob.upload_from_string, file_content, content_type=content_type)
 
-            # Return the CDN URL if configured, otherwise public GCS URL
-            if self.cdn_domain:
-                return f"https://{self.cdn_domain}/{key}"
-            else:
-                return f"https://storage.googleapis.com/{self.bucket_name}/{key}"
+            return await self.get_public_url(key)
 
         except Exception as e:
             if isinstance(e, StorageException):
@@ -183,6 +179,13 @@ class GCSStorageProvider(StorageProvider):
             logger.error(f"Unexpected error uploading {key} to GCS: {e}")
             raise StorageException(f"GCS upload failed: {e}") from e
 
+    async def get_public_url(self, key: str) -> str:
+        """Return the CDN URL if configured, otherwise the public GCS URL."""
+        if self.cdn_domain:
+            return f"https://{self.cdn_domain}/{key}"
+        else:
+            return f"https://storage.googleapis.com/{self.bucket_name}/{key}"
+
     async def download(self, key: str) -> bytes:
         """Download file content from GCS."""
         try:
@@ -202,6 +205,20 @@ class GCSStorageProvider(StorageProvider):
             logger.error(f"Failed to download {key} from GCS: {e}")
             raise StorageException(f"GCS download failed: {e}") from e
 
+    async def download_range(self, key: str, start: int, length: int) -> bytes:
+        """Download part of a file from GCS."""
+        try:
+            client = self._get_client()
+            blob = client.bucket(self.bucket_name).blob(key)
+            # `end` is inclusive
+            return await self._run_sync(blob.download_as_bytes, start=start, end=start + length - 1)
+
+        except Exception as e:
+            if isinstance(e, StorageException):
+                raise
+            logger.error(f"Failed to download {key} from GCS: {e}")
+            raise StorageException(f"GCS download failed: {e}") from e
+
     async def get_presigned_upload_url(
         self,
         key: str,
@@ -288,6 +305,20 @@ class GCSStorageProvider(StorageProvider):
             logger.error(f"Unexpected error deleting {key} from GCS: {e}")
             raise StorageException(f"GCS delete failed: {e}") from e
 
+    async def move(self, source_key: str, dest_key: str) -> None:
+        """Copy a file to another key server-side, then delete the source."""
+        try:
+            client = self._get_client()
+            bucket = client.bucket(self.bucket_name)
+
+            blob = bucket.blob(source_key)
+            await self._run_sync(bucket.copy_blob, blob, bucket, dest_key)
+            await self._run_sync(blob.delete)
+
+        except Exception as e:
+            logger.error(f"Failed to move {source_key} in GCS: {e}")
+            raise StorageException(f"GCS move failed: {e}") from e
+
     async def exists(self, key: str) -> bool:
         """Check if file exists."""
         try:
@@ -1,11 +1,15 @@
 """Local filesystem storage provider for development and self-hosted deployments."""
 
+import hashlib
+import hmac
 import json
-from collections.abc import AsyncIterable
-from datetime import timedelta
+import secrets
+import time
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 import aiofiles
 
@@ -14,13 +18,26 @@ from ..base import SecurityException, StorageException, StorageProvider
 
 logger = get_logger(__name__)
 
+# Streamed downloads are read in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Signs upload URLs when no signing secret is configured; such URLs only work
+# against the process that issued them
+_PROCESS_SIGNING_SECRET = secrets.token_hex(32)
+
 
 class LocalStorageProvider(StorageProvider):
     """Local filesystem storage for development and self-hosted with security."""
 
-    def __init__(self, base_path: Path, public_url_base: str | None = None):
+    def __init__(
+        self,
+        base_path: Path,
+        public_url_base: str | None = None,
+        signing_secret: str | None = None,
+    ):
         self.base_path = Path(base_path).resolve()  # Resolve to absolute path
         self.public_url_base = public_url_base
+        self._signing_secret = (signing_secret or _PROCESS_SIGNING_SECRET).encode()
         self.base_path.mkdir(parents=True, exist_ok=True)
 
     def _get_safe_file_path(self, key: str) -> Path:
@@ -54,11 +71,16 @@ class LocalStorageProvider(StorageProvider):
                 async with aiofiles.open(file_path, "wb") as f:
                     await f.write(content)
             else:  # isinstance(content, AsyncIterable):
-                async with aiofiles.open(file_path, "wb") as f:
-                    async for chunk in content:
-                        # Just write the chunk directly - aiofiles accepts bytes-like objects
-                        # It will raise an error if chunk is not bytes-like
-                        await f.write(chunk)
+                try:
+                    async with aiofiles.open(file_path, "wb") as f:
+                        async for chunk in content:
+                            # Just write the chunk directly - aiofiles accepts bytes-like objects
+                            # It will raise an error if chunk is not bytes-like
+                            await f.write(chunk)
+                except BaseException:
+                    # Don't leave a truncated file behind when the stream fails
+                    file_path.unlink(missing_ok=True)
+                    raise
 
             # Store metadata atomically
             if metadata:
@@ -109,19 +131,79 @@ class LocalStorageProvider(StorageProvider):
             logger.error(f"Unexpected error downloading {key}: {e}")
             raise StorageException(f"Download failed: {e}") from e
 
+    async def download_range(self, key: str, start: int, length: int) -> bytes:
+        """Read part of a file from local storage."""
+        try:
+            file_path = self._get_safe_file_path(key)
+
+            if not file_path.exists():
+                raise StorageException(f"File not found: {key}")
+
+            async with aiofiles.open(file_path, "rb") as f:
+                await f.seek(start)
+                return await f.read(length)
+
+        except OSError as e:
+            logger.error(f"File system error downloading {key}: {e}")
+            raise StorageException(f"Failed to read file: {e}") from e
+
+    async def download_stream(self, key: str) -> AsyncIterator[bytes]:
+        """Read a file from local storage in chunks."""
+        file_path = self._get_safe_file_path(key)
+        if not file_path.exists():
+            raise StorageException(f"File not found: {key}")
+        try:
+            async with aiofiles.open(file_path, "rb") as f:
+                while chunk := await f.read(DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
+        except OSError as e:
+            logger.error(f"File system error downloading {key}: {e}")
+            raise StorageException(f"Failed to read file: {e}") from e
+
+    async def get_public_url(self, key: str) -> str:
+        """Return the URL the file is served from."""
+        return self._get_public_url(key)
+
     async def get_presigned_upload_url(
         self, key: str, content_type: str, expires_in: timedelta | None = None
     ) -> dict[str, Any]:
-        """Local storage doesn't support presigned URLs - return direct upload info."""
-        # For local storage, we can't really do presigned URLs
-        # This would be handled by the web server (e.g., FastAPI endpoint)
+        """Generate a signed PUT URL for the storage upload endpoint.
+
+        The API serves it (PUT /api/storage/upload/{key}) and checks it with
+        `verify_upload_signature`.
+        """
+        if expires_in is None:
+            expires_in = timedelta(hours=1)
+
+        expires = int(time.time() + expires_in.total_seconds())
+        query = urlencode(
+            {"expires": expires, "signature": self._sign_upload(key, content_type, expires)}
+        )
+        base = (
+            f"{self.public_url_base.rstrip('/')}/upload"
+            if self.public_url_base
+            else "/api/storage/upload"
+        )
         return {
-            "url": f"/api/storage/upload/{quote(key, safe='/')}",
-            "fields": {"content-type": content_type},
+            "url": f"{base}/{quote(key, safe='/')}?{query}",
             "method": "PUT",
-            "expires_at": None,  # Handled by server session
+            "headers": {"Content-Type": content_type},
+            "expires_at": datetime.fromtimestamp(expires, UTC).isoformat(),
         }
 
+    def verify_upload_signature(
+        self, key: str, content_type: str, expires: int, signature: str
+    ) -> bool:
+        """Check a signed upload URL from `get_presigned_upload_url`."""
+        if expires < time.time():
+            return False
+        expected = self._sign_upload(key, content_type, expires)
+        return hmac.compare_digest(expected, signature)
+
+    def _sign_upload(self, key: str, content_type: str, expires: int) -> str:
+        message = f"PUT\n{key}\n{content_type}\n{expires}".encode()
+        return hmac.new(self._signing_secret, message, hashlib.sha256).hexdigest()
+
     async def get_presigned_download_url(
         self, key: str, expires_in: timedelta | None = None
     ) -> str:
@@ -154,6 +236,24 @@ class LocalStorageProvider(StorageProvider):
             logger.error(f"Unexpected error deleting {key}: {e}")
             raise StorageException(f"Delete failed: {e}") from e
 
+    async def move(self, source_key: str, dest_key: str) -> None:
+        """Rename a file (and its metadata) within local storage."""
+        try:
+            source_path = self._get_safe_file_path(source_key)
+            dest_path = self._get_safe_file_path(dest_key)
+            if not source_path.exists():
+                raise StorageException(f"File not found: {source_key}")
+
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            source_path.replace(dest_path)
+            metadata_path = source_path.with_suffix(source_path.suffix + ".meta")
+            if metadata_path.exists():
+                metadata_path.replace(dest_path.with_suffix(dest_path.suffix + ".meta"))
+
+        except OSError as e:
+            logger.error(f"File system error moving {source_key}: {e}")
+            raise StorageException(f"Failed to move file: {e}") from e
+
     async def exists(self, key: str) -> bool:
         """Check if file exists."""
         try:
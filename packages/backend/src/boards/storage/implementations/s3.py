@@ -27,6 +27,20 @@ from ..base import StorageException, StorageProvider
 
 logger = get_logger(__name__)
 
+# Streamed uploads are sent in parts of this size (S3's minimum is 5MB)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# Streamed downloads are read in chunks of this size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Form fields of presigned POSTs for the upload_config parameters they support
+_POST_FORM_FIELDS = {
+    "ServerSideEncryption": "x-amz-server-side-encryption",
+    "SSEKMSKeyId": "x-amz-server-side-encryption-aws-kms-key-id",
+    "StorageClass": "x-amz-storage-class",
+    "CacheControl": "Cache-Control",
+}
+
 
 class S3StorageProvider(StorageProvider):
     """AWS S3 storage with IAM auth, CloudFront CDN, and proper async patterns."""
@@ -108,37 +122,16 @@ class S3StorageProvider(StorageProvider):
                     s3_metadata[clean_key] = str(v)
                 upload_params["Metadata"] = s3_metadata
 
-            # Handle streaming content for large files
-            if isinstance(content, bytes):
-                upload_params["Body"] = content
-            else:
-                # Collect streaming content into memory for upload
-                # For very large files, consider using S3 multipart upload
-                chunks = []
-                total_size = 0
-                async for chunk in content:
-                    chunks.append(chunk)
-                    total_size += len(chunk)
-                    # For files larger than 100MB, we could implement multipart upload
-                    if total_size > 100 * 1024 * 1024:
-                        logger.warning(
-                            f"Large file upload ({total_size} bytes) - "
-                            f"consider implementing multipart upload for key: {key}"
-                        )
-
-                upload_params["Body"] = b"".join(chunks)
-
             # Upload using aioboto3
             async with session.client(
                 "s3", config=self.config, endpoint_url=self.endpoint_url
             ) as s3:
-                await s3.put_object(**upload_params)
+                if isinstance(content, bytes):
+                    await s3.put_object(Body=content, **upload_params)
+                else:
+                    await self._upload_stream(s3, upload_params, content)
 
-            # Return the CloudFront URL if configured, otherwise S3 URL
-            if self.cloudfront_domain:
-                return f"https://{self.cloudfront_domain}/{key}"
-            else:
-                return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
+            return await self.get_public_url(key)
 
         except Exception as e:
             if isinstance(e, StorageException):
@@ -146,6 +139,61 @@ class S3StorageProvider(StorageProvider):
             logger.error(f"Unexpected error uploading {key} to S3: {e}")
             raise StorageException(f"S3 upload failed: {e}") from e
 
+    async def _upload_stream(
+        self, s3: Any, upload_params: dict[str, Any], content: AsyncIterator[bytes]
+    ) -> None:
+        """Upload streamed content, as a multipart upload once it outgrows one part.
+
+        At most one part is buffered in memory at a time.
+        """
+        buffer = bytearray()
+        stream = aiter(content)
+        async for chunk in stream:
+            buffer += chunk
+            if len(buffer) >= MULTIPART_PART_SIZE:
+                break
+        else:
+            # Small enough for a single request
+            await s3.put_object(Body=bytes(buffer), **upload_params)
+            return
+
+        upload = await s3.create_multipart_upload(**upload_params)
+        upload_id = upload["UploadId"]
+        target = {"Bucket": upload_params["Bucket"], "Key": upload_params["Key"]}
+        parts: list[dict[str, Any]] = []
+
+        async def upload_part(body: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await s3.upload_part(
+                Body=body, PartNumber=part_number, UploadId=upload_id, **target
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            await upload_part(bytes(buffer))
+            buffer.clear()
+            async for chunk in stream:
+                buffer += chunk
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    await upload_part(bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await upload_part(bytes(buffer))
+            await s3.complete_multipart_upload(
+                UploadId=upload_id, MultipartUpload={"Parts": parts}, **target
+            )
+        except BaseException:
+            # Don't leave orphaned parts accruing storage charges
+            await s3.abort_multipart_upload(UploadId=upload_id, **target)
+            raise
+
+    async def get_public_url(self, key: str) -> str:
+        """Return the CloudFront URL if configured, otherwise the S3 URL."""
+        if self.cloudfront_domain:
+            return f"https://{self.cloudfront_domain}/{key}"
+        else:
+            return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{key}"
+
     async def download(self, key: str) -> bytes:
         """Download file content from S3."""
         try:
@@ -165,6 +213,37 @@ class S3StorageProvider(StorageProvider):
             logger.error(f"Failed to download {key} from S3: {e}")
             raise StorageException(f"S3 download failed: {e}") from e
 
+    async def download_range(self, key: str, start: int, length: int) -> bytes:
+        """Download part of a file from S3 with a ranged GET."""
+        try:
+            session = self._get_session()
+            async with session.client(
+                "s3", config=self.config, endpoint_url=self.endpoint_url
+            ) as s3:
+                response = await s3.get_object(
+                    Bucket=self.bucket, Key=key, Range=f"bytes={start}-{start + length - 1}"
+                )
+                return await response["Body"].read()
+
+        except Exception as e:
+            logger.error(f"Failed to download {key} from S3: {e}")
+            raise StorageException(f"S3 download failed: {e}") from e
+
+    async def download_stream(self, key: str) -> AsyncIterator[bytes]:
+        """Download a file from S3 in chunks."""
+        try:
+            session = self._get_session()
+            async with session.client(
+                "s3", config=self.config, endpoint_url=self.endpoint_url
+            ) as s3:
+                response = await s3.get_object(Bucket=self.bucket, Key=key)
+                async for chunk in response["Body"].iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                    yield chunk
+
+        except Exception as e:
+            logger.error(f"Failed to download {key} from S3: {e}")
+            raise StorageException(f"S3 download failed: {e}") from e
+
     async def get_presigned_upload_url(
         self,
         key: str,
@@ -180,13 +259,18 @@ class S3StorageProvider(StorageProvider):
             async with session.client(
                 "s3", config=self.config, endpoint_url=self.endpoint_url
             ) as s3:
-                # Generate presigned POST for direct uploads with form fields
+                # Generate presigned POST for direct uploads with form fields.
+                # Every field sent must also be a condition of the policy.
+                fields = {"Content-Type": content_type}
+                for param, value in self.upload_config.items():
+                    if param in _POST_FORM_FIELDS and value is not None:
+                        fields[_POST_FORM_FIELDS[param]] = value
                 response = await s3.generate_presigned_post(
                     Bucket=self.bucket,
                     Key=key,
-                    Fields={"Content-Type": content_type, **self.upload_config},
+                    Fields=fields,
                     Conditions=[
-                        {"Content-Type": content_type},
+                        *({name: value} for name, value in fields.items()),
                         [
                             "content-length-range",
                             1,
@@ -198,6 +282,7 @@ class S3StorageProvider(StorageProvider):
 
                 return {
                     "url": response["url"],
+                    "method": "POST",
                     "fields": response["fields"],
                     "expires_at": (datetime.now(UTC) + expires_in).isoformat(),
                 }
@@ -248,6 +333,33 @@ class S3StorageProvider(StorageProvider):
             logger.error(f"Unexpected error deleting {key} from S3: {e}")
             raise StorageException(f"S3 delete failed: {e}") from e
 
+    async def move(self, source_key: str, dest_key: str) -> None:
+        """Copy a file to another key server-side, then delete the source."""
+        try:
+            session = self._get_session()
+            async with session.client(
+                "s3", config=self.config, endpoint_url=self.endpoint_url
+            ) as s3:
+                # Encryption and storage class are not copied unless requested
+                copy_params = {
+                    param: value
+                    for param, value in self.upload_config.items()
+                    if param in ("ServerSideEncryption", "SSEKMSKeyId", "StorageClass")
+                    and value is not None
+                }
+                await s3.copy_object(
+                    Bucket=self.bucket,
+                    Key=dest_key,
+                    CopySource={"Bucket": self.bucket, "Key": source_key},
+                    MetadataDirective="COPY",
+                    **copy_params,
+                )
+                await s3.delete_object(Bucket=self.bucket, Key=source_key)
+
+        except Exception as e:
+            logger.error(f"Failed to move {source_key} in S3: {e}")
+            raise StorageException(f"S3 move failed: {e}") from e
+
     async def exists(self, key: str) -> bool:
         """Check if file exists."""
         try:
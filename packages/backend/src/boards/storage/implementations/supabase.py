@@ -100,6 +100,11 @@ class SupabaseStorageProvider(StorageProvider):
             logger.error(f"Unexpected error uploading {key} to Supabase: {e}")
             raise StorageException(f"Supabase upload failed: {e}") from e
 
+    async def get_public_url(self, key: str) -> str:
+        """Return the public URL of a file in the bucket."""
+        client = await self._get_client()
+        return await client.storage.from_(self.bucket).get_public_url(key)
+
     async def download(self, key: str) -> bytes:
         """Download file content from Supabase storage."""
         try:
@@ -130,6 +135,7 @@ class SupabaseStorageProvider(StorageProvider):
 
             return {
                 "url": response["signed_url"],
+                "method": "PUT",
                 "fields": {},  # Supabase doesn't use form fields like S3
                 "expires_at": (datetime.now(UTC) + expires_in).isoformat(),
             }
@@ -172,6 +178,16 @@ class SupabaseStorageProvider(StorageProvider):
             logger.error(f"Unexpected error deleting {key} from Supabase: {e}")
             raise StorageException(f"Delete failed: {e}") from e
 
+    async def move(self, source_key: str, dest_key: str) -> None:
+        """Move a file within the bucket."""
+        try:
+            client = await self._get_client()
+            await client.storage.from_(self.bucket).move(source_key, dest_key)
+
+        except Exception as e:
+            logger.error(f"Failed to move {source_key} in Supabase: {e}")
+            raise StorageException(f"Move failed: {e}") from e
+
     async def exists(self, key: str) -> bool:
         """Check if file exists."""
         try:
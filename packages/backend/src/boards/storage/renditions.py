@@ -0,0 +1,247 @@
+"""Downscaled renditions of stored artifacts (thumbnails, poster frames).
+
+Decoding, resizing and encoding images is CPU-bound. Run in a worker thread or
+on the event loop, it stalls every other job sharing that process, so the
+functions here run in a process pool via `run_rendition`. They take and return
+plain bytes and paths so they can be sent to the pool.
+
+Video poster frames are extracted with ffmpeg, which must be on the PATH.
+
+`ensure_rendition` serves on-demand renditions (resized or transcoded images)
+of stored artifacts. Each rendition is rendered on first request and stored
+next to its source, so later requests read it straight from storage.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import io
+import math
+import multiprocessing
+import shutil
+import subprocess
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
+
+from PIL import Image, ImageOps
+
+from ..config import settings
+from ..logging import get_logger
+from .base import StorageException, StorageProvider
+
+logger = get_logger(__name__)
+
+# Output formats a rendition can be encoded as, with their content types
+RENDITION_FORMATS: dict[str, str] = {
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+}
+
+# Storage variant of uploaded and generated files; only these have renditions
+ORIGINAL_VARIANT = "original"
+
+DEFAULT_QUALITY = 80
+FFMPEG_TIMEOUT_SECONDS = 60
+
+
+class RenditionError(StorageException):
+    """The source could not be decoded or rendered."""
+
+    pass
+
+
+def render_image(
+    content: bytes,
+    *,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    fmt: str = "webp",
+    quality: int = DEFAULT_QUALITY,
+) -> bytes:
+    """Downscale an image to fit within max_width x max_height and re-encode it.
+
+    A missing bound leaves that dimension unconstrained. Images are never
+    upscaled. EXIF orientation is applied, since most encoders drop the tag.
+    """
+    if fmt not in RENDITION_FORMATS:
+        raise RenditionError(f"Unsupported rendition format: {fmt}")
+    try:
+        with Image.open(io.BytesIO(content)) as source:
+            # Lets the JPEG decoder downscale by a power of two while decoding
+            source.draft("RGB", _draft_size(source.size, max_width, max_height))
+            image = ImageOps.exif_transpose(source)
+            box = (max_width or image.width, max_height or image.height)
+            image.thumbnail(box, Image.Resampling.LANCZOS)
+            if fmt == "jpeg":
+                image = image.convert("RGB")
+            elif image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+            output = io.BytesIO()
+            image.save(output, format=fmt.upper(), quality=quality)
+            return output.getvalue()
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise RenditionError(f"Failed to render image: {e}") from e
+
+
+def _draft_size(
+    size: tuple[int, int], max_width: int | None, max_height: int | None
+) -> tuple[int, int]:
+    """Smallest decode size that still covers the box, whichever way EXIF rotates the image."""
+    width, height = size
+
+    def scale(w: int, h: int) -> float:
+        return min(1.0, (max_width or w) / w, (max_height or h) / h)
+
+    factor = max(scale(width, height), scale(height, width))
+    return (math.ceil(width * factor), math.ceil(height * factor))
+
+
+def extract_poster_frame(
+    video_path: str,
+    *,
+    max_width: int | None = None,
+    max_height: int | None = None,
+    fmt: str = "webp",
+    quality: int = DEFAULT_QUALITY,
+) -> bytes:
+    """Render the first frame of a video file like `render_image`."""
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RenditionError("ffmpeg is required to extract video poster frames")
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg,
+                "-v",
+                "error",
+                "-i",
+                video_path,
+                "-frames:v",
+                "1",
+                "-f",
+                "image2pipe",
+                "-vcodec",
+                "png",
+                "-",
+            ],
+            capture_output=True,
+            timeout=FFMPEG_TIMEOUT_SECONDS,
+            check=False,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise RenditionError("Timed out extracting video poster frame") from e
+    if result.returncode != 0 or not result.stdout:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise RenditionError(f"ffmpeg could not extract a frame: {stderr}")
+    return render_image(
+        result.stdout, max_width=max_width, max_height=max_height, fmt=fmt, quality=quality
+    )
+
+
+_pool: Executor | None = None
+
+
+def get_rendition_pool() -> Executor:
+    """Process pool shared by all renditions in this process (created on first use)."""
+    global _pool
+    if _pool is None:
+        # Worker processes are threaded; forking them could copy held locks
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.rendition_process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        logger.info("Started rendition process pool", workers=settings.rendition_process_workers)
+    return _pool
+
+
+async def run_rendition[T](fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a rendition function in the process pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_rendition_pool(), functools.partial(fn, *args, **kwargs))
+
+
+def shutdown_rendition_pool() -> None:
+    """Stop the rendition pool's processes, if it was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+def rendition_key(source_key: str, *, width: int | None, fmt: str) -> str:
+    """Storage key of a rendition, next to its source (e.g. `.../original_w512.webp`)."""
+    directory, _, variant = source_key.rpartition("/")
+    name = f"{variant}_w{width}.{fmt}" if width else f"{variant}.{fmt}"
+    return f"{directory}/{name}" if directory else name
+
+
+def is_rendition_source(source_key: str, metadata: Mapping[str, Any]) -> bool:
+    """Whether renditions may be made of a stored object.
+
+    Only original variants qualify. Renditions themselves (which record their
+    `source_key`) and derived variants such as thumbnails do not, so renditions
+    cannot be chained (`original_w512.webp_w256.webp`, ...).
+    """
+    if metadata.get("source_key"):
+        return False
+    if metadata.get("variant", ORIGINAL_VARIANT) != ORIGINAL_VARIANT:
+        return False
+    return source_key.rpartition("/")[2] == ORIGINAL_VARIANT
+
+
+# Renditions being rendered by this process, so concurrent identical requests
+# wait for one render instead of each starting their own
+_in_flight: dict[str, asyncio.Future[str]] = {}
+
+
+async def ensure_rendition(
+    provider: StorageProvider, source_key: str, *, width: int | None, fmt: str
+) -> str:
+    """Return the key of a rendition of an image, rendering and storing it if needed.
+
+    Args:
+        provider: Provider storing the source image (the rendition is stored there too)
+        source_key: Storage key of the source image
+        width: Maximum width in pixels (None keeps the source size)
+        fmt: Output format, one of RENDITION_FORMATS
+
+    Raises:
+        RenditionError: If the source is not an original variant or not a decodable image
+        StorageException: If reading the source or storing the rendition fails
+    """
+    if source_key.rpartition("/")[2] != ORIGINAL_VARIANT:
+        raise RenditionError(f"Renditions are only made of original variants: {source_key}")
+    key = rendition_key(source_key, width=width, fmt=fmt)
+    if key in _in_flight:
+        return await asyncio.shield(_in_flight[key])
+    if await provider.exists(key):
+        return key
+    # exists() may have yielded to another request for the same rendition
+    if key not in _in_flight:
+        task = asyncio.ensure_future(_render_and_store(provider, source_key, key, width, fmt))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    # Shielded: a client disconnecting must not cancel the render for the others
+    return await asyncio.shield(_in_flight[key])
+
+
+async def _render_and_store(
+    provider: StorageProvider, source_key: str, key: str, width: int | None, fmt: str
+) -> str:
+    content = await provider.download(source_key)
+    rendered = await run_rendition(render_image, content, max_width=width, fmt=fmt)
+    content_type = RENDITION_FORMATS[fmt]
+    await provider.upload(
+        key, rendered, content_type, {"content_type": content_type, "source_key": source_key}
+    )
+    logger.info(
+        "Stored rendition",
+        source_key=source_key,
+        storage_key=key,
+        source_bytes=len(content),
+        rendition_bytes=len(rendered),
+    )
+    return key
@@ -0,0 +1,559 @@
+"""Upload handling shared by the REST and GraphQL APIs.
+
+Validates uploaded files and records them as generations. Direct uploads go
+straight from the client to the storage provider. `reserve_direct_upload`
+creates a pending generation with a presigned upload, `complete_direct_upload`
+verifies the stored object and completes it, and `expire_direct_uploads`
+(run by the outbox relay, see workers/relay.py) fails reservations that were
+never completed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from .auth.context import AuthContext
+from .config import settings
+from .database.connection import get_async_session
+from .dbmodels import Boards, Generations
+from .generators.media_probe import sniff_mime_type
+from .jobs import repository as jobs_repo
+from .jobs.outbox import USER_UPLOAD_GENERATOR_PREFIX
+from .logging import get_logger
+from .storage.base import StorageException, StorageManager, UploadTarget
+from .storage.factory import create_storage_manager
+
+logger = get_logger(__name__)
+
+# Bytes needed to sniff a file's MIME type (see generators/media_probe.py)
+SNIFF_BYTES = 64
+
+# Time after its presigned upload expires for an upload in flight to finish
+# before the reservation is expired
+DIRECT_UPLOAD_GRACE = timedelta(minutes=5)
+
+
+def validate_mime_type(
+    content_type: str, artifact_type: str, filename: str | None
+) -> tuple[bool, str | None]:
+    """
+    Validate that MIME type matches the expected artifact type.
+
+    Args:
+        content_type: The MIME type to validate (e.g., "image/jpeg")
+        artifact_type: The expected artifact type (image, video, audio or text)
+        filename: Optional filename for additional context
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    # Define allowed MIME types for each artifact type
+    allowed_mime_types = {
+        "image": [
+            "image/jpeg",
+            "image/jpg",
+            "image/png",
+            "image/gif",
+            "image/webp",
+            "image/bmp",
+            "image/svg+xml",
+        ],
+        "video": [
+            "video/mp4",
+            "video/quicktime",
+            "video/x-msvideo",
+            "video/webm",
+            "video/mpeg",
+            "video/x-matroska",
+        ],
+        "audio": [
+            "audio/mpeg",
+            "audio/mp3",
+            "audio/wav",
+            "audio/ogg",
+            "audio/webm",
+            "audio/x-m4a",
+            "audio/mp4",
+        ],
+        "text": [
+            "text/plain",
+            "text/markdown",
+            "application/json",
+            "text/html",
+            "text/csv",
+        ],
+    }
+
+    # Normalize MIME type (remove charset, etc.)
+    mime_type = content_type.split(";")[0].strip().lower()
+
+    # Check if artifact type is supported
+    if artifact_type not in allowed_mime_types:
+        return False, f"Unsupported artifact type: {artifact_type}"
+
+    # Check if MIME type is allowed for this artifact type
+    if mime_type not in allowed_mime_types[artifact_type]:
+        # Also check for generic types
+        mime_category = mime_type.split("/")[0]
+        if mime_category != artifact_type:
+            return (
+                False,
+                f"MIME type '{mime_type}' does not match artifact type '{artifact_type}'",
+            )
+
+    return True, None
+
+
+_SHA256_PATTERN = re.compile(r"[0-9a-fA-F]{64}")
+
+# Declared MIME types that name the same container as a sniffed one
+_MIME_ALIASES = {
+    "image/jpeg": frozenset({"image/jpg"}),
+    "audio/mpeg": frozenset({"audio/mp3"}),
+    "audio/wav": frozenset({"audio/x-wav", "audio/wave"}),
+    "audio/ogg": frozenset({"video/ogg", "application/ogg"}),
+    "audio/mp4": frozenset({"audio/x-m4a"}),
+    "video/mp4": frozenset({"audio/mp4", "audio/x-m4a"}),
+    "video/webm": frozenset({"audio/webm"}),
+}
+
+
+def detect_content_type(head: bytes, declared: str | None) -> str:
+    """
+    Determine an upload's MIME type from its first bytes.
+
+    The sniffed type takes precedence over the client's claim, unless the claim
+    names the same container (e.g. audio/webm for a WebM file). Formats without
+    a signature, such as text, keep the declared type.
+
+    Args:
+        head: The first chunk of the file
+        declared: The MIME type sent by the client, if any
+
+    Returns:
+        The MIME type to validate and store the upload with
+    """
+    sniffed = sniff_mime_type(head)
+    if sniffed is None:
+        return declared or "application/octet-stream"
+    if declared:
+        mime_type = declared.split(";")[0].strip().lower()
+        if mime_type == sniffed or mime_type in _MIME_ALIASES.get(sniffed, ()):
+            return declared
+        logger.info("Upload content type overridden", declared=declared, sniffed=sniffed)
+    return sniffed
+
+
+def sanitize_filename(filename: str) -> str:
+    """
+    Sanitize filename to prevent path traversal and other security issues.
+
+    Returns:
+        Sanitized filename (basename only, no path components)
+    """
+    # Get basename only (remove any path components)
+    filename = os.path.basename(filename)
+
+    # Remove any null bytes
+    filename = filename.replace("\x00", "")
+
+    # Replace potentially dangerous characters (including backslash for Windows paths)
+    filename = re.sub(r'[<>:"|?*\\]', "_", filename)
+
+    # Remove leading/trailing whitespace and dots
+    filename = filename.strip(". ")
+
+    # If filename is empty after sanitization, use a default
+    if not filename:
+        filename = "uploaded_file"
+
+    return filename
+
+
+def check_mime_type(content_type: str, artifact_type: str, filename: str) -> None:
+    """Raise RuntimeError unless the MIME type is allowed for the artifact type."""
+    is_valid, error_msg = validate_mime_type(content_type, artifact_type, filename)
+    if not is_valid:
+        logger.warning(
+            "Invalid MIME type for artifact",
+            mime_type=content_type,
+            artifact_type=artifact_type,
+            reason=error_msg,
+        )
+        raise RuntimeError(f"Invalid file type: {error_msg}")
+
+
+async def check_board_upload_access(
+    session: AsyncSession, board_id: UUID, auth_context: AuthContext
+) -> None:
+    """Raise RuntimeError unless the user may upload to the board."""
+    # Validate board access
+    board_stmt = (
+        select(Boards).where(Boards.id == board_id).options(selectinload(Boards.board_members))
+    )
+    board = (await session.execute(board_stmt)).scalar_one_or_none()
+
+    if not board:
+        raise RuntimeError("Board not found")
+
+    # Check permissions (same as create_generation)
+    if not auth_context.user_id:
+        raise RuntimeError("User ID is required")
+
+    is_owner = board.owner_id == auth_context.user_id
+    is_editor = any(
+        m.user_id == auth_context.user_id and m.role in {"editor", "admin"}
+        for m in board.board_members
+    )
+
+    if not is_owner and not is_editor:
+        raise RuntimeError("Permission denied: You don't have permission to upload to this board")
+
+
+def new_upload_generation(
+    *,
+    auth_context: AuthContext,
+    board_id: UUID,
+    artifact_type: str,
+    filename: str,
+    content_type: str,
+    file_size: int | None,
+    user_description: str | None,
+    parent_generation_id: UUID | None,
+    upload_source: str,
+    source_url: str | None,
+) -> Generations:
+    """Build the pending generation of an upload."""
+    gen = Generations()
+    gen.tenant_id = auth_context.tenant_id
+    gen.board_id = board_id
+    gen.user_id = auth_context.user_id
+    gen.generator_name = f"{USER_UPLOAD_GENERATOR_PREFIX}{artifact_type}"
+    gen.artifact_type = artifact_type
+    gen.status = "pending"
+    gen.progress = Decimal(0.0)
+    gen.input_params = {
+        "upload_source": upload_source,
+        "original_filename": filename,
+        "source_url": source_url,
+        "user_description": user_description,
+    }
+    gen.output_metadata = {
+        "file_size": file_size,
+        "mime_type": content_type,
+        "upload_timestamp": datetime.now(UTC).isoformat(),
+    }
+    # If parent_generation_id is provided, add it to input_artifacts
+    if parent_generation_id:
+        gen.input_artifacts = [
+            {
+                "generation_id": str(parent_generation_id),
+                "role": "parent",
+                "artifact_type": artifact_type,
+            }
+        ]
+    else:
+        gen.input_artifacts = []
+    gen.started_at = datetime.now(UTC)
+    return gen
+
+
+def complete_upload_generation(
+    gen: Generations,
+    *,
+    storage_url: str,
+    file_size: int,
+    storage_key: str,
+    storage_provider: str,
+) -> None:
+    """Mark an upload's generation completed with its stored file."""
+    gen.storage_url = storage_url
+    gen.status = "completed"
+    gen.progress = Decimal(100.0)
+    gen.completed_at = datetime.now(UTC)
+
+    # Update metadata with storage details (reassigned so the change is
+    # tracked after the generation was flushed)
+    gen.output_metadata = {
+        **(gen.output_metadata or {}),
+        "file_size": file_size,
+        "storage_key": storage_key,
+        "storage_provider": storage_provider,
+    }
+
+
+async def reserve_direct_upload(
+    auth_context: AuthContext,
+    board_id: UUID,
+    artifact_type: str,
+    filename: str,
+    content_type: str,
+    size: int,
+    sha256: str | None,
+    user_description: str | None,
+    parent_generation_id: UUID | None,
+) -> tuple[Generations, UploadTarget]:
+    """Reserve a generation for a file the client uploads straight to storage.
+
+    The generation stays pending until `complete_direct_upload` verifies the
+    stored object, so the file's bytes never pass through the API.
+
+    Args:
+        auth_context: Authentication context for the request
+        board_id: UUID of the board to upload to
+        artifact_type: Type of artifact being uploaded
+        filename: Original filename
+        content_type: MIME type of the file
+        size: Exact size of the file in bytes
+        sha256: Optional hex SHA-256 digest the stored file must match
+        user_description: Optional user-provided description
+        parent_generation_id: Optional parent generation UUID
+
+    Returns:
+        The pending generation and the presigned upload for the file
+    """
+    filename = sanitize_filename(filename)
+    check_mime_type(content_type, artifact_type, filename)
+
+    if not 0 < size <= settings.max_upload_size:
+        raise RuntimeError(
+            f"File size ({size} bytes) must be between 1 and {settings.max_upload_size} bytes"
+        )
+    if sha256 is not None and not _SHA256_PATTERN.fullmatch(sha256):
+        raise RuntimeError("sha256 must be a hex-encoded SHA-256 digest")
+
+    async with get_async_session() as session:
+        await check_board_upload_access(session, board_id, auth_context)
+
+        gen = new_upload_generation(
+            auth_context=auth_context,
+            board_id=board_id,
+            artifact_type=artifact_type,
+            filename=filename,
+            content_type=content_type,
+            file_size=size,
+            user_description=user_description,
+            parent_generation_id=parent_generation_id,
+            upload_source="direct",
+            source_url=None,
+        )
+        session.add(gen)
+        await session.flush()  # Get ID
+
+        try:
+            target = await create_storage_manager().create_upload_target(
+                artifact_id=str(gen.id),
+                artifact_type=artifact_type,
+                content_type=content_type,
+                size=size,
+                tenant_id=str(auth_context.tenant_id),
+                board_id=str(board_id),
+                expires_in=timedelta(seconds=settings.direct_upload_expiry_seconds),
+            )
+        except StorageException as e:
+            raise RuntimeError(f"Upload not possible: {e}") from e
+
+        gen.output_metadata = {
+            **gen.output_metadata,
+            "sha256": sha256.lower() if sha256 else None,
+            "storage_key": target.storage_key,
+            "storage_provider": target.storage_provider,
+        }
+        await session.commit()
+        await session.refresh(gen)
+
+    logger.info(
+        "Direct upload reserved",
+        generation_id=str(gen.id),
+        storage_provider=target.storage_provider,
+        file_size=size,
+    )
+    return gen, target
+
+
+async def complete_direct_upload(auth_context: AuthContext, generation_id: UUID) -> Generations:
+    """Verify a direct upload reserved by `reserve_direct_upload` and complete it.
+
+    The uploaded object is moved to the artifact's permanent key first. It must
+    have the reserved size and content type (and SHA-256 digest, if one was
+    given). Otherwise the object is deleted and the generation fails. The
+    generation row stays locked until the upload is completed or rejected, so
+    concurrent completions of the same upload run one after the other.
+
+    Returns:
+        The completed generation
+    """
+    async with get_async_session() as session:
+        try:
+            gen = await jobs_repo.get_generation(session, generation_id, for_update=True)
+        except NoResultFound as e:
+            raise RuntimeError("Upload not found") from e
+
+        if (
+            gen.tenant_id != auth_context.tenant_id
+            or gen.user_id != auth_context.user_id
+            or (gen.input_params or {}).get("upload_source") != "direct"
+        ):
+            raise RuntimeError("Upload not found")
+        if gen.status == "completed":
+            # Completing twice (e.g. a client retry) is harmless
+            return gen
+        if gen.status != "pending":
+            raise RuntimeError(f"Upload is {gen.status}")
+
+        metadata = gen.output_metadata
+        storage_provider = metadata["storage_provider"]
+        storage_manager = create_storage_manager()
+
+        try:
+            # Moved before verifying, so the client cannot replace what was verified
+            storage_key = await storage_manager.finalize_upload(
+                metadata["storage_key"], storage_provider
+            )
+            stored = await storage_manager.get_artifact_metadata(storage_key, storage_provider)
+        except StorageException as e:
+            # Nothing uploaded yet; the client may still upload and retry
+            raise RuntimeError("Uploaded file not found in storage") from e
+
+        try:
+            await _verify_direct_upload(
+                storage_manager,
+                storage_key,
+                storage_provider,
+                stored,
+                size=metadata["file_size"],
+                content_type=metadata["mime_type"],
+                sha256=metadata.get("sha256"),
+            )
+            storage_url = await storage_manager.get_artifact_url(storage_key, storage_provider)
+        except (RuntimeError, StorageException) as e:
+            gen.status = "failed"
+            gen.error_message = str(e)
+            gen.completed_at = datetime.now(UTC)
+            await session.commit()
+            with suppress(StorageException):
+                await storage_manager.delete_artifact(storage_key, storage_provider)
+
+            logger.warning("Direct upload rejected", generation_id=str(gen.id), error=str(e))
+            raise RuntimeError(f"Upload failed: {e}") from e
+
+        complete_upload_generation(
+            gen,
+            storage_url=storage_url,
+            file_size=metadata["file_size"],
+            storage_key=storage_key,
+            storage_provider=storage_provider,
+        )
+        await jobs_repo.record_lineage(session, gen.id)
+        await session.commit()
+        await session.refresh(gen)
+
+    logger.info(
+        "Artifact uploaded",
+        generation_id=str(gen.id),
+        artifact_type=gen.artifact_type,
+        file_size=metadata["file_size"],
+        upload_source="direct",
+    )
+    return gen
+
+
+async def expire_direct_uploads(limit: int = 100) -> int:
+    """Fail direct uploads that were reserved but not completed in time.
+
+    A reservation expires `direct_upload_expiry_seconds` (the lifetime of its
+    presigned upload) plus DIRECT_UPLOAD_GRACE after it was made. Its
+    generation is marked failed and any uploaded file is deleted. Called
+    periodically by the outbox relay (see workers/relay.py).
+
+    Returns:
+        Number of reservations expired
+    """
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(seconds=settings.direct_upload_expiry_seconds) - DIRECT_UPLOAD_GRACE
+    async with get_async_session() as session:
+        stmt = (
+            select(Generations)
+            .where(
+                Generations.status == "pending",
+                Generations.generator_name.like(f"{USER_UPLOAD_GENERATOR_PREFIX}%"),
+                Generations.input_params["upload_source"].astext == "direct",
+                Generations.created_at < cutoff,
+            )
+            .order_by(Generations.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        expired = list((await session.execute(stmt)).scalars().all())
+        if not expired:
+            return 0
+        for gen in expired:
+            gen.status = "failed"
+            gen.error_message = "Upload was not completed before its reservation expired"
+            gen.completed_at = now
+        await session.commit()
+
+    storage_manager = create_storage_manager()
+    for gen in expired:
+        metadata = gen.output_metadata or {}
+        storage_key = metadata.get("storage_key")
+        storage_provider = metadata.get("storage_provider")
+        if not storage_key or not storage_provider:
+            continue
+        # The file may sit at its upload key or, if a completion was cut short, its final key
+        directory = storage_key.rpartition("/")[0]
+        for key in {storage_key, f"{directory}/original"}:
+            with suppress(StorageException):
+                await storage_manager.delete_artifact(key, storage_provider)
+
+    logger.info("Expired direct uploads", generation_ids=[str(gen.id) for gen in expired])
+    return len(expired)
+
+
+async def _verify_direct_upload(
+    storage_manager: StorageManager,
+    storage_key: str,
+    storage_provider: str,
+    stored: dict[str, Any],
+    *,
+    size: int,
+    content_type: str,
+    sha256: str | None,
+) -> None:
+    """Check a directly uploaded object against its reservation.
+
+    The type is sniffed from the object's first bytes, like other uploads, as
+    the stored content type is whatever the client sent. The SHA-256 digest is
+    computed over a streamed read, only when the client gave one.
+    """
+    if stored.get("size") != size:
+        raise RuntimeError(f"Uploaded file is {stored.get('size')} bytes, expected {size}")
+
+    stored_type = stored.get("content_type")
+    if stored_type and stored_type.split(";")[0].strip().lower() != content_type.lower():
+        raise RuntimeError(f"Uploaded file has type {stored_type}, expected {content_type}")
+
+    provider = storage_manager.providers[storage_provider]
+    head = await provider.download_range(storage_key, 0, SNIFF_BYTES)
+    detected = detect_content_type(head, content_type)
+    if detected != content_type:
+        raise RuntimeError(f"Uploaded file is {detected}, expected {content_type}")
+
+    if sha256:
+        digest = hashlib.sha256()
+        async for chunk in provider.download_stream(storage_key):
+            digest.update(chunk)
+        if digest.hexdigest() != sha256:
+            raise RuntimeError("Uploaded file does not match its SHA-256 checksum")
@@ -2,24 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 import traceback
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import dramatiq
 from dramatiq import actor
 from dramatiq.brokers.redis import RedisBroker
 from dramatiq.middleware import AsyncIO
+from pydantic import ValidationError
+from redis.exceptions import RedisError
 
 from ..config import Settings
 from ..database.connection import get_async_session
+from ..generators.failover import get_failover_router
 from ..generators.registry import registry as generator_registry
 from ..jobs import repository as jobs_repo
+from ..jobs.admission import AdmissionController, PendingJob
+from ..jobs.cancellation import GenerationCancelled, is_cancellation_requested
+from ..jobs.heartbeats import GenerationLease
+from ..jobs.retries import PermanentGenerationError, remaining_retries
 from ..logging import get_logger
 from ..progress.models import ProgressUpdate
 from ..progress.publisher import ProgressPublisher
+from ..redis_pool import get_redis_client
 from ..storage.factory import create_storage_manager
+from ..storage.renditions import RenditionError
 from .context import GeneratorExecutionContext
-from .middleware import GeneratorLoaderMiddleware
+from .middleware import GenerationRetries, GeneratorLoaderMiddleware
+from .queues import (
+    DEFAULT_QUEUE,
+    ENQUEUED_GENERATIONS_KEY,
+    GENERATION_QUEUES,
+    PREVIEW_QUEUE,
+    enqueue_many,
+    queue_for_generator,
+    record_enqueued,
+    send_to_queue,
+)
+from .thumbnails import THUMBNAIL_ARTIFACT_TYPES, create_thumbnail
+
+if TYPE_CHECKING:
+    from dramatiq import Message
+
+    from ..generators.base import BaseGenerator
 
 logger = get_logger(__name__)
 
@@ -36,15 +63,34 @@ broker.add_middleware(AsyncIO())
 # Middleware runs before_worker_boot hook once per worker process at startup
 broker.add_middleware(GeneratorLoaderMiddleware())
 
+# Lets process_generation tell a retried failure from a final one (see jobs/retries.py)
+broker.add_middleware(GenerationRetries({"process_generation"}))
 
-@actor(queue_name="boards-jobs", max_retries=3, min_backoff=5000, max_backoff=30000)
+# Declare every routing queue so workers consume them and producers can enqueue
+# to them (see queues.py); process_generation itself is declared on DEFAULT_QUEUE
+for _queue_name in GENERATION_QUEUES:
+    broker.declare_queue(_queue_name)
+
+
+@actor(
+    queue_name=DEFAULT_QUEUE,
+    max_retries=3,
+    min_backoff=5000,
+    max_backoff=30000,
+    throws=(PermanentGenerationError,),
+)
 async def process_generation(generation_id: str) -> None:
     """Entry actor: load job context and dispatch to the generator.
 
     Retry policy:
-    - max_retries: 3 attempts
+    - max_retries: 3 retries after the first attempt
     - min_backoff: 5 seconds
     - max_backoff: 30 seconds
+    - PermanentGenerationError (unknown generator, invalid inputs) is not retried
+
+    A retried attempt reattaches to the provider job submitted by the previous
+    attempt (its external_job_id) instead of resubmitting; see jobs/retries.py.
+    The generation is only marked failed once no retries are left.
 
     Note: This is an async actor. Dramatiq manages the event loop lifecycle properly,
     avoiding the event loop conflicts that would occur with asyncio.run().
@@ -54,8 +100,33 @@ async def process_generation(generation_id: str) -> None:
     logger.info("Starting generation processing", generation_id=generation_id)
 
     publisher = ProgressPublisher(settings)
+    context: GeneratorExecutionContext | None = None
+    lease: GenerationLease | None = None
+    retrying = False
+    duplicate = False
 
     try:
+        await _record_queue_wait(generation_id)
+
+        # Skip jobs that were cancelled while queued (before marking them processing)
+        if await _cancelled_while_queued(generation_id):
+            logger.info("Skipping cancelled generation", generation_id=generation_id)
+            return
+
+        # Hold a heartbeat lease while running (see jobs/heartbeats.py)
+        lease = GenerationLease(
+            generation_id,
+            ttl_seconds=settings.generation_lease_ttl_seconds,
+            interval_seconds=settings.generation_heartbeat_interval,
+        )
+        if not await _acquire_lease(lease):
+            duplicate = True
+            logger.info(
+                "Generation is running or finished on another worker; skipping duplicate",
+                generation_id=generation_id,
+            )
+            return
+
         # Initialize processing
         await publisher.publish_progress(
             generation_id,
@@ -78,6 +149,8 @@ async def process_generation(generation_id: str) -> None:
             board_id = gen.board_id
             user_id = gen.user_id
             artifact_type = gen.artifact_type
+            external_job_id = gen.external_job_id
+            external_job_generator = gen.external_job_generator
 
         # Initialize storage manager
         # This will use the default storage configuration from environment/config
@@ -88,37 +161,43 @@ async def process_generation(generation_id: str) -> None:
         if generator is None:
             error_msg = "Unknown generator"
             logger.error(error_msg, generator_name=generator_name)
-            raise RuntimeError(f"Unknown generator: {generator_name}")
+            raise PermanentGenerationError(f"Unknown generator: {generator_name}")
 
         # Build and validate typed inputs
         # First resolve any artifact fields (generation IDs -> artifact objects)
         # This happens automatically via type introspection
-        lineage_metadata: list[dict[str, Any]] = []
-        try:
-            input_schema = generator.get_input_schema()
+        # Only invalid inputs are permanent; database errors propagate and are retried.
+        input_schema = generator.get_input_schema()
 
-            # Automatically resolve generation IDs to artifacts before validation
-            from ..generators.artifact_resolution import resolve_input_artifacts
+        # Automatically resolve generation IDs to artifacts before validation
+        from ..generators.artifact_resolution import resolve_input_artifacts
 
-            async with get_async_session() as session:
+        async with get_async_session() as session:
+            try:
                 resolved_params, lineage_metadata = await resolve_input_artifacts(
                     input_params,
                     input_schema,  # Schema is introspected to find artifact fields
                     session,
                     tenant_id,
                 )
+            except ValueError as e:
+                # Missing, foreign or unfinished input artifacts
+                logger.error("Invalid input parameters", generation_id=generation_id, error=str(e))
+                raise PermanentGenerationError(f"Invalid input parameters: {e}") from e
+
+            # Store lineage metadata in the generation
+            if lineage_metadata:
+                generation = await jobs_repo.get_generation(session, generation_id)
+                generation.input_artifacts = lineage_metadata
+                await session.flush()
+                await jobs_repo.record_lineage(session, generation_id)
+                await session.commit()
 
-                # Store lineage metadata in the generation
-                if lineage_metadata:
-                    generation = await jobs_repo.get_generation(session, generation_id)
-                    generation.input_artifacts = lineage_metadata
-                    await session.commit()
-
+        try:
             typed_inputs = input_schema.model_validate(resolved_params)
-        except Exception as e:
-            error_msg = "Invalid input parameters"
-            logger.error(error_msg, generation_id=generation_id, error=str(e))
-            raise ValueError(f"Invalid input parameters: {e}") from e
+        except ValidationError as e:
+            logger.error("Invalid input parameters", generation_id=generation_id, error=str(e))
+            raise PermanentGenerationError(f"Invalid input parameters: {e}") from e
 
         # Build context and run generator
         context = GeneratorExecutionContext(
@@ -131,10 +210,11 @@ async def process_generation(generation_id: str) -> None:
             generator_name,
             artifact_type,
             input_params,
+            external_job_id=external_job_id,
+            external_job_generator=external_job_generator,
         )
 
-        await publisher.publish_progress(
-            generation_id,
+        await context.publish_progress(
             ProgressUpdate(
                 job_id=generation_id,
                 status="processing",
@@ -152,10 +232,13 @@ async def process_generation(generation_id: str) -> None:
         )
         # TODO: Consider implementing credit refund logic on failure
         # await refund_credits(gen.user_id, gen.estimated_cost)
-        output = await generator.generate(typed_inputs, context)
+        # Fails over to equivalent generators if configured (see generators/failover.py)
+        output, served_by = await get_failover_router().run(
+            generator, typed_inputs, resolved_params, context
+        )
         logger.info(
             "Generator completed successfully",
-            generator_name=generator_name,
+            generator_name=served_by.name,
             generation_id=generation_id,
             artifact_count=len(output.outputs),
         )
@@ -183,6 +266,9 @@ async def process_generation(generation_id: str) -> None:
         storage_url = artifact.storage_url
         output_metadata = artifact.model_dump()
 
+        if served_by is not generator:
+            output_metadata["served_by_generator"] = served_by.name
+
         # If this was a batch generation, add batch metadata to primary generation
         if context._batch_id is not None:
             output_metadata["batch_id"] = context._batch_id
@@ -234,6 +320,11 @@ async def process_generation(generation_id: str) -> None:
 
         logger.info("Job finalized successfully", generation_id=generation_id)
 
+        if settings.generation_thumbnails_enabled:
+            _enqueue_thumbnails(
+                list(dict.fromkeys(art.generation_id for art in output.outputs)), artifact_type
+            )
+
         # Publish completion (DB already updated by finalize_success)
         await publisher.publish_only(
             generation_id,
@@ -246,29 +337,293 @@ async def process_generation(generation_id: str) -> None:
             ),
         )
 
+    except asyncio.CancelledError:
+        if lease is None or not lease.lost:
+            raise
+        # The heartbeat lost the lease to another delivery, which now owns the
+        # generation (and its admission slot); leave the job to it
+        duplicate = True
+        task = asyncio.current_task()
+        if task is not None:
+            task.uncancel()
+        logger.warning(
+            "Generation lease was lost while running; stopped this run",
+            generation_id=generation_id,
+        )
+
+    except GenerationCancelled:
+        # The API already marked the generation cancelled; just notify subscribers
+        logger.info("Generation cancelled while running", generation_id=generation_id)
+        await publisher.publish_only(
+            generation_id,
+            ProgressUpdate(
+                job_id=generation_id,
+                status="cancelled",
+                progress=0.0,
+                phase="finalizing",
+                message="Cancelled by user",
+            ),
+        )
+
     except Exception as e:
+        retrying = (
+            not isinstance(e, PermanentGenerationError) and remaining_retries(generation_id) > 0
+        )
         # Log the full traceback for debugging
         logger.error(
             "Job failed with error",
             generation_id=generation_id,
             error=str(e),
+            retrying=retrying,
             traceback=traceback.format_exc(),
         )
 
-        # Publish failure status (this also persists to DB via ProgressPublisher)
+        if retrying and context is not None:
+            try:
+                await context.discard_failed_provider_job()
+            except Exception as discard_error:
+                logger.error("Failed to discard provider job", error=str(discard_error))
+
+        # Publish failure status (this also persists to DB via ProgressPublisher).
+        # A failure that will be retried leaves the generation processing.
         try:
-            await publisher.publish_progress(
-                generation_id,
-                ProgressUpdate(
+            if retrying:
+                update = ProgressUpdate(
+                    job_id=generation_id,
+                    status="processing",
+                    progress=0.0,
+                    phase="processing",
+                    message=f"Retrying after error: {e}",
+                )
+            else:
+                update = ProgressUpdate(
                     job_id=generation_id,
                     status="failed",
                     progress=0.0,
                     phase="finalizing",
                     message=str(e),
-                ),
-            )
+                )
+            await publisher.publish_progress(generation_id, update)
         except Exception as pub_error:
             logger.error("Failed to publish error status", error=str(pub_error))
 
+        if not retrying and context is not None and context._batch_id is not None:
+            await _fail_batch_generations(generation_id, str(e))
+
         # Re-raise for Dramatiq retry mechanism
-        # raise
+        raise
+
+    finally:
+        if lease is not None and not duplicate:
+            await _release_lease(lease, finished=not retrying)
+        # A retried job keeps its admission slot until its last attempt
+        if not retrying and not duplicate:
+            await _release_admission_slot(generation_id)
+
+
+@actor(queue_name=PREVIEW_QUEUE, max_retries=3, min_backoff=5000, throws=(RenditionError,))
+async def generate_thumbnail(generation_id: str) -> None:
+    """Render the thumbnail of a completed generation (see thumbnails.py)."""
+    await create_thumbnail(generation_id)
+
+
+def _enqueue_thumbnails(generation_ids: list[str], artifact_type: str) -> None:
+    if artifact_type not in THUMBNAIL_ARTIFACT_TYPES:
+        return
+    try:
+        enqueue_many(broker, [generate_thumbnail.message(gen_id) for gen_id in generation_ids])
+    except RedisError as e:
+        # The generation is complete either way; tiles fall back to the original
+        logger.warning(
+            "Failed to enqueue thumbnail jobs", generation_ids=generation_ids, error=str(e)
+        )
+
+
+def enqueue_generation(generation_id: str, generator: BaseGenerator | None) -> Message[Any]:
+    """Enqueue a generation job on the queue chosen for its generator.
+
+    Args:
+        generation_id: ID of the generation to process
+        generator: The generation's generator (None routes to the default queue)
+
+    Returns:
+        The enqueued Dramatiq message
+    """
+    return send_to_queue(process_generation, queue_for_generator(generator), generation_id)
+
+
+def enqueue_generations(jobs: list[PendingJob]) -> list[Message[Any]]:
+    """Enqueue several generation jobs, each on its generator's queue, in one round trip."""
+    messages = [
+        process_generation.message(job.generation_id).copy(
+            queue_name=queue_for_generator(generator_registry.get(job.generator_name))
+        )
+        for job in jobs
+    ]
+    enqueued = enqueue_many(broker, messages)
+    record_enqueued(broker, enqueued)
+    return enqueued
+
+
+def _enqueue_dispatched(jobs: list[PendingJob]) -> None:
+    if not jobs:
+        return
+    for job, message in zip(jobs, enqueue_generations(jobs), strict=True):
+        logger.info(
+            "Generation job enqueued",
+            generation_id=job.generation_id,
+            tenant_id=job.tenant_id,
+            queue_name=message.queue_name,
+        )
+
+
+async def admit_generations(jobs: list[PendingJob]) -> set[str]:
+    """Submit new generations through admission control (see jobs/admission.py).
+
+    Jobs are enqueued now if their tenant and user are below their in-flight
+    limits; otherwise they are deferred and enqueued when a slot frees up. If
+    admission control is disabled or Redis is unavailable, the jobs are
+    enqueued directly. Enqueue errors propagate to the caller.
+
+    Returns:
+        IDs of the given jobs that were enqueued now (the rest were deferred)
+    """
+    if settings.generation_admission_enabled:
+        try:
+            dispatched = await AdmissionController.from_settings(settings).submit_many(jobs)
+        except RedisError as e:
+            logger.warning(
+                "Admission control unavailable, enqueueing directly",
+                generation_ids=[job.generation_id for job in jobs],
+                error=str(e),
+            )
+        else:
+            _enqueue_dispatched(dispatched)
+            dispatched_ids = {item.generation_id for item in dispatched}
+            admitted = {job.generation_id for job in jobs} & dispatched_ids
+            for job in jobs:
+                if job.generation_id not in admitted:
+                    logger.info(
+                        "Generation deferred by admission control",
+                        generation_id=job.generation_id,
+                        tenant_id=job.tenant_id,
+                        user_id=job.user_id,
+                    )
+            return admitted
+
+    _enqueue_dispatched(jobs)
+    return {job.generation_id for job in jobs}
+
+
+async def admit_generation(
+    generation_id: str, tenant_id: str, user_id: str, generator_name: str
+) -> bool:
+    """Submit one new generation through admission control (see `admit_generations`).
+
+    Returns:
+        True if the job was enqueued now, False if it was deferred
+    """
+    job = PendingJob(
+        generation_id=generation_id,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        generator_name=generator_name,
+        submitted_at=time.time(),
+    )
+    return generation_id in await admit_generations([job])
+
+
+async def _acquire_lease(lease: GenerationLease) -> bool:
+    """Take a generation's heartbeat lease.
+
+    Returns False if another delivery of the job holds the lease (or already
+    finished it). If Redis is unavailable the job runs without a lease.
+    """
+    try:
+        return await lease.acquire()
+    except RedisError as e:
+        logger.warning(
+            "Failed to acquire generation lease", generation_id=lease.generation_id, error=str(e)
+        )
+        return True
+
+
+async def _cancelled_while_queued(generation_id: str) -> bool:
+    """Check for a cancellation request before starting a job.
+
+    If Redis is unavailable the job starts; a cancellation is still noticed
+    by the checks while it runs.
+    """
+    try:
+        return await is_cancellation_requested(generation_id)
+    except RedisError as e:
+        logger.warning(
+            "Failed to check cancellation signal", generation_id=generation_id, error=str(e)
+        )
+        return False
+
+
+async def _release_lease(lease: GenerationLease, *, finished: bool) -> None:
+    try:
+        await lease.release(finished=finished)
+    except RedisError as e:
+        # The lease expires on its own; the reaper then finds the generation finished
+        logger.warning(
+            "Failed to release generation lease", generation_id=lease.generation_id, error=str(e)
+        )
+
+
+async def _fail_batch_generations(generation_id: str, error_message: str) -> None:
+    """Fail the batch outputs a failed generation left behind."""
+    try:
+        async with get_async_session() as session:
+            await jobs_repo.fail_batch_generations(
+                session, generation_id, error_message=error_message
+            )
+            await session.commit()
+    except Exception as e:
+        logger.error(
+            "Failed to mark batch generations failed", generation_id=generation_id, error=str(e)
+        )
+
+
+async def _record_queue_wait(generation_id: str) -> None:
+    try:
+        # The message reached a worker, so the sweeper must not re-enqueue it (see queues.py)
+        await get_redis_client().hdel(ENQUEUED_GENERATIONS_KEY, generation_id)
+        if not settings.generation_admission_enabled:
+            return
+        wait = await AdmissionController.from_settings(settings).record_start(generation_id)
+    except RedisError as e:
+        logger.warning("Failed to record queue wait", generation_id=generation_id, error=str(e))
+        return
+    if wait is not None:
+        logger.info("Generation started", generation_id=generation_id, queue_wait_seconds=wait)
+
+
+async def dispatch_deferred_generations() -> int:
+    """Enqueue deferred generations that fit into free slots (see jobs/admission.py).
+
+    Returns:
+        Number of generations enqueued
+    """
+    if not settings.generation_admission_enabled:
+        return 0
+    dispatched = await AdmissionController.from_settings(settings).dispatch()
+    _enqueue_dispatched(dispatched)
+    return len(dispatched)
+
+
+async def _release_admission_slot(generation_id: str) -> None:
+    if not settings.generation_admission_enabled:
+        return
+    try:
+        dispatched = await AdmissionController.from_settings(settings).release(generation_id)
+    except RedisError as e:
+        # The slot lease expires on its own; deferred jobs go out on the next
+        # release or the relay's periodic dispatch
+        logger.warning(
+            "Failed to release admission slot", generation_id=generation_id, error=str(e)
+        )
+        return
+    _enqueue_dispatched(dispatched)
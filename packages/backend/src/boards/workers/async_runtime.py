@@ -0,0 +1,287 @@
+"""Async-native worker runtime: many generations per event loop.
+
+Generation jobs spend nearly all their time waiting on providers, storage and
+the database. Dramatiq's worker runs one message per thread, so a process with
+8 threads has at most 8 jobs in flight even though its event loop is idle most
+of the time. `AsyncWorker` instead prefetches up to `concurrency` messages
+(split between its queues) and runs each async actor as a task on a single
+event loop. Every job in the process therefore shares one DB engine and
+connection pool (the async engine is per thread, see database/connection.py)
+and one set of provider HTTP clients.
+
+Messages go through the broker's middleware as in a Dramatiq worker, so
+retries, admission bookkeeping and the generator loader behave the same. The
+exceptions are middleware that work by interrupting threads (TimeLimit and
+ShutdownNotifications). Time limits are enforced with `asyncio.wait_for`
+instead. Each consumer is only touched from its own thread, because Dramatiq
+consumers are not thread-safe.
+
+Start it with `boards-worker --async --concurrency 200`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import signal
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from dramatiq.common import current_millis, dq_name, q_name
+from dramatiq.errors import ActorNotFound, ConnectionError
+from dramatiq.middleware import (
+    AsyncIO,
+    Middleware,
+    ShutdownNotifications,
+    SkipMessage,
+    TimeLimit,
+    TimeLimitExceeded,
+)
+
+from ..http_client import close_http_client
+from ..logging import get_logger
+
+if TYPE_CHECKING:
+    from dramatiq import Broker, Consumer, MessageProxy
+
+logger = get_logger(__name__)
+
+# Middleware that interrupt worker threads or manage Dramatiq's own event loop
+# thread; they do not apply to tasks on this runtime's loop.
+_THREAD_MIDDLEWARE = (TimeLimit, ShutdownNotifications, AsyncIO)
+
+# Seconds to wait before recreating a consumer after a connection error
+CONSUMER_RESTART_DELAY = 3.0
+
+
+class AsyncWorker:
+    """Runs async actors as tasks on one event loop, up to `concurrency` at a time."""
+
+    def __init__(
+        self,
+        broker: Broker,
+        *,
+        queues: Iterable[str],
+        concurrency: int = 100,
+        worker_timeout: int = 1000,
+    ) -> None:
+        self.broker = broker
+        self.queues = list(queues)
+        self.concurrency = concurrency
+        # Each queue's consumer prefetches its share of the concurrency, so the
+        # worker does not hold messages that another worker could be running
+        self.prefetch = max(1, -(-concurrency // max(1, len(self.queues))))
+        self.worker_timeout = worker_timeout
+        self.middleware: list[Middleware] = [
+            m for m in broker.middleware if not isinstance(m, _THREAD_MIDDLEWARE)
+        ]
+        time_limit = next((m for m in broker.middleware if isinstance(m, TimeLimit)), None)
+        self.default_time_limit: int | None = time_limit.time_limit if time_limit else None
+        self._slots = asyncio.Semaphore(concurrency)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stopping = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    def stop(self) -> None:
+        """Stop fetching messages; `run` returns once in-flight jobs finish."""
+        self._stopping.set()
+
+    async def run(self) -> None:
+        """Consume the queues (and their delay queues) until `stop` is called."""
+        self._emit("before", "worker_boot", self)
+        self._emit("after", "worker_boot", self)
+        logger.info("Async worker started", queues=self.queues, concurrency=self.concurrency)
+        try:
+            consumers = [self._consume(queue) for queue in self.queues]
+            consumers += [self._consume(dq_name(queue)) for queue in self.queues]
+            await asyncio.gather(*consumers)
+        finally:
+            self._emit("before", "worker_shutdown", self)
+            # Jobs on this loop shared one HTTP client (see http_client.py)
+            await close_http_client()
+            self._emit("after", "worker_shutdown", self)
+            logger.info("Async worker stopped")
+
+    async def _consume(self, queue_name: str) -> None:
+        # All calls on a consumer happen on this one thread
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"consumer-{queue_name}")
+        loop = asyncio.get_running_loop()
+        delayed: list[tuple[int, int, MessageProxy]] = []
+        order = itertools.count()
+        is_delay_queue = queue_name == dq_name(queue_name)
+
+        try:
+            while not self._stopping.is_set():
+                try:
+                    consumer = await loop.run_in_executor(
+                        executor,
+                        lambda: self.broker.consume(
+                            queue_name, prefetch=self.prefetch, timeout=self.worker_timeout
+                        ),
+                    )
+                    while not self._stopping.is_set():
+                        if not is_delay_queue:
+                            await self._slots.acquire()
+                            if self._stopping.is_set():
+                                self._slots.release()
+                                break
+                        message = await loop.run_in_executor(executor, next, consumer)
+                        if message is None:
+                            if not is_delay_queue:
+                                self._slots.release()
+                        elif "eta" in message.options:
+                            self.broker.emit_before("delay_message", message)
+                            heapq.heappush(delayed, (message.options["eta"], next(order), message))
+                        else:
+                            self._start(message, consumer, executor)
+                        await self._enqueue_due(delayed, consumer, executor)
+                except ConnectionError as e:
+                    logger.error("Consumer connection error", queue_name=queue_name, error=str(e))
+                    await asyncio.sleep(CONSUMER_RESTART_DELAY)
+                    continue
+
+                # In-flight jobs ack through this consumer, so wait for them first
+                if self._tasks:
+                    logger.info("Waiting for in-flight jobs", count=len(self._tasks))
+                    await asyncio.gather(*self._tasks, return_exceptions=True)
+                if delayed:
+                    await loop.run_in_executor(
+                        executor, consumer.requeue, [message for _, _, message in delayed]
+                    )
+                await loop.run_in_executor(executor, consumer.close)
+        finally:
+            executor.shutdown(wait=False)
+
+    async def _enqueue_due(
+        self,
+        delayed: list[tuple[int, int, MessageProxy]],
+        consumer: Consumer,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        """Move delayed messages whose eta has passed back to their queue."""
+        while delayed and delayed[0][0] <= current_millis():
+            _, _, message = heapq.heappop(delayed)
+            new_message = message.copy(queue_name=q_name(message.queue_name))
+            del new_message.options["eta"]
+            self.broker.enqueue(new_message)
+            await self._post_process(message, consumer, executor)
+
+    def _start(
+        self, message: MessageProxy, consumer: Consumer, executor: ThreadPoolExecutor
+    ) -> None:
+        task = asyncio.create_task(self._process(message, consumer, executor))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _process(
+        self, message: MessageProxy, consumer: Consumer, executor: ThreadPoolExecutor
+    ) -> None:
+        try:
+            try:
+                actor = self.broker.get_actor(message.actor_name)
+            except ActorNotFound:
+                logger.error(
+                    "Received message for undefined actor; moving it to the DLQ",
+                    actor_name=message.actor_name,
+                )
+                message.fail()
+                return
+
+            try:
+                self._emit("before", "process_message", message)
+                result = None
+                if not message.failed:
+                    result = await self._call(actor, message)
+                self._emit("after", "process_message", message, result=result)
+            except SkipMessage:
+                self._emit("after", "skip_message", message)
+            # TimeLimitExceeded is a BaseException, like Dramatiq's other interrupts
+            except (Exception, TimeLimitExceeded) as e:
+                message.stuff_exception(e)
+                throws = message.options.get("throws") or actor.options.get("throws")
+                if not (throws and isinstance(e, throws)):
+                    logger.error(
+                        "Failed to process message",
+                        message_id=message.message_id,
+                        actor_name=message.actor_name,
+                        error=str(e),
+                        exc_info=True,
+                    )
+                self._emit("after", "process_message", message, exception=e)
+        finally:
+            try:
+                await self._post_process(message, consumer, executor)
+            finally:
+                self._slots.release()
+
+    async def _call(self, actor: Any, message: MessageProxy) -> Any:
+        # Async actors are wrapped to run on Dramatiq's event loop thread; run
+        # the underlying coroutine function on this loop instead
+        fn = getattr(actor.fn, "__wrapped__", None)
+        if fn is not None and inspect.iscoroutinefunction(fn):
+            call = fn(*message.args, **message.kwargs)
+        else:
+            call = asyncio.to_thread(actor.fn, *message.args, **message.kwargs)
+
+        time_limit = message.options.get(
+            "time_limit", actor.options.get("time_limit", self.default_time_limit)
+        )
+        if not time_limit:
+            return await call
+        try:
+            return await asyncio.wait_for(call, timeout=time_limit / 1000)
+        except TimeoutError:
+            raise TimeLimitExceeded() from None
+
+    async def _post_process(
+        self, message: MessageProxy, consumer: Consumer, executor: ThreadPoolExecutor
+    ) -> None:
+        """Ack or (if it failed) nack a message, retrying while the broker is unreachable."""
+        loop = asyncio.get_running_loop()
+        action = "nack" if message.failed else "ack"
+        while True:
+            try:
+                self.broker.emit_before(action, message)
+                await loop.run_in_executor(executor, getattr(consumer, action), message)
+                self.broker.emit_after(action, message)
+                return
+            except ConnectionError as e:
+                logger.warning(
+                    "Failed to acknowledge message; retrying",
+                    message_id=message.message_id,
+                    error=str(e),
+                )
+                await asyncio.sleep(CONSUMER_RESTART_DELAY)
+
+    def _emit(self, when: str, signal_name: str, *args: Any, **kwargs: Any) -> None:
+        # Mirrors Broker.emit_before/emit_after over the applicable middleware
+        hook = f"{when}_{signal_name}"
+        if when == "before":
+            for middleware in self.middleware:
+                getattr(middleware, hook)(self.broker, *args, **kwargs)
+            return
+        for middleware in reversed(self.middleware):
+            try:
+                getattr(middleware, hook)(self.broker, *args, **kwargs)
+            except Exception:
+                logger.error("Unexpected failure in middleware", hook=hook, exc_info=True)
+
+
+def run_async_worker(queues: Iterable[str], concurrency: int) -> None:
+    """Run an AsyncWorker for the generation actors until SIGINT or SIGTERM."""
+    from .actors import broker
+
+    async def main() -> None:
+        worker = AsyncWorker(broker, queues=queues, concurrency=concurrency)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(main())
@@ -14,12 +14,15 @@ For auto-reload during development, use a file watcher like entr or nodemon:
     nodemon --watch packages/backend/src --exec "uv run boards-worker"
 """
 
+import subprocess
 import sys
+import time
 
 import click
 
 from boards import __version__
 from boards.logging import configure_logging, get_logger
+from boards.workers.queues import WORKER_QUEUES
 
 logger = get_logger(__name__)
 
@@ -71,6 +74,99 @@ def start_worker(
         sys.argv = original_argv
 
 
+def start_async_worker(concurrency: int, queue_list: list[str], log_level: str) -> None:
+    """Run the async worker runtime in this process."""
+    configure_logging(debug=(log_level == "debug"))
+
+    from boards.workers.async_runtime import run_async_worker
+
+    try:
+        run_async_worker(queue_list, concurrency)
+    except KeyboardInterrupt:
+        logger.info("Worker shutdown requested by user")
+
+
+def start_pools(
+    pools: list[tuple[list[str], int]],
+    processes: int,
+    async_mode: bool = False,
+    log_level: str = "info",
+) -> None:
+    """Run one worker pool per (queues, threads) entry and supervise them.
+
+    Each pool is a separate `dramatiq` invocation, so long-running jobs on one
+    pool's queues cannot occupy the threads serving another pool's queues. In
+    async mode the number is the concurrency of each of the pool's processes,
+    which each run the async runtime. If any pool exits, the others are stopped
+    and its exit code is returned.
+    """
+    procs: list[subprocess.Popen[bytes]] = []
+    for queue_list, threads in pools:
+        if async_mode:
+            cmd = [
+                sys.executable,
+                "-m",
+                "boards.workers.cli",
+                "--async",
+                "--processes=1",
+                f"--concurrency={threads}",
+                f"--queues={','.join(queue_list)}",
+                f"--log-level={log_level}",
+            ]
+            logger.info("Starting async worker pool", queues=queue_list, concurrency=threads)
+            procs.extend(subprocess.Popen(cmd) for _ in range(processes))
+            continue
+
+        cmd = [
+            sys.executable,
+            "-m",
+            "dramatiq",
+            "boards.workers.actors",
+            f"--processes={processes}",
+            f"--threads={threads}",
+        ]
+        for queue in queue_list:
+            cmd.extend(["--queues", queue])
+
+        logger.info("Starting worker pool", queues=queue_list, threads=threads)
+        procs.append(subprocess.Popen(cmd))
+
+    exit_code = 0
+    try:
+        while all(proc.poll() is None for proc in procs):
+            time.sleep(1)
+        exited = [proc for proc in procs if proc.returncode is not None]
+        if exited:
+            exit_code = exited[0].returncode
+            logger.error("Worker pool exited; stopping remaining pools", returncode=exit_code)
+    except KeyboardInterrupt:
+        logger.info("Worker shutdown requested by user")
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.terminate()
+        for proc in procs:
+            proc.wait()
+
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def _parse_pools(
+    ctx: click.Context, param: click.Parameter, values: tuple[str, ...]
+) -> list[tuple[list[str], int]]:
+    pools = []
+    for value in values:
+        queues, _, threads = value.rpartition(":")
+        queue_list = [q.strip() for q in queues.split(",") if q.strip()]
+        if not queue_list or not threads.isdigit() or int(threads) < 1:
+            raise click.BadParameter(
+                f"expected QUEUE[,QUEUE...]:THREADS, got {value!r}", ctx=ctx, param=param
+            )
+        pools.append((queue_list, int(threads)))
+    return pools
+
+
 @click.command()
 @click.option(
     "--processes",
@@ -84,10 +180,38 @@ def start_worker(
     type=int,
     help="Number of worker threads per process (default: 1)",
 )
+@click.option(
+    "--async",
+    "async_mode",
+    is_flag=True,
+    help=(
+        "Run generations as tasks on one event loop per process instead of one "
+        "per thread (see --concurrency)"
+    ),
+)
+@click.option(
+    "--concurrency",
+    default=100,
+    type=int,
+    help="With --async, maximum in-flight jobs per process (default: 100)",
+)
 @click.option(
     "--queues",
-    default="boards-jobs",
-    help="Comma-separated list of queues to process (default: boards-jobs)",
+    default=",".join(WORKER_QUEUES),
+    help="Comma-separated list of queues to process (default: all queues)",
+)
+@click.option(
+    "--pool",
+    "pools",
+    multiple=True,
+    callback=_parse_pools,
+    metavar="QUEUES:THREADS",
+    help=(
+        "Run a separate worker pool for comma-separated QUEUES with THREADS threads "
+        "per process, e.g. --pool boards-fast-image:8 --pool boards-video,boards-audio:2. "
+        "Repeatable; overrides --queues and --threads. With --async, THREADS is the "
+        "concurrency per process."
+    ),
 )
 @click.option(
     "--log-level",
@@ -99,7 +223,10 @@ def start_worker(
 def main(
     processes: int,
     threads: int,
+    async_mode: bool,
+    concurrency: int,
     queues: str,
+    pools: list[tuple[list[str], int]],
     log_level: str,
 ) -> None:
     """Start Boards background workers."""
@@ -107,8 +234,35 @@ def main(
     # Configure logging
     configure_logging(debug=(log_level == "debug"))
 
+    if pools:
+        logger.info(
+            "Starting Boards worker pools",
+            processes=processes,
+            pools=[{"queues": q, "threads": t} for q, t in pools],
+            async_mode=async_mode,
+            log_level=log_level,
+        )
+        start_pools(pools, processes, async_mode=async_mode, log_level=log_level)
+        return
+
     queue_list = [q.strip() for q in queues.split(",")]
 
+    if async_mode:
+        logger.info(
+            "Starting Boards async workers",
+            processes=processes,
+            concurrency=concurrency,
+            queues=queue_list,
+            log_level=log_level,
+        )
+        if processes > 1:
+            start_pools(
+                [(queue_list, concurrency)], processes, async_mode=True, log_level=log_level
+            )
+        else:
+            start_async_worker(concurrency, queue_list, log_level)
+        return
+
     logger.info(
         "Starting Boards workers",
         processes=processes,
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from uuid import UUID, uuid4
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
+from uuid import UUID
 
+from redis.exceptions import RedisError
+
+from ..config import settings
 from ..database.connection import get_async_session
 from ..generators import resolution
 from ..generators.artifacts import (
@@ -12,7 +18,13 @@ from ..generators.artifacts import (
     TextArtifact,
     VideoArtifact,
 )
+from ..generators.provider_limits import ProviderSlot, get_provider_limiter
 from ..jobs import repository as jobs_repo
+from ..jobs.cancellation import (
+    GenerationCancelled,
+    is_cancellation_requested,
+    wait_for_cancellation,
+)
 from ..logging import get_logger
 from ..progress.models import ProgressUpdate
 from ..progress.publisher import ProgressPublisher
@@ -33,6 +45,8 @@ class GeneratorExecutionContext:
         generator_name: str,
         artifact_type: str,
         input_params: dict,
+        external_job_id: str | None = None,
+        external_job_generator: str | None = None,
     ) -> None:
         self.generation_id = str(generation_id)
         self.publisher = publisher
@@ -44,7 +58,20 @@ class GeneratorExecutionContext:
         self.artifact_type = artifact_type
         self.input_params = input_params
         self._batch_id: str | None = None
-        self._batch_generations: list[str] = []
+        self._batch_generations: dict[int, str] = {}
+        self._cancelled = False
+        self._cancel_handler: Callable[[], Awaitable[None]] | None = None
+        self._provider_slots: list[ProviderSlot] = []
+        # Provider job submitted by a previous attempt, offered once for resuming
+        self._resumable_external_job_id = external_job_id
+        # Generator that submitted it (rows from before this was recorded: the requested one)
+        self._resumable_generator = external_job_generator or generator_name
+        # Generator currently running the job; differs from generator_name after failover
+        self._serving_generator = generator_name
+        # Set when the provider reported the current provider job as failed
+        self._provider_job_failed = False
+        # Set once the generator has a provider job (or its output) to lose by failing over
+        self._provider_job_started = False
         logger.info(
             "Created execution context",
             generation_id=str(generation_id),
@@ -88,6 +115,7 @@ class GeneratorExecutionContext:
             generation_id=self.generation_id,
             output_index=output_index,
         )
+        self._provider_job_started = True
         try:
             # Determine which generation_id to use
             target_generation_id = await self._get_or_create_generation_for_output(output_index)
@@ -141,6 +169,7 @@ class GeneratorExecutionContext:
             generation_id=self.generation_id,
             output_index=output_index,
         )
+        self._provider_job_started = True
         try:
             # Determine which generation_id to use
             target_generation_id = await self._get_or_create_generation_for_output(output_index)
@@ -194,6 +223,7 @@ class GeneratorExecutionContext:
             generation_id=self.generation_id,
             output_index=output_index,
         )
+        self._provider_job_started = True
         try:
             # Determine which generation_id to use
             target_generation_id = await self._get_or_create_generation_for_output(output_index)
@@ -240,6 +270,7 @@ class GeneratorExecutionContext:
             generation_id=self.generation_id,
             output_index=output_index,
         )
+        self._provider_job_started = True
         try:
             # Determine which generation_id to use
             target_generation_id = await self._get_or_create_generation_for_output(output_index)
@@ -263,7 +294,13 @@ class GeneratorExecutionContext:
             raise
 
     async def publish_progress(self, update: ProgressUpdate) -> None:
-        """Publish progress update for the generation."""
+        """Publish progress update for the generation.
+
+        Raises:
+            GenerationCancelled: If the generation has been cancelled, so that
+                polling loops stop and progress does not overwrite the status
+        """
+        await self.raise_if_cancelled()
         logger.debug(
             "Publishing progress",
             generation_id=self.generation_id,
@@ -286,14 +323,199 @@ class GeneratorExecutionContext:
             # The generation should continue even if progress updates fail
 
     async def set_external_job_id(self, external_id: str) -> None:
-        """Set the external job ID from the provider."""
+        """Set the external job ID from the provider, recorded with the serving generator."""
         logger.info(
             "Setting external job ID",
             external_job_id=external_id,
             generation_id=self.generation_id,
+            generator_name=self._serving_generator,
         )
+        self._provider_job_started = True
+        self._provider_job_failed = False
         async with get_async_session() as session:
-            await jobs_repo.set_external_job_id(session, self.generation_id, external_id)
+            await jobs_repo.set_external_job_id(
+                session, self.generation_id, external_id, self._serving_generator
+            )
+
+    def resumable_generator_name(self) -> str | None:
+        """Generator that submitted the provider job a previous attempt left behind."""
+        if self._resumable_external_job_id is None:
+            return None
+        return self._resumable_generator
+
+    def set_serving_generator(self, generator_name: str) -> None:
+        """Record which generator (the requested one or an equivalent) runs the job."""
+        self._serving_generator = generator_name
+
+    def resumable_external_job_id(self) -> str | None:
+        """Provider job ID submitted by a previous attempt of this generation.
+
+        Offered only to the generator that submitted it, and only on the first
+        call, so that when the generator fails over to an equivalent the
+        equivalent submits its own job.
+        """
+        if self._serving_generator != self._resumable_generator:
+            return None
+        external_job_id, self._resumable_external_job_id = self._resumable_external_job_id, None
+        if external_job_id is not None:
+            self._provider_job_started = True
+            logger.info(
+                "Resuming provider job from previous attempt",
+                external_job_id=external_job_id,
+                generation_id=self.generation_id,
+            )
+        return external_job_id
+
+    def mark_provider_job_failed(self) -> None:
+        """Record that the provider reported the current provider job as failed."""
+        self._provider_job_failed = True
+
+    async def discard_failed_provider_job(self) -> None:
+        """Make the next attempt resubmit if the provider reported its job as failed.
+
+        Called when an attempt fails and will be retried. Resuming a job the
+        provider failed would fail the same way. Any other failure (storage,
+        network, a timeout while polling) keeps the job so the retry resumes it.
+        """
+        if not self._provider_job_failed:
+            return
+        logger.info(
+            "Discarding failed provider job",
+            generation_id=self.generation_id,
+        )
+        async with get_async_session() as session:
+            await jobs_repo.set_external_job_id(session, self.generation_id, None, None)
+
+    def set_cancel_handler(self, cancel: Callable[[], Awaitable[None]]) -> None:
+        """Register a callback that cancels the job on the provider side."""
+        self._cancel_handler = cancel
+
+    def provider_job_started(self) -> bool:
+        """Whether the generator submitted or resumed a provider job, or began storing output."""
+        return self._provider_job_started
+
+    async def acquire_provider_slot(self, provider: str, endpoint: str | None = None) -> None:
+        """Wait for the provider's rate and concurrency limits (see provider_limits.py).
+
+        Concurrency slots are released when `run_cancellable` returns. If Redis is
+        unavailable the submit goes ahead unthrottled.
+        """
+        limiter = get_provider_limiter()
+        if limiter is None:
+            return
+        try:
+            self._provider_slots.append(await limiter.acquire(provider, endpoint))
+        except RedisError as e:
+            logger.warning(
+                "Failed to acquire provider slot",
+                generation_id=self.generation_id,
+                provider=provider,
+                endpoint=endpoint,
+                error=str(e),
+            )
+
+    async def release_provider_slots(self) -> None:
+        """Release concurrency slots taken with `acquire_provider_slot`."""
+        limiter = get_provider_limiter()
+        slots, self._provider_slots = self._provider_slots, []
+        if limiter is None:
+            return
+        for slot in slots:
+            try:
+                await limiter.release(slot)
+            except RedisError as e:
+                # The lease expires on its own
+                logger.warning(
+                    "Failed to release provider slot",
+                    generation_id=self.generation_id,
+                    error=str(e),
+                )
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether this generation is known to have been cancelled."""
+        return self._cancelled
+
+    async def raise_if_cancelled(self) -> None:
+        """Raise GenerationCancelled if the generation has been cancelled."""
+        if not self._cancelled:
+            try:
+                self._cancelled = await is_cancellation_requested(self.generation_id)
+            except RedisError as e:
+                logger.warning(
+                    "Failed to check cancellation signal",
+                    generation_id=self.generation_id,
+                    error=str(e),
+                )
+        if self._cancelled:
+            raise GenerationCancelled(self.generation_id)
+
+    async def run_cancellable[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a generator coroutine, aborting it if the generation is cancelled.
+
+        A watcher polls the cancellation signal alongside the generator. On
+        cancellation the generator task is cancelled (interrupting provider
+        polling and sleeps), the provider-side job is cancelled via the handler
+        registered with `set_cancel_handler`, and GenerationCancelled is raised.
+        Provider slots held by the generator are released either way, and the
+        cancel handler is dropped: it belongs to this run's provider request.
+        """
+        try:
+            return await self._run_cancellable(coro)
+        finally:
+            self._cancel_handler = None
+            await self.release_provider_slots()
+
+    async def _run_cancellable[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        task = asyncio.ensure_future(coro)
+        watcher = asyncio.ensure_future(
+            wait_for_cancellation(self.generation_id, settings.generation_cancel_poll_interval)
+        )
+        try:
+            await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            watcher.cancel()
+
+        if task.done():
+            try:
+                return task.result()
+            except GenerationCancelled:
+                await self._cancel_upstream()
+                raise
+
+        self._cancelled = True
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(
+                "Generator raised while being cancelled",
+                generation_id=self.generation_id,
+                error=str(e),
+            )
+        await self._cancel_upstream()
+        raise GenerationCancelled(self.generation_id)
+
+    async def _cancel_upstream(self) -> None:
+        """Cancel the provider-side job, if the generator registered a way to."""
+        cancel, self._cancel_handler = self._cancel_handler, None
+        if cancel is None:
+            return
+        try:
+            await cancel()
+            logger.info("Cancelled provider job", generation_id=self.generation_id)
+        except Exception as e:
+            # The provider job may already have finished; nothing else to do
+            logger.warning(
+                "Failed to cancel provider job",
+                generation_id=self.generation_id,
+                error=str(e),
+            )
 
     async def _get_or_create_generation_for_output(self, output_index: int) -> str:
         """Get or create a generation record for the given output index.
@@ -310,20 +532,38 @@ class GeneratorExecutionContext:
 
         # For batch outputs, ensure we have a batch_id
         if self._batch_id is None:
-            self._batch_id = str(uuid4())
+            self._batch_id = jobs_repo.batch_id_for(self.generation_id)
             logger.debug(
-                "Created batch_id for multi-output generation",
+                "Using batch_id for multi-output generation",
                 batch_id=self._batch_id,
                 primary_generation_id=self.generation_id,
             )
 
         # Check if we've already created a generation for this index
-        batch_index = output_index - 1  # Adjust since index 0 is primary
-        if batch_index < len(self._batch_generations):
-            return self._batch_generations[batch_index]
+        if output_index in self._batch_generations:
+            return self._batch_generations[output_index]
 
-        # Create new batch generation record
         async with get_async_session() as session:
+            # An earlier attempt of this job may already have created the record
+            batch_gen_id = await jobs_repo.get_batch_generation(
+                session,
+                tenant_id=UUID(self.tenant_id),
+                board_id=UUID(self.board_id),
+                batch_id=self._batch_id,
+                batch_index=output_index,
+            )
+            if batch_gen_id is not None:
+                self._batch_generations[output_index] = batch_gen_id
+                logger.info(
+                    "Reusing batch generation record",
+                    batch_generation_id=batch_gen_id,
+                    primary_generation_id=self.generation_id,
+                    batch_id=self._batch_id,
+                    batch_index=output_index,
+                )
+                return batch_gen_id
+
+            # Create new batch generation record
             batch_gen_id = await jobs_repo.create_batch_generation(
                 session,
                 tenant_id=UUID(self.tenant_id),
@@ -337,7 +577,7 @@ class GeneratorExecutionContext:
             )
             await session.commit()
 
-        self._batch_generations.append(batch_gen_id)
+        self._batch_generations[output_index] = batch_gen_id
         logger.info(
             "Created batch generation record",
             batch_generation_id=batch_gen_id,
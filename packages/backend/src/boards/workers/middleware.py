@@ -6,17 +6,21 @@ particularly for loading generators during worker startup.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from dramatiq.asyncio import get_event_loop_thread
 from dramatiq.middleware import Middleware
 
 from ..config import initialize_generator_api_keys, settings
 from ..generators.loader import load_generators_from_config
 from ..generators.registry import registry as generator_registry
+from ..http_client import close_http_client
+from ..jobs.retries import forget_attempt, record_attempt
 from ..logging import configure_logging, get_logger
+from ..storage.renditions import shutdown_rendition_pool
 
 if TYPE_CHECKING:
-    from dramatiq import Broker, Worker
+    from dramatiq import Broker, Message, Worker
 
 logger = get_logger(__name__)
 
@@ -61,3 +65,52 @@ class GeneratorLoaderMiddleware(Middleware):
             generator_count=len(generator_registry.list_names()),
             generators=generator_registry.list_names(),
         )
+
+    def before_worker_shutdown(self, broker: Broker, worker: Worker) -> None:
+        """Close the async actors' shared HTTP client (see http_client.py).
+
+        It lives on the AsyncIO middleware's event loop, which is stopped after
+        the worker shuts down, so it is closed on that loop beforehand.
+        """
+        event_loop_thread = get_event_loop_thread()
+        if event_loop_thread is not None:
+            event_loop_thread.run_coroutine(close_http_client())
+
+    def after_worker_shutdown(self, broker: Broker, worker: Worker) -> None:
+        """Stop the rendition process pool (see storage/renditions.py) if it was used."""
+        shutdown_rendition_pool()
+
+
+class GenerationRetries(Middleware):
+    """Middleware that tells generation actors whether a failure will be retried.
+
+    Dramatiq keeps the retry count in the message options, which async actors
+    cannot access. Before a generation message is processed, this records how
+    many retries are left for it (see jobs/retries.py).
+    """
+
+    def __init__(self, actor_names: set[str], default_max_retries: int = 20) -> None:
+        self.actor_names = actor_names
+        self.default_max_retries = default_max_retries
+
+    def before_process_message(self, broker: Broker, message: Message[Any]) -> None:
+        if message.actor_name not in self.actor_names or not message.args:
+            return
+        actor = broker.get_actor(message.actor_name)
+        max_retries = message.options.get(
+            "max_retries", actor.options.get("max_retries", self.default_max_retries)
+        )
+        record_attempt(str(message.args[0]), message.options.get("retries", 0), max_retries)
+
+    def after_process_message(
+        self,
+        broker: Broker,
+        message: Message[Any],
+        *,
+        result: Any = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        if message.actor_name in self.actor_names and message.args:
+            forget_attempt(str(message.args[0]))
+
+    after_skip_message = after_process_message
@@ -0,0 +1,198 @@
+"""Queue routing for generation jobs.
+
+A single queue lets a burst of multi-minute video jobs occupy every worker
+thread while quick image edits wait behind them (head-of-line blocking).
+Generation jobs are instead routed to a queue chosen from generator metadata,
+and `boards-worker --pool` runs a separate worker pool (with its own thread
+count) per queue or group of queues.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from dramatiq.brokers.redis import RedisBroker
+from dramatiq.common import current_millis
+from redis.exceptions import RedisError
+
+from ..logging import get_logger
+
+if TYPE_CHECKING:
+    from dramatiq import Actor, Broker, Message
+
+    from ..generators.base import BaseGenerator
+
+logger = get_logger(__name__)
+
+# Catch-all queue (text, LoRA, slow image generators, unknown generators)
+DEFAULT_QUEUE = "boards-jobs"
+FAST_IMAGE_QUEUE = "boards-fast-image"
+VIDEO_QUEUE = "boards-video"
+AUDIO_QUEUE = "boards-audio"
+
+GENERATION_QUEUES: tuple[str, ...] = (
+    DEFAULT_QUEUE,
+    FAST_IMAGE_QUEUE,
+    VIDEO_QUEUE,
+    AUDIO_QUEUE,
+)
+
+# Post-processing of completed generations (thumbnails; see thumbnails.py)
+PREVIEW_QUEUE = "boards-previews"
+
+# Queues a worker consumes by default
+WORKER_QUEUES: tuple[str, ...] = (*GENERATION_QUEUES, PREVIEW_QUEUE)
+
+# Generation jobs that were enqueued but have not started, as generation ID ->
+# "<queue name> <Redis message ID>". Cleared when the job starts; the relay's
+# sweeper uses it to tell a lost message from one waiting in a long queue.
+ENQUEUED_GENERATIONS_KEY = "boards:generations:enqueued"
+
+# Image generators expected to finish within this many seconds use the fast queue
+FAST_IMAGE_MAX_SECONDS = 60.0
+
+_QUEUES_BY_ARTIFACT_TYPE = {
+    "video": VIDEO_QUEUE,
+    "audio": AUDIO_QUEUE,
+}
+
+
+def queue_for_generator(generator: BaseGenerator | None) -> str:
+    """
+    Choose the queue for a generator's jobs.
+
+    An explicit `queue` on the generator wins. Otherwise video and audio
+    generators get their own queues, and image generators use the fast queue
+    unless their `expected_duration_seconds` exceeds FAST_IMAGE_MAX_SECONDS.
+    Everything else (and unknown generators) uses DEFAULT_QUEUE.
+    """
+    if generator is None:
+        return DEFAULT_QUEUE
+
+    if generator.queue:
+        return generator.queue
+
+    if generator.artifact_type in _QUEUES_BY_ARTIFACT_TYPE:
+        return _QUEUES_BY_ARTIFACT_TYPE[generator.artifact_type]
+
+    if generator.artifact_type == "image":
+        expected = generator.expected_duration_seconds
+        if expected is None or expected <= FAST_IMAGE_MAX_SECONDS:
+            return FAST_IMAGE_QUEUE
+
+    return DEFAULT_QUEUE
+
+
+def send_to_queue(actor: Actor[..., Any], queue_name: str, *args: Any) -> Message[Any]:
+    """
+    Send a message for `actor` on `queue_name` rather than the actor's own queue.
+
+    The queue must have been declared on the actor's broker. Retries are
+    re-enqueued on the same queue.
+    """
+    if queue_name == actor.queue_name:
+        return actor.send(*args)
+    return actor.broker.enqueue(actor.message(*args).copy(queue_name=queue_name))
+
+
+def enqueue_many(broker: Broker, messages: Sequence[Message[Any]]) -> list[Message[Any]]:
+    """
+    Enqueue several messages, in one Redis round trip on a RedisBroker.
+
+    Equivalent to calling `broker.enqueue` for each message (without a delay),
+    including the enqueue middleware hooks. Other brokers enqueue one by one,
+    as does a RedisBroker whose private internals used here have changed.
+    """
+    # Same script call as RedisBroker.enqueue (see its `_dispatch`), but queued
+    # on a pipeline. Maintenance is left to regular enqueues and consumers.
+    # tests/test_generation_outbox.py checks the arguments against `enqueue`.
+    scripts = getattr(broker, "scripts", None)
+    dispatch = scripts.get("dispatch") if isinstance(scripts, dict) else None
+    get_max_unpack_size = getattr(broker, "_max_unpack_size", None)
+    if not isinstance(broker, RedisBroker) or dispatch is None or get_max_unpack_size is None:
+        return [broker.enqueue(message) for message in messages]
+
+    max_unpack_size = get_max_unpack_size()
+    enqueued = []
+    with broker.client.pipeline(transaction=False) as pipe:
+        for message in messages:
+            message = message.copy(options={"redis_message_id": str(uuid4())})
+            broker.emit_before("enqueue", message, None)
+            dispatch(
+                keys=[broker.namespace],
+                args=[
+                    "enqueue",
+                    current_millis(),
+                    message.queue_name,
+                    broker.broker_id,
+                    broker.heartbeat_timeout,
+                    broker.dead_message_ttl,
+                    0,
+                    max_unpack_size,
+                    message.options["redis_message_id"],
+                    message.encode(),
+                ],
+                client=pipe,
+            )
+            enqueued.append(message)
+        pipe.execute()
+
+    for message in enqueued:
+        broker.emit_after("enqueue", message, None)
+    return enqueued
+
+
+def record_enqueued(broker: Broker, messages: Sequence[Message[Any]]) -> None:
+    """
+    Remember the Redis message of each enqueued generation job (see ENQUEUED_GENERATIONS_KEY).
+
+    The messages' first argument is the generation ID. Failures are only
+    logged: a job without a marker is never treated as lost.
+    """
+    if not isinstance(broker, RedisBroker) or not messages:
+        return
+    markers = {
+        str(message.args[0]): f"{message.queue_name} {message.options['redis_message_id']}"
+        for message in messages
+    }
+    try:
+        broker.client.hset(ENQUEUED_GENERATIONS_KEY, mapping=markers)
+    except RedisError as e:
+        logger.warning(
+            "Failed to record enqueued generations", generation_ids=list(markers), error=str(e)
+        )
+
+
+def lost_generations(broker: Broker, generation_ids: Sequence[str]) -> set[str]:
+    """
+    Generations whose enqueued job message is gone from the broker.
+
+    Only generations with an enqueue marker are checked, i.e. jobs that were
+    enqueued and have not started. Their message is lost if it is neither
+    waiting in its queue nor held by a worker, which both keep it in the
+    queue's `.msgs` hash. Other brokers report nothing as lost.
+    """
+    if not isinstance(broker, RedisBroker) or not generation_ids:
+        return set()
+    markers = broker.client.hmget(ENQUEUED_GENERATIONS_KEY, list(generation_ids))
+    enqueued = []
+    for generation_id, marker in zip(generation_ids, markers, strict=True):
+        if marker is None:
+            continue
+        if isinstance(marker, bytes):
+            marker = marker.decode()
+        queue_name, message_id = marker.split(" ", 1)
+        enqueued.append((generation_id, f"{broker.namespace}:{queue_name}.msgs", message_id))
+    if not enqueued:
+        return set()
+    with broker.client.pipeline(transaction=False) as pipe:
+        for _, messages_key, message_id in enqueued:
+            pipe.hexists(messages_key, message_id)
+        held = pipe.execute()
+    return {
+        generation_id
+        for (generation_id, _, _), is_held in zip(enqueued, held, strict=True)
+        if not is_held
+    }
@@ -0,0 +1,108 @@
+"""Reaper for generations whose worker died mid-job.
+
+Running generations hold a heartbeat lease (see jobs/heartbeats.py). When a
+worker is killed, its leases stop being renewed and expire. The reaper claims
+each expired lease and requeues the generation. The new attempt reattaches to
+the provider job recorded in `external_job_id` when the generator supports it
+(see jobs/retries.py), so a job that was already running upstream is not paid
+for twice. A generation reaped more than `generation_max_reaps` times is marked
+failed, which publishes a terminal status and releases SSE subscribers.
+
+It runs periodically in the background relay of each API process (see
+workers/relay.py) and on demand with `boards-server reap-jobs`.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.exc import NoResultFound
+
+from ..config import settings
+from ..database.connection import get_async_session
+from ..jobs import heartbeats
+from ..jobs import repository as jobs_repo
+from ..jobs.admission import PendingJob
+from ..logging import get_logger
+from ..progress.models import ProgressUpdate
+from ..progress.publisher import ProgressPublisher
+from .actors import _fail_batch_generations, _release_admission_slot, enqueue_generations
+
+logger = get_logger(__name__)
+
+ACTIVE_STATUSES = frozenset({"pending", "processing"})
+
+
+async def reap_expired_leases(limit: int = 100) -> int:
+    """Requeue (or give up on) generations whose heartbeat lease expired.
+
+    Returns:
+        Number of generations reaped
+    """
+    reaped = 0
+    for generation_id in await heartbeats.expired_leases(limit=limit):
+        if not await heartbeats.claim_expired_lease(generation_id):
+            continue
+        if await _reap(generation_id):
+            reaped += 1
+    return reaped
+
+
+async def _reap(generation_id: str) -> bool:
+    try:
+        async with get_async_session() as session:
+            gen = await jobs_repo.get_generation(session, generation_id)
+            job = PendingJob(
+                generation_id=generation_id,
+                tenant_id=str(gen.tenant_id),
+                user_id=str(gen.user_id),
+                generator_name=gen.generator_name,
+                submitted_at=gen.created_at.timestamp(),
+            )
+            status = gen.status
+            external_job_id = gen.external_job_id
+    except NoResultFound:
+        return False
+    if status not in ACTIVE_STATUSES:
+        return False
+
+    publisher = ProgressPublisher(settings)
+    reaps = await heartbeats.record_reap(generation_id)
+    if reaps > settings.generation_max_reaps:
+        logger.error(
+            "Generation worker stopped responding too often; marking failed",
+            generation_id=generation_id,
+            reaps=reaps - 1,
+        )
+        await heartbeats.mark_finished(generation_id)
+        await publisher.publish_progress(
+            generation_id,
+            ProgressUpdate(
+                job_id=generation_id,
+                status="failed",
+                progress=0.0,
+                phase="finalizing",
+                message="Worker stopped responding",
+            ),
+        )
+        await _fail_batch_generations(generation_id, "Worker stopped responding")
+        await _release_admission_slot(generation_id)
+        return True
+
+    [message] = enqueue_generations([job])
+    logger.warning(
+        "Requeued generation after its worker stopped responding",
+        generation_id=generation_id,
+        external_job_id=external_job_id,
+        queue_name=message.queue_name,
+        reaps=reaps,
+    )
+    await publisher.publish_only(
+        generation_id,
+        ProgressUpdate(
+            job_id=generation_id,
+            status=status,
+            progress=0.0,
+            phase="queued",
+            message="Worker stopped responding; resuming on another worker",
+        ),
+    )
+    return True
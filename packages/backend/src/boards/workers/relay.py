@@ -0,0 +1,123 @@
+"""Outbox relay: hands committed generations to the job queue in batches.
+
+`relay_outbox` claims a batch of outbox rows (see jobs/outbox.py), submits
+them to admission control in one call, enqueues whatever was dispatched in a
+single pipelined Redis round trip and deletes the rows in the same
+transaction. If Redis is unavailable, the transaction rolls back and the rows
+are retried on the next pass.
+
+The API relays right after committing a generation, so jobs normally start
+without waiting for a poll. `run_relay` runs in the background of each API
+process and picks up whatever that missed, draining bursts batch by batch.
+It also sweeps for generations stuck in `pending` whose queue message was
+lost and re-enqueues them, dispatches deferred generations
+whose slots were freed without a release (see jobs/admission.py), expires
+direct uploads that were never completed, and runs the reaper for jobs whose
+worker died (see workers/reaper.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+from ..config import settings
+from ..database.connection import get_async_session
+from ..jobs import outbox
+from ..logging import get_logger
+from ..uploads import expire_direct_uploads
+from .actors import admit_generations, broker, dispatch_deferred_generations, enqueue_generations
+from .queues import lost_generations
+from .reaper import reap_expired_leases
+
+logger = get_logger(__name__)
+
+
+async def relay_outbox(batch_size: int | None = None) -> int:
+    """Relay one batch of outbox rows to the job queue.
+
+    Returns:
+        Number of generations relayed (enqueued now or deferred by admission)
+    """
+    limit = batch_size or settings.generation_outbox_batch_size
+    async with get_async_session() as session:
+        jobs = await outbox.claim_batch(session, limit)
+        if not jobs:
+            return 0
+        await admit_generations(jobs)
+        await outbox.remove_from_outbox(session, [job.generation_id for job in jobs])
+    logger.info("Relayed generations from outbox", count=len(jobs))
+    return len(jobs)
+
+
+async def sweep_stale_generations(stale_after: timedelta | None = None, limit: int = 100) -> int:
+    """Re-enqueue pending generations whose job message was lost.
+
+    A stale generation is only re-enqueued if its job was enqueued, has not
+    started and its message is no longer held by the broker (see
+    `queues.lost_generations`). Jobs waiting in a long queue, or deferred by
+    admission control, are left alone. Swept jobs are enqueued directly, as
+    they already went through admission once. If the enqueue fails, the sweep
+    is rolled back and retried on the next pass.
+
+    Returns:
+        Number of generations re-enqueued
+    """
+    stale_after = stale_after or timedelta(seconds=settings.generation_stale_pending_seconds)
+    async with get_async_session() as session:
+        jobs = await outbox.find_stale_pending(session, stale_after, limit)
+        if not jobs:
+            return 0
+        lost = lost_generations(broker, [job.generation_id for job in jobs])
+        jobs = [job for job in jobs if job.generation_id in lost]
+        if not jobs:
+            return 0
+        enqueue_generations(jobs)
+    logger.warning(
+        "Re-enqueued stale pending generations",
+        generation_ids=[job.generation_id for job in jobs],
+    )
+    return len(jobs)
+
+
+async def run_relay(
+    poll_interval: float | None = None,
+    sweep_interval: float | None = None,
+    reap_interval: float | None = None,
+) -> None:
+    """Relay the outbox and run the periodic dispatch, sweep and reaper until cancelled."""
+    poll_interval = poll_interval or settings.generation_outbox_poll_interval
+    sweep_interval = sweep_interval or settings.generation_outbox_sweep_interval
+    reap_interval = reap_interval or settings.generation_reaper_interval
+    loop = asyncio.get_running_loop()
+    next_sweep = loop.time() + sweep_interval
+    next_reap = loop.time() + reap_interval
+
+    while True:
+        try:
+            # Keep draining while batches come back full
+            while await relay_outbox() >= settings.generation_outbox_batch_size:
+                pass
+            if loop.time() >= next_sweep:
+                next_sweep = loop.time() + sweep_interval
+                await dispatch_deferred_generations()
+                await sweep_stale_generations()
+                await expire_direct_uploads()
+            if loop.time() >= next_reap:
+                next_reap = loop.time() + reap_interval
+                await reap_expired_leases()
+        except Exception as e:
+            logger.warning("Outbox relay pass failed", error=str(e))
+        await asyncio.sleep(poll_interval)
+
+
+async def relay_committed_generations() -> None:
+    """Relay right after committing new generations, so their jobs start without a poll.
+
+    Failures are only logged: the generations stay in the outbox and the
+    background relay enqueues them later.
+    """
+    try:
+        await relay_outbox()
+    except Exception as e:
+        logger.warning("Immediate outbox relay failed; will retry in background", error=str(e))
@@ -0,0 +1,104 @@
+"""Thumbnails for completed generations.
+
+Board grids render every generation as a tile. Without a thumbnail, each tile
+downloads the full-resolution image or the whole video. Once a generation
+completes, a job on PREVIEW_QUEUE renders a downscaled WebP of it (the first
+frame, for videos) in the rendition process pool. The thumbnail is stored as
+the `thumbnail` variant of the artifact and recorded in `thumbnail_url`.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+import aiofiles
+
+from ..config import settings
+from ..database.connection import get_async_session
+from ..generators.resolution import _rewrite_storage_url, download_from_url
+from ..jobs import repository as jobs_repo
+from ..logging import get_logger
+from ..storage.factory import create_storage_manager
+from ..storage.renditions import (
+    RENDITION_FORMATS,
+    extract_poster_frame,
+    render_image,
+    run_rendition,
+)
+
+logger = get_logger(__name__)
+
+THUMBNAIL_ARTIFACT_TYPES = frozenset({"image", "video"})
+THUMBNAIL_VARIANT = "thumbnail"
+THUMBNAIL_FORMAT = "webp"
+
+
+async def create_thumbnail(generation_id: str) -> str | None:
+    """Render and store the thumbnail of a completed generation.
+
+    Returns:
+        The thumbnail URL, or None for generations that get no thumbnail
+    """
+    async with get_async_session() as session:
+        gen = await jobs_repo.get_generation(session, generation_id)
+        artifact_type = gen.artifact_type
+        storage_url = gen.storage_url
+        thumbnail_url = gen.thumbnail_url
+        tenant_id = str(gen.tenant_id)
+        board_id = str(gen.board_id)
+
+    if artifact_type not in THUMBNAIL_ARTIFACT_TYPES or not storage_url:
+        return None
+    if thumbnail_url:
+        # Redelivered message; the thumbnail already exists
+        return thumbnail_url
+
+    content = await download_from_url(_rewrite_storage_url(storage_url))
+    max_size = settings.thumbnail_max_size
+    if artifact_type == "video":
+        thumbnail = await _render_poster_frame(content, max_size)
+    else:
+        thumbnail = await run_rendition(
+            render_image, content, max_width=max_size, max_height=max_size, fmt=THUMBNAIL_FORMAT
+        )
+
+    storage_manager = create_storage_manager()
+    artifact_ref = await storage_manager.store_artifact(
+        artifact_id=generation_id,
+        content=thumbnail,
+        artifact_type=artifact_type,
+        content_type=RENDITION_FORMATS[THUMBNAIL_FORMAT],
+        tenant_id=tenant_id,
+        board_id=board_id,
+        variant=THUMBNAIL_VARIANT,
+    )
+    async with get_async_session() as session:
+        await jobs_repo.set_thumbnail_url(session, generation_id, artifact_ref.storage_url)
+
+    logger.info(
+        "Generation thumbnail stored",
+        generation_id=generation_id,
+        storage_key=artifact_ref.storage_key,
+        source_bytes=len(content),
+        thumbnail_bytes=len(thumbnail),
+    )
+    return artifact_ref.storage_url
+
+
+async def _render_poster_frame(content: bytes, max_size: int) -> bytes:
+    # ffmpeg needs a seekable file: MP4s often keep their index at the end
+    fd, path = tempfile.mkstemp(prefix="boards_poster_")
+    os.close(fd)
+    try:
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(content)
+        return await run_rendition(
+            extract_poster_frame,
+            path,
+            max_width=max_size,
+            max_height=max_size,
+            fmt=THUMBNAIL_FORMAT,
+        )
+    finally:
+        os.unlink(path)
@@ -21,6 +21,7 @@ import click
 from boards import __version__
 from boards.logging import configure_logging, get_logger
 from boards.workers.health import start_health_server_thread
+from boards.workers.queues import WORKER_QUEUES
 
 logger = get_logger(__name__)
 
@@ -40,8 +41,8 @@ logger = get_logger(__name__)
 )
 @click.option(
     "--queues",
-    default="boards-jobs",
-    help="Comma-separated list of queues to process (default: boards-jobs)",
+    default=",".join(WORKER_QUEUES),
+    help="Comma-separated list of queues to process (default: all queues)",
 )
 @click.option(
     "--log-level",
@@ -7,8 +7,9 @@ import os
 # Set testing flag BEFORE any boards imports to prevent .env loading
 os.environ["BOARDS_TESTING"] = "1"
 
+import asyncio
 import sys
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from pathlib import Path
 from typing import Any
 
@@ -101,6 +102,31 @@ async def db_session(
         yield session
 
 
+@pytest_asyncio.fixture
+async def serve_asgi() -> AsyncGenerator[Callable[[Any], Awaitable[str]]]:
+    """Serve ASGI apps over HTTP on localhost; `await serve_asgi(app)` returns the base URL."""
+    import uvicorn
+
+    running: list[tuple[uvicorn.Server, asyncio.Task[None]]] = []
+
+    async def serve(app: Any) -> str:
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off")
+        )
+        task = asyncio.create_task(server.serve())
+        running.append((server, task))
+        while not server.started:
+            await asyncio.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    yield serve
+
+    for server, task in running:
+        server.should_exit = True
+        await task
+
+
 @pytest.fixture(autouse=True)
 def reset_environment() -> Generator[None, None, None]:
     """Reset environment variables for each test."""
@@ -0,0 +1,149 @@
+"""
+EXPLAIN-based regression tests for generation query plans.
+
+Seeds a realistic generations table and asserts the hot resolver/worker query
+shapes are served by an index. A sequential scan over ``generations`` here
+means an index was dropped or a query drifted away from the indexed shape.
+"""
+
+import json
+import uuid
+from typing import Any
+
+import pytest
+from psycopg import Connection  # type: ignore[import]
+
+SCHEMA = "boards"
+
+TENANTS = 2
+USERS_PER_TENANT = 5
+BOARDS_PER_USER = 10
+GENERATIONS_PER_BOARD = 500
+
+
+def _seed(conn: Connection[Any]) -> dict[str, Any]:
+    """Seed tenants/users/boards/generations with a skewed status distribution."""
+    tenant_ids = [uuid.uuid4() for _ in range(TENANTS)]
+    ids: dict[str, Any] = {"tenant_id": tenant_ids[0]}
+
+    with conn.cursor() as cur:
+        for t, tenant_id in enumerate(tenant_ids):
+            cur.execute(
+                f"INSERT INTO {SCHEMA}.tenants (id, name, slug) VALUES (%s, %s, %s)",
+                (tenant_id, f"Plan Tenant {t}", f"plan-tenant-{t}"),
+            )
+            for u in range(USERS_PER_TENANT):
+                user_id = uuid.uuid4()
+                ids.setdefault("user_id", user_id)
+                cur.execute(
+                    f"INSERT INTO {SCHEMA}.users (id, tenant_id, auth_provider, auth_subject) "
+                    "VALUES (%s, %s, 'none', %s)",
+                    (user_id, tenant_id, f"plan-user-{t}-{u}"),
+                )
+                for b in range(BOARDS_PER_USER):
+                    board_id = uuid.uuid4()
+                    ids.setdefault("board_id", board_id)
+                    cur.execute(
+                        f"INSERT INTO {SCHEMA}.boards (id, tenant_id, owner_id, title) "
+                        "VALUES (%s, %s, %s, %s)",
+                        (board_id, tenant_id, user_id, f"Board {t}-{u}-{b}"),
+                    )
+                    # ~90% completed, ~8% failed, ~2% in flight
+                    cur.execute(
+                        f"""
+                        INSERT INTO {SCHEMA}.generations
+                            (tenant_id, board_id, user_id, generator_name, artifact_type,
+                             input_params, status, created_at, updated_at)
+                        SELECT %s, %s, %s, 'flux-pro', 'image', '{{}}'::jsonb,
+                            CASE
+                                WHEN g %% 50 = 0 THEN 'pending'
+                                WHEN g %% 50 = 1 THEN 'processing'
+                                WHEN g %% 12 = 0 THEN 'failed'
+                                ELSE 'completed'
+                            END,
+                            now() - make_interval(secs => g * 60),
+                            now() - make_interval(secs => g * 60)
+                        FROM generate_series(1, %s) AS g
+                        """,
+                        (tenant_id, board_id, user_id, GENERATIONS_PER_BOARD),
+                    )
+        cur.execute(f"ANALYZE {SCHEMA}.generations")
+    conn.commit()
+    return ids
+
+
+def _plan_nodes(plan: dict[str, Any]):
+    """Yield every node in an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def _explain(conn: Connection[Any], query: str) -> list[dict[str, Any]]:
+    with conn.cursor() as cur:
+        cur.execute(f"EXPLAIN (FORMAT JSON) {query}")
+        row = cur.fetchone()
+    assert row is not None
+    result = row[0] if not isinstance(row[0], str) else json.loads(row[0])
+    return list(_plan_nodes(result[0]["Plan"]))
+
+
+def _assert_index_plan(nodes: list[dict[str, Any]], expected_index: str) -> None:
+    seq_scans = [
+        n for n in nodes if n["Node Type"] == "Seq Scan" and n.get("Relation Name") == "generations"
+    ]
+    assert not seq_scans, f"Sequential scan on generations: {json.dumps(nodes, indent=2)}"
+
+    used = {n.get("Index Name") for n in nodes}
+    assert expected_index in used, f"Expected {expected_index}, plan used {used}"
+
+
+@pytest.mark.integration
+@pytest.mark.requires_db
+def test_generation_queries_use_indexes(alembic_migrate, postgresql):
+    """Key generation query shapes must be index scans, never seq scans."""
+    ids = _seed(postgresql)
+    board_id, tenant_id, user_id = ids["board_id"], ids["tenant_id"], ids["user_id"]
+
+    cases = [
+        # Board.generations / generationsConnection (first page and keyset page)
+        (
+            f"SELECT * FROM {SCHEMA}.generations WHERE board_id = '{board_id}' "
+            "ORDER BY created_at DESC, id DESC LIMIT 51",
+            "idx_generations_board_created",
+        ),
+        (
+            f"SELECT * FROM {SCHEMA}.generations WHERE board_id = '{board_id}' "
+            f"AND (created_at, id) < (now() - interval '1 hour', '{uuid.uuid4()}') "
+            "ORDER BY created_at DESC, id DESC LIMIT 51",
+            "idx_generations_board_created",
+        ),
+        # recentGenerations(boardId, status)
+        (
+            f"SELECT * FROM {SCHEMA}.generations WHERE board_id = '{board_id}' "
+            "AND status = 'failed' ORDER BY created_at DESC, id DESC LIMIT 51",
+            "idx_generations_board_status_created",
+        ),
+        # Tenant-wide status listing
+        (
+            f"SELECT * FROM {SCHEMA}.generations WHERE tenant_id = '{tenant_id}' "
+            "AND status = 'failed' ORDER BY created_at DESC LIMIT 50",
+            "idx_generations_tenant_status_created",
+        ),
+        # Per-user history
+        (
+            f"SELECT * FROM {SCHEMA}.generations WHERE tenant_id = '{tenant_id}' "
+            f"AND user_id = '{user_id}' ORDER BY created_at DESC, id DESC LIMIT 51",
+            "idx_generations_tenant_user_created",
+        ),
+        # Worker sweep over stale in-flight jobs
+        (
+            f"SELECT id FROM {SCHEMA}.generations "
+            "WHERE status IN ('pending', 'processing') "
+            "AND updated_at < now() - interval '10 minutes' ORDER BY updated_at LIMIT 100",
+            "idx_generations_active",
+        ),
+    ]
+
+    for query, expected_index in cases:
+        _assert_index_plan(_explain(postgresql, query), expected_index)
@@ -0,0 +1,144 @@
+"""
+Benchmark for board and generation search on a large seeded dataset.
+
+Seeds ~1M generations (override with BOARDS_SEARCH_BENCH_ROWS) and compares
+the indexed search paths against the unindexed baselines they replace:
+
+- generation prompt full-text search vs. ILIKE over input_params->>'prompt'
+- trigram-backed board ILIKE search vs. the same query with indexes disabled
+
+Skipped unless BOARDS_RUN_BENCHMARKS=1, e.g.:
+
+    BOARDS_RUN_BENCHMARKS=1 pytest tests/database/test_search_benchmark.py -s
+"""
+
+import json
+import os
+import uuid
+from typing import Any
+
+import pytest
+from psycopg import Connection  # type: ignore[import]
+
+from boards.dbmodels import GENERATION_PROMPT_TSVECTOR
+
+SCHEMA = "boards"
+
+GENERATION_ROWS = int(os.environ.get("BOARDS_SEARCH_BENCH_ROWS", "1000000"))
+BOARD_ROWS = max(GENERATION_ROWS // 10, 1000)
+
+WORDS = [
+    "astronaut", "forest", "neon", "portrait", "cathedral", "ocean", "robot", "sunset",
+    "watercolor", "cyberpunk", "mountain", "dragon", "library", "desert", "glacier", "city",
+]  # fmt: skip
+
+
+def _seed(conn: Connection[Any]) -> None:
+    tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+    words = "ARRAY[" + ", ".join(f"'{w}'" for w in WORDS) + "]"
+    n_words = len(WORDS)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            f"INSERT INTO {SCHEMA}.tenants (id, name, slug) VALUES (%s, 'Bench', 'bench')",
+            (tenant_id,),
+        )
+        cur.execute(
+            f"INSERT INTO {SCHEMA}.users (id, tenant_id, auth_provider, auth_subject) "
+            "VALUES (%s, %s, 'none', 'bench-user')",
+            (user_id, tenant_id),
+        )
+        cur.execute(
+            f"""
+            INSERT INTO {SCHEMA}.boards (tenant_id, owner_id, title, description, is_public)
+            SELECT %s, %s,
+                'Board ' || g || ' ' || ({words})[1 + g %% {n_words}],
+                'Collection of ' || ({words})[1 + (g / 7) %% {n_words}] || ' studies',
+                true
+            FROM generate_series(1, %s) AS g
+            """,
+            (tenant_id, user_id, BOARD_ROWS),
+        )
+        cur.execute(
+            f"""
+            INSERT INTO {SCHEMA}.generations
+                (tenant_id, board_id, user_id, generator_name, artifact_type,
+                 input_params, status)
+            WITH b AS (
+                SELECT array_agg(id) AS ids
+                FROM (SELECT id FROM {SCHEMA}.boards LIMIT 1000) s
+            )
+            SELECT %s, b.ids[1 + g %% array_length(b.ids, 1)], %s, 'flux-pro', 'image',
+                jsonb_build_object(
+                    'prompt',
+                    'a ' || ({words})[1 + g %% {n_words}]
+                    || ' in the style of ' || ({words})[1 + (g / 3) %% {n_words}]
+                    || ' number ' || g
+                ),
+                'completed'
+            FROM generate_series(1, %s) AS g, b
+            """,
+            (tenant_id, user_id, GENERATION_ROWS),
+        )
+        cur.execute(f"ANALYZE {SCHEMA}.boards")
+        cur.execute(f"ANALYZE {SCHEMA}.generations")
+    conn.commit()
+
+
+def _explain_analyze(conn: Connection[Any], query: str) -> tuple[float, str]:
+    """Return (execution time in ms, JSON plan) for a query."""
+    with conn.cursor() as cur:
+        cur.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {query}")
+        row = cur.fetchone()
+    assert row is not None
+    result = row[0] if not isinstance(row[0], str) else json.loads(row[0])
+    return float(result[0]["Execution Time"]), json.dumps(result[0]["Plan"])
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    os.environ.get("BOARDS_RUN_BENCHMARKS") != "1", reason="set BOARDS_RUN_BENCHMARKS=1 to run"
+)
+@pytest.mark.integration
+@pytest.mark.requires_db
+def test_search_benchmark(alembic_migrate, postgresql):
+    """Indexed search must use its index and beat the unindexed baseline."""
+    _seed(postgresql)
+
+    fts_query = (
+        f"SELECT id FROM {SCHEMA}.generations "
+        f"WHERE {GENERATION_PROMPT_TSVECTOR} @@ websearch_to_tsquery('english', 'dragon glacier') "
+        f"ORDER BY ts_rank_cd({GENERATION_PROMPT_TSVECTOR}, "
+        "websearch_to_tsquery('english', 'dragon glacier')) DESC LIMIT 50"
+    )
+    prompt_ilike_query = (
+        f"SELECT id FROM {SCHEMA}.generations "
+        "WHERE input_params ->> 'prompt' ILIKE '%dragon%' "
+        "AND input_params ->> 'prompt' ILIKE '%glacier%' "
+        "ORDER BY created_at DESC LIMIT 50"
+    )
+    board_query = (
+        f"SELECT id FROM {SCHEMA}.boards "
+        "WHERE title ILIKE '%Board 4242 %' OR description ILIKE '%Board 4242 %' "
+        "ORDER BY updated_at DESC LIMIT 50"
+    )
+
+    fts_ms, fts_plan = _explain_analyze(postgresql, fts_query)
+    ilike_ms, _ = _explain_analyze(postgresql, prompt_ilike_query)
+    trgm_ms, trgm_plan = _explain_analyze(postgresql, board_query)
+
+    with postgresql.cursor() as cur:
+        cur.execute("SET enable_indexscan = off")
+        cur.execute("SET enable_bitmapscan = off")
+    board_seq_ms, _ = _explain_analyze(postgresql, board_query)
+
+    print(
+        f"\n[search benchmark] generations={GENERATION_ROWS} boards={BOARD_ROWS}\n"
+        f"  prompt full-text: {fts_ms:.1f} ms (ILIKE baseline {ilike_ms:.1f} ms)\n"
+        f"  board trigram:    {trgm_ms:.1f} ms (seq scan baseline {board_seq_ms:.1f} ms)"
+    )
+
+    assert "idx_generations_prompt_fts" in fts_plan
+    assert "idx_boards_title_trgm" in trgm_plan
+    assert fts_ms < ilike_ms
+    assert trgm_ms < board_seq_ms
@@ -0,0 +1,106 @@
+"""
+Tests for batched generation ID -> artifact resolution.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from boards.generators import artifact_resolution
+from boards.generators.artifact_resolution import (
+    _artifact_fields_for_schema,
+    extract_artifact_fields,
+    resolve_generation_ids_to_artifacts,
+)
+from boards.generators.artifacts import ImageArtifact, VideoArtifact
+from boards.jobs import repository as jobs_repo
+
+
+def _image_generation(gen_id, status="completed", artifact_type="image"):
+    return SimpleNamespace(
+        id=gen_id,
+        status=status,
+        artifact_type=artifact_type,
+        storage_url=f"https://cdn.example.com/{gen_id}.png",
+        output_metadata={"format": "png", "width": 512, "height": 512},
+    )
+
+
+@pytest.fixture
+def fake_batch_lookup(monkeypatch):
+    """Replace the batch lookup with an in-memory table and record calls."""
+    table: dict = {}
+    calls: list = []
+
+    async def fake_get_generations_by_ids(session, generation_ids, tenant_id):
+        calls.append(list(generation_ids))
+        return {gen_id: table[gen_id] for gen_id in generation_ids if gen_id in table}
+
+    monkeypatch.setattr(jobs_repo, "get_generations_by_ids", fake_get_generations_by_ids)
+    return table, calls
+
+
+@pytest.mark.asyncio
+async def test_resolves_in_one_query_preserving_order(fake_batch_lookup):
+    table, calls = fake_batch_lookup
+    ids = [uuid4() for _ in range(3)]
+    for gen_id in ids:
+        table[gen_id] = _image_generation(gen_id)
+
+    requested = [str(ids[2]), str(ids[0]), str(ids[1]), str(ids[0])]
+    artifacts = await resolve_generation_ids_to_artifacts(
+        requested, ImageArtifact, session=None, tenant_id=uuid4()
+    )
+
+    assert [a.generation_id for a in artifacts] == requested
+    # Single round trip, duplicates collapsed
+    assert calls == [[ids[2], ids[0], ids[1]]]
+
+
+@pytest.mark.asyncio
+async def test_reports_every_bad_id(fake_batch_lookup):
+    table, _ = fake_batch_lookup
+    ok, pending, video = uuid4(), uuid4(), uuid4()
+    missing = uuid4()
+    table[ok] = _image_generation(ok)
+    table[pending] = _image_generation(pending, status="processing")
+    table[video] = _image_generation(video, artifact_type="video")
+
+    with pytest.raises(ValueError) as exc_info:
+        await resolve_generation_ids_to_artifacts(
+            [str(ok), str(pending), str(missing), str(video), "not-a-uuid"],
+            ImageArtifact,
+            session=None,
+            tenant_id=uuid4(),
+        )
+
+    message = str(exc_info.value)
+    assert f"Generation {pending} is not completed (status: processing)" in message
+    assert f"Generation {missing} not found" in message
+    assert f"Generation {video} has wrong artifact type" in message
+    assert "Generation not-a-uuid not found" in message
+    assert str(ok) not in message
+
+
+def test_extract_artifact_fields_is_memoized():
+    class Input(BaseModel):
+        prompt: str
+        image_source: ImageArtifact
+        video_sources: list[VideoArtifact]
+
+    _artifact_fields_for_schema.cache_clear()
+    first = extract_artifact_fields(Input)
+    second = extract_artifact_fields(Input)
+
+    assert first == {
+        "image_source": (ImageArtifact, False),
+        "video_sources": (VideoArtifact, True),
+    }
+    assert second == first
+    assert _artifact_fields_for_schema.cache_info().hits == 1
+
+    # Callers get their own dict; mutating it does not poison the cache
+    first.pop("image_source")
+    assert "image_source" in artifact_resolution.extract_artifact_fields(Input)
@@ -0,0 +1,391 @@
+"""Tests for circuit breakers and failover between equivalent generators.
+
+Fake providers inject errors and delays; breaker state lives in an in-memory
+stand-in for Redis.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from boards.generators.base import BaseGenerator, GeneratorResult
+from boards.generators.failover import (
+    BreakerConfig,
+    CircuitBreakers,
+    FailoverRouter,
+    is_provider_error,
+)
+from boards.generators.implementations.kie.image.nano_banana_edit import (
+    KieNanoBananaEditGenerator,
+)
+from boards.generators.registry import GeneratorRegistry
+from boards.storage.base import StorageException
+
+
+class _FakeRedis:
+    """In-memory stand-in for the string and list commands used by the breakers."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str | list[str]] = {}
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.data)
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+    async def lpush(self, key: str, value: str) -> None:
+        self.data.setdefault(key, []).insert(0, value)  # type: ignore[union-attr]
+
+    async def ltrim(self, key: str, start: int, end: int) -> None:
+        self.data[key] = self.data[key][start : end + 1]
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        return list(self.data.get(key, []))
+
+
+class PromptInput(BaseModel):
+    prompt: str
+
+
+class StrictInput(BaseModel):
+    prompt: str
+    resolution: str
+
+
+class _FakeProviderGenerator(BaseGenerator):
+    """Generator whose provider can be made to fail or respond slowly."""
+
+    artifact_type = "image"
+    description = "Fake provider"
+
+    def __init__(self, name: str, schema: type[BaseModel] = PromptInput) -> None:
+        self.name = name
+        self.schema = schema
+        self.fail = False
+        # Raised instead of a provider outage when set, e.g. a rejected request
+        self.error: Exception | None = None
+        self.submits = False
+        self.delay = 0.0
+        self.calls = 0
+
+    def get_input_schema(self) -> type[BaseModel]:
+        return self.schema
+
+    async def generate(self, inputs, context) -> GeneratorResult:
+        self.calls += 1
+        if self.submits:
+            await context.set_external_job_id(f"{self.name}-req")
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        if self.fail:
+            raise httpx.ConnectError(f"{self.name} is down")
+        return GeneratorResult(outputs=[])
+
+    async def estimate_cost(self, inputs) -> float:
+        return 0.0
+
+
+class _Context:
+    generation_id = "gen-1"
+
+    def __init__(self, resumable_generator: str | None = None) -> None:
+        self.external_job_id: str | None = None
+        self.resumable_generator = resumable_generator
+        self.served_by: list[str] = []
+
+    async def run_cancellable(self, coro):
+        return await coro
+
+    async def set_external_job_id(self, external_id: str) -> None:
+        self.external_job_id = external_id
+
+    def provider_job_started(self) -> bool:
+        return self.external_job_id is not None
+
+    def resumable_generator_name(self) -> str | None:
+        return self.resumable_generator
+
+    def set_serving_generator(self, generator_name: str) -> None:
+        self.served_by.append(generator_name)
+
+
+@pytest.fixture
+def fake_redis():
+    return _FakeRedis()
+
+
+@pytest.fixture
+def generators():
+    registry = GeneratorRegistry()
+    gens = {
+        name: _FakeProviderGenerator(name) for name in ("fala-model", "kieb-model", "repc-model")
+    }
+    for gen in gens.values():
+        registry.register(gen)
+    return registry, gens
+
+
+def _router(fake_redis, registry, groups, **config) -> FailoverRouter:
+    breakers = CircuitBreakers(fake_redis, BreakerConfig(min_samples=3, **config))
+    return FailoverRouter(groups, breakers, registry)
+
+
+async def _run(
+    router: FailoverRouter, generator: BaseGenerator, context: _Context | None = None
+) -> BaseGenerator:
+    _, served_by = await router.run(
+        generator, PromptInput(prompt="hi"), {"prompt": "hi"}, context or _Context()
+    )
+    return served_by
+
+
+@pytest.mark.asyncio
+async def test_without_equivalents_errors_propagate(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [])
+    gens["fala-model"].fail = True
+
+    with pytest.raises(httpx.ConnectError, match="fala-model is down"):
+        await _run(router, gens["fala-model"])
+    # Nothing is recorded when failover is not configured
+    assert fake_redis.data == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_job_fails_over_to_equivalent(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    gens["fala-model"].fail = True
+
+    assert await _run(router, gens["fala-model"]) is gens["kieb-model"]
+    assert gens["fala-model"].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_routes_around_provider(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    breakers = router._breakers
+    gens["fala-model"].fail = True
+
+    for _ in range(3):
+        await _run(router, gens["fala-model"])
+    assert await breakers.state("fala") == "open"
+    assert gens["fala-model"].calls == 3
+
+    # While open, jobs go straight to the equivalent
+    assert await _run(router, gens["fala-model"]) is gens["kieb-model"]
+    assert gens["fala-model"].calls == 3
+
+
+@pytest.mark.asyncio
+async def test_resumed_job_goes_back_to_the_generator_that_submitted_it(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    gens["kieb-model"].fail = True
+    for _ in range(3):
+        await _run(router, gens["kieb-model"])
+    assert await router._breakers.state("kieb") == "open"
+    gens["kieb-model"].fail = False
+
+    # Only Kie can resume the Kie job, even while its breaker is open
+    context = _Context(resumable_generator="kieb-model")
+    assert await _run(router, gens["fala-model"], context) is gens["kieb-model"]
+    assert context.served_by == ["kieb-model"]
+    assert gens["fala-model"].calls == 3
+
+
+@pytest.mark.asyncio
+async def test_half_open_trial_closes_or_reopens_breaker(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    breakers = router._breakers
+    gens["fala-model"].fail = True
+    for _ in range(3):
+        await _run(router, gens["fala-model"])
+
+    # Cooldown elapses: one failed trial re-opens the breaker immediately
+    await fake_redis.delete("breaker:fala:open")
+    assert await breakers.state("fala") == "half_open"
+    await _run(router, gens["fala-model"])
+    assert await breakers.state("fala") == "open"
+
+    # Next cooldown: a successful trial closes it
+    await fake_redis.delete("breaker:fala:open")
+    gens["fala-model"].fail = False
+    assert await _run(router, gens["fala-model"]) is gens["fala-model"]
+    assert await breakers.state("fala") == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_runs_count_as_failures(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]], slow_call_seconds=0.01)
+    gens["fala-model"].delay = 0.03
+
+    for _ in range(3):
+        assert await _run(router, gens["fala-model"]) is gens["fala-model"]
+
+    assert await router._breakers.state("fala") == "open"
+
+
+@pytest.mark.asyncio
+async def test_lowest_latency_healthy_equivalent_is_preferred(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model", "repc-model"]])
+    breakers = router._breakers
+    await breakers.record("kieb", "kieb-model", ok=True, latency=30.0)
+    await breakers.record("repc", "repc-model", ok=True, latency=5.0)
+
+    # Healthy requested generator first, then equivalents by median latency
+    assert await router.candidates(gens["fala-model"]) == [
+        gens["fala-model"],
+        gens["repc-model"],
+        gens["kieb-model"],
+    ]
+
+    await breakers._open("fala", reason="test")
+    await breakers._open("repc", reason="test")
+    # The requested generator is kept as a last resort
+    assert await router.candidates(gens["fala-model"]) == [gens["kieb-model"], gens["fala-model"]]
+
+
+@pytest.mark.asyncio
+async def test_equivalents_with_incompatible_inputs_are_skipped(fake_redis, generators):
+    registry, gens = generators
+    strict = _FakeProviderGenerator("kied-model", schema=StrictInput)
+    registry.register(strict)
+    router = _router(fake_redis, registry, [["fala-model", "kied-model", "kieb-model"]])
+    gens["fala-model"].fail = True
+
+    assert await _run(router, gens["fala-model"]) is gens["kieb-model"]
+    assert strict.calls == 0
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://provider.example/run")
+    return httpx.HTTPStatusError(
+        "provider error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (httpx.ConnectError("refused"), True),
+        (httpx.ReadTimeout("timed out"), True),
+        (TimeoutError(), True),
+        (_status_error(503), True),
+        (_status_error(429), True),
+        (_status_error(422), False),
+        (ValueError("No images returned"), False),
+    ],
+)
+def test_provider_errors_are_told_apart_from_rejected_requests(error, expected):
+    assert is_provider_error(error) is expected
+
+    # Wrapped provider errors count; storage failures never do
+    try:
+        raise RuntimeError("generation failed") from error
+    except RuntimeError as wrapped:
+        assert is_provider_error(wrapped) is expected
+    assert not is_provider_error(StorageException("upload failed"))
+
+
+def _kie_client(status_code: int, body: dict | None = None) -> AsyncMock:
+    request = httpx.Request("GET", "https://api.kie.ai/api/v1/jobs/recordInfo")
+    response = httpx.Response(status_code, json=body or {}, request=request)
+    client = MagicMock()
+    client.get = AsyncMock(return_value=response)
+    client.post = AsyncMock(return_value=response)
+    return AsyncMock(return_value=client)
+
+
+@pytest.mark.asyncio
+async def test_kie_outages_and_timeouts_fail_over(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["kieb-model", "fala-model"]])
+    kie = KieNanoBananaEditGenerator()
+    context = MagicMock(publish_progress=AsyncMock())
+
+    with patch("boards.generators.implementations.kie.base.get_http_client", _kie_client(503)):
+        with pytest.raises(ValueError) as outage:
+            await kie._make_request("https://api.kie.ai/api/v1/jobs/createTask", "POST", "key")
+    with patch("boards.generators.implementations.kie.base.get_http_client", _kie_client(422)):
+        with pytest.raises(ValueError) as rejected:
+            await kie._make_request("https://api.kie.ai/api/v1/jobs/createTask", "POST", "key")
+    waiting = {"code": 200, "data": {"state": "waiting"}}
+    with patch(
+        "boards.generators.implementations.kie.base.get_http_client", _kie_client(200, waiting)
+    ):
+        with pytest.raises(TimeoutError) as timeout:
+            await kie._poll_for_completion("task-1", "key", context, max_polls=1)
+
+    assert is_provider_error(outage.value)
+    assert is_provider_error(timeout.value)
+    assert not is_provider_error(rejected.value)
+
+    for error in (outage.value, timeout.value):
+        gens["kieb-model"].error = error
+        assert await _run(router, gens["kieb-model"]) is gens["fala-model"]
+
+
+@pytest.mark.asyncio
+async def test_rejected_requests_do_not_fail_over_or_trip_breaker(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    gens["fala-model"].error = _status_error(422)
+
+    for _ in range(3):
+        with pytest.raises(httpx.HTTPStatusError):
+            await _run(router, gens["fala-model"])
+
+    assert gens["kieb-model"].calls == 0
+    assert await router._breakers.state("fala") == "closed"
+
+
+@pytest.mark.asyncio
+async def test_no_failover_once_provider_job_was_submitted(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    gens["fala-model"].fail = True
+    gens["fala-model"].submits = True
+
+    # The retry resumes the submitted job instead of paying a second provider
+    with pytest.raises(httpx.ConnectError):
+        await _run(router, gens["fala-model"])
+    assert gens["kieb-model"].calls == 0
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_lets_one_trial_through(fake_redis, generators):
+    registry, gens = generators
+    router = _router(fake_redis, registry, [["fala-model", "kieb-model"]])
+    gens["fala-model"].fail = True
+    for _ in range(3):
+        await _run(router, gens["fala-model"])
+    gens["fala-model"].fail = False
+    gens["fala-model"].calls = 0
+
+    # Cooldown elapses while many jobs arrive at once
+    await fake_redis.delete("breaker:fala:open")
+    gens["fala-model"].delay = 0.05
+    served_by = await asyncio.gather(*(_run(router, gens["fala-model"]) for _ in range(5)))
+
+    assert served_by.count(gens["fala-model"]) == 1
+    assert served_by.count(gens["kieb-model"]) == 4
+    assert await router._breakers.state("fala") == "closed"
+    assert "breaker:fala:trial" not in fake_redis.data
@@ -0,0 +1,176 @@
+"""
+Tests for header-only media probing.
+"""
+
+import io
+import struct
+import wave
+
+import pytest
+from PIL import Image
+
+from boards.generators.media_probe import MediaInfo, probe_media, read_mp4_moov, sniff_mime_type
+
+
+def _image(fmt: str, size: tuple[int, int], mode: str = "RGB", **save_kwargs) -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, size).save(output, format=fmt, **save_kwargs)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize(
+    ("fmt", "mode", "save_kwargs"),
+    [
+        ("PNG", "RGB", {}),
+        ("JPEG", "RGB", {}),
+        ("GIF", "P", {}),
+        ("WEBP", "RGB", {}),  # VP8
+        ("WEBP", "RGB", {"lossless": True}),  # VP8L
+        ("WEBP", "RGBA", {}),  # VP8X
+    ],
+)
+def test_probes_image_dimensions(fmt, mode, save_kwargs):
+    content = _image(fmt, (321, 123), mode, **save_kwargs)
+
+    assert probe_media(content) == MediaInfo(width=321, height=123)
+
+
+def test_jpeg_dimensions_follow_exif_rotation():
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Rotated 90 degrees clockwise
+    content = _image("JPEG", (640, 480), exif=exif)
+
+    assert probe_media(content) == MediaInfo(width=480, height=640)
+
+
+def test_probes_wav_duration():
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(22050)
+        wav.writeframes(b"\x00" * 22050 * 4 * 3)
+
+    assert probe_media(output.getvalue()) == MediaInfo(duration=3.0, sample_rate=22050, channels=2)
+
+
+# MPEG-1 layer III, 128 kbps, 44.1 kHz, stereo; 417-byte frames
+_MP3_HEADER = b"\xff\xfb\x90\x00"
+
+
+def _mp3(frames: int, first_frame: bytes = b"") -> bytes:
+    id3 = b"ID3\x03\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10
+    first = (_MP3_HEADER + first_frame).ljust(417, b"\x00")
+    return id3 + first + (_MP3_HEADER.ljust(417, b"\x00") * (frames - 1))
+
+
+def test_probes_cbr_mp3_duration_from_bitrate():
+    info = probe_media(_mp3(100))
+
+    assert (info.sample_rate, info.channels) == (44100, 2)
+    assert info.duration == pytest.approx(100 * 1152 / 44100, abs=0.01)
+
+
+def test_probes_vbr_mp3_duration_from_xing_frame_count():
+    xing = b"\x00" * 32 + b"Xing" + struct.pack(">II", 0x1, 1000)
+
+    info = probe_media(_mp3(10, xing))
+
+    assert info.duration == pytest.approx(1000 * 1152 / 44100)
+
+
+def _box(box_type: bytes, *children: bytes) -> bytes:
+    payload = b"".join(children)
+    return struct.pack(">I", 8 + len(payload)) + box_type + payload
+
+
+def _full_box(box_type: bytes, body: bytes) -> bytes:
+    return _box(box_type, b"\x00\x00\x00\x00" + body)
+
+
+def _track(handler: bytes, timescale: int, duration: int, *, tkhd=b"", stbl=()) -> bytes:
+    mdhd = _full_box(b"mdhd", struct.pack(">IIII", 0, 0, timescale, duration) + b"\x00" * 4)
+    hdlr = _full_box(b"hdlr", b"\x00" * 4 + handler + b"\x00" * 12)
+    return _box(
+        b"trak",
+        tkhd,
+        _box(b"mdia", mdhd, hdlr, _box(b"minf", _box(b"stbl", *stbl))),
+    )
+
+
+def _mp4() -> bytes:
+    mvhd = _full_box(b"mvhd", struct.pack(">IIII", 0, 0, 1000, 4000) + b"\x00" * 80)
+    tkhd = _full_box(b"tkhd", b"\x00" * 72 + struct.pack(">II", 1280 << 16, 720 << 16))
+    stts = _full_box(b"stts", struct.pack(">III", 1, 96, 512))
+    video = _track(b"vide", 12288, 96 * 512, tkhd=tkhd, stbl=[stts])
+    audio_entry = _box(
+        b"mp4a",
+        b"\x00" * 8 + b"\x00" * 8 + struct.pack(">HHHHI", 2, 16, 0, 0, 48000 << 16),
+    )
+    stsd = _full_box(b"stsd", struct.pack(">I", 1) + audio_entry)
+    audio = _track(b"soun", 48000, 4 * 48000, stbl=[stsd])
+    ftyp = _box(b"ftyp", b"isom\x00\x00\x02\x00isomiso2mp41")
+    # Index written after the media data, as many encoders do
+    return ftyp + _box(b"mdat", b"\x00" * 4096) + _box(b"moov", mvhd, video, audio)
+
+
+def test_probes_mp4_video_and_audio_tracks():
+    assert probe_media(_mp4()) == MediaInfo(
+        width=1280, height=720, duration=4.0, fps=24.0, sample_rate=48000, channels=2
+    )
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 100, 1 << 20])
+def test_reads_moov_after_media_data_block_by_block(block_size):
+    content = _mp4()
+    # A 64-bit sized box must be skipped too
+    mdat = b"\x00" * 5000
+    content = content.replace(
+        _box(b"mdat", b"\x00" * 4096),
+        struct.pack(">I", 1) + b"mdat" + struct.pack(">Q", 16 + 5000) + mdat,
+    )
+    blocks = (content[i : i + block_size] for i in range(0, len(content), block_size))
+
+    moov = read_mp4_moov(blocks)
+
+    assert moov[4:8] == b"moov"
+    assert content.endswith(moov)
+    assert probe_media(moov) == probe_media(content)
+
+
+@pytest.mark.parametrize(
+    "content", [b"", _image("PNG", (8, 8)), _mp4()[:-100]], ids=["empty", "png", "truncated"]
+)
+def test_read_mp4_moov_without_complete_moov_is_empty(content):
+    assert read_mp4_moov([content]) == b""
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"plain text", b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff\xe0\x00", _mp4()[:100]],
+)
+def test_unknown_or_truncated_content_yields_empty_info(content):
+    assert probe_media(content) == MediaInfo()
+
+
+@pytest.mark.parametrize(
+    ("content", "mime_type"),
+    [
+        (_image("PNG", (8, 8)), "image/png"),
+        (_image("JPEG", (8, 8)), "image/jpeg"),
+        (_image("GIF", (8, 8), "P"), "image/gif"),
+        (_image("WEBP", (8, 8)), "image/webp"),
+        (_image("BMP", (8, 8)), "image/bmp"),
+        (_mp3(2), "audio/mpeg"),
+        (_mp4(), "video/mp4"),
+        (_box(b"ftyp", b"qt  \x00\x00\x00\x00"), "video/quicktime"),
+        (_box(b"ftyp", b"M4A \x00\x00\x00\x00"), "audio/mp4"),
+        (b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\x82\x84webm", "video/webm"),
+        (b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\x82\x88matroska", "video/x-matroska"),
+        (b"OggS\x00\x02", "audio/ogg"),
+        (b"plain text", None),
+        (b"", None),
+    ],
+)
+def test_sniffs_mime_type_from_leading_bytes(content, mime_type):
+    assert sniff_mime_type(content[:64]) == mime_type
@@ -0,0 +1,160 @@
+"""Tests for cluster-wide provider rate limits and concurrency caps."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from boards.generators import provider_limits
+from boards.generators.provider_limits import (
+    _SEMAPHORE_SCRIPT,
+    _TOKEN_BUCKET_SCRIPT,
+    ProviderLimit,
+    ProviderLimiter,
+)
+
+
+class _FakeRedis:
+    """Runs Python equivalents of the limiter's Lua scripts against in-memory state."""
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self.leases: dict[str, dict[str, float]] = {}
+
+    def register_script(self, script: str):
+        handlers = {
+            _TOKEN_BUCKET_SCRIPT: self._token_bucket,
+            _SEMAPHORE_SCRIPT: self._semaphore,
+        }
+        return handlers[script]
+
+    async def _token_bucket(self, keys: list[str], args: list) -> str:
+        rate, burst = float(args[0]), float(args[1])
+        now = time.monotonic()
+        tokens, ts = self.buckets.get(keys[0], (burst, now))
+        tokens = min(burst, tokens + max(0.0, now - ts) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        self.buckets[keys[0]] = (tokens, now)
+        return str(wait)
+
+    async def _semaphore(self, keys: list[str], args: list) -> int:
+        limit, lease_id, lease_seconds = int(args[0]), args[1], float(args[2])
+        now = time.monotonic()
+        leases = self.leases.setdefault(keys[0], {})
+        for expired in [lease for lease, expiry in leases.items() if expiry <= now]:
+            del leases[expired]
+        if len(leases) >= limit:
+            return 0
+        leases[lease_id] = now + lease_seconds
+        return 1
+
+    async def zrem(self, key: str, member: str) -> None:
+        self.leases.get(key, {}).pop(member, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    monkeypatch.setattr(provider_limits, "CONCURRENCY_POLL_INTERVAL", 0.01)
+    return _FakeRedis()
+
+
+def test_unknown_limit_options_are_rejected(fake_redis):
+    with pytest.raises(ValueError, match="Unknown provider limit option"):
+        ProviderLimiter.from_config({"fal": {"rps": 10}}, client=fake_redis)
+
+
+def test_endpoint_limits_apply_in_addition_to_provider_limits(fake_redis):
+    limiter = ProviderLimiter.from_config(
+        {"fal": {"max_concurrency": 40}, "fal:fal-ai/veo3": {"max_concurrency": 4}},
+        client=fake_redis,
+    )
+
+    assert limiter.limits_for("fal", "fal-ai/veo3") == [
+        ("fal", ProviderLimit(max_concurrency=40)),
+        ("fal:fal-ai/veo3", ProviderLimit(max_concurrency=4)),
+    ]
+    assert limiter.limits_for("fal", "fal-ai/flux") == [("fal", ProviderLimit(max_concurrency=40))]
+    assert limiter.limits_for("kie", "veo3") == []
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_waits_for_release(fake_redis):
+    limiter = ProviderLimiter(fake_redis, {"fal:fal-ai/veo3": ProviderLimit(max_concurrency=2)})
+
+    first = await limiter.acquire("fal", "fal-ai/veo3")
+    await limiter.acquire("fal", "fal-ai/veo3")
+    # Other endpoints are not capped
+    await asyncio.wait_for(limiter.acquire("fal", "fal-ai/flux"), timeout=1)
+
+    third = asyncio.ensure_future(limiter.acquire("fal", "fal-ai/veo3"))
+    await asyncio.sleep(0.05)
+    assert not third.done()
+
+    await limiter.release(first)
+    await asyncio.wait_for(third, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_keep_leases(fake_redis):
+    limiter = ProviderLimiter(
+        fake_redis,
+        {
+            "fal": ProviderLimit(max_concurrency=5),
+            "fal:fal-ai/veo3": ProviderLimit(max_concurrency=1),
+        },
+    )
+    await limiter.acquire("fal", "fal-ai/veo3")
+
+    waiter = asyncio.ensure_future(limiter.acquire("fal", "fal-ai/veo3"))
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # Only the first job's provider-level lease remains
+    assert len(fake_redis.leases["provider:fal:leases"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_submissions(fake_redis):
+    limiter = ProviderLimiter(fake_redis, {"kie": ProviderLimit(requests_per_second=20, burst=1)})
+
+    start = time.monotonic()
+    for _ in range(5):
+        await limiter.acquire("kie", "veo3")
+    elapsed = time.monotonic() - start
+
+    # The first request uses the burst; the other four wait 1/20s each
+    assert elapsed >= 0.18
+
+
+@pytest.mark.asyncio
+async def test_context_releases_provider_slots_when_generator_finishes(fake_redis, monkeypatch):
+    from boards.workers import context as context_module
+    from boards.workers.context import GeneratorExecutionContext
+
+    limiter = ProviderLimiter(fake_redis, {"fal": ProviderLimit(max_concurrency=1)})
+    monkeypatch.setattr(context_module, "get_provider_limiter", lambda: limiter)
+
+    async def never_cancelled(generation_id, poll_interval, client=None):
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(context_module, "wait_for_cancellation", never_cancelled)
+
+    context = GeneratorExecutionContext(
+        uuid4(), MagicMock(), MagicMock(), uuid4(), uuid4(), uuid4(), "gen", "image", {}
+    )
+
+    async def generate() -> str:
+        await context.acquire_provider_slot("fal", "fal-ai/flux")
+        assert len(fake_redis.leases["provider:fal:leases"]) == 1
+        return "done"
+
+    assert await context.run_cancellable(generate()) == "done"
+    assert fake_redis.leases["provider:fal:leases"] == {}
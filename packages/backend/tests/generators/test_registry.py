@@ -7,7 +7,7 @@ from pydantic import BaseModel
 
 from boards.generators.artifacts import ImageArtifact
 from boards.generators.base import BaseGenerator
-from boards.generators.registry import GeneratorRegistry
+from boards.generators.registry import GeneratorCatalogEntry, GeneratorRegistry
 
 
 class MockInput(BaseModel):
@@ -190,6 +190,84 @@ class TestGeneratorRegistry:
         self.registry.register(self.mock_video_gen)
         assert len(self.registry) == 2
 
+    def test_list_by_artifact_type_after_unregister(self):
+        """Test the artifact type index stays in sync with unregister/clear."""
+        self.registry.register(self.mock_image_gen)
+        self.registry.register(self.mock_video_gen)
+
+        self.registry.unregister("mock-image")
+        assert self.registry.list_by_artifact_type("image") == []
+        assert self.registry.list_by_artifact_type("video") == [self.mock_video_gen]
+
+        self.registry.clear()
+        assert self.registry.list_by_artifact_type("video") == []
+
+    def test_catalog_snapshot(self):
+        """Test the catalog precomputes schemas and indexes by artifact type."""
+        self.registry.register(self.mock_image_gen)
+        self.registry.register(self.mock_video_gen)
+
+        catalog = self.registry.catalog()
+
+        assert [entry.name for entry in catalog.list()] == ["mock-image", "mock-video"]
+        assert [entry.name for entry in catalog.list("video")] == ["mock-video"]
+        assert catalog.list("audio") == ()
+        assert catalog.entries[0].input_schema == MockInput.model_json_schema()
+
+    def test_catalog_is_cached_until_registry_changes(self):
+        """Test the catalog is reused and its version tracks registry contents."""
+        self.registry.register(self.mock_image_gen)
+        catalog = self.registry.catalog()
+
+        assert self.registry.catalog() is catalog
+
+        self.registry.register(self.mock_video_gen)
+        updated = self.registry.catalog()
+        assert updated is not catalog
+        assert updated.version != catalog.version
+
+        self.registry.unregister("mock-video")
+        assert self.registry.catalog().version == catalog.version
+
+    def test_lazy_generator_is_materialized_on_get(self):
+        """Test lazily registered generators are listed without being constructed."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return self.mock_image_gen
+
+        entry = GeneratorCatalogEntry.from_generator(self.mock_image_gen)
+        self.registry.register_lazy(entry, factory)
+
+        assert "mock-image" in self.registry
+        assert self.registry.list_names() == ["mock-image"]
+        assert self.registry.catalog().list("image") == (entry,)
+        assert not self.registry.is_loaded("mock-image")
+        assert calls == []
+
+        assert self.registry.get("mock-image") is self.mock_image_gen
+        assert self.registry.get("mock-image") is self.mock_image_gen
+        assert self.registry.list_by_artifact_type("image") == [self.mock_image_gen]
+        assert self.registry.is_loaded("mock-image")
+        assert calls == [1]
+
+        with pytest.raises(ValueError, match="already registered"):
+            self.registry.register(self.mock_image_gen)
+
+    def test_lazy_generator_mismatch_raises(self):
+        """Test a stale manifest entry is detected when the generator is imported."""
+        entry = GeneratorCatalogEntry(
+            name="renamed", description="", artifact_type="image", input_schema={}
+        )
+        self.registry.register_lazy(entry, lambda: self.mock_image_gen)
+
+        with pytest.raises(ValueError, match="manifest"):
+            self.registry.get("renamed")
+
+        assert self.registry.unregister("renamed") is True
+        assert self.registry.list_by_artifact_type("image") == []
+
 
 class TestGlobalRegistry:
     """Tests for the global registry instance."""
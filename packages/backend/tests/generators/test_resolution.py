@@ -4,8 +4,10 @@ Tests for artifact resolution utilities.
 
 import base64
 import os
+import struct
 import tempfile
-from unittest.mock import AsyncMock, patch
+import tracemalloc
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -20,8 +22,11 @@ from boards.generators.resolution import (
     _decode_data_url,
     download_artifact_to_temp,
     download_from_url,
+    iter_data_url,
     resolve_artifact,
     store_image_result,
+    store_text_result,
+    store_video_result,
 )
 
 
@@ -66,6 +71,26 @@ class TestResolveArtifact:
             assert result == "/tmp/downloaded_audio.mp3"
             mock_download.assert_called_once_with(artifact)
 
+    @pytest.mark.asyncio
+    async def test_resolve_inline_artifact(self):
+        """Test resolving artifact whose content is inline in a data URL."""
+        artifact = ImageArtifact(
+            generation_id="test",
+            storage_url="data:image/png;base64," + base64.b64encode(b"fake png").decode("ascii"),
+            format="png",
+            width=1,
+            height=1,
+        )
+
+        temp_path = await resolve_artifact(artifact)
+
+        try:
+            assert temp_path.endswith(".png")
+            with open(temp_path, "rb") as f:
+                assert f.read() == b"fake png"
+        finally:
+            os.unlink(temp_path)
+
     @pytest.mark.asyncio
     async def test_resolve_text_artifact_fails(self):
         """Test that resolving TextArtifact raises an error."""
@@ -132,7 +157,9 @@ class TestDownloadArtifactToTemp:
                 assert content == fake_content
 
             # Verify the HTTP call was made correctly
-            mock_client.stream.assert_called_once_with("GET", "https://example.com/image.png")
+            mock_client.stream.assert_called_once_with(
+                "GET", "https://example.com/image.png", timeout=300.0
+            )
             mock_response.raise_for_status.assert_called_once()
 
             # Clean up
@@ -272,6 +299,102 @@ class TestStoreResults:
         # Storage URL should be different from input URL
         assert "storage" in result.storage_url or result.storage_url.startswith("file://")
 
+    @pytest.mark.asyncio
+    async def test_store_image_result_prefers_probed_dimensions(self, tmp_path):
+        """Dimensions from the image headers override provider defaults."""
+        import io
+
+        from PIL import Image
+
+        from boards.storage.factory import create_development_storage
+
+        storage_manager = create_development_storage()
+        storage_manager.providers["local"].base_path = tmp_path  # type: ignore[attr-defined]
+
+        png = io.BytesIO()
+        Image.new("RGB", (640, 480)).save(png, format="PNG")
+
+        with patch(
+            "boards.generators.resolution.download_from_url",
+            AsyncMock(return_value=png.getvalue()),
+        ):
+            result = await store_image_result(
+                storage_manager=storage_manager,
+                generation_id="gen_123",
+                tenant_id="tenant_123",
+                board_id="board_123",
+                storage_url="https://example.com/generated.png",
+                format="png",
+                width=1024,
+                height=1024,
+            )
+
+        assert (result.width, result.height) == (640, 480)
+
+    @pytest.mark.asyncio
+    async def test_store_text_result_inline(self):
+        """Small text results are stored inline instead of uploaded."""
+        storage_manager = MagicMock()
+        storage_manager.store_artifact = AsyncMock()
+        content = "Transcript: 100% done, naïve café — ok?\n"
+
+        result = await store_text_result(
+            storage_manager=storage_manager,
+            generation_id="gen_123",
+            tenant_id="tenant_123",
+            board_id="board_123",
+            content=content,
+            format="plain",
+        )
+
+        storage_manager.store_artifact.assert_not_awaited()
+        assert result.content == content
+        assert result.storage_url.startswith("data:text/plain;charset=utf-8,")
+        assert await download_from_url(result.storage_url) == content.encode("utf-8")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("format", "content_type"),
+        [("markdown", "text/markdown"), ("json", "application/json"), ("html", "text/plain")],
+    )
+    async def test_store_text_result_inline_has_format_content_type(self, format, content_type):
+        """Inline text is typed by its format; markup is never served as HTML."""
+        storage_manager = MagicMock()
+
+        result = await store_text_result(
+            storage_manager=storage_manager,
+            generation_id="gen_123",
+            tenant_id="tenant_123",
+            board_id="board_123",
+            content="# Title",
+            format=format,
+        )
+
+        assert result.storage_url == f"data:{content_type};charset=utf-8,%23%20Title"
+
+    @pytest.mark.asyncio
+    async def test_store_text_result_uploads_large_text(self, monkeypatch):
+        """Text results over the inline limit are uploaded to storage."""
+        from boards.config import settings
+
+        monkeypatch.setattr(settings, "inline_text_max_size", 16)
+        storage_manager = MagicMock()
+        storage_manager.store_artifact = AsyncMock(
+            return_value=MagicMock(storage_key="key", storage_url="https://cdn/key")
+        )
+
+        result = await store_text_result(
+            storage_manager=storage_manager,
+            generation_id="gen_123",
+            tenant_id="tenant_123",
+            board_id="board_123",
+            content="x" * 17,
+            format="plain",
+        )
+
+        assert result.storage_url == "https://cdn/key"
+        assert storage_manager.store_artifact.await_args.kwargs["content"] == b"x" * 17
+
     @pytest.mark.skip(reason="Replaced by test_storage_integration.py tests")
     @pytest.mark.asyncio
     async def test_store_video_result(self):
@@ -341,6 +464,139 @@ class TestDataURLDecoding:
         with pytest.raises(ValueError, match="Failed to decode base64 data"):
             _decode_data_url(data_url)
 
+    @pytest.mark.parametrize("chunk_size", [1, 3, 4, 1000, 1024 * 1024])
+    def test_iter_data_url_matches_b64decode(self, chunk_size):
+        """Incremental decoding yields the same bytes as decoding in one go."""
+        test_data = os.urandom(10_000)
+        # MIME-style line breaks must be skipped wherever the blocks split
+        encoded = base64.encodebytes(test_data).decode("ascii")
+        data_url = f"data:application/octet-stream;base64,{encoded}"
+
+        blocks = list(iter_data_url(data_url, chunk_size=chunk_size))
+
+        assert b"".join(blocks) == test_data
+        assert all(blocks)
+        assert max(len(block) for block in blocks) <= max(chunk_size, 3)
+
+    def test_iter_data_url_peak_memory_is_bounded_by_chunk_size(self):
+        """Streaming a large data URL never holds the decoded content at once."""
+        chunk_size = 256 * 1024
+        data_url = "data:video/mp4;base64," + base64.b64encode(os.urandom(16 * 1024 * 1024)).decode(
+            "ascii"
+        )
+
+        tracemalloc.start()
+        try:
+            total = sum(len(block) for block in iter_data_url(data_url, chunk_size=chunk_size))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert total == 16 * 1024 * 1024
+        assert peak < 8 * chunk_size
+
+    @pytest.mark.asyncio
+    async def test_store_image_result_streams_data_url(self, tmp_path):
+        """Data URL results are uploaded block by block and probed from the first."""
+        import io
+
+        from PIL import Image
+
+        from boards.storage.factory import create_development_storage
+
+        storage_manager = create_development_storage()
+        storage_manager.providers["local"].base_path = tmp_path  # type: ignore[attr-defined]
+        store_artifact = AsyncMock(wraps=storage_manager.store_artifact)
+        storage_manager.store_artifact = store_artifact  # type: ignore[method-assign]
+
+        png = io.BytesIO()
+        Image.new("RGB", (640, 480)).save(png, format="PNG")
+        encoded = base64.b64encode(png.getvalue()).decode("ascii")
+
+        result = await store_image_result(
+            storage_manager=storage_manager,
+            generation_id="gen_123",
+            tenant_id="tenant_123",
+            board_id="board_123",
+            storage_url=f"data:image/png;base64,{encoded}",
+            format="png",
+        )
+
+        assert (result.width, result.height) == (640, 480)
+        assert not isinstance(store_artifact.await_args.kwargs["content"], bytes)
+        [stored] = tmp_path.rglob("gen_123_*/original")
+        assert stored.read_bytes() == png.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_store_video_result_probes_moov_after_large_media_data(self, tmp_path):
+        """The moov box is found even when it comes several blocks into a data URL."""
+        from boards.storage.factory import create_development_storage
+
+        storage_manager = create_development_storage()
+        storage_manager.providers["local"].base_path = tmp_path  # type: ignore[attr-defined]
+
+        def box(box_type: bytes, payload: bytes) -> bytes:
+            return struct.pack(">I", 8 + len(payload)) + box_type + payload
+
+        mvhd = box(b"mvhd", b"\x00" * 12 + struct.pack(">II", 1000, 4000) + b"\x00" * 80)
+        video = (
+            box(b"ftyp", b"isom\x00\x00\x02\x00isom")
+            + box(b"mdat", os.urandom(3 * 1024 * 1024))
+            + box(b"moov", mvhd)
+        )
+        encoded = base64.b64encode(video).decode("ascii")
+
+        result = await store_video_result(
+            storage_manager=storage_manager,
+            generation_id="gen_123",
+            tenant_id="tenant_123",
+            board_id="board_123",
+            storage_url=f"data:video/mp4;base64,{encoded}",
+            format="mp4",
+            duration=10.0,
+        )
+
+        assert result.duration == 4.0
+        [stored] = tmp_path.rglob("gen_123_*/original")
+        assert stored.read_bytes() == video
+
+    @pytest.mark.asyncio
+    async def test_store_image_result_retries_data_url_upload(self, tmp_path):
+        """A failed upload of a data URL result is retried from its first byte."""
+        from boards.storage.factory import create_development_storage
+
+        storage_manager = create_development_storage()
+        provider = storage_manager.providers["local"]
+        provider.base_path = tmp_path  # type: ignore[attr-defined]
+        upload = provider.upload
+        attempts = []
+
+        async def flaky_upload(key, content, content_type, metadata=None):
+            attempts.append(key)
+            if len(attempts) > 1:
+                return await upload(key, content, content_type, metadata)
+            await anext(content)
+            raise OSError("connection reset")
+
+        provider.upload = flaky_upload  # type: ignore[method-assign]
+
+        data = os.urandom(3 * 1024 * 1024)
+        encoded = base64.b64encode(data).decode("ascii")
+
+        with patch("boards.storage.base.asyncio.sleep", AsyncMock()):
+            await store_image_result(
+                storage_manager=storage_manager,
+                generation_id="gen_123",
+                tenant_id="tenant_123",
+                board_id="board_123",
+                storage_url=f"data:image/png;base64,{encoded}",
+                format="png",
+            )
+
+        assert len(attempts) == 2
+        [stored] = tmp_path.rglob("gen_123_*/original")
+        assert stored.read_bytes() == data
+
     @pytest.mark.asyncio
     async def test_download_from_url_with_data_url(self):
         """Test that download_from_url handles data URLs."""
@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark for generator loading.
+
+Compares loading baseline-config/generators.yaml eagerly (every generator
+module imported at boot) against loading it from a prebuilt manifest, where
+generator modules are only imported on first `registry.get()`. Each run is a
+fresh interpreter so import caches do not carry over.
+
+Skipped unless BOARDS_RUN_BENCHMARKS=1, e.g.:
+
+    BOARDS_RUN_BENCHMARKS=1 pytest tests/generators/test_startup_benchmark.py -s
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+CONFIG_PATH = BACKEND_ROOT / "baseline-config" / "generators.yaml"
+RUNS = int(os.environ.get("BOARDS_STARTUP_BENCH_RUNS", "5"))
+
+# Time from interpreter start of `boards` imports to a ready registry, then the
+# cost of the first lookup (which imports the generator's module when lazy).
+STARTUP_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from boards.generators.loader import load_generators_from_config
+from boards.generators.registry import registry
+t1 = time.perf_counter()
+load_generators_from_config(sys.argv[1], manifest_path=sys.argv[2] or None)
+t2 = time.perf_counter()
+registry.get(registry.list_names()[0])
+t3 = time.perf_counter()
+print(json.dumps({
+    "load": t2 - t1,
+    "total": t2 - t0,
+    "first_get": t3 - t2,
+    "generators": len(registry),
+    "modules": len(sys.modules),
+}))
+"""
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("BOARDS_RUN_BENCHMARKS") != "1",
+    reason="Set BOARDS_RUN_BENCHMARKS=1 to run benchmarks",
+)
+
+
+def _run(manifest_path: str) -> dict[str, float]:
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_ROOT / "src"), "BOARDS_LOG_LEVEL": "WARNING"}
+    proc = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT, str(CONFIG_PATH), manifest_path],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _median(runs: list[dict[str, float]], key: str) -> float:
+    return statistics.median(run[key] for run in runs)
+
+
+def test_manifest_startup_is_faster_than_eager_loading(tmp_path):
+    manifest_path = tmp_path / "generators.manifest.json"
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "boards.cli",
+            "generators",
+            "build-manifest",
+            "--config",
+            str(CONFIG_PATH),
+            "--output",
+            str(manifest_path),
+        ],
+        check=True,
+        capture_output=True,
+        env={**os.environ, "PYTHONPATH": str(BACKEND_ROOT / "src")},
+    )
+
+    eager = [_run("") for _ in range(RUNS)]
+    lazy = [_run(str(manifest_path)) for _ in range(RUNS)]
+
+    print()
+    for label, runs in (("eager", eager), ("manifest", lazy)):
+        print(
+            f"{label:>8}: load={_median(runs, 'load') * 1000:.0f}ms "
+            f"total={_median(runs, 'total') * 1000:.0f}ms "
+            f"first_get={_median(runs, 'first_get') * 1000:.1f}ms "
+            f"generators={int(runs[0]['generators'])} modules={int(runs[0]['modules'])}"
+        )
+
+    assert eager[0]["generators"] == lazy[0]["generators"]
+    assert lazy[0]["modules"] < eager[0]["modules"]
+    assert _median(lazy, "load") < _median(eager, "load")
@@ -0,0 +1,135 @@
+"""
+Unit tests for ID-only lineage traversal and batched node hydration
+"""
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import strawberry
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
+from boards.dbmodels import Generations
+from boards.graphql.resolvers.lineage import (
+    convert_db_to_graphql_generation,
+    resolve_ancestry,
+    resolve_descendants,
+)
+
+
+def _generation(gen_id: uuid.UUID) -> Generations:
+    gen = Generations()
+    gen.id = gen_id
+    gen.tenant_id = DEFAULT_TENANT_UUID
+    gen.board_id = uuid.uuid4()
+    gen.user_id = uuid.uuid4()
+    gen.generator_name = "flux-pro"
+    gen.artifact_type = "image"
+    gen.input_params = {}
+    gen.output_metadata = {}
+    gen.status = "completed"
+    gen.progress = 100
+    gen.created_at = datetime.now(UTC)
+    gen.updated_at = datetime.now(UTC)
+    return gen
+
+
+def _session_returning(cte_rows, generations):
+    """Mock session: first execute() is the CTE, second is the batch hydration."""
+    cte_result = MagicMock()
+    cte_result.fetchall.return_value = cte_rows
+    hydrate_result = MagicMock()
+    hydrate_result.scalars().all.return_value = generations
+
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.side_effect = [cte_result, hydrate_result]
+    return session
+
+
+@pytest.fixture
+def auth_context():
+    return AuthContext(
+        user_id=uuid.uuid4(),
+        tenant_id=DEFAULT_TENANT_UUID,
+        principal={"provider": "none", "subject": "user"},
+        token="test-token",
+    )
+
+
+@pytest.mark.asyncio
+async def test_ancestry_builds_tree_from_edges(auth_context):
+    """root <- (a as image, b as mask); a <- c as image."""
+    root, a, b, c = (uuid.uuid4() for _ in range(4))
+    rows = [
+        SimpleNamespace(id=root, child_id=None, role=None),
+        SimpleNamespace(id=a, child_id=root, role="image"),
+        SimpleNamespace(id=b, child_id=root, role="mask"),
+        SimpleNamespace(id=c, child_id=a, role="image"),
+    ]
+    gens = [_generation(g) for g in (root, a, b, c)]
+    session = _session_returning(rows, gens)
+
+    with (
+        patch("boards.graphql.resolvers.lineage.get_auth_context_from_info") as mock_get_auth,
+        patch("boards.graphql.resolvers.lineage.get_async_session") as mock_session,
+    ):
+        mock_get_auth.return_value = auth_context
+        mock_session.return_value.__aenter__.return_value = session
+
+        tree = await resolve_ancestry(
+            convert_db_to_graphql_generation(gens[0]), MagicMock(spec=strawberry.Info)
+        )
+
+    # One CTE + one batch hydration, regardless of tree size
+    assert session.execute.await_count == 2
+    assert "generation_lineage" in str(session.execute.await_args_list[0].args[0])
+
+    assert tree.generation.id == root
+    assert {(p.generation.id, p.role, p.depth) for p in tree.parents} == {
+        (a, "image", 1),
+        (b, "mask", 1),
+    }
+    node_a = next(p for p in tree.parents if p.generation.id == a)
+    assert [(p.generation.id, p.depth) for p in node_a.parents] == [(c, 2)]
+
+
+@pytest.mark.asyncio
+async def test_descendants_skips_nodes_outside_tenant(auth_context):
+    """Nodes that fail tenant-scoped hydration are dropped from the tree."""
+    root, child, foreign = (uuid.uuid4() for _ in range(3))
+    rows = [
+        SimpleNamespace(id=root, parent_id=None, role=None),
+        SimpleNamespace(id=child, parent_id=root, role="input"),
+        SimpleNamespace(id=foreign, parent_id=root, role="input"),
+    ]
+    gens = [_generation(root), _generation(child)]
+    session = _session_returning(rows, gens)
+
+    with (
+        patch("boards.graphql.resolvers.lineage.get_auth_context_from_info") as mock_get_auth,
+        patch("boards.graphql.resolvers.lineage.get_async_session") as mock_session,
+    ):
+        mock_get_auth.return_value = auth_context
+        mock_session.return_value.__aenter__.return_value = session
+
+        tree = await resolve_descendants(
+            convert_db_to_graphql_generation(gens[0]), MagicMock(spec=strawberry.Info)
+        )
+
+    assert [(c.generation.id, c.role, c.depth) for c in tree.children] == [(child, "input", 1)]
+
+
+@pytest.mark.asyncio
+async def test_record_lineage_skips_non_array_input_artifacts():
+    """Rows whose input_artifacts is not a JSON array must not reach jsonb_array_elements."""
+    from boards.jobs.repository import record_lineage
+
+    session = AsyncMock(spec=AsyncSession)
+
+    await record_lineage(session, uuid.uuid4())
+
+    sql = str(session.execute.await_args.args[0])
+    assert "jsonb_typeof(g.input_artifacts) = 'array'" in sql
@@ -0,0 +1,163 @@
+"""
+Unit tests for keyset (cursor) pagination helpers and connection resolvers
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import strawberry
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
+from boards.dbmodels import Generations, Tags
+from boards.graphql.pagination import (
+    MAX_PAGE_SIZE,
+    apply_keyset_pagination,
+    build_page_info,
+    clamp_page_size,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+)
+from boards.graphql.resolvers.tag import resolve_tags_connection
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+class TestCursorEncoding:
+    """Tests for cursor encode/decode."""
+
+    def test_round_trip_datetime(self):
+        row_id = uuid.uuid4()
+        ts = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+
+        value, decoded_id = decode_cursor(encode_cursor(ts, row_id))
+
+        assert datetime.fromisoformat(value) == ts
+        assert decoded_id == row_id
+
+    def test_round_trip_string(self):
+        row_id = uuid.uuid4()
+
+        assert decode_cursor(encode_cursor("landscape", row_id)) == ("landscape", row_id)
+
+    @pytest.mark.parametrize("cursor", ["not-base64!!", "e30=", "eyJrIjoxfQ=="])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
+
+    def test_clamp_page_size(self):
+        assert clamp_page_size(0) == 1
+        assert clamp_page_size(25) == 25
+        assert clamp_page_size(10_000) == MAX_PAGE_SIZE
+
+
+class TestKeysetQuery:
+    """Tests for the SQL produced by apply_keyset_pagination."""
+
+    def test_first_page_has_no_seek_condition(self):
+        stmt = apply_keyset_pagination(
+            select(Generations), Generations.created_at, Generations.id, first=10, after=None
+        )
+        sql = _compile(stmt)
+
+        assert "WHERE" not in sql
+        assert "ORDER BY boards.generations.created_at DESC, boards.generations.id DESC" in sql
+        assert stmt._limit_clause.value == 11  # one look-ahead row
+
+    def test_descending_seek_uses_row_comparison(self):
+        cursor = encode_cursor(datetime.now(UTC), uuid.uuid4())
+        stmt = apply_keyset_pagination(
+            select(Generations), Generations.created_at, Generations.id, first=10, after=cursor
+        )
+        sql = _compile(stmt)
+
+        assert "(boards.generations.created_at, boards.generations.id) <" in sql
+
+    def test_ascending_seek_uses_row_comparison(self):
+        cursor = encode_cursor("b", uuid.uuid4())
+        stmt = apply_keyset_pagination(
+            select(Tags), Tags.name, Tags.id, first=10, after=cursor, descending=False
+        )
+        sql = _compile(stmt)
+
+        assert "(boards.tags.name, boards.tags.id) >" in sql
+        assert "ORDER BY boards.tags.name ASC, boards.tags.id ASC" in sql
+
+    def test_split_page_and_page_info(self):
+        rows, has_next = split_page([1, 2, 3], 2)
+        assert rows == [1, 2]
+        assert has_next is True
+
+        page_info = build_page_info(["a", "b"], has_next, after="z")
+        assert page_info.start_cursor == "a"
+        assert page_info.end_cursor == "b"
+        assert page_info.has_previous_page is True
+
+        empty = build_page_info([], False, after=None)
+        assert empty.start_cursor is None
+        assert empty.has_previous_page is False
+
+
+class TestTagsConnection:
+    """Tests for resolve_tags_connection."""
+
+    @pytest.mark.asyncio
+    async def test_returns_edges_with_cursors(self):
+        info = MagicMock(spec=strawberry.Info)
+        now = datetime.now(UTC)
+        tags = []
+        for i, name in enumerate(["alpha", "beta", "gamma"]):
+            tag = MagicMock(spec=Tags)
+            tag.id = uuid.uuid4()
+            tag.tenant_id = DEFAULT_TENANT_UUID
+            tag.name = name
+            tag.slug = name
+            tag.description = None
+            tag.metadata_ = {}
+            tag.created_at = now + timedelta(seconds=i)
+            tag.updated_at = now + timedelta(seconds=i)
+            tags.append(tag)
+
+        with (
+            patch("boards.graphql.resolvers.tag.get_auth_context_from_info") as mock_get_auth,
+            patch("boards.graphql.resolvers.tag.get_async_session") as mock_session,
+        ):
+            mock_get_auth.return_value = AuthContext(
+                user_id=uuid.uuid4(),
+                tenant_id=DEFAULT_TENANT_UUID,
+                principal={"provider": "none", "subject": "user"},
+                token="test-token",
+            )
+            mock_async_session = AsyncMock(spec=AsyncSession)
+            mock_session.return_value.__aenter__.return_value = mock_async_session
+
+            # Look-ahead row present -> has_next_page
+            mock_result = MagicMock()
+            mock_result.scalars().all.return_value = tags
+            mock_async_session.execute.return_value = mock_result
+
+            connection = await resolve_tags_connection(info, first=2, after=None)
+
+        assert [edge.node.name for edge in connection.edges] == ["alpha", "beta"]
+        assert connection.page_info.has_next_page is True
+        assert connection.page_info.end_cursor == connection.edges[-1].cursor
+        assert decode_cursor(connection.page_info.end_cursor) == ("beta", tags[1].id)
+
+    @pytest.mark.asyncio
+    async def test_unauthenticated_returns_empty(self):
+        info = MagicMock(spec=strawberry.Info)
+
+        with patch("boards.graphql.resolvers.tag.get_auth_context_from_info") as mock_get_auth:
+            mock_get_auth.return_value = None
+
+            connection = await resolve_tags_connection(info, first=10, after=None)
+
+        assert connection.edges == []
+        assert connection.page_info.has_next_page is False
@@ -0,0 +1,80 @@
+"""
+Unit tests for the search_generations resolver
+"""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import strawberry
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
+from boards.dbmodels import GENERATION_PROMPT_TSVECTOR, Generations
+from boards.graphql.pagination import MAX_PAGE_SIZE
+from boards.graphql.resolvers.generation import search_generations
+
+
+def _generation(prompt: str) -> MagicMock:
+    gen = MagicMock(spec=Generations)
+    gen.id = uuid.uuid4()
+    gen.tenant_id = DEFAULT_TENANT_UUID
+    gen.board_id = uuid.uuid4()
+    gen.user_id = uuid.uuid4()
+    gen.generator_name = "flux-pro"
+    gen.artifact_type = "image"
+    gen.storage_url = None
+    gen.thumbnail_url = None
+    gen.additional_files = []
+    gen.input_params = {"prompt": prompt}
+    gen.output_metadata = {}
+    gen.external_job_id = None
+    gen.status = "completed"
+    gen.progress = 1.0
+    gen.error_message = None
+    gen.started_at = None
+    gen.completed_at = None
+    gen.created_at = datetime.now(UTC)
+    gen.updated_at = datetime.now(UTC)
+    return gen
+
+
+@pytest.mark.asyncio
+async def test_search_generations_uses_indexed_expression_and_ranks():
+    """The query must use the indexed tsvector expression and order by rank."""
+    info = MagicMock(spec=strawberry.Info)
+    generations = [_generation("a dragon over a glacier"), _generation("a dragon")]
+
+    with (
+        patch("boards.graphql.resolvers.generation.get_auth_context_from_info") as mock_get_auth,
+        patch("boards.graphql.resolvers.generation.get_async_session") as mock_session,
+    ):
+        mock_get_auth.return_value = AuthContext(
+            user_id=None, tenant_id=DEFAULT_TENANT_UUID, principal=None, token=None
+        )
+        mock_async_session = AsyncMock(spec=AsyncSession)
+        mock_session.return_value.__aenter__.return_value = mock_async_session
+
+        mock_result = MagicMock()
+        mock_result.scalars().all.return_value = generations
+        mock_async_session.execute.return_value = mock_result
+
+        results = await search_generations(
+            info, "dragon glacier", board_id=None, limit=10_000, offset=0
+        )
+
+        stmt = mock_async_session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        params = stmt.compile(dialect=postgresql.dialect()).params
+
+    assert [r.id for r in results] == [g.id for g in generations]
+    assert f"{GENERATION_PROMPT_TSVECTOR} @@ websearch_to_tsquery('english'" in sql
+    assert "ORDER BY ts_rank_cd(" in sql
+    # Unauthenticated: only public boards of the tenant
+    assert "boards.boards.is_public" in sql
+    assert "boards.generations.tenant_id = " in sql
+    assert DEFAULT_TENANT_UUID in params.values()
+    # The requested limit is clamped to the maximum page size
+    assert MAX_PAGE_SIZE in params.values()
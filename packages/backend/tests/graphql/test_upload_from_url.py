@@ -0,0 +1,179 @@
+"""Tests for streaming artifact uploads from URLs against a local HTTP server."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
+from boards.config import settings
+from boards.graphql.resolvers import upload as upload_resolvers
+from boards.graphql.types.generation import ArtifactType, UploadArtifactInput
+from boards.storage.base import StorageConfig, StorageManager
+from boards.storage.implementations.local import LocalStorageProvider
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * (3 * 1024 * 1024)
+
+
+@pytest.fixture
+async def server(serve_asgi, monkeypatch):
+    """Serve test files on localhost; returns the base URL and request stats."""
+    stats = {"in_flight": 0, "max_in_flight": 0}
+
+    async def png(request: Request) -> Response:
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(0.05)
+            return Response(PNG, media_type="application/octet-stream")
+        finally:
+            stats["in_flight"] -= 1
+
+    async def endless(request: Request) -> Response:
+        async def body():
+            yield PNG[:64]
+            for _ in range(1024):
+                yield b"\x00" * 65536
+
+        # Chunked, so there is no Content-Length to reject it up front
+        return StreamingResponse(body(), media_type="image/png")
+
+    base_url = await serve_asgi(
+        Starlette(routes=[Route("/image.png", png), Route("/endless.png", endless)])
+    )
+
+    # The server is on localhost, which the SSRF check rejects
+    monkeypatch.setattr(upload_resolvers, "_is_safe_url", lambda url: (True, None))
+    return base_url, stats
+
+
+@pytest.fixture
+def uploads(tmp_path, monkeypatch):
+    """Store uploads in local storage with the database mocked out."""
+    manager = StorageManager(
+        StorageConfig(
+            default_provider="local",
+            providers={},
+            routing_rules=[],
+            max_file_size=settings.max_upload_size,
+        )
+    )
+    manager.register_provider("local", LocalStorageProvider(tmp_path))
+    monkeypatch.setattr(upload_resolvers, "create_storage_manager", lambda: manager)
+
+    generations = []
+    session = AsyncMock()
+
+    def add(gen):
+        gen.id = uuid4()
+        generations.append(gen)
+
+    session.add = MagicMock(side_effect=add)
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    monkeypatch.setattr(upload_resolvers, "get_async_session", fake_session)
+    monkeypatch.setattr(upload_resolvers, "check_board_upload_access", AsyncMock())
+    monkeypatch.setattr(upload_resolvers.jobs_repo, "record_lineage", AsyncMock())
+
+    auth_context = AuthContext(
+        user_id=uuid4(),
+        tenant_id=DEFAULT_TENANT_UUID,
+        principal={"provider": "none", "subject": "test-user"},
+        token="test-token",
+    )
+    monkeypatch.setattr(
+        upload_resolvers, "get_auth_context_from_info", AsyncMock(return_value=auth_context)
+    )
+    return manager, generations
+
+
+def _input(url: str) -> UploadArtifactInput:
+    return UploadArtifactInput(board_id=uuid4(), artifact_type=ArtifactType.IMAGE, file_url=url)
+
+
+async def test_url_upload_is_streamed_to_storage_with_sniffed_type(server, uploads):
+    base_url, _ = server
+    manager, generations = uploads
+
+    result = await upload_resolvers.upload_artifact_from_url(
+        MagicMock(), _input(f"{base_url}/image.png")
+    )
+
+    [gen] = generations
+    assert result.status.value == "completed"
+    assert gen.output_metadata["mime_type"] == "image/png"
+    assert gen.output_metadata["file_size"] == len(PNG)
+    stored = await manager.providers["local"].download(gen.output_metadata["storage_key"])
+    assert stored == PNG
+
+
+async def test_url_upload_is_cut_off_once_it_exceeds_the_size_limit(
+    server, uploads, tmp_path, monkeypatch
+):
+    base_url, _ = server
+    _, generations = uploads
+    monkeypatch.setattr(settings, "max_upload_size", 1024 * 1024)
+
+    with pytest.raises(RuntimeError, match="exceeds maximum allowed size"):
+        await upload_resolvers.upload_artifact_from_url(
+            MagicMock(), _input(f"{base_url}/endless.png")
+        )
+
+    [gen] = generations
+    assert gen.status == "failed"
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+async def test_batch_upload_limits_concurrency_and_reports_failures(server, uploads, monkeypatch):
+    base_url, stats = server
+    monkeypatch.setattr(settings, "url_upload_concurrency", 2)
+    urls = [f"{base_url}/image.png"] * 5 + [f"{base_url}/missing.png"]
+
+    results = await upload_resolvers.upload_artifacts_from_urls(
+        MagicMock(), [_input(url) for url in urls]
+    )
+
+    assert [result.file_url for result in results] == urls
+    assert all(result.generation.status.value == "completed" for result in results[:5])
+    assert results[5].generation is None
+    assert "HTTP 404" in results[5].error
+    assert stats["max_in_flight"] == 2
+
+
+async def test_batch_upload_reports_unexpected_errors_per_item(server, uploads, monkeypatch):
+    base_url, _ = server
+    ingest = upload_resolvers._ingest_url
+
+    async def flaky_ingest(auth_context, input):
+        if input.file_url.endswith("broken.png"):
+            raise ConnectionResetError("database connection lost")
+        return await ingest(auth_context, input)
+
+    monkeypatch.setattr(upload_resolvers, "_ingest_url", flaky_ingest)
+    urls = [f"{base_url}/image.png", f"{base_url}/broken.png"]
+
+    results = await upload_resolvers.upload_artifacts_from_urls(
+        MagicMock(), [_input(url) for url in urls]
+    )
+
+    assert results[0].generation.status.value == "completed"
+    assert results[1].generation is None
+    assert "database connection lost" in results[1].error
+
+
+async def test_batch_upload_rejects_oversized_batches(uploads, monkeypatch):
+    monkeypatch.setattr(settings, "url_upload_max_batch", 2)
+
+    with pytest.raises(RuntimeError, match="Too many uploads"):
+        await upload_resolvers.upload_artifacts_from_urls(
+            MagicMock(), [_input("https://example.com/a.png")] * 3
+        )
@@ -9,6 +9,11 @@ from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
 from boards.graphql.types.generation import ArtifactType
 
 
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
 @pytest.fixture
 def auth_context():
     """Create a test auth context."""
@@ -216,22 +221,22 @@ class TestUploadArtifactFromURL:
         mock_board.board_members = []
 
         # Mock the HTTP request and storage
-        with patch("boards.graphql.resolvers.upload.aiohttp.ClientSession") as mock_session_cls:
+        with patch("boards.graphql.resolvers.upload.get_http_client") as mock_get_client:
             mock_resp = MagicMock()
-            mock_resp.status = 200
+            mock_resp.status_code = 200
             mock_resp.headers = {
                 "Content-Type": "image/jpeg",
                 "Content-Length": "1024",
             }
-            mock_resp.read = AsyncMock(return_value=b"fake-image-data")
+            mock_resp.aiter_bytes.return_value = _chunks(b"fake-image-data")
 
-            # Set up mock session context manager chain
-            mock_get_ctx = AsyncMock()
-            mock_get_ctx.__aenter__.return_value = mock_resp
+            # Set up mock stream context manager chain
+            mock_stream_ctx = AsyncMock()
+            mock_stream_ctx.__aenter__.return_value = mock_resp
 
-            mock_session = MagicMock()
-            mock_session.get.return_value = mock_get_ctx
-            mock_session_cls.return_value.__aenter__.return_value = mock_session
+            mock_client = MagicMock()
+            mock_client.stream.return_value = mock_stream_ctx
+            mock_get_client.return_value = mock_client
 
             with patch("boards.graphql.resolvers.upload.create_storage_manager") as mock_storage:
                 mock_manager = AsyncMock()
@@ -342,21 +347,21 @@ class TestUploadArtifactFromURL:
             parent_generation_id=None,
         )
 
-        with patch("boards.graphql.resolvers.upload.aiohttp.ClientSession") as mock_session_cls:
+        with patch("boards.graphql.resolvers.upload.get_http_client") as mock_get_client:
             mock_resp = MagicMock()
-            mock_resp.status = 200
+            mock_resp.status_code = 200
             mock_resp.headers = {
                 "Content-Type": "image/jpeg",
                 "Content-Length": str(101 * 1024 * 1024),  # 101 MB
             }
 
-            # Set up mock session context manager chain
-            mock_get_ctx = AsyncMock()
-            mock_get_ctx.__aenter__.return_value = mock_resp
+            # Set up mock stream context manager chain
+            mock_stream_ctx = AsyncMock()
+            mock_stream_ctx.__aenter__.return_value = mock_resp
 
-            mock_session = MagicMock()
-            mock_session.get.return_value = mock_get_ctx
-            mock_session_cls.return_value.__aenter__.return_value = mock_session
+            mock_client = MagicMock()
+            mock_client.stream.return_value = mock_stream_ctx
+            mock_get_client.return_value = mock_client
 
             mock_info = MagicMock()
             mock_info.context = {"auth_context": auth_context}
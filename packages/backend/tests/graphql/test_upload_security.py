@@ -2,12 +2,9 @@
 
 import pytest
 
-from boards.graphql.resolvers.upload import (
-    _is_safe_url,
-    _sanitize_filename,
-    _validate_mime_type,
-)
+from boards.graphql.resolvers.upload import _is_safe_url
 from boards.graphql.types.generation import ArtifactType
+from boards.uploads import sanitize_filename, validate_mime_type
 
 
 class TestURLSecurity:
@@ -91,7 +88,7 @@ class TestMIMETypeValidation:
             "image/webp",
         ]
         for mime_type in valid_types:
-            is_valid, error = _validate_mime_type(mime_type, ArtifactType.IMAGE, "test.jpg")
+            is_valid, error = validate_mime_type(mime_type, "image", "test.jpg")
             assert is_valid is True
             assert error is None
 
@@ -103,7 +100,7 @@ class TestMIMETypeValidation:
             "video/webm",
         ]
         for mime_type in valid_types:
-            is_valid, error = _validate_mime_type(mime_type, ArtifactType.VIDEO, "test.mp4")
+            is_valid, error = validate_mime_type(mime_type, "video", "test.mp4")
             assert is_valid is True
             assert error is None
 
@@ -115,7 +112,7 @@ class TestMIMETypeValidation:
             "audio/ogg",
         ]
         for mime_type in valid_types:
-            is_valid, error = _validate_mime_type(mime_type, ArtifactType.AUDIO, "test.mp3")
+            is_valid, error = validate_mime_type(mime_type, "audio", "test.mp3")
             assert is_valid is True
             assert error is None
 
@@ -127,22 +124,20 @@ class TestMIMETypeValidation:
             "application/json",
         ]
         for mime_type in valid_types:
-            is_valid, error = _validate_mime_type(mime_type, ArtifactType.TEXT, "test.txt")
+            is_valid, error = validate_mime_type(mime_type, "text", "test.txt")
             assert is_valid is True
             assert error is None
 
     def test_rejects_mismatched_mime_types(self):
         """MIME types not matching artifact type should be rejected."""
-        is_valid, error = _validate_mime_type("video/mp4", ArtifactType.IMAGE, "test.mp4")
+        is_valid, error = validate_mime_type("video/mp4", "image", "test.mp4")
         assert is_valid is False
         assert error is not None
         assert "does not match" in error.lower()
 
     def test_handles_mime_type_with_charset(self):
         """MIME types with charset should be normalized."""
-        is_valid, error = _validate_mime_type(
-            "text/plain; charset=utf-8", ArtifactType.TEXT, "test.txt"
-        )
+        is_valid, error = validate_mime_type("text/plain; charset=utf-8", "text", "test.txt")
         assert is_valid is True
         assert error is None
 
@@ -159,24 +154,24 @@ class TestFilenameSanitization:
 
     def test_sanitizes_basic_filename(self):
         """Basic filenames should pass through unchanged."""
-        result = _sanitize_filename("image.jpg")
+        result = sanitize_filename("image.jpg")
         assert result == "image.jpg"
 
     def test_removes_path_components(self):
         """Path components should be removed."""
-        result = _sanitize_filename("../../../etc/passwd")
+        result = sanitize_filename("../../../etc/passwd")
         assert result == "passwd"
         assert ".." not in result
         assert "/" not in result
 
     def test_removes_absolute_paths(self):
         """Absolute paths should be reduced to basename."""
-        result = _sanitize_filename("/var/www/html/image.jpg")
+        result = sanitize_filename("/var/www/html/image.jpg")
         assert result == "image.jpg"
 
     def test_removes_windows_paths(self):
         """Windows paths should have backslashes converted to underscores on Unix."""
-        result = _sanitize_filename("C:\\Users\\test\\image.jpg")
+        result = sanitize_filename("C:\\Users\\test\\image.jpg")
         # On Unix, backslashes are treated as dangerous characters and replaced
         # The colon in C: is also replaced
         assert "\\" not in result
@@ -185,12 +180,12 @@ class TestFilenameSanitization:
 
     def test_removes_null_bytes(self):
         """Null bytes should be removed."""
-        result = _sanitize_filename("image\x00.jpg")
+        result = sanitize_filename("image\x00.jpg")
         assert "\x00" not in result
 
     def test_removes_dangerous_characters(self):
         """Dangerous characters should be replaced."""
-        result = _sanitize_filename('test<>:"|?*.jpg')
+        result = sanitize_filename('test<>:"|?*.jpg')
         assert "<" not in result
         assert ">" not in result
         assert ":" not in result
@@ -201,16 +196,16 @@ class TestFilenameSanitization:
 
     def test_handles_empty_filename(self):
         """Empty filenames should get a default."""
-        result = _sanitize_filename("")
+        result = sanitize_filename("")
         assert result == "uploaded_file"
 
     def test_handles_only_dots(self):
         """Filenames with only dots should get a default."""
-        result = _sanitize_filename("...")
+        result = sanitize_filename("...")
         assert result == "uploaded_file"
 
     def test_preserves_unicode_characters(self):
         """Unicode characters should be preserved."""
-        result = _sanitize_filename("测试文件.jpg")
+        result = sanitize_filename("测试文件.jpg")
         assert "测试文件" in result
         assert ".jpg" in result
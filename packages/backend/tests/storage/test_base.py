@@ -1,7 +1,7 @@
 """Tests for storage base classes and manager."""
 
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -257,6 +257,99 @@ class TestStorageManager:
         # Provider should not be called
         mock_provider.upload.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_store_artifact_stream_is_counted_and_not_retried(
+        self, manager: StorageManager, mock_provider: AsyncMock
+    ):
+        async def consume(key, content, content_type, metadata):
+            async for _ in content:
+                pass
+            raise StorageException("connection reset")
+
+        mock_provider.upload.side_effect = consume
+        manager.register_provider("local", mock_provider)
+
+        async def content():
+            yield b"a" * 100
+            yield b"b" * 50
+
+        # A consumed stream cannot be replayed, so there is a single attempt
+        with pytest.raises(StorageException):
+            await manager.store_artifact(
+                artifact_id="test",
+                content=content(),
+                artifact_type="image",
+                content_type="image/jpeg",
+            )
+        mock_provider.upload.assert_called_once()
+
+        async def read_all(key, content, content_type, metadata):
+            async for _ in content:
+                pass
+            return "http://example.com/file.jpg"
+
+        mock_provider.upload.side_effect = read_all
+        ref = await manager.store_artifact(
+            artifact_id="test",
+            content=content(),
+            artifact_type="image",
+            content_type="image/jpeg",
+        )
+        assert ref.size == 150
+
+    @pytest.mark.asyncio
+    async def test_store_artifact_stream_factory_is_retried(
+        self, manager: StorageManager, mock_provider: AsyncMock
+    ):
+        received = []
+
+        async def consume(key, content, content_type, metadata):
+            received.append(b"".join([chunk async for chunk in content]))
+            if len(received) == 1:
+                raise StorageException("connection reset")
+            return "http://example.com/file.jpg"
+
+        mock_provider.upload.side_effect = consume
+        manager.register_provider("local", mock_provider)
+
+        async def content():
+            yield b"a" * 100
+            yield b"b" * 50
+
+        # Each attempt opens the stream afresh
+        with patch("boards.storage.base.asyncio.sleep", AsyncMock()):
+            ref = await manager.store_artifact(
+                artifact_id="test",
+                content=content,
+                artifact_type="image",
+                content_type="image/jpeg",
+            )
+        assert received == [b"a" * 100 + b"b" * 50] * 2
+        assert ref.size == 150
+
+    @pytest.mark.asyncio
+    async def test_store_artifact_stream_over_limit_fails(
+        self, manager: StorageManager, mock_provider: AsyncMock
+    ):
+        async def consume(key, content, content_type, metadata):
+            async for _ in content:
+                pass
+
+        mock_provider.upload.side_effect = consume
+        manager.register_provider("local", mock_provider)
+
+        async def content():
+            for _ in range(3):
+                yield b"x" * 512 * 1024
+
+        with pytest.raises(ValidationException, match="exceeds limit"):
+            await manager.store_artifact(
+                artifact_id="test",
+                content=content(),
+                artifact_type="image",
+                content_type="image/jpeg",
+            )
+
     @pytest.mark.asyncio
     async def test_store_artifact_provider_not_found(self, manager: StorageManager):
         # No providers registered - should fail
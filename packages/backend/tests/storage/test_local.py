@@ -5,6 +5,7 @@ from collections.abc import Generator
 from datetime import timedelta
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from urllib.parse import parse_qsl
 
 import aiofiles
 import pytest
@@ -161,10 +162,23 @@ class TestLocalStorageProvider:
             "test/file.txt", "text/plain", timedelta(hours=1)
         )
 
-        assert result["url"] == "/api/storage/upload/test/file.txt"
-        assert result["fields"]["content-type"] == "text/plain"
+        url, _, query = result["url"].partition("?")
+        assert url == "http://localhost:8088/api/storage/upload/test/file.txt"
+        assert result["headers"]["Content-Type"] == "text/plain"
         assert result["method"] == "PUT"
-        assert result["expires_at"] is None
+        assert result["expires_at"] is not None
+
+        params = dict(parse_qsl(query))
+        expires, signature = int(params["expires"]), params["signature"]
+        assert provider.verify_upload_signature("test/file.txt", "text/plain", expires, signature)
+        # The signature binds the key, content type and expiry
+        assert not provider.verify_upload_signature(
+            "test/other.txt", "text/plain", expires, signature
+        )
+        assert not provider.verify_upload_signature(
+            "test/file.txt", "image/png", expires, signature
+        )
+        assert not provider.verify_upload_signature("test/file.txt", "text/plain", 1, signature)
 
     @pytest.mark.asyncio
     async def test_get_presigned_download_url(self, provider: LocalStorageProvider):
@@ -0,0 +1,157 @@
+"""Tests for on-demand image renditions."""
+
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from boards.api.app import app
+from boards.api.endpoints import storage as storage_endpoint
+from boards.storage import renditions
+from boards.storage.base import StorageConfig, StorageManager
+from boards.storage.implementations.local import LocalStorageProvider
+from boards.storage.renditions import ensure_rendition, rendition_key
+
+SOURCE_KEY = "tenant/image/board/gen_20261018000000_abcd1234/original"
+
+
+def _png(size: tuple[int, int]) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, "blue").save(output, format="PNG")
+    return output.getvalue()
+
+
+class CountingProvider(LocalStorageProvider):
+    """Local provider that counts source downloads."""
+
+    downloads = 0
+
+    async def download(self, key: str) -> bytes:
+        self.downloads += 1
+        return await super().download(key)
+
+
+@pytest.fixture
+def provider(tmp_path: Path):
+    provider = CountingProvider(tmp_path, public_url_base="http://localhost:8088/api/storage")
+    asyncio.run(
+        provider.upload(SOURCE_KEY, _png((2000, 1000)), "image/png", {"content_type": "image/png"})
+    )
+    yield provider
+    renditions.shutdown_rendition_pool()
+
+
+def test_rendition_key_sits_next_to_source():
+    assert rendition_key(SOURCE_KEY, width=512, fmt="webp") == (
+        "tenant/image/board/gen_20261018000000_abcd1234/original_w512.webp"
+    )
+    assert rendition_key("thumbnail", width=None, fmt="jpeg") == "thumbnail.jpeg"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_render_once_and_later_hits_read_storage(provider):
+    keys = await asyncio.gather(
+        *(ensure_rendition(provider, SOURCE_KEY, width=512, fmt="webp") for _ in range(5))
+    )
+
+    assert set(keys) == {rendition_key(SOURCE_KEY, width=512, fmt="webp")}
+    assert provider.downloads == 1
+    with Image.open(io.BytesIO(await provider.download(keys[0]))) as image:
+        assert (image.format, image.size) == ("WEBP", (512, 256))
+
+    provider.downloads = 0
+    await ensure_rendition(provider, SOURCE_KEY, width=512, fmt="webp")
+    assert provider.downloads == 0
+
+
+@pytest.fixture
+def client(provider, monkeypatch):
+    provider_cdn = LocalStorageProvider(provider.base_path, public_url_base="https://cdn.example")
+
+    def fake_storage_manager():
+        manager = StorageManager(
+            StorageConfig(default_provider="local", providers={}, routing_rules=[])
+        )
+        manager.register_provider("local", provider)
+        # A provider serving its files from elsewhere, like a bucket behind a CDN
+        manager.register_provider("cdn", provider_cdn)
+        return manager
+
+    monkeypatch.setattr(storage_endpoint, "create_storage_manager", fake_storage_manager)
+    return TestClient(app)
+
+
+def test_endpoint_serves_rendition_with_long_cache_headers(client):
+    resp = client.get(f"/api/storage/{SOURCE_KEY}", params={"w": 256, "fmt": "jpeg"})
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "image/jpeg"
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+    with Image.open(io.BytesIO(resp.content)) as image:
+        assert image.size == (256, 128)
+
+    # The original is unchanged
+    original = client.get(f"/api/storage/{SOURCE_KEY}")
+    assert "cache-control" not in original.headers
+    with Image.open(io.BytesIO(original.content)) as image:
+        assert image.size == (2000, 1000)
+
+
+def test_endpoint_rejects_unsupported_renditions(client):
+    assert client.get(f"/api/storage/{SOURCE_KEY}", params={"w": 333}).status_code == 400
+    assert client.get(f"/api/storage/{SOURCE_KEY}", params={"fmt": "bmp"}).status_code == 400
+
+
+def test_endpoint_rejects_renditions_of_renditions_and_thumbnails(client, provider):
+    first = client.get(f"/api/storage/{SOURCE_KEY}", params={"w": 256})
+    assert first.status_code == 200, first.text
+
+    rendition = rendition_key(SOURCE_KEY, width=256, fmt="webp")
+    for params in ({"w": 256}, {"fmt": "png"}):
+        resp = client.get(f"/api/storage/{rendition}", params=params)
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Renditions are only available for original images"
+
+    thumbnail = SOURCE_KEY.replace("/original", "/thumbnail")
+    asyncio.run(
+        provider.upload(
+            thumbnail,
+            _png((256, 128)),
+            "image/webp",
+            {"content_type": "image/webp", "variant": "thumbnail"},
+        )
+    )
+    assert client.get(f"/api/storage/{thumbnail}", params={"w": 256}).status_code == 400
+
+
+def test_rendition_route_redirects_to_the_providers_url(client, provider):
+    resp = client.get(
+        f"/api/storage/renditions/cdn/{SOURCE_KEY}",
+        params={"w": 256, "fmt": "jpeg"},
+        follow_redirects=False,
+    )
+
+    assert resp.status_code == 307, resp.text
+    rendition = rendition_key(SOURCE_KEY, width=256, fmt="jpeg")
+    assert resp.headers["location"] == f"https://cdn.example/{rendition}"
+    assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert asyncio.run(provider.exists(rendition))
+
+    assert (
+        client.get(f"/api/storage/renditions/cdn/{SOURCE_KEY}", params={"w": 333}).status_code
+        == 400
+    )
+    assert client.get(f"/api/storage/renditions/other/{SOURCE_KEY}").status_code == 404
+    missing = SOURCE_KEY.replace("abcd1234", "ffff0000")
+    assert client.get(f"/api/storage/renditions/cdn/{missing}").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_renditions_are_only_made_of_originals(provider):
+    rendition = await ensure_rendition(provider, SOURCE_KEY, width=512, fmt="webp")
+
+    with pytest.raises(renditions.RenditionError):
+        await ensure_rendition(provider, rendition, width=256, fmt="webp")
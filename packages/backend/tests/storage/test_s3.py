@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from boards.storage.base import StorageException
-from boards.storage.implementations.s3 import S3StorageProvider
+from boards.storage.implementations.s3 import MULTIPART_PART_SIZE, S3StorageProvider
 
 # Skip tests if S3 dependencies are not available
 pytest.importorskip("boto3", reason="boto3 not available")
@@ -117,6 +117,42 @@ class TestS3StorageProvider:
             mock_client.get_object.assert_called_once_with(Bucket="test-bucket", Key=test_key)
             assert result == test_content
 
+    @pytest.mark.asyncio
+    async def test_move_copies_server_side_then_deletes_source(self, s3_provider):
+        """Moves keep the object's metadata and the configured encryption."""
+        with patch.object(s3_provider, "_get_session") as mock_session:
+            mock_client = AsyncMock()
+            mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+
+            await s3_provider.move("a/upload", "a/original")
+
+            mock_client.copy_object.assert_called_once_with(
+                Bucket="test-bucket",
+                Key="a/original",
+                CopySource={"Bucket": "test-bucket", "Key": "a/upload"},
+                MetadataDirective="COPY",
+                ServerSideEncryption="AES256",
+                StorageClass="STANDARD",
+            )
+            mock_client.delete_object.assert_called_once_with(Bucket="test-bucket", Key="a/upload")
+
+    @pytest.mark.asyncio
+    async def test_download_range_requests_only_those_bytes(self, s3_provider):
+        """Ranged reads send an inclusive Range header."""
+        with patch.object(s3_provider, "_get_session") as mock_session:
+            mock_client = AsyncMock()
+            mock_response = {"Body": AsyncMock()}
+            mock_response["Body"].read = AsyncMock(return_value=b"\x89PNG")
+            mock_client.get_object.return_value = mock_response
+            mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+
+            result = await s3_provider.download_range("test/file.png", 0, 64)
+
+            mock_client.get_object.assert_called_once_with(
+                Bucket="test-bucket", Key="test/file.png", Range="bytes=0-63"
+            )
+            assert result == b"\x89PNG"
+
     @pytest.mark.asyncio
     async def test_get_presigned_upload_url(self, s3_provider):
         """Test presigned upload URL generation."""
@@ -136,9 +172,20 @@ class TestS3StorageProvider:
             result = await s3_provider.get_presigned_upload_url(test_key, test_content_type)
 
             assert result["url"] == test_url
+            assert result["method"] == "POST"
             assert result["fields"] == test_fields
             assert "expires_at" in result
 
+            # Upload settings become POST form fields, each covered by the policy
+            kwargs = mock_client.generate_presigned_post.call_args.kwargs
+            assert kwargs["Fields"] == {
+                "Content-Type": test_content_type,
+                "x-amz-server-side-encryption": "AES256",
+                "x-amz-storage-class": "STANDARD",
+            }
+            for name, value in kwargs["Fields"].items():
+                assert {name: value} in kwargs["Conditions"]
+
     @pytest.mark.asyncio
     async def test_get_presigned_download_url(self, s3_provider):
         """Test presigned download URL generation."""
@@ -254,6 +301,77 @@ class TestS3StorageProvider:
 
             assert "S3 upload failed" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_upload_small_stream_uses_single_request(self, s3_provider):
+        """A stream that fits in one part is uploaded with put_object."""
+
+        async def content():
+            yield b"chunk1"
+            yield b"chunk2"
+
+        with patch.object(s3_provider, "_get_session") as mock_session:
+            mock_client = AsyncMock()
+            mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+
+            await s3_provider.upload("test/file.txt", content(), "text/plain")
+
+            assert mock_client.put_object.call_args[1]["Body"] == b"chunk1chunk2"
+            mock_client.create_multipart_upload.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upload_large_stream_uses_multipart_upload(self, s3_provider):
+        """Streams larger than a part are sent as a multipart upload, one part at a time."""
+        chunk = b"x" * (MULTIPART_PART_SIZE // 2)
+
+        async def content():
+            for _ in range(5):
+                yield chunk
+
+        with patch.object(s3_provider, "_get_session") as mock_session:
+            mock_client = AsyncMock()
+            mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            mock_client.upload_part.side_effect = [{"ETag": f"etag-{i}"} for i in range(1, 4)]
+            mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+
+            await s3_provider.upload("test/video.mp4", content(), "video/mp4")
+
+            mock_client.put_object.assert_not_called()
+            assert mock_client.create_multipart_upload.call_args[1]["ContentType"] == "video/mp4"
+            bodies = [call[1]["Body"] for call in mock_client.upload_part.call_args_list]
+            assert [len(body) for body in bodies] == [
+                MULTIPART_PART_SIZE,
+                MULTIPART_PART_SIZE,
+                MULTIPART_PART_SIZE // 2,
+            ]
+            complete_args = mock_client.complete_multipart_upload.call_args[1]
+            assert complete_args["UploadId"] == "upload-1"
+            assert complete_args["MultipartUpload"]["Parts"] == [
+                {"ETag": "etag-1", "PartNumber": 1},
+                {"ETag": "etag-2", "PartNumber": 2},
+                {"ETag": "etag-3", "PartNumber": 3},
+            ]
+
+    @pytest.mark.asyncio
+    async def test_upload_stream_failure_aborts_multipart_upload(self, s3_provider):
+        """A stream that fails midway aborts the multipart upload."""
+
+        async def content():
+            yield b"x" * MULTIPART_PART_SIZE
+            raise OSError("client disconnected")
+
+        with patch.object(s3_provider, "_get_session") as mock_session:
+            mock_client = AsyncMock()
+            mock_client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+            mock_session.return_value.client.return_value.__aenter__.return_value = mock_client
+
+            with pytest.raises(StorageException):
+                await s3_provider.upload("test/video.mp4", content(), "video/mp4")
+
+            mock_client.abort_multipart_upload.assert_called_once_with(
+                UploadId="upload-1", Bucket="test-bucket", Key="test/video.mp4"
+            )
+            mock_client.complete_multipart_upload.assert_not_called()
+
     def test_invalid_import(self):
         """Test behavior when boto3/aioboto3 is not available."""
         with patch("boards.storage.implementations.s3._s3_available", False):
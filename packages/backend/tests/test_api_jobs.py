@@ -10,16 +10,16 @@ from boards.api.app import app
 def test_submit_generation_smoke(monkeypatch):
     client = TestClient(app)
 
-    # Monkeypatch the actor send to avoid needing Redis during test
-    sent = {}
+    # Monkeypatch the outbox relay to avoid needing Redis during test
+    relayed = []
 
+    from boards.api.endpoints import jobs
     from boards.jobs import repository as jobs_repo
-    from boards.workers import actors
 
-    def fake_send(gen_id: str):
-        sent["id"] = gen_id
+    async def fake_relay():
+        relayed.append(True)
 
-    monkeypatch.setattr(actors.process_generation, "send", fake_send)
+    monkeypatch.setattr(jobs, "relay_committed_generations", fake_relay)
 
     # Bypass DB FKs by faking create_generation
     async def fake_create_generation(db, **kwargs):
@@ -47,4 +47,5 @@ def test_submit_generation_smoke(monkeypatch):
     assert resp.status_code == 200, resp.text
     data = resp.json()
     assert "generation_id" in data
-    assert sent.get("id") == data["generation_id"]
+    assert data["generation_id"] == "00000000-0000-0000-0000-0000000000aa"
+    assert relayed == [True]
@@ -0,0 +1,187 @@
+"""Tests for streaming multipart uploads to /api/uploads/artifact."""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from boards.api.app import app
+from boards.api.endpoints import uploads
+from boards.auth import get_auth_context
+from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
+from boards.config import settings
+from boards.graphql.resolvers import upload as upload_resolvers
+from boards.storage.base import FileTooLargeException, StorageException
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.fixture
+def uploaded(monkeypatch):
+    """Capture what the endpoint hands to the upload resolver."""
+    calls = []
+
+    async def fake_upload_artifact_from_file(**kwargs):
+        chunks = [chunk async for chunk in kwargs["file_content"]]
+        calls.append({**kwargs, "chunks": chunks})
+        return SimpleNamespace(
+            id=uuid4(),
+            status=SimpleNamespace(value="completed"),
+            storage_url="http://localhost:8088/api/storage/upload",
+            thumbnail_url=None,
+            artifact_type=SimpleNamespace(value=kwargs["artifact_type"]),
+            generator_name=f"user-upload-{kwargs['artifact_type']}",
+            output_metadata={"file_size": sum(len(chunk) for chunk in chunks)},
+        )
+
+    monkeypatch.setattr(
+        upload_resolvers, "upload_artifact_from_file", fake_upload_artifact_from_file
+    )
+    app.dependency_overrides[get_auth_context] = lambda: AuthContext(
+        user_id=uuid4(),
+        tenant_id=DEFAULT_TENANT_UUID,
+        principal={"provider": "none", "subject": "test-user"},
+        token="test-token",
+    )
+    yield calls
+    app.dependency_overrides.pop(get_auth_context)
+
+
+def _post(content: bytes, filename: str, content_type: str):
+    return TestClient(app).post(
+        "/api/uploads/artifact",
+        data={"board_id": str(uuid4()), "artifact_type": "image"},
+        files={"file": (filename, content, content_type)},
+    )
+
+
+def test_upload_is_streamed_in_chunks_with_sniffed_type(uploaded):
+    content = PNG_HEADER + b"\x00" * (uploads.UPLOAD_CHUNK_SIZE * 2)
+
+    resp = _post(content, "photo.png", "application/octet-stream")
+
+    assert resp.status_code == 200, resp.text
+    [call] = uploaded
+    assert call["content_type"] == "image/png"
+    assert [len(chunk) for chunk in call["chunks"]] == [
+        uploads.UPLOAD_CHUNK_SIZE,
+        uploads.UPLOAD_CHUNK_SIZE,
+        len(PNG_HEADER),
+    ]
+    assert b"".join(call["chunks"]) == content
+
+
+def test_declared_type_is_kept_for_unsniffable_content(uploaded):
+    resp = _post(b"hello", "notes.txt", "text/plain")
+
+    assert resp.status_code == 200, resp.text
+    assert uploaded[0]["content_type"] == "text/plain"
+
+
+def test_oversized_file_is_rejected_without_reaching_storage(uploaded, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size", 1000)
+
+    resp = _post(PNG_HEADER + b"\x00" * 5000, "photo.png", "image/png")
+
+    assert resp.status_code == 413
+    assert uploaded == []
+
+
+def test_oversized_request_body_is_rejected_before_it_is_parsed(uploaded, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size", 1000)
+    content = b"\x00" * (2 * 1024 * 1024)
+
+    resp = _post(content, "photo.png", "image/png")
+
+    assert resp.status_code == 413
+    assert "exceeds maximum allowed size" in resp.json()["detail"]
+    assert uploaded == []
+
+
+def test_oversized_chunked_body_is_cut_off_while_received(uploaded, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size", 1000)
+    boundary = "boundary"
+
+    def body():
+        yield (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="a.png"'
+            "\r\nContent-Type: image/png\r\n\r\n"
+        ).encode()
+        # Sent with chunked encoding, so no Content-Length to check up front
+        for _ in range(64):
+            yield b"\x00" * 65536
+
+    resp = TestClient(app).post(
+        "/api/uploads/artifact",
+        content=body(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert resp.status_code == 413
+    assert uploaded == []
+
+
+def test_oversized_chunked_file_under_the_body_limit_is_rejected(uploaded, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size", 1000)
+    boundary = "boundary"
+
+    def body():
+        for name, value in (("board_id", str(uuid4())), ("artifact_type", "image")):
+            yield (
+                f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            ).encode()
+        yield (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="a.png"'
+            "\r\nContent-Type: image/png\r\n\r\n"
+        ).encode()
+        # Over the file limit, but within the multipart allowance of the body limit
+        for _ in range(5):
+            yield PNG_HEADER + b"\x00" * 1000
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    resp = TestClient(app).post(
+        "/api/uploads/artifact",
+        content=body(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert resp.status_code == 413
+    assert uploaded == []
+
+
+class _EndlessFile:
+    """Upload that keeps returning data, e.g. one whose size was not known up front."""
+
+    async def read(self, size: int) -> bytes:
+        return b"\x00" * 600
+
+
+@pytest.mark.asyncio
+async def test_stream_is_cut_off_at_the_size_limit(monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size", 1000)
+
+    with pytest.raises(FileTooLargeException):
+        async for _chunk in uploads._read_chunks(_EndlessFile(), PNG_HEADER):  # type: ignore[arg-type]
+            pass
+
+
+def test_size_limit_hit_in_storage_is_reported_as_413(uploaded, monkeypatch):
+    async def fake_upload_artifact_from_file(**kwargs):
+        # As the resolver reports a stream cut off by the storage provider
+        try:
+            try:
+                raise FileTooLargeException("File size exceeds limit")
+            except FileTooLargeException as e:
+                raise StorageException(f"Upload failed: {e}") from e
+        except StorageException as e:
+            raise RuntimeError(f"Upload failed: {e}") from e
+
+    monkeypatch.setattr(
+        upload_resolvers, "upload_artifact_from_file", fake_upload_artifact_from_file
+    )
+
+    resp = _post(PNG_HEADER, "photo.png", "image/png")
+
+    assert resp.status_code == 413
+    assert "exceeds maximum allowed size" in resp.json()["detail"]
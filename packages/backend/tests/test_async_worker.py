@@ -0,0 +1,186 @@
+"""Tests for the async-native worker runtime."""
+
+import asyncio
+import time
+
+import dramatiq
+import pytest
+from click.testing import CliRunner
+from dramatiq.brokers.stub import StubBroker
+from dramatiq.middleware import AsyncIO
+
+from boards.workers.async_runtime import AsyncWorker
+
+QUEUE = "boards-jobs"
+JOB_SECONDS = 0.2
+
+
+@pytest.fixture
+def broker():
+    broker = StubBroker()
+    broker.add_middleware(AsyncIO())
+    broker.emit_after("process_boot")
+    broker.declare_queue(QUEUE)
+    yield broker
+    broker.close()
+
+
+async def _run_until_drained(worker: AsyncWorker, broker: StubBroker, queue: str = QUEUE) -> None:
+    task = asyncio.create_task(worker.run())
+    try:
+        await asyncio.to_thread(broker.join, queue, timeout=10_000)
+    finally:
+        worker.stop()
+        await asyncio.wait_for(task, timeout=10)
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_concurrently_on_one_loop(broker):
+    loops = set()
+
+    @dramatiq.actor(broker=broker, queue_name=QUEUE, max_retries=0)
+    async def slow_job(i: int) -> None:
+        loops.add(asyncio.get_running_loop())
+        await asyncio.sleep(JOB_SECONDS)
+
+    for i in range(20):
+        slow_job.send(i)
+
+    worker = AsyncWorker(broker, queues=[QUEUE], concurrency=20, worker_timeout=50)
+    start = time.monotonic()
+    await _run_until_drained(worker, broker)
+    elapsed = time.monotonic() - start
+
+    # 20 jobs run serially would take 20 x JOB_SECONDS
+    assert elapsed < 5 * JOB_SECONDS
+    assert loops == {asyncio.get_running_loop()}
+    assert worker.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limits_in_flight_jobs(broker):
+    running = 0
+    peak = 0
+
+    @dramatiq.actor(broker=broker, queue_name=QUEUE, max_retries=0)
+    async def slow_job(i: int) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    for i in range(12):
+        slow_job.send(i)
+
+    await _run_until_drained(
+        AsyncWorker(broker, queues=[QUEUE], concurrency=3, worker_timeout=50), broker
+    )
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_split_between_queues(broker):
+    other_queue = "boards-other"
+    broker.declare_queue(other_queue)
+    prefetches = {}
+    consume = broker.consume
+
+    def recording_consume(queue_name, prefetch=1, timeout=5000):
+        prefetches[queue_name] = prefetch
+        return consume(queue_name, prefetch=prefetch, timeout=timeout)
+
+    broker.consume = recording_consume
+    worker = AsyncWorker(broker, queues=[QUEUE, other_queue], concurrency=5, worker_timeout=50)
+    task = asyncio.create_task(worker.run())
+    while len(prefetches) < 4:
+        await asyncio.sleep(0.01)
+    worker.stop()
+    await asyncio.wait_for(task, timeout=10)
+
+    assert prefetches[QUEUE] == prefetches[other_queue] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_job_is_retried_through_delay_queue(broker):
+    attempts = []
+
+    @dramatiq.actor(broker=broker, queue_name=QUEUE, max_retries=1, min_backoff=10, max_backoff=10)
+    async def flaky_job() -> None:
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            raise RuntimeError("provider unavailable")
+
+    flaky_job.send()
+
+    worker = AsyncWorker(broker, queues=[QUEUE], concurrency=5, worker_timeout=50)
+    task = asyncio.create_task(worker.run())
+    try:
+        for _ in range(200):
+            if len(attempts) == 2:
+                break
+            await asyncio.sleep(0.02)
+        await asyncio.to_thread(broker.join, QUEUE, timeout=10_000)
+        await asyncio.to_thread(broker.join, f"{QUEUE}.DQ", timeout=10_000)
+    finally:
+        worker.stop()
+        await asyncio.wait_for(task, timeout=10)
+
+    assert len(attempts) == 2
+    assert broker.dead_letters == []
+
+
+@pytest.mark.asyncio
+async def test_time_limit_fails_job(broker):
+    @dramatiq.actor(broker=broker, queue_name=QUEUE, max_retries=0, time_limit=50)
+    async def stuck_job() -> None:
+        await asyncio.sleep(10)
+
+    stuck_job.send()
+
+    await _run_until_drained(
+        AsyncWorker(broker, queues=[QUEUE], concurrency=5, worker_timeout=50), broker
+    )
+
+    [dead] = broker.dead_letters
+    assert dead.actor_name == "stuck_job"
+
+
+@pytest.mark.asyncio
+async def test_sync_actors_run_in_threads(broker):
+    done = []
+
+    @dramatiq.actor(broker=broker, queue_name=QUEUE, max_retries=0)
+    def blocking_job() -> None:
+        time.sleep(JOB_SECONDS)
+        done.append(True)
+
+    for _ in range(5):
+        blocking_job.send()
+
+    start = time.monotonic()
+    await _run_until_drained(
+        AsyncWorker(broker, queues=[QUEUE], concurrency=5, worker_timeout=50), broker
+    )
+
+    assert len(done) == 5
+    assert time.monotonic() - start < 3 * JOB_SECONDS
+
+
+def test_cli_async_mode(monkeypatch):
+    from boards.workers import cli
+
+    started = []
+    monkeypatch.setattr(
+        cli,
+        "start_async_worker",
+        lambda concurrency, queues, log_level: started.append((concurrency, queues)),
+    )
+
+    result = CliRunner().invoke(
+        cli.main, ["--async", "--concurrency", "200", "--queues", "boards-jobs"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert started == [(200, ["boards-jobs"])]
@@ -0,0 +1,328 @@
+"""Tests for two-step direct-to-storage uploads (/api/uploads/direct)."""
+
+import asyncio
+import hashlib
+import os
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from boards import uploads
+from boards.api.app import app
+from boards.api.endpoints import storage as storage_endpoint
+from boards.auth.context import DEFAULT_TENANT_UUID, AuthContext
+from boards.dbmodels import Generations
+from boards.storage.base import StorageConfig, StorageException, StorageManager
+from boards.storage.implementations.local import LocalStorageProvider
+
+CONTENT = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    manager = StorageManager(
+        StorageConfig(default_provider="local", providers={}, routing_rules=[])
+    )
+    manager.register_provider(
+        "local",
+        LocalStorageProvider(tmp_path, public_url_base="http://testserver/api/storage"),
+    )
+    monkeypatch.setattr(storage_endpoint, "create_storage_manager", lambda: manager)
+    monkeypatch.setattr(uploads, "create_storage_manager", lambda: manager)
+    return manager
+
+
+def _reserve(manager: StorageManager, content_type: str = "image/png"):
+    return asyncio.run(
+        manager.create_upload_target(
+            artifact_id=str(uuid4()),
+            artifact_type="image",
+            content_type=content_type,
+            size=len(CONTENT),
+            tenant_id=str(DEFAULT_TENANT_UUID),
+            board_id=str(uuid4()),
+            expires_in=timedelta(minutes=5),
+        )
+    )
+
+
+def _put(target, content: bytes = CONTENT, content_type: str = "image/png"):
+    return TestClient(app).request(
+        target.upload["method"],
+        target.upload["url"],
+        content=content,
+        headers={**target.upload["headers"], "Content-Type": content_type},
+    )
+
+
+def test_local_presigned_upload_is_stored_and_verified(manager):
+    target = _reserve(manager)
+
+    resp = _put(target)
+
+    assert resp.status_code == 204, resp.text
+    stored = asyncio.run(manager.get_artifact_metadata(target.storage_key, target.storage_provider))
+    assert (stored["size"], stored["content_type"]) == (len(CONTENT), "image/png")
+    asyncio.run(
+        uploads._verify_direct_upload(
+            manager,
+            target.storage_key,
+            target.storage_provider,
+            stored,
+            size=len(CONTENT),
+            content_type="image/png",
+            sha256=SHA256,
+        )
+    )
+
+
+def test_local_upload_url_is_bound_to_its_signature_and_content_type(manager):
+    target = _reserve(manager)
+
+    tampered = target.upload["url"].replace("signature=", "signature=0")
+    resp = TestClient(app).put(tampered, content=CONTENT, headers=target.upload["headers"])
+    assert resp.status_code == 403
+
+    assert _put(target, content_type="text/html").status_code == 403
+
+
+@pytest.mark.parametrize(
+    ("expected", "error"),
+    [
+        ({"size": len(CONTENT) + 1}, "expected"),
+        ({"content_type": "image/jpeg"}, "expected image/jpeg"),
+        ({"sha256": "0" * 64}, "SHA-256"),
+    ],
+)
+def test_verification_rejects_mismatching_uploads(manager, expected, error):
+    target = _reserve(manager)
+    assert _put(target).status_code == 204
+    stored = asyncio.run(manager.get_artifact_metadata(target.storage_key, target.storage_provider))
+
+    reservation = {"size": len(CONTENT), "content_type": "image/png", "sha256": SHA256}
+    with pytest.raises(RuntimeError, match=error):
+        asyncio.run(
+            uploads._verify_direct_upload(
+                manager,
+                target.storage_key,
+                target.storage_provider,
+                stored,
+                **{**reservation, **expected},
+            )
+        )
+
+
+def test_verification_sniffs_the_uploaded_bytes(manager):
+    # A JPEG uploaded with the PNG type the upload was reserved for
+    jpeg = b"\xff\xd8\xff\xe0" + CONTENT[4:]
+    target = _reserve(manager)
+    assert _put(target, content=jpeg).status_code == 204
+    stored = asyncio.run(manager.get_artifact_metadata(target.storage_key, target.storage_provider))
+
+    with pytest.raises(RuntimeError, match="is image/jpeg, expected image/png"):
+        asyncio.run(
+            uploads._verify_direct_upload(
+                manager,
+                target.storage_key,
+                target.storage_provider,
+                stored,
+                size=len(CONTENT),
+                content_type="image/png",
+                sha256=None,
+            )
+        )
+
+
+def test_verification_reads_the_upload_in_chunks(manager, monkeypatch):
+    provider = manager.providers["local"]
+    content = CONTENT + b"\x00" * (2 * 1024 * 1024)
+    target = asyncio.run(
+        manager.create_upload_target(
+            artifact_id=str(uuid4()),
+            artifact_type="image",
+            content_type="image/png",
+            size=len(content),
+            tenant_id=str(DEFAULT_TENANT_UUID),
+            board_id=str(uuid4()),
+        )
+    )
+    assert _put(target, content=content).status_code == 204
+    stored = asyncio.run(manager.get_artifact_metadata(target.storage_key, target.storage_provider))
+
+    async def no_full_download(key):
+        raise AssertionError("verification must not download the whole file")
+
+    monkeypatch.setattr(provider, "download", no_full_download)
+    asyncio.run(
+        uploads._verify_direct_upload(
+            manager,
+            target.storage_key,
+            target.storage_provider,
+            stored,
+            size=len(content),
+            content_type="image/png",
+            sha256=hashlib.sha256(content).hexdigest(),
+        )
+    )
+
+
+@pytest.fixture
+def pending_upload(manager, monkeypatch):
+    """A reserved direct upload, with the database mocked out."""
+    auth_context = AuthContext(
+        user_id=uuid4(),
+        tenant_id=DEFAULT_TENANT_UUID,
+        principal={"provider": "none", "subject": "test-user"},
+        token="test-token",
+    )
+    target = _reserve(manager)
+
+    gen = Generations()
+    gen.id = uuid4()
+    gen.tenant_id = auth_context.tenant_id
+    gen.board_id = uuid4()
+    gen.user_id = auth_context.user_id
+    gen.generator_name = "user-upload-image"
+    gen.artifact_type = "image"
+    gen.status = "pending"
+    gen.input_params = {"upload_source": "direct"}
+    gen.output_metadata = {
+        "file_size": len(CONTENT),
+        "mime_type": "image/png",
+        "sha256": SHA256,
+        "storage_key": target.storage_key,
+        "storage_provider": target.storage_provider,
+    }
+
+    session = AsyncMock()
+    session.add = MagicMock()
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    monkeypatch.setattr(uploads, "get_async_session", fake_session)
+    monkeypatch.setattr(uploads.jobs_repo, "get_generation", AsyncMock(return_value=gen))
+    monkeypatch.setattr(uploads.jobs_repo, "record_lineage", AsyncMock())
+    return auth_context, gen, target
+
+
+def test_complete_marks_verified_upload_completed(pending_upload):
+    auth_context, gen, target = pending_upload
+    assert _put(target).status_code == 204
+
+    result = asyncio.run(uploads.complete_direct_upload(auth_context, gen.id))
+
+    final_key = target.storage_key.replace("/upload", "/original")
+    assert gen.status == "completed"
+    assert gen.output_metadata["storage_key"] == final_key
+    assert result.storage_url == f"http://testserver/api/storage/{final_key}"
+    # The row is locked so concurrent completes verify the upload once
+    assert uploads.jobs_repo.get_generation.await_args.kwargs["for_update"] is True
+    # A retried complete returns the upload unchanged
+    asyncio.run(uploads.complete_direct_upload(auth_context, gen.id))
+    assert uploads.jobs_repo.record_lineage.await_count == 1
+
+
+def test_uploading_again_after_complete_does_not_replace_the_artifact(pending_upload, manager):
+    auth_context, gen, target = pending_upload
+    assert _put(target).status_code == 204
+    asyncio.run(uploads.complete_direct_upload(auth_context, gen.id))
+
+    # The presigned request is still valid, but only writes the upload key
+    assert _put(target, content=b"\x89PNG\r\n\x1a\n" + b"\xff" * 4096).status_code == 204
+
+    provider = manager.providers["local"]
+    assert asyncio.run(provider.download(gen.output_metadata["storage_key"])) == CONTENT
+
+
+def test_expired_reservations_fail_and_delete_their_upload(pending_upload, manager, monkeypatch):
+    _, gen, target = pending_upload
+    assert _put(target).status_code == 204
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [gen]
+    session.execute = AsyncMock(return_value=result)
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    monkeypatch.setattr(uploads, "get_async_session", fake_session)
+
+    assert asyncio.run(uploads.expire_direct_uploads()) == 1
+
+    assert gen.status == "failed"
+    assert "expired" in gen.error_message
+    session.commit.assert_awaited_once()
+    with pytest.raises(StorageException):
+        asyncio.run(manager.get_artifact_metadata(target.storage_key, target.storage_provider))
+    # Only stale pending direct uploads are selected
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "generations.status = " in sql
+    assert "generations.created_at < " in sql
+    assert "FOR UPDATE SKIP LOCKED" in sql
+
+
+def test_complete_before_upload_leaves_generation_pending(pending_upload):
+    auth_context, gen, _ = pending_upload
+
+    with pytest.raises(RuntimeError, match="not found in storage"):
+        asyncio.run(uploads.complete_direct_upload(auth_context, gen.id))
+
+    assert gen.status == "pending"
+
+
+def test_complete_fails_and_deletes_mismatching_upload(pending_upload, manager):
+    auth_context, gen, target = pending_upload
+    assert _put(target, content=CONTENT[:-1]).status_code == 204
+
+    with pytest.raises(RuntimeError, match="Upload failed"):
+        asyncio.run(uploads.complete_direct_upload(auth_context, gen.id))
+
+    assert gen.status == "failed"
+    for key in (target.storage_key, target.storage_key.replace("/upload", "/original")):
+        with pytest.raises(StorageException):
+            asyncio.run(manager.get_artifact_metadata(key, target.storage_provider))
+
+
+@pytest.mark.skipif(
+    not os.environ.get("BOARDS_TEST_S3_ENDPOINT"),
+    reason="Set BOARDS_TEST_S3_ENDPOINT (and _BUCKET, _ACCESS_KEY, _SECRET_KEY) to an "
+    "S3-compatible server such as MinIO",
+)
+def test_presigned_post_upload_to_s3_compatible_server():
+    from boards.storage.implementations.s3 import S3StorageProvider
+
+    provider = S3StorageProvider(
+        bucket=os.environ.get("BOARDS_TEST_S3_BUCKET", "boards-test"),
+        aws_access_key_id=os.environ.get("BOARDS_TEST_S3_ACCESS_KEY", "minioadmin"),
+        aws_secret_access_key=os.environ.get("BOARDS_TEST_S3_SECRET_KEY", "minioadmin"),
+        endpoint_url=os.environ["BOARDS_TEST_S3_ENDPOINT"],
+        # MinIO only supports server-side encryption with a KMS configured
+        upload_config={"ServerSideEncryption": None},
+    )
+    manager = StorageManager(StorageConfig(default_provider="s3", providers={}, routing_rules=[]))
+    manager.register_provider("s3", provider)
+    target = _reserve(manager)
+
+    resp = httpx.post(
+        target.upload["url"],
+        data=target.upload["fields"],
+        files={"file": ("photo.png", CONTENT, "image/png")},
+    )
+
+    assert resp.status_code == 204, resp.text
+    try:
+        stored = asyncio.run(provider.get_metadata(target.storage_key))
+        assert (stored["size"], stored["content_type"]) == (len(CONTENT), "image/png")
+    finally:
+        asyncio.run(provider.delete(target.storage_key))
@@ -0,0 +1,286 @@
+"""Tests for per-tenant admission control and fair dispatch of generations."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from boards.jobs import admission
+from boards.jobs.admission import AdmissionController, PendingJob
+
+
+class _FakeRedis:
+    """In-memory stand-in for the list, hash and sorted-set commands used."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self._lock = asyncio.Lock()
+
+    def lock(self, name: str, timeout: float, blocking_timeout: float) -> asyncio.Lock:
+        return self._lock
+
+    async def rpush(self, key: str, value: str) -> None:
+        self.lists.setdefault(key, []).append(value)
+
+    async def lpush(self, key: str, value: str) -> None:
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def lrange(self, key: str, start: int, end: int) -> list[str]:
+        values = self.lists.get(key, [])
+        return values[start:] if end == -1 else values[start : end + 1]
+
+    async def lrem(self, key: str, count: int, value: str) -> None:
+        self.lists[key].remove(value)
+
+    async def ltrim(self, key: str, start: int, end: int) -> None:
+        self.lists[key] = self.lists[key][start : end + 1]
+
+    async def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    async def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hget(self, key: str, field: str) -> str | None:
+        return self.hashes.get(key, {}).get(field)
+
+    async def hdel(self, key: str, field: str) -> None:
+        self.hashes.get(key, {}).pop(field, None)
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zscore(self, key: str, member: str) -> float | None:
+        return self.zsets.get(key, {}).get(member)
+
+    async def zrange(self, key: str, start: int, end: int, withscores: bool = False):
+        # Redis orders equal scores lexicographically by member
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        return items[start:] if end == -1 else items[start : end + 1]
+
+    async def zrem(self, key: str, member: str) -> None:
+        self.zsets.get(key, {}).pop(member, None)
+
+    async def zremrangebyscore(self, key: str, minimum: str, maximum: float) -> None:
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= maximum]:
+            del zset[member]
+
+    async def zrangebyscore(self, key: str, minimum: str, maximum: float) -> list[str]:
+        return [m for m, score in self.zsets.get(key, {}).items() if score <= maximum]
+
+    async def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+
+def _job(generation_id: str, tenant_id: str = "t1", user_id: str = "u1") -> PendingJob:
+    return PendingJob(generation_id, tenant_id, user_id, "fake-generator", time.time())
+
+
+def _ids(jobs: list[PendingJob]) -> list[str]:
+    return [job.generation_id for job in jobs]
+
+
+def _fake_enqueue() -> MagicMock:
+    return MagicMock(side_effect=lambda jobs: [MagicMock(queue_name="boards-jobs") for _ in jobs])
+
+
+def _enqueued_ids(enqueue: MagicMock) -> list[str]:
+    return [job.generation_id for call in enqueue.call_args_list for job in call.args[0]]
+
+
+@pytest.fixture
+def fake_redis():
+    return _FakeRedis()
+
+
+@pytest.mark.asyncio
+async def test_jobs_over_tenant_limit_are_deferred_until_release(fake_redis):
+    controller = AdmissionController(fake_redis, max_per_tenant=2)
+
+    assert _ids(await controller.submit(_job("g1"))) == ["g1"]
+    assert _ids(await controller.submit(_job("g2"))) == ["g2"]
+    assert await controller.submit(_job("g3")) == []
+    assert await controller.submit(_job("g4")) == []
+
+    # Freeing a slot dispatches the oldest deferred job
+    assert _ids(await controller.release("g1")) == ["g3"]
+    # Releasing an unknown job frees nothing
+    assert await controller.release("unknown") == []
+    assert _ids(await controller.release("g2")) == ["g4"]
+
+
+@pytest.mark.asyncio
+async def test_user_limit_lets_other_users_of_tenant_through(fake_redis):
+    controller = AdmissionController(fake_redis, max_per_tenant=10, max_per_user=1)
+
+    assert _ids(await controller.submit(_job("a1", user_id="alice"))) == ["a1"]
+    assert await controller.submit(_job("a2", user_id="alice")) == []
+    # Bob's job skips past Alice's deferred one
+    assert _ids(await controller.submit(_job("b1", user_id="bob"))) == ["b1"]
+
+    assert _ids(await controller.release("a1")) == ["a2"]
+
+
+@pytest.mark.asyncio
+async def test_expired_slots_are_reclaimed(fake_redis):
+    controller = AdmissionController(fake_redis, max_per_tenant=1, slot_ttl_seconds=-1)
+
+    assert _ids(await controller.submit(_job("g1"))) == ["g1"]
+    # g1's worker never released its slot, but the lease has already expired
+    assert _ids(await controller.submit(_job("g2"))) == ["g2"]
+    # The expired slot's owner is forgotten, so it does not accumulate
+    assert fake_redis.hashes[admission.ADMITTED_KEY] == {"g2": "t1:u1"}
+    assert list(fake_redis.zsets[admission.ALL_SLOTS_KEY]) == ["g2"]
+
+
+@pytest.mark.asyncio
+async def test_freed_slots_are_shared_fairly_across_tenants(fake_redis):
+    controller = AdmissionController(fake_redis, max_total=1)
+
+    # A noisy tenant queues a burst before a quieter tenant submits anything
+    running = _ids(await controller.submit(_job("noisy-0", tenant_id="noisy")))
+    for i in range(1, 6):
+        await controller.submit(_job(f"noisy-{i}", tenant_id="noisy"))
+    for i in range(2):
+        await controller.submit(_job(f"quiet-{i}", tenant_id="quiet"))
+
+    order = []
+    while running:
+        running = _ids(await controller.release(running[0]))
+        order.extend(running)
+
+    # The quiet tenant's jobs are interleaved rather than queued behind the burst
+    assert order == ["noisy-1", "quiet-0", "noisy-2", "quiet-1", "noisy-3", "noisy-4", "noisy-5"]
+
+
+@pytest.mark.asyncio
+async def test_tenant_weights_set_share_of_slots(fake_redis):
+    controller = AdmissionController(fake_redis, max_total=1, tenant_weights={"big": 3.0})
+
+    running = _ids(await controller.submit(_job("blocker", tenant_id="other")))
+    for i in range(6):
+        await controller.submit(_job(f"small-{i}", tenant_id="small"))
+        await controller.submit(_job(f"big-{i}", tenant_id="big"))
+
+    order = []
+    while running and len(order) < 8:
+        running = _ids(await controller.release(running[0]))
+        order.extend(running)
+
+    assert [job_id.split("-")[0] for job_id in order].count("big") == 6
+    assert [job_id.split("-")[0] for job_id in order].count("small") == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_percentiles_per_tenant(fake_redis, monkeypatch):
+    controller = AdmissionController(fake_redis)
+    now = time.time()
+    monkeypatch.setattr(admission.time, "time", lambda: now)
+
+    for i in range(100):
+        job = PendingJob(f"g{i}", "t1", "u1", "fake-generator", now - i)
+        await controller.submit(job)
+        await controller.record_start(job.generation_id)
+    await controller.submit(_job("other", tenant_id="t2"))
+
+    stats = await controller.queue_wait_stats("t1")
+    assert stats.samples == 100
+    assert (stats.p50, stats.p90, stats.p99) == (49.0, 89.0, 98.0)
+    # Jobs that have not started yet contribute no samples
+    assert (await controller.queue_wait_stats("t2")).samples == 0
+    # Each job is only sampled once
+    assert await controller.record_start("g0") is None
+
+
+@pytest.mark.asyncio
+async def test_admit_generation_enqueues_dispatched_jobs(fake_redis, monkeypatch):
+    from boards.workers import actors
+
+    monkeypatch.setattr(admission, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(actors.settings, "generation_admission_enabled", True)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_per_tenant", 1)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_per_user", 0)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_total", 0)
+    enqueue = _fake_enqueue()
+    monkeypatch.setattr(actors, "enqueue_generations", enqueue)
+
+    assert await actors.admit_generation("g1", "t1", "u1", "fake-generator") is True
+    assert await actors.admit_generation("g2", "t1", "u1", "fake-generator") is False
+    assert _enqueued_ids(enqueue) == ["g1"]
+
+    await actors._release_admission_slot("g1")
+    assert _enqueued_ids(enqueue) == ["g1", "g2"]
+
+
+@pytest.mark.asyncio
+async def test_admit_generation_falls_back_when_redis_is_down(monkeypatch):
+    from redis.exceptions import ConnectionError
+
+    from boards.workers import actors
+
+    client = MagicMock()
+    client.lock.return_value.__aenter__ = AsyncMock(side_effect=ConnectionError("down"))
+    monkeypatch.setattr(admission, "get_redis_client", lambda: client)
+    monkeypatch.setattr(actors.settings, "generation_admission_enabled", True)
+    enqueue = _fake_enqueue()
+    monkeypatch.setattr(actors, "enqueue_generations", enqueue)
+
+    assert await actors.admit_generation("g1", "t1", "u1", "fake-generator") is True
+    assert _enqueued_ids(enqueue) == ["g1"]
+
+
+@pytest.mark.asyncio
+async def test_admit_generations_submits_batch_once(fake_redis, monkeypatch):
+    from boards.workers import actors
+
+    monkeypatch.setattr(admission, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(actors.settings, "generation_admission_enabled", True)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_per_tenant", 2)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_per_user", 0)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_total", 0)
+    enqueue = _fake_enqueue()
+    monkeypatch.setattr(actors, "enqueue_generations", enqueue)
+
+    jobs = [_job("g1"), _job("g2"), _job("g3"), _job("h1", tenant_id="t2")]
+    assert await actors.admit_generations(jobs) == {"g1", "g2", "h1"}
+    # All dispatched jobs go out in a single enqueue call
+    assert enqueue.call_count == 1
+    assert sorted(_enqueued_ids(enqueue)) == ["g1", "g2", "h1"]
+
+
+@pytest.mark.asyncio
+async def test_resubmitting_a_job_does_not_defer_it_twice(fake_redis):
+    controller = AdmissionController(fake_redis, max_per_tenant=1)
+
+    assert _ids(await controller.submit_many([_job("g1"), _job("g2")])) == ["g1"]
+    # A relay retrying the same batch after a failed commit
+    assert await controller.submit_many([_job("g1"), _job("g2")]) == []
+    assert await controller.deferred(["g1", "g2", "g3"]) == {"g2"}
+
+    assert _ids(await controller.release("g1")) == ["g2"]
+    assert _ids(await controller.release("g2")) == []
+
+
+@pytest.mark.asyncio
+async def test_periodic_dispatch_sends_jobs_when_slots_expire(fake_redis, monkeypatch):
+    from boards.workers import actors
+
+    monkeypatch.setattr(admission, "get_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(actors.settings, "generation_admission_enabled", True)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_per_tenant", 1)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_per_user", 0)
+    monkeypatch.setattr(actors.settings, "generation_max_in_flight_total", 0)
+    enqueue = _fake_enqueue()
+    monkeypatch.setattr(actors, "enqueue_generations", enqueue)
+
+    await actors.admit_generations([_job("g1"), _job("g2")])
+    assert await actors.dispatch_deferred_generations() == 0
+
+    # g1's release was lost; its slot lease expires without further traffic
+    fake_redis.zsets[admission.tenant_slots_key("t1")]["g1"] = time.time() - 1
+    assert await actors.dispatch_deferred_generations() == 1
+    assert _enqueued_ids(enqueue) == ["g1", "g2"]
@@ -0,0 +1,156 @@
+"""Tests for cancelling running generations via the Redis cancellation signal."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from boards.jobs import cancellation
+from boards.jobs.cancellation import (
+    CANCEL_KEY_TTL_SECONDS,
+    GenerationCancelled,
+    cancel_key,
+    request_cancellation,
+)
+from boards.progress.models import ProgressUpdate
+from boards.workers import context as context_module
+from boards.workers.context import GeneratorExecutionContext
+
+
+class _FakeRedis:
+    """Minimal in-memory stand-in for the two Redis commands used."""
+
+    def __init__(self) -> None:
+        self.keys: dict[str, tuple[str, int | None]] = {}
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.keys[key] = (value, ex)
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.keys)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(cancellation, "get_redis_client", lambda: redis)
+    monkeypatch.setattr(context_module.settings, "generation_cancel_poll_interval", 0.01)
+    return redis
+
+
+def _make_context() -> GeneratorExecutionContext:
+    publisher = MagicMock()
+    publisher.publish_progress = AsyncMock()
+    return GeneratorExecutionContext(
+        uuid4(),
+        publisher,
+        MagicMock(),
+        uuid4(),
+        uuid4(),
+        uuid4(),
+        "test-generator",
+        "image",
+        {},
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_cancellation_sets_expiring_key(fake_redis):
+    await request_cancellation("abc")
+
+    assert fake_redis.keys[cancel_key("abc")] == ("1", CANCEL_KEY_TTL_SECONDS)
+
+
+@pytest.mark.asyncio
+async def test_run_cancellable_aborts_task_and_cancels_provider_job(fake_redis):
+    context = _make_context()
+    provider_cancel = AsyncMock()
+    started = asyncio.Event()
+    interrupted = False
+
+    async def slow_generate() -> str:
+        nonlocal interrupted
+        context.set_cancel_handler(provider_cancel)
+        started.set()
+        try:
+            await asyncio.sleep(60)  # e.g. a provider polling loop
+        except asyncio.CancelledError:
+            interrupted = True
+            raise
+        return "done"
+
+    async def cancel_soon() -> None:
+        await started.wait()
+        await request_cancellation(context.generation_id)
+
+    canceller = asyncio.create_task(cancel_soon())
+    with pytest.raises(GenerationCancelled):
+        await asyncio.wait_for(context.run_cancellable(slow_generate()), timeout=5)
+    await canceller
+
+    assert interrupted
+    assert context.cancelled
+    provider_cancel.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_cancellable_returns_result_without_cancelling(fake_redis):
+    context = _make_context()
+    provider_cancel = AsyncMock()
+
+    async def generate() -> str:
+        context.set_cancel_handler(provider_cancel)
+        return "done"
+
+    assert await context.run_cancellable(generate()) == "done"
+    provider_cancel.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cancel_handler_does_not_outlive_its_run(fake_redis):
+    context = _make_context()
+    first_cancel = AsyncMock()
+    started = asyncio.Event()
+
+    async def failed_generate() -> str:
+        context.set_cancel_handler(first_cancel)
+        raise RuntimeError("provider unavailable")
+
+    async def next_generate() -> str:
+        # e.g. an equivalent generator that has not submitted yet
+        started.set()
+        await asyncio.sleep(60)
+        return "done"
+
+    async def cancel_soon() -> None:
+        await started.wait()
+        await request_cancellation(context.generation_id)
+
+    with pytest.raises(RuntimeError):
+        await context.run_cancellable(failed_generate())
+    canceller = asyncio.create_task(cancel_soon())
+    with pytest.raises(GenerationCancelled):
+        await asyncio.wait_for(context.run_cancellable(next_generate()), timeout=5)
+    await canceller
+
+    first_cancel.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publish_progress_stops_cancelled_generation(fake_redis):
+    context = _make_context()
+    await request_cancellation(context.generation_id)
+
+    with pytest.raises(GenerationCancelled):
+        await context.publish_progress(
+            ProgressUpdate(
+                job_id=context.generation_id,
+                status="processing",
+                progress=0.5,
+                phase="processing",
+            )
+        )
+
+    # A cancelled generation must not be flipped back to "processing"
+    context.publisher.publish_progress.assert_not_awaited()
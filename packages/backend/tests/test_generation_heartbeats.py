@@ -0,0 +1,293 @@
+"""Tests for generation heartbeat leases and the stale-job reaper."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from boards.jobs import heartbeats
+from boards.jobs.heartbeats import (
+    _RELEASE_SCRIPT,
+    _RENEW_SCRIPT,
+    FINISHED,
+    LEASES_KEY,
+    GenerationLease,
+    lease_key,
+)
+from boards.workers import reaper
+
+
+class _FakeRedis:
+    """In-memory stand-in for the string, hash and sorted-set commands used.
+
+    The lease scripts run as Python equivalents.
+    """
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.expires: dict[str, float] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def _expire(self, key: str) -> None:
+        if key in self.expires and self.expires[key] <= time.time():
+            self.values.pop(key, None)
+            self.expires.pop(key, None)
+
+    def register_script(self, script: str):
+        return {_RENEW_SCRIPT: self._renew, _RELEASE_SCRIPT: self._release}[script]
+
+    async def _renew(self, keys, args) -> int:
+        lease, index = keys
+        token, ttl_ms, expiry, generation_id = args
+        if await self.get(lease) != token:
+            return 0
+        self.expires[lease] = time.time() + ttl_ms / 1000
+        await self.zadd(index, {generation_id: expiry})
+        return 1
+
+    async def _release(self, keys, args) -> int:
+        lease, index, reaps = keys
+        token, finished, finished_ttl, generation_id = args
+        holder = await self.get(lease)
+        if holder is not None and holder != token:
+            return 0
+        if finished:
+            await self.set(lease, FINISHED, ex=finished_ttl)
+            await self.hdel(reaps, generation_id)
+        else:
+            await self.delete(lease)
+        await self.zrem(index, generation_id)
+        return 1
+
+    async def set(self, key, value, px=None, ex=None, nx=False, xx=False):
+        self._expire(key)
+        if (nx and key in self.values) or (xx and key not in self.values):
+            return None
+        self.values[key] = value
+        ttl = px / 1000 if px is not None else ex
+        if ttl is not None:
+            self.expires[key] = time.time() + ttl
+        return True
+
+    async def get(self, key):
+        self._expire(key)
+        return self.values.get(key)
+
+    async def exists(self, key) -> int:
+        self._expire(key)
+        return int(key in self.values)
+
+    async def delete(self, key) -> None:
+        self.values.pop(key, None)
+
+    async def zadd(self, key, mapping) -> None:
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    async def zrem(self, key, member) -> int:
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    async def zrangebyscore(self, key, minimum, maximum, start=0, num=None):
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        members = [member for member, score in items if score <= maximum]
+        return members[start : None if num is None else start + num]
+
+    async def hincrby(self, key, field, amount) -> int:
+        values = self.hashes.setdefault(key, {})
+        values[field] = values.get(field, 0) + amount
+        return values[field]
+
+    async def hdel(self, key, field) -> None:
+        self.hashes.get(key, {}).pop(field, None)
+
+    def expire_now(self, generation_id: str) -> None:
+        """Simulate a worker that died: its lease and index entry lapse."""
+        self.values.pop(lease_key(generation_id), None)
+        self.zsets[LEASES_KEY][generation_id] = time.time() - 1
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    client = _FakeRedis()
+    monkeypatch.setattr(heartbeats, "get_redis_client", lambda: client)
+    return client
+
+
+def _lease(generation_id: str = "g1", client=None) -> GenerationLease:
+    return GenerationLease(generation_id, ttl_seconds=60, interval_seconds=0.01, client=client)
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_and_blocks_duplicates_after_finishing(fake_redis):
+    lease = _lease(client=fake_redis)
+    assert await lease.acquire() is True
+    # A second delivery of the same job cannot run while the first holds the lease
+    assert await _lease(client=fake_redis).acquire() is False
+
+    await lease.release(finished=True)
+    assert await fake_redis.get(lease_key("g1")) == FINISHED
+    assert await _lease(client=fake_redis).acquire() is False
+    assert "g1" not in fake_redis.zsets[LEASES_KEY]
+
+
+@pytest.mark.asyncio
+async def test_lease_dropped_for_retry_can_be_taken_again(fake_redis):
+    lease = _lease(client=fake_redis)
+    await lease.acquire()
+    await lease.release(finished=False)
+
+    assert await _lease(client=fake_redis).acquire() is True
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_renews_lease(fake_redis):
+    lease = _lease(client=fake_redis)
+    await lease.acquire()
+    first_expiry = fake_redis.zsets[LEASES_KEY]["g1"]
+
+    await asyncio.sleep(0.05)
+
+    assert fake_redis.zsets[LEASES_KEY]["g1"] > first_expiry
+    await lease.release(finished=True)
+
+
+@pytest.mark.asyncio
+async def test_stale_owner_cannot_renew_or_release(fake_redis):
+    stalled = _lease(client=fake_redis)
+    await stalled.acquire()
+    stalled._heartbeat.cancel()
+    # The stalled worker's lease lapses, the job is requeued and another worker takes it
+    fake_redis.expire_now("g1")
+    assert await heartbeats.claim_expired_lease("g1") is True
+    owner = _lease(client=fake_redis)
+    assert await owner.acquire() is True
+
+    assert await stalled.renew() is False
+    await stalled.release(finished=False)
+    await stalled.release(finished=True)
+
+    assert await fake_redis.get(lease_key("g1")) == owner.token
+    assert "g1" in fake_redis.zsets[LEASES_KEY]
+    # A third delivery still cannot run the job alongside its owner
+    assert await _lease(client=fake_redis).acquire() is False
+    await owner.release(finished=True)
+
+
+@pytest.mark.asyncio
+async def test_lost_lease_cancels_the_job(fake_redis):
+    lease = _lease(client=fake_redis)
+
+    async def job():
+        await lease.acquire()
+        # Another worker takes over while this one runs
+        fake_redis.values[lease_key("g1")] = "other-token"
+        await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(job(), timeout=5)
+    assert lease.lost is True
+    assert await fake_redis.get(lease_key("g1")) == "other-token"
+
+
+@pytest.mark.asyncio
+async def test_only_expired_leases_are_claimed_once(fake_redis):
+    live, dead = _lease("live", fake_redis), _lease("dead", fake_redis)
+    await live.acquire()
+    await dead.acquire()
+    dead._heartbeat.cancel()
+    fake_redis.expire_now("dead")
+
+    assert await heartbeats.expired_leases() == ["dead"]
+    assert await heartbeats.claim_expired_lease("dead") is True
+    # A concurrent reaper loses the race
+    assert await heartbeats.claim_expired_lease("dead") is False
+    await live.release(finished=True)
+
+
+@pytest.fixture
+def reaper_env(fake_redis, monkeypatch):
+    """Run the reaper against an in-memory generation row and publisher."""
+    state = SimpleNamespace(
+        status="processing", enqueued=[], published=[], persisted=[], released=[]
+    )
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    async def fake_get_generation(session, generation_id):
+        return SimpleNamespace(
+            id=generation_id,
+            tenant_id="t1",
+            user_id="u1",
+            generator_name="fal-flux",
+            created_at=datetime.now(UTC),
+            status=state.status,
+            external_job_id="req-1",
+        )
+
+    class _Publisher:
+        def __init__(self, settings) -> None:
+            pass
+
+        async def publish_progress(self, job_id, update):
+            state.persisted.append(update.status)
+
+        async def publish_only(self, job_id, update):
+            state.published.append(update.status)
+
+    async def fake_release(generation_id):
+        state.released.append(generation_id)
+
+    monkeypatch.setattr(reaper, "get_async_session", fake_session)
+    monkeypatch.setattr(reaper.jobs_repo, "get_generation", fake_get_generation)
+    monkeypatch.setattr(reaper, "ProgressPublisher", _Publisher)
+    monkeypatch.setattr(reaper, "_release_admission_slot", fake_release)
+    monkeypatch.setattr(
+        reaper,
+        "enqueue_generations",
+        lambda jobs: [
+            state.enqueued.append(job.generation_id) or SimpleNamespace(queue_name="boards-jobs")
+            for job in jobs
+        ],
+    )
+    monkeypatch.setattr(reaper.settings, "generation_max_reaps", 1)
+    return state
+
+
+async def _worker_dies(fake_redis, generation_id: str = "g1") -> None:
+    lease = _lease(generation_id, fake_redis)
+    await lease.acquire()
+    lease._heartbeat.cancel()
+    fake_redis.expire_now(generation_id)
+
+
+@pytest.mark.asyncio
+async def test_reaper_requeues_then_fails_generation(fake_redis, reaper_env):
+    await _worker_dies(fake_redis)
+
+    assert await reaper.reap_expired_leases() == 1
+    assert reaper_env.enqueued == ["g1"]
+    assert reaper_env.published == ["processing"]
+    # The requeued job can take the lease
+    await _worker_dies(fake_redis)
+
+    assert await reaper.reap_expired_leases() == 1
+    # Reaped more than generation_max_reaps times: terminal status for SSE listeners
+    assert reaper_env.enqueued == ["g1"]
+    assert reaper_env.persisted == ["failed"]
+    assert reaper_env.released == ["g1"]
+    assert await fake_redis.get(lease_key("g1")) == FINISHED
+
+
+@pytest.mark.asyncio
+async def test_reaper_ignores_finished_generations(fake_redis, reaper_env):
+    reaper_env.status = "completed"
+    await _worker_dies(fake_redis)
+
+    assert await reaper.reap_expired_leases() == 0
+    assert reaper_env.enqueued == []
+    assert await heartbeats.expired_leases() == []
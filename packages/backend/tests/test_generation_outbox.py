@@ -0,0 +1,278 @@
+"""Tests for the generation outbox, its batched relay and the stale-job sweeper."""
+
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import dramatiq
+import pytest
+from dramatiq.brokers.redis import RedisBroker
+from dramatiq.brokers.stub import StubBroker
+from redis.exceptions import ConnectionError
+from sqlalchemy.dialects import postgresql
+
+from boards.jobs import outbox
+from boards.jobs.admission import PendingJob
+from boards.workers import relay
+from boards.workers.queues import (
+    ENQUEUED_GENERATIONS_KEY,
+    enqueue_many,
+    lost_generations,
+    record_enqueued,
+)
+
+
+def _job(generation_id: str) -> PendingJob:
+    return PendingJob(generation_id, "t1", "u1", "fake-generator", time.time())
+
+
+class _Pipeline:
+    def __init__(self, held: set[tuple[str, str]] | None = None) -> None:
+        self.commands: list[tuple] = []
+        self.executed = 0
+        # (hash, field) pairs that exist, for HEXISTS
+        self.held = held or set()
+        self.results: list = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def evalsha(self, *args):
+        self.commands.append(args)
+
+    def hexists(self, key, field):
+        self.results.append((key, field) in self.held)
+
+    def execute(self):
+        self.executed += 1
+        return self.results
+
+
+def test_enqueue_many_pipelines_redis_enqueues(monkeypatch):
+    broker = RedisBroker(url="redis://localhost:1/0")
+    pipe = _Pipeline()
+    monkeypatch.setattr(broker.client, "pipeline", lambda transaction: pipe)
+    monkeypatch.setattr(RedisBroker, "_max_unpack_size_val", 1000)
+
+    @dramatiq.actor(broker=broker, queue_name="boards-jobs")
+    def job(n: int) -> None:
+        pass
+
+    before_enqueue = []
+    monkeypatch.setattr(
+        broker, "emit_before", lambda signal, message, delay: before_enqueue.append(message)
+    )
+
+    messages = [job.message(i).copy(queue_name="boards-video") for i in range(3)]
+    enqueued = enqueue_many(broker, messages)
+
+    assert pipe.executed == 1
+    assert len(pipe.commands) == 3
+    assert [command[5] for command in pipe.commands] == ["boards-video"] * 3
+    assert [m.args for m in enqueued] == [(0,), (1,), (2,)]
+    assert len({m.options["redis_message_id"] for m in enqueued}) == 3
+    assert before_enqueue == enqueued
+
+
+def test_enqueue_many_sends_the_same_script_call_as_enqueue(monkeypatch):
+    """Fails if RedisBroker changes the dispatch script call enqueue_many copies."""
+    broker = RedisBroker(url="redis://localhost:1/0")
+    single: list[tuple] = []
+    monkeypatch.setattr(broker.client, "evalsha", lambda *args: single.append(args))
+    pipe = _Pipeline()
+    monkeypatch.setattr(broker.client, "pipeline", lambda transaction: pipe)
+    monkeypatch.setattr(RedisBroker, "_max_unpack_size_val", 1000)
+
+    @dramatiq.actor(broker=broker, queue_name="boards-jobs")
+    def job(n: int) -> None:
+        pass
+
+    expected = broker.enqueue(job.message(1))
+    [enqueued] = enqueue_many(broker, [job.message(1)])
+    [sent] = single
+    [batched] = pipe.commands
+
+    # Differ per call: timestamp, maintenance flag, message ID and encoded message
+    varying = {4, 9, 11, 12}
+    assert len(batched) == len(sent)
+    assert [a for i, a in enumerate(batched) if i not in varying] == [
+        a for i, a in enumerate(sent) if i not in varying
+    ]
+    assert (batched[11], batched[12]) == (
+        enqueued.options["redis_message_id"],
+        enqueued.encode(),
+    )
+    assert (sent[11], sent[12]) == (expected.options["redis_message_id"], expected.encode())
+
+
+def test_enqueue_many_falls_back_when_redis_broker_internals_are_missing(monkeypatch):
+    broker = RedisBroker(url="redis://localhost:1/0")
+    monkeypatch.setattr(broker, "scripts", {})
+    single = []
+    monkeypatch.setattr(broker, "enqueue", lambda message: single.append(message) or message)
+
+    @dramatiq.actor(broker=broker, queue_name="boards-jobs")
+    def job(n: int) -> None:
+        pass
+
+    messages = [job.message(i) for i in range(3)]
+    assert enqueue_many(broker, messages) == messages
+    assert single == messages
+
+
+def test_only_enqueued_jobs_missing_from_the_broker_count_as_lost(monkeypatch):
+    broker = RedisBroker(url="redis://localhost:1/0")
+
+    @dramatiq.actor(broker=broker, queue_name="boards-jobs")
+    def process(generation_id: str) -> None:
+        pass
+
+    stored: dict[str, str] = {}
+    monkeypatch.setattr(
+        broker.client,
+        "hset",
+        lambda key, mapping: stored.update(mapping) if key == ENQUEUED_GENERATIONS_KEY else None,
+    )
+    messages = [
+        process.message(generation_id).copy(
+            queue_name="boards-video", options={"redis_message_id": f"m-{generation_id}"}
+        )
+        for generation_id in ("queued", "lost")
+    ]
+    record_enqueued(broker, messages)
+    assert stored == {"queued": "boards-video m-queued", "lost": "boards-video m-lost"}
+
+    # "started" has no marker: its worker cleared it when the job began
+    monkeypatch.setattr(
+        broker.client,
+        "hmget",
+        lambda key, ids: [stored[i].encode() if i in stored else None for i in ids],
+    )
+    pipe = _Pipeline(held={("dramatiq:boards-video.msgs", "m-queued")})
+    monkeypatch.setattr(broker.client, "pipeline", lambda transaction: pipe)
+
+    assert lost_generations(broker, ["queued", "lost", "started"]) == {"lost"}
+
+
+def test_enqueue_many_falls_back_to_single_enqueues():
+    broker = StubBroker()
+    broker.declare_queue("boards-jobs")
+
+    @dramatiq.actor(broker=broker, queue_name="boards-jobs")
+    def job(n: int) -> None:
+        pass
+
+    enqueue_many(broker, [job.message(i) for i in range(3)])
+
+    assert broker.queues["boards-jobs"].qsize() == 3
+
+
+@pytest.mark.asyncio
+async def test_claim_batch_skips_rows_locked_by_other_relays():
+    captured = {}
+
+    class _Session:
+        async def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+            result = MagicMock()
+            result.all.return_value = []
+            return result
+
+    await outbox.claim_batch(_Session(), 50)
+
+    assert "FOR UPDATE OF generation_outbox SKIP LOCKED" in captured["sql"]
+    assert "ORDER BY boards.generation_outbox.created_at" in captured["sql"]
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Stand-in for get_async_session that records commits and rollbacks."""
+    state = MagicMock(committed=0, rolled_back=0)
+
+    @asynccontextmanager
+    async def fake_session():
+        try:
+            yield state
+            state.committed += 1
+        except Exception:
+            state.rolled_back += 1
+            raise
+
+    monkeypatch.setattr(relay, "get_async_session", fake_session)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_relay_hands_batch_to_admission_and_removes_rows(db, monkeypatch):
+    jobs = [_job("g1"), _job("g2")]
+    removed = []
+    admitted = []
+
+    async def fake_claim(session, limit):
+        return jobs
+
+    async def fake_remove(session, generation_ids):
+        removed.extend(generation_ids)
+
+    async def fake_admit(batch):
+        admitted.append(batch)
+        return {job.generation_id for job in batch}
+
+    monkeypatch.setattr(outbox, "claim_batch", fake_claim)
+    monkeypatch.setattr(outbox, "remove_from_outbox", fake_remove)
+    monkeypatch.setattr(relay, "admit_generations", fake_admit)
+
+    assert await relay.relay_outbox() == 2
+    assert admitted == [jobs]
+    assert removed == ["g1", "g2"]
+    assert db.committed == 1
+
+
+@pytest.mark.asyncio
+async def test_relay_keeps_rows_when_enqueue_fails(db, monkeypatch):
+    removed = []
+
+    async def fake_claim(session, limit):
+        return [_job("g1")]
+
+    async def fake_remove(session, generation_ids):
+        removed.extend(generation_ids)
+
+    async def failing_admit(batch):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(outbox, "claim_batch", fake_claim)
+    monkeypatch.setattr(outbox, "remove_from_outbox", fake_remove)
+    monkeypatch.setattr(relay, "admit_generations", failing_admit)
+
+    with pytest.raises(ConnectionError):
+        await relay.relay_outbox()
+    assert removed == []
+    assert db.rolled_back == 1
+
+    # The request that created the generation still succeeds
+    await relay.relay_committed_generations()
+
+
+@pytest.mark.asyncio
+async def test_sweeper_reenqueues_lost_jobs_but_not_queued_ones(db, monkeypatch):
+    async def fake_find(session, stale_after, limit):
+        assert stale_after == timedelta(minutes=10)
+        return [_job("lost"), _job("waiting-in-queue"), _job("deferred")]
+
+    def fake_lost(broker, generation_ids):
+        assert generation_ids == ["lost", "waiting-in-queue", "deferred"]
+        return {"lost"}
+
+    enqueued = []
+    monkeypatch.setattr(outbox, "find_stale_pending", fake_find)
+    monkeypatch.setattr(relay.settings, "generation_stale_pending_seconds", 600)
+    monkeypatch.setattr(relay, "lost_generations", fake_lost)
+    monkeypatch.setattr(relay, "enqueue_generations", lambda jobs: enqueued.extend(jobs))
+
+    assert await relay.sweep_stale_generations() == 1
+    assert [job.generation_id for job in enqueued] == ["lost"]
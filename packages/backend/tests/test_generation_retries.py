@@ -0,0 +1,498 @@
+"""Tests for retried generations resuming their provider job instead of resubmitting."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from dramatiq import Message
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy.exc import OperationalError
+
+from boards.generators.artifacts import ImageArtifact
+from boards.generators.base import BaseGenerator, GeneratorResult
+from boards.generators.registry import registry
+from boards.jobs import repository as jobs_repo
+from boards.jobs.retries import PermanentGenerationError, record_attempt, remaining_retries
+from boards.progress.publisher import ProgressPublisher
+from boards.workers import actors
+from boards.workers.middleware import GenerationRetries
+from boards.workers.queues import ENQUEUED_GENERATIONS_KEY
+
+GENERATION_ID = "00000000-0000-0000-0000-00000000b2b2"
+
+
+class PromptInput(BaseModel):
+    prompt: str
+
+
+class _ProviderGenerator(BaseGenerator):
+    """Submits a provider job unless it can resume one, then optionally fails."""
+
+    name = "retry-test-provider"
+    artifact_type = "image"
+    description = "Fake provider"
+
+    def __init__(self) -> None:
+        self.fail_with: Exception | None = None
+        # Whether the provider reports the job itself as failed
+        self.provider_failed = False
+        self.submitted: list[str] = []
+        self.resumed: list[str | None] = []
+        # Seconds the provider job takes
+        self.delay = 0.0
+        # Whether the job produces a second (batch) output
+        self.batch = False
+
+    def get_input_schema(self) -> type[PromptInput]:
+        return PromptInput
+
+    async def generate(self, inputs, context) -> GeneratorResult:
+        request_id = context.resumable_external_job_id()
+        self.resumed.append(request_id)
+        if request_id is None:
+            request_id = f"req-{len(self.submitted) + 1}"
+            self.submitted.append(request_id)
+            await context.set_external_job_id(request_id)
+        outputs = [
+            ImageArtifact(
+                generation_id=context.generation_id,
+                storage_url=f"https://storage.example/{request_id}.png",
+                format="png",
+            )
+        ]
+        if self.batch:
+            outputs.append(
+                ImageArtifact(
+                    generation_id=await context._get_or_create_generation_for_output(1),
+                    storage_url=f"https://storage.example/{request_id}-1.png",
+                    format="png",
+                )
+            )
+        await asyncio.sleep(self.delay)
+        if self.fail_with is not None:
+            if self.provider_failed:
+                context.mark_provider_job_failed()
+            raise self.fail_with
+        return GeneratorResult(outputs=outputs)
+
+    async def estimate_cost(self, inputs) -> float:
+        return 0.0
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    """Run process_generation against in-memory stand-ins for the DB and Redis."""
+    mock_redis = MagicMock()
+    mock_redis.publish = AsyncMock()
+    mock_redis.exists = AsyncMock(return_value=0)
+    # Heartbeat lease (see jobs/heartbeats.py)
+    mock_redis.set = AsyncMock(return_value=True)
+    mock_redis.zadd = AsyncMock()
+    mock_redis.zrem = AsyncMock()
+    mock_redis.delete = AsyncMock()
+    mock_redis.hdel = AsyncMock()
+    mock_redis.register_script = MagicMock(return_value=AsyncMock(return_value=1))
+
+    from boards import redis_pool
+
+    monkeypatch.setattr(redis_pool._redis_pool_manager, "_client", mock_redis)
+    monkeypatch.setattr(redis_pool, "get_redis_client", lambda: mock_redis)
+    monkeypatch.setattr("boards.workers.actors.settings.generation_admission_enabled", False)
+
+    generator = _ProviderGenerator()
+    monkeypatch.setattr(registry, "get", lambda name: generator if name == generator.name else None)
+
+    state = SimpleNamespace(
+        redis=mock_redis,
+        generator=generator,
+        generator_name=generator.name,
+        external_job_id=None,
+        external_job_generator=None,
+        statuses=[],
+        released=[],
+        # Batch generation rows by (batch_id, batch_index) -> [id, status]
+        batch_rows={},
+    )
+
+    async def fake_get_generation(session, generation_id):
+        return SimpleNamespace(
+            id=generation_id,
+            generator_name=state.generator_name,
+            input_params={"prompt": "hi"},
+            tenant_id="00000000-0000-0000-0000-0000000000a1",
+            board_id="00000000-0000-0000-0000-0000000000b1",
+            user_id="00000000-0000-0000-0000-0000000000c1",
+            artifact_type="image",
+            external_job_id=state.external_job_id,
+            external_job_generator=state.external_job_generator,
+        )
+
+    async def fake_set_external_job_id(session, generation_id, external_job_id, generator_name):
+        state.external_job_id = external_job_id
+        state.external_job_generator = generator_name
+
+    async def fake_finalize_success(session, generation_id, **kwargs):
+        for row in state.batch_rows.values():
+            if row[0] == generation_id:
+                row[1] = "completed"
+                return
+        state.statuses.append("completed")
+
+    async def fake_get_batch_generation(session, *, batch_id, batch_index, **kwargs):
+        row = state.batch_rows.get((batch_id, batch_index))
+        return row[0] if row else None
+
+    async def fake_create_batch_generation(session, *, batch_id, batch_index, **kwargs):
+        gen_id = f"batch-{len(state.batch_rows) + 1}"
+        state.batch_rows[(batch_id, batch_index)] = [gen_id, "processing"]
+        return gen_id
+
+    async def fake_fail_batch_generations(session, generation_id, *, error_message):
+        for (batch_id, _), row in state.batch_rows.items():
+            if batch_id == jobs_repo.batch_id_for(generation_id) and row[1] == "processing":
+                row[1] = "failed"
+
+    async def fake_publish_progress(self, job_id, update):
+        state.statuses.append(update.status)
+
+    async def fake_release(generation_id):
+        state.released.append(generation_id)
+
+    monkeypatch.setattr(jobs_repo, "get_generation", fake_get_generation)
+    monkeypatch.setattr(jobs_repo, "set_external_job_id", fake_set_external_job_id)
+    monkeypatch.setattr(jobs_repo, "finalize_success", fake_finalize_success)
+    monkeypatch.setattr(jobs_repo, "get_batch_generation", fake_get_batch_generation)
+    monkeypatch.setattr(jobs_repo, "create_batch_generation", fake_create_batch_generation)
+    monkeypatch.setattr(jobs_repo, "fail_batch_generations", fake_fail_batch_generations)
+    monkeypatch.setattr(ProgressPublisher, "publish_progress", fake_publish_progress)
+    monkeypatch.setattr(actors, "_release_admission_slot", fake_release)
+    return state
+
+
+async def _attempt(retries: int) -> None:
+    record_attempt(GENERATION_ID, retries=retries, max_retries=3)
+    await actors.process_generation.fn.__wrapped__(GENERATION_ID)
+
+
+def test_middleware_records_remaining_retries():
+    broker = SimpleNamespace(get_actor=lambda name: SimpleNamespace(options={"max_retries": 3}))
+    middleware = GenerationRetries({"process_generation"})
+    message = Message(
+        queue_name="boards-jobs",
+        actor_name="process_generation",
+        args=("gen-1",),
+        kwargs={},
+        options={"retries": 1},
+    )
+
+    middleware.before_process_message(broker, message)
+    assert remaining_retries("gen-1") == 2
+
+    middleware.after_process_message(broker, message, exception=RuntimeError("boom"))
+    # Unknown attempts are treated as final
+    assert remaining_retries("gen-1") == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_with_retries_left_is_reraised_without_failing_generation(worker):
+    worker.generator.fail_with = RuntimeError("upload failed")
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        await _attempt(retries=0)
+
+    assert worker.statuses[-1] == "processing"
+    assert "failed" not in worker.statuses
+    # The admission slot is kept for the retry
+    assert worker.released == []
+
+
+@pytest.mark.asyncio
+async def test_retry_resumes_provider_job_instead_of_resubmitting(worker):
+    worker.generator.fail_with = RuntimeError("storage unavailable")
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=0)
+
+    worker.generator.fail_with = None
+    await _attempt(retries=1)
+
+    assert worker.generator.submitted == ["req-1"]
+    assert worker.generator.resumed == [None, "req-1"]
+    assert worker.statuses[-1] == "completed"
+    assert "failed" not in worker.statuses
+    assert worker.released == [GENERATION_ID]
+
+
+@pytest.mark.asyncio
+async def test_provider_job_is_only_resumed_by_the_generator_that_submitted_it(worker):
+    worker.generator.fail_with = RuntimeError("storage unavailable")
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=0)
+    assert worker.external_job_generator == worker.generator_name
+
+    # A job submitted by an equivalent on another provider is not offered
+    worker.external_job_generator = "other-provider-model"
+    worker.generator.fail_with = None
+    await _attempt(retries=1)
+
+    assert worker.generator.resumed == [None, None]
+    assert worker.generator.submitted == ["req-1", "req-2"]
+
+
+@pytest.mark.asyncio
+async def test_resumed_job_that_fails_is_resubmitted_on_next_retry(worker):
+    worker.external_job_id = "req-0"
+    worker.generator.fail_with = RuntimeError("provider job failed")
+    worker.generator.provider_failed = True
+
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=1)
+
+    # The provider reported the resumed job as failed, so the ID is discarded
+    assert worker.external_job_id is None
+
+    worker.generator.fail_with = None
+    await _attempt(retries=2)
+    assert worker.generator.resumed == ["req-0", None]
+    assert worker.generator.submitted == ["req-1"]
+
+
+@pytest.mark.asyncio
+async def test_resumed_job_is_kept_when_attempt_fails_for_other_reasons(worker):
+    worker.external_job_id = "req-0"
+    worker.generator.fail_with = RuntimeError("poll timed out")
+
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=1)
+
+    # Nothing says the provider job failed, so the next attempt resumes it again
+    assert worker.external_job_id == "req-0"
+
+
+@pytest.mark.asyncio
+async def test_database_errors_while_resolving_inputs_are_retried(worker, monkeypatch):
+    from boards.generators import artifact_resolution
+
+    async def unavailable(*args, **kwargs):
+        raise OperationalError("SELECT 1", {}, ConnectionError("connection refused"))
+
+    monkeypatch.setattr(artifact_resolution, "resolve_input_artifacts", unavailable)
+
+    with pytest.raises(OperationalError):
+        await _attempt(retries=0)
+    assert "failed" not in worker.statuses
+
+
+@pytest.mark.asyncio
+async def test_invalid_inputs_are_permanent(worker, monkeypatch):
+    from boards.generators import artifact_resolution
+
+    async def missing_artifact(*args, **kwargs):
+        raise ValueError("Generation gen-9 not found")
+
+    monkeypatch.setattr(artifact_resolution, "resolve_input_artifacts", missing_artifact)
+    with pytest.raises(PermanentGenerationError, match="gen-9 not found"):
+        await _attempt(retries=0)
+
+    # Schema validation failures are permanent too
+    monkeypatch.setattr(
+        artifact_resolution,
+        "resolve_input_artifacts",
+        AsyncMock(return_value=({"prompt": None}, [])),
+    )
+    with pytest.raises(PermanentGenerationError, match="Invalid input parameters"):
+        await _attempt(retries=0)
+
+
+@pytest.mark.asyncio
+async def test_job_starts_when_cancellation_check_fails(worker):
+    worker.redis.exists = AsyncMock(side_effect=RedisError("connection reset"))
+
+    await _attempt(retries=0)
+
+    assert worker.generator.submitted == ["req-1"]
+    assert worker.statuses[-1] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_started_job_clears_its_enqueue_marker(worker):
+    await _attempt(retries=0)
+
+    # The relay's sweeper only re-enqueues jobs that still have a marker
+    worker.redis.hdel.assert_any_await(ENQUEUED_GENERATIONS_KEY, GENERATION_ID)
+
+
+@pytest.mark.asyncio
+async def test_last_attempt_marks_generation_failed(worker):
+    worker.generator.fail_with = RuntimeError("still down")
+
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=3)
+
+    assert worker.statuses[-1] == "failed"
+    assert worker.released == [GENERATION_ID]
+
+
+@pytest.mark.asyncio
+async def test_retried_batch_job_reuses_its_batch_generations(worker):
+    worker.generator.batch = True
+    worker.generator.fail_with = RuntimeError("provider timeout")
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=0)
+
+    worker.generator.fail_with = None
+    await _attempt(retries=1)
+
+    batch_id = jobs_repo.batch_id_for(GENERATION_ID)
+    assert worker.batch_rows == {(batch_id, 1): ["batch-1", "completed"]}
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_job_fails_its_batch_generations(worker):
+    worker.generator.batch = True
+    worker.generator.fail_with = RuntimeError("still down")
+
+    with pytest.raises(RuntimeError):
+        await _attempt(retries=3)
+
+    assert [row[1] for row in worker.batch_rows.values()] == ["failed"]
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_are_not_retried(worker):
+    worker.generator_name = "unknown-generator"
+
+    with pytest.raises(PermanentGenerationError, match="Unknown generator"):
+        await _attempt(retries=0)
+
+    assert worker.statuses[-1] == "failed"
+    assert actors.process_generation.options["throws"] == (PermanentGenerationError,)
+
+
+class _Context:
+    def __init__(self, request_id: str | None) -> None:
+        self.request_id = request_id
+        self.cancel_handler = None
+        self.failed = False
+        self.slots: list[str | None] = []
+
+    def resumable_external_job_id(self) -> str | None:
+        return self.request_id
+
+    async def set_external_job_id(self, external_job_id: str) -> None:
+        self.request_id = external_job_id
+
+    async def acquire_provider_slot(self, provider: str, endpoint: str | None = None) -> None:
+        self.slots.append(endpoint)
+
+    def mark_provider_job_failed(self) -> None:
+        self.failed = True
+
+    def set_cancel_handler(self, cancel) -> None:
+        self.cancel_handler = cancel
+
+
+@pytest.mark.asyncio
+async def test_fal_request_is_resumed_unless_unknown_or_failed(monkeypatch):
+    # Some generator tests leave a stub fal_client module behind; use the real one
+    monkeypatch.delitem(sys.modules, "fal_client", raising=False)
+    fal_client = pytest.importorskip("fal_client")
+    from boards.generators.implementations.fal.utils import resume_fal_request
+
+    status: object = fal_client.InProgress(logs=None)
+    handle = MagicMock()
+
+    async def fake_status(*args, **kwargs):
+        if isinstance(status, Exception):
+            raise status
+        return status
+
+    handle.status = fake_status
+
+    async def fake_get_handle(endpoint, request_id):
+        assert (endpoint, request_id) == ("fal-ai/flux", "req-1")
+        return handle
+
+    monkeypatch.setattr(fal_client.async_client, "get_handle", fake_get_handle)
+
+    assert await resume_fal_request("fal-ai/flux", _Context(None)) is None
+
+    context = _Context("req-1")
+    resumed = await resume_fal_request("fal-ai/flux", context)
+    assert resumed is not None
+    assert resumed.request_id is handle.request_id
+    assert context.cancel_handler is handle.cancel
+    assert not context.failed
+
+    # Fal rejecting the result of the resumed request marks it failed
+    not_found = fal_client.FalClientHTTPError(
+        "Request not found", status_code=404, response_headers={}, response=MagicMock()
+    )
+    handle.get = AsyncMock(side_effect=not_found)
+    with pytest.raises(fal_client.FalClientHTTPError):
+        await resumed.get()
+    assert context.failed
+
+    status = fal_client.Completed(logs=None, metrics={}, error="NSFW content detected")
+    context = _Context("req-1")
+    assert await resume_fal_request("fal-ai/flux", context) is None
+    assert context.failed
+
+    status = not_found
+    context = _Context("req-1")
+    assert await resume_fal_request("fal-ai/flux", context) is None
+    assert context.failed
+
+
+@pytest.mark.asyncio
+async def test_fal_submit_skips_slot_and_uploads_when_resuming(monkeypatch):
+    monkeypatch.delitem(sys.modules, "fal_client", raising=False)
+    fal_client = pytest.importorskip("fal_client")
+    from boards.generators.implementations.fal import utils
+
+    submitted = MagicMock(request_id="req-2")
+    monkeypatch.setattr(fal_client, "submit_async", AsyncMock(return_value=submitted))
+    resumed = MagicMock(request_id="req-1")
+
+    async def fake_resume(endpoint, context):
+        return resumed if context.request_id else None
+
+    monkeypatch.setattr(utils, "resume_fal_request", fake_resume)
+    uploads = []
+
+    async def build_arguments():
+        uploads.append("image")
+        return {"image_url": "https://fal.media/image.png"}
+
+    context = _Context("req-1")
+    assert await utils.submit_or_resume("fal-ai/flux", build_arguments, context) is resumed
+    assert context.slots == []
+    assert uploads == []
+    fal_client.submit_async.assert_not_called()
+
+    context = _Context(None)
+    assert await utils.submit_or_resume("fal-ai/flux", build_arguments, context) is submitted
+    assert context.slots == ["fal-ai/flux"]
+    assert uploads == ["image"]
+    fal_client.submit_async.assert_called_once_with(
+        "fal-ai/flux", arguments={"image_url": "https://fal.media/image.png"}
+    )
+    assert context.request_id == "req-2"
+    assert context.cancel_handler is submitted.cancel
+
+
+@pytest.mark.asyncio
+async def test_run_that_lost_its_lease_stops_and_leaves_the_job_to_its_owner(worker, monkeypatch):
+    monkeypatch.setattr(actors.settings, "generation_heartbeat_interval", 0.01)
+    # Another worker took the lease, so renewing (and releasing) it fails
+    worker.redis.register_script.return_value = AsyncMock(return_value=0)
+    worker.generator.delay = 10
+
+    await asyncio.wait_for(_attempt(retries=0), timeout=5)
+
+    assert "completed" not in worker.statuses
+    assert "failed" not in worker.statuses
+    # The new owner keeps the admission slot
+    assert worker.released == []
@@ -0,0 +1,133 @@
+"""Tests for rendition rendering and generation thumbnails."""
+
+import io
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from boards.storage import renditions
+from boards.storage.base import StorageConfig, StorageManager
+from boards.storage.implementations.local import LocalStorageProvider
+from boards.storage.renditions import RenditionError, extract_poster_frame, render_image
+from boards.workers import actors, thumbnails
+from boards.workers.queues import PREVIEW_QUEUE
+
+
+def _png(size: tuple[int, int], mode: str = "RGB") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, size, (255, 0, 0, 128)).save(output, format="PNG")
+    return output.getvalue()
+
+
+def _open(content: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(content))
+
+
+def test_render_image_downscales_to_webp_keeping_aspect_ratio():
+    image = _open(render_image(_png((2048, 1024)), max_width=512, max_height=512))
+
+    assert image.format == "WEBP"
+    assert image.size == (512, 256)
+
+
+def test_render_image_never_upscales_and_keeps_transparency():
+    image = _open(render_image(_png((100, 80), mode="RGBA"), max_width=512, max_height=512))
+
+    assert image.size == (100, 80)
+    assert image.mode == "RGBA"
+
+
+def test_render_image_rejects_undecodable_content():
+    with pytest.raises(RenditionError):
+        render_image(b"not an image", max_width=512, max_height=512)
+
+
+def test_poster_frame_requires_ffmpeg(monkeypatch):
+    monkeypatch.setattr(renditions.shutil, "which", lambda name: None)
+
+    with pytest.raises(RenditionError, match="ffmpeg"):
+        extract_poster_frame("/tmp/video.mp4", max_width=512, max_height=512)
+
+
+@pytest.fixture
+def generation(monkeypatch, tmp_path):
+    """A completed generation whose thumbnail is stored in local storage."""
+    gen = SimpleNamespace(
+        id=uuid4(),
+        tenant_id=uuid4(),
+        board_id=uuid4(),
+        artifact_type="image",
+        storage_url="http://localhost:8088/api/storage/original",
+        thumbnail_url=None,
+    )
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    async def fake_get_generation(session, generation_id):
+        return gen
+
+    async def fake_set_thumbnail_url(session, generation_id, thumbnail_url):
+        gen.thumbnail_url = thumbnail_url
+
+    async def fake_download(url):
+        return _png((1024, 1024))
+
+    def fake_storage_manager():
+        manager = StorageManager(
+            StorageConfig(default_provider="local", providers={}, routing_rules=[])
+        )
+        manager.register_provider(
+            "local", LocalStorageProvider(tmp_path, public_url_base="http://localhost/storage")
+        )
+        return manager
+
+    monkeypatch.setattr(thumbnails, "get_async_session", fake_session)
+    monkeypatch.setattr(thumbnails.jobs_repo, "get_generation", fake_get_generation)
+    monkeypatch.setattr(thumbnails.jobs_repo, "set_thumbnail_url", fake_set_thumbnail_url)
+    monkeypatch.setattr(thumbnails, "download_from_url", fake_download)
+    monkeypatch.setattr(thumbnails, "create_storage_manager", fake_storage_manager)
+    monkeypatch.setattr(thumbnails.settings, "thumbnail_max_size", 256)
+    return gen
+
+
+@pytest.mark.asyncio
+async def test_create_thumbnail_stores_webp_variant_in_process_pool(generation, tmp_path):
+    try:
+        url = await thumbnails.create_thumbnail(str(generation.id))
+    finally:
+        renditions.shutdown_rendition_pool()
+
+    assert url == generation.thumbnail_url
+    assert url.endswith("/thumbnail")
+    [stored] = tmp_path.rglob("thumbnail")
+    assert _open(stored.read_bytes()).size == (256, 256)
+    # tenant/artifact_type/board/artifact/variant
+    assert stored.relative_to(tmp_path).parts[1] == "image"
+
+    # A redelivered job keeps the existing thumbnail
+    assert await thumbnails.create_thumbnail(str(generation.id)) == url
+    assert len(list(tmp_path.rglob("thumbnail"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_thumbnail_skips_artifacts_without_previews(generation):
+    generation.artifact_type = "audio"
+
+    assert await thumbnails.create_thumbnail(str(generation.id)) is None
+    assert generation.thumbnail_url is None
+
+
+def test_thumbnail_jobs_are_enqueued_on_preview_queue(monkeypatch):
+    enqueued = []
+    monkeypatch.setattr(actors, "enqueue_many", lambda broker, messages: enqueued.extend(messages))
+
+    actors._enqueue_thumbnails(["g1", "g2"], "video")
+    actors._enqueue_thumbnails(["g3"], "text")
+
+    assert [message.args for message in enqueued] == [("g1",), ("g2",)]
+    assert {message.queue_name for message in enqueued} == {PREVIEW_QUEUE}
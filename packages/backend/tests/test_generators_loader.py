@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from boards.generators.loader import load_generators_from_config
@@ -126,3 +128,132 @@ generators:
 
     load_generators_from_config(str(cfg))
     assert "class-gen" in registry
+
+
+def test_manifest_registers_class_declarations_lazily(tmp_path, monkeypatch):
+    _reset_registry()
+    from boards.generators.loader import build_generators_manifest
+    from boards.generators.manifest import load_manifest, write_manifest
+
+    cfg = tmp_path / "gens.yaml"
+    cfg.write_text(
+        """
+strict_mode: true
+allow_unlisted: false
+generators:
+  - class: "boards.generators.testmods.class_gen:ClassGen"
+    name: "custom-class-gen"
+    options:
+      suffix: "?"
+        """,
+        encoding="utf-8",
+    )
+    manifest_path = tmp_path / "gens.manifest.json"
+    write_manifest(build_generators_manifest(str(cfg)), manifest_path)
+
+    manifest = load_manifest(manifest_path)
+    assert manifest is not None
+    assert [entry.name for entry in manifest.entries] == ["custom-class-gen"]
+
+    # Simulate a fresh process: the generator module has not been imported yet
+    monkeypatch.delitem(sys.modules, "boards.generators.testmods.class_gen", raising=False)
+
+    load_generators_from_config(str(cfg), manifest_path=str(manifest_path))
+
+    assert "custom-class-gen" in registry
+    assert not registry.is_loaded("custom-class-gen")
+    assert "boards.generators.testmods.class_gen" not in sys.modules
+    [entry] = registry.catalog().list("text")
+    assert entry.name == "custom-class-gen"
+    assert entry.input_schema["properties"]["text"]["default"] == "hello"
+
+    gen = registry.get("custom-class-gen")
+    assert gen is not None
+    assert gen.name == "custom-class-gen"
+    assert getattr(gen, "suffix") == "?"  # noqa: B009
+    assert registry.is_loaded("custom-class-gen")
+    assert registry.get("custom-class-gen") is gen
+
+
+def test_manifest_falls_back_to_eager_for_unmatched_declarations(tmp_path):
+    _reset_registry()
+    from boards.generators.manifest import GeneratorManifest, write_manifest
+
+    cfg = tmp_path / "gens.yaml"
+    cfg.write_text(
+        """
+strict_mode: true
+allow_unlisted: false
+generators:
+  - class: "boards.generators.testmods.class_gen:ClassGen"
+        """,
+        encoding="utf-8",
+    )
+    manifest_path = tmp_path / "gens.manifest.json"
+    write_manifest(GeneratorManifest(entries=()), manifest_path)
+
+    load_generators_from_config(str(cfg), manifest_path=str(manifest_path))
+
+    assert registry.is_loaded("class-gen")
+
+
+def test_strict_mode_fails_on_invalid_manifest(tmp_path):
+    _reset_registry()
+    cfg = tmp_path / "gens.yaml"
+    cfg.write_text(
+        """
+strict_mode: true
+generators:
+  - class: "boards.generators.testmods.class_gen:ClassGen"
+        """,
+        encoding="utf-8",
+    )
+    manifest_path = tmp_path / "gens.manifest.json"
+    manifest_path.write_text('{"version": 999, "generators": []}', encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="manifest"):
+        load_generators_from_config(str(cfg), manifest_path=str(manifest_path))
+
+
+def test_equivalents_drop_unregistered_generators(tmp_path):
+    from boards.generators import failover
+
+    _reset_registry()
+    cfg = tmp_path / "gens.yaml"
+    cfg.write_text(
+        """
+strict_mode: true
+generators:
+  - class: "boards.generators.testmods.class_gen:ClassGen"
+    name: "gen-a"
+  - class: "boards.generators.testmods.class_gen:ClassGen"
+    name: "gen-b"
+equivalents:
+  - ["gen-a", "gen-b", "gen-disabled"]
+  - ["gen-disabled", "gen-other"]
+        """,
+        encoding="utf-8",
+    )
+
+    load_generators_from_config(str(cfg))
+
+    assert failover._equivalent_groups == [["gen-a", "gen-b"]]
+    failover.configure_equivalents([])
+
+
+def test_strict_mode_fails_on_invalid_equivalents(tmp_path):
+    _reset_registry()
+    cfg = tmp_path / "gens.yaml"
+    cfg.write_text(
+        """
+strict_mode: true
+generators:
+  - class: "boards.generators.testmods.class_gen:ClassGen"
+equivalents:
+  - "gen-a, gen-b"
+        """,
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="Invalid equivalents group"):
+        load_generators_from_config(str(cfg))
@@ -0,0 +1,86 @@
+"""Tests for the shared per-event-loop HTTP client."""
+
+import asyncio
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from boards.config import settings
+from boards.generators.resolution import download_from_url
+from boards.http_client import close_http_client, get_http_client
+
+
+@pytest.fixture
+async def server(serve_asgi):
+    """Serve a file on localhost; returns the base URL and request stats."""
+    stats = {"client_ports": set(), "in_flight": 0, "max_in_flight": 0}
+
+    async def file(request: Request) -> Response:
+        stats["client_ports"].add(request.client.port)
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(float(request.query_params.get("delay", 0)))
+            return Response(b"x" * 4096, media_type="application/octet-stream")
+        finally:
+            stats["in_flight"] -= 1
+
+    base_url = await serve_asgi(Starlette(routes=[Route("/file", file)]))
+    yield base_url, stats
+    await close_http_client()
+
+
+def test_client_is_shared_per_event_loop():
+    async def clients():
+        first, second = await asyncio.gather(get_http_client(), get_http_client())
+        await close_http_client()
+        assert first.is_closed
+        recreated = await get_http_client()
+        await close_http_client()
+        return first, second, recreated
+
+    first, second, recreated = asyncio.run(clients())
+    assert first is second
+    assert recreated is not first
+    other_loop, _, _ = asyncio.run(clients())
+    assert other_loop is not first
+
+
+async def test_downloads_reuse_one_connection(server):
+    base_url, stats = server
+
+    for _ in range(10):
+        assert len(await download_from_url(f"{base_url}/file")) == 4096
+
+    assert len(stats["client_ports"]) == 1
+
+
+async def test_requests_per_host_are_limited(server, monkeypatch):
+    base_url, stats = server
+    monkeypatch.setattr(settings, "http_client_max_connections_per_host", 2)
+    client = await get_http_client()
+
+    responses = await asyncio.gather(
+        *(client.get(f"{base_url}/file", params={"delay": 0.05}) for _ in range(6))
+    )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert stats["max_in_flight"] == 2
+    assert len(stats["client_ports"]) == 2
+
+
+async def test_streamed_response_holds_its_slot_until_closed(server, monkeypatch):
+    base_url, stats = server
+    monkeypatch.setattr(settings, "http_client_max_connections_per_host", 1)
+    client = await get_http_client()
+
+    async with client.stream("GET", f"{base_url}/file") as response:
+        waiting = asyncio.create_task(client.get(f"{base_url}/file"))
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        await response.aread()
+
+    assert (await waiting).status_code == 200
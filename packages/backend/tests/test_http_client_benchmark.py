@@ -0,0 +1,74 @@
+"""
+Latency benchmark: a new HTTP client per download vs the shared pooled client.
+
+Downloads the same file from a local server repeatedly, first opening a new
+`httpx.AsyncClient` for each download (as artifact downloads used to), then
+through the shared client of boards.http_client. Reports the p50 latency and
+how many connections the server saw. Against a real provider the difference is
+larger, since each new connection also pays for DNS and TLS.
+
+Skipped unless BOARDS_RUN_BENCHMARKS=1, e.g.:
+
+    BOARDS_RUN_BENCHMARKS=1 pytest tests/test_http_client_benchmark.py -s
+"""
+
+import os
+import statistics
+import time
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from boards.generators.resolution import download_from_url
+from boards.http_client import close_http_client
+
+DOWNLOADS = int(os.environ.get("BOARDS_HTTP_BENCH_DOWNLOADS", "500"))
+FILE_SIZE = int(os.environ.get("BOARDS_HTTP_BENCH_FILE_SIZE", str(256 * 1024)))
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("BOARDS_RUN_BENCHMARKS") != "1",
+    reason="Set BOARDS_RUN_BENCHMARKS=1 to run benchmarks",
+)
+
+
+async def _per_call_client_download(url: str) -> bytes:
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            return b"".join([chunk async for chunk in response.aiter_bytes(chunk_size=8192)])
+
+
+async def test_shared_client_reuses_connections_and_is_faster(serve_asgi):
+    content = b"x" * FILE_SIZE
+    client_ports: set[int] = set()
+
+    async def file(request: Request) -> Response:
+        client_ports.add(request.client.port)
+        return Response(content, media_type="application/octet-stream")
+
+    url = await serve_asgi(Starlette(routes=[Route("/file", file)])) + "/file"
+
+    results = {}
+    for label, download in (
+        ("client per download", _per_call_client_download),
+        ("shared client", download_from_url),
+    ):
+        client_ports.clear()
+        latencies = []
+        for _ in range(DOWNLOADS):
+            start = time.perf_counter()
+            assert len(await download(url)) == FILE_SIZE
+            latencies.append(time.perf_counter() - start)
+        results[label] = (statistics.median(latencies), len(client_ports))
+    await close_http_client()
+
+    print()
+    for label, (p50, connections) in results.items():
+        print(f"{label:>20}: p50 {p50 * 1000:.2f}ms, {connections} connections")
+
+    assert results["shared client"][1] == 1
+    assert results["shared client"][0] < results["client per download"][0]
@@ -206,12 +206,21 @@ async def test_worker_integration_with_storage(monkeypatch, tmp_path: Path):
     # We need to mock at the RedisPoolManager level since it's a singleton
     mock_redis = MagicMock()
     mock_redis.publish = AsyncMock()
+    mock_redis.exists = AsyncMock(return_value=0)  # no cancellation requested
+    # Heartbeat lease (see jobs/heartbeats.py)
+    mock_redis.set = AsyncMock(return_value=True)
+    mock_redis.zadd = AsyncMock()
+    mock_redis.zrem = AsyncMock()
+    mock_redis.delete = AsyncMock()
+    mock_redis.hdel = AsyncMock()
+    mock_redis.register_script = MagicMock(return_value=AsyncMock(return_value=1))
 
     from boards import redis_pool
 
     # Mock the singleton's client property
     monkeypatch.setattr(redis_pool._redis_pool_manager, "_client", mock_redis)
     monkeypatch.setattr(redis_pool, "get_redis_client", lambda: mock_redis)
+    monkeypatch.setattr("boards.workers.actors.settings.generation_admission_enabled", False)
 
     # Mock replicate module
     mock_file_output = SimpleNamespace(url="https://replicate.delivery/fake.png")
@@ -253,6 +262,8 @@ async def test_worker_integration_with_storage(monkeypatch, tmp_path: Path):
             board_id=uuid4(),
             user_id=uuid4(),
             artifact_type="image",
+            external_job_id=None,
+            external_job_generator=None,
         )
 
     async def fake_finalize_success(session, generation_id, **kwargs):
@@ -387,7 +398,10 @@ async def test_batch_generation_context(tmp_path: Path):
         mock_session.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
         mock_session.return_value.__aexit__ = AsyncMock(return_value=None)
 
-        with patch.object(jobs_repo, "create_batch_generation", fake_create_batch_generation):
+        with (
+            patch.object(jobs_repo, "get_batch_generation", AsyncMock(return_value=None)),
+            patch.object(jobs_repo, "create_batch_generation", fake_create_batch_generation),
+        ):
             # Test storing multiple images via context
             test_image_data = b"batch test image"
 
@@ -0,0 +1,137 @@
+"""Tests for duration-based queue routing and per-queue worker pools."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import dramatiq
+import pytest
+from click.testing import CliRunner
+from dramatiq import Worker
+from dramatiq.brokers.stub import StubBroker
+
+from boards.workers.queues import (
+    AUDIO_QUEUE,
+    DEFAULT_QUEUE,
+    FAST_IMAGE_MAX_SECONDS,
+    FAST_IMAGE_QUEUE,
+    GENERATION_QUEUES,
+    VIDEO_QUEUE,
+    queue_for_generator,
+    send_to_queue,
+)
+
+LONG_JOB_SECONDS = 0.5
+
+
+def _generator(artifact_type: str, expected: float | None = None, queue: str | None = None):
+    return SimpleNamespace(
+        artifact_type=artifact_type, expected_duration_seconds=expected, queue=queue
+    )
+
+
+class TestQueueRouting:
+    @pytest.mark.parametrize(
+        ("generator", "expected_queue"),
+        [
+            (_generator("image"), FAST_IMAGE_QUEUE),
+            (_generator("image", expected=5), FAST_IMAGE_QUEUE),
+            (_generator("image", expected=FAST_IMAGE_MAX_SECONDS * 2), DEFAULT_QUEUE),
+            (_generator("video"), VIDEO_QUEUE),
+            (_generator("audio"), AUDIO_QUEUE),
+            (_generator("text"), DEFAULT_QUEUE),
+            (_generator("image", queue="custom"), "custom"),
+            (None, DEFAULT_QUEUE),
+        ],
+    )
+    def test_queue_for_generator(self, generator, expected_queue):
+        assert queue_for_generator(generator) == expected_queue
+
+    def test_enqueue_generation_routes_by_generator(self, monkeypatch):
+        from boards.workers import actors
+
+        enqueued = []
+        monkeypatch.setattr(actors.broker, "enqueue", lambda message: enqueued.append(message))
+
+        actors.enqueue_generation("gen-1", _generator("video"))
+
+        [message] = enqueued
+        assert message.queue_name == VIDEO_QUEUE
+        assert message.actor_name == actors.process_generation.actor_name
+        assert message.args == ("gen-1",)
+
+
+class TestWorkerPools:
+    def _run(self, pools: list[set[str]]) -> tuple[float, float]:
+        """Enqueue long video jobs then a short image job; return (short, long) finish times."""
+        broker = StubBroker()
+        broker.emit_after("process_boot")
+        for queue in GENERATION_QUEUES:
+            broker.declare_queue(queue)
+
+        finished: dict[str, float] = {}
+        lock = threading.Lock()
+
+        @dramatiq.actor(broker=broker, queue_name=DEFAULT_QUEUE, max_retries=0)
+        def fake_generation(kind: str) -> None:
+            if kind.startswith("long"):
+                time.sleep(LONG_JOB_SECONDS)
+            with lock:
+                finished[kind] = time.monotonic()
+
+        start = time.monotonic()
+        for i in range(3):
+            send_to_queue(fake_generation, queue_for_generator(_generator("video")), f"long-{i}")
+        send_to_queue(fake_generation, queue_for_generator(_generator("image")), "short")
+
+        workers = [Worker(broker, queues=queues, worker_threads=1) for queues in pools]
+        for worker in workers:
+            worker.start()
+        try:
+            broker.join(FAST_IMAGE_QUEUE, timeout=10_000)
+            broker.join(VIDEO_QUEUE, timeout=10_000)
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                worker.stop()
+
+        longs = [t for kind, t in finished.items() if kind.startswith("long")]
+        return finished["short"] - start, max(longs) - start
+
+    def test_short_jobs_are_not_blocked_by_long_jobs(self):
+        short, longest = self._run([{FAST_IMAGE_QUEUE}, {VIDEO_QUEUE}])
+
+        # The fast pool picks up the image job immediately, while the video pool
+        # works through ~3 x LONG_JOB_SECONDS of video jobs
+        assert short < LONG_JOB_SECONDS
+        assert longest >= 3 * LONG_JOB_SECONDS
+
+
+class TestWorkerCli:
+    def test_invalid_pool_is_rejected(self):
+        from boards.workers.cli import main
+
+        result = CliRunner().invoke(main, ["--pool", "boards-video"])
+
+        assert result.exit_code != 0
+        assert "QUEUE[,QUEUE...]:THREADS" in result.output
+
+    def test_pools_are_started_per_queue_group(self, monkeypatch):
+        from boards.workers import cli
+
+        started = []
+        monkeypatch.setattr(
+            cli,
+            "start_pools",
+            lambda pools, processes, **kwargs: started.append((pools, processes)),
+        )
+
+        result = CliRunner().invoke(
+            cli.main, ["--pool", "boards-fast-image,boards-jobs:8", "--pool", "boards-video:2"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert started == [
+            ([(["boards-fast-image", "boards-jobs"], 8), (["boards-video"], 2)], 1),
+        ]
@@ -0,0 +1,99 @@
+"""
+Throughput benchmark: thread-per-job Dramatiq worker vs the async worker runtime.
+
+Both runtimes drain the same batch of jobs that run the `slow-gen` test
+generator, which only waits on a simulated provider. The thread worker is
+capped by its thread count; the async runtime by its concurrency.
+
+Skipped unless BOARDS_RUN_BENCHMARKS=1, e.g.:
+
+    BOARDS_RUN_BENCHMARKS=1 pytest tests/test_worker_runtime_benchmark.py -s
+"""
+
+import asyncio
+import os
+import time
+
+import dramatiq
+import pytest
+from dramatiq import Worker
+from dramatiq.brokers.stub import StubBroker
+from dramatiq.middleware import AsyncIO
+
+from boards.generators.testmods.slow_gen import SlowGen
+from boards.workers.async_runtime import AsyncWorker
+
+JOBS = int(os.environ.get("BOARDS_WORKER_BENCH_JOBS", "400"))
+DELAY_SECONDS = float(os.environ.get("BOARDS_WORKER_BENCH_DELAY", "0.2"))
+THREADS = 8
+CONCURRENCY = 200
+QUEUE = "boards-bench"
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("BOARDS_RUN_BENCHMARKS") != "1",
+    reason="Set BOARDS_RUN_BENCHMARKS=1 to run benchmarks",
+)
+
+
+def _broker() -> StubBroker:
+    broker = StubBroker()
+    broker.add_middleware(AsyncIO())
+    broker.emit_after("process_boot")
+    broker.declare_queue(QUEUE)
+    generator = SlowGen()
+
+    @dramatiq.actor(broker=broker, queue_name=QUEUE, max_retries=0)
+    async def slow_generation(i: int) -> None:
+        inputs = generator.get_input_schema()(text=str(i), delay_seconds=DELAY_SECONDS)
+        await generator.generate(inputs, None)
+
+    for i in range(JOBS):
+        slow_generation.send(i)
+    return broker
+
+
+def _run_thread_worker() -> float:
+    broker = _broker()
+    worker = Worker(broker, queues={QUEUE}, worker_threads=THREADS)
+    start = time.monotonic()
+    worker.start()
+    try:
+        broker.join(QUEUE, timeout=600_000)
+        worker.join()
+        return time.monotonic() - start
+    finally:
+        worker.stop()
+        broker.close()
+
+
+def _run_async_worker() -> float:
+    broker = _broker()
+
+    async def main() -> float:
+        worker = AsyncWorker(broker, queues=[QUEUE], concurrency=CONCURRENCY, worker_timeout=50)
+        start = time.monotonic()
+        task = asyncio.create_task(worker.run())
+        await asyncio.to_thread(broker.join, QUEUE, timeout=600_000)
+        elapsed = time.monotonic() - start
+        worker.stop()
+        await task
+        return elapsed
+
+    try:
+        return asyncio.run(main())
+    finally:
+        broker.close()
+
+
+def test_async_runtime_has_higher_throughput_than_threads():
+    threaded = _run_thread_worker()
+    async_ = _run_async_worker()
+
+    print()
+    for label, elapsed in (
+        (f"threads={THREADS}", threaded),
+        (f"async concurrency={CONCURRENCY}", async_),
+    ):
+        print(f"{label:>26}: {JOBS} jobs in {elapsed:.2f}s ({JOBS / elapsed:.0f} jobs/s)")
+
+    assert async_ < threaded
@@ -115,7 +115,10 @@ async def test_worker_integration(
     # This prevents ProgressPublisher.__init__ from trying to connect to Redis
     mock_redis = AsyncMock()
     mock_redis.publish = AsyncMock()
+    mock_redis.exists = AsyncMock(return_value=0)  # no cancellation requested
     monkeypatch.setattr("boards.progress.publisher.get_redis_client", lambda: mock_redis)
+    monkeypatch.setattr("boards.jobs.cancellation.get_redis_client", lambda: mock_redis)
+    monkeypatch.setattr("boards.workers.actors.settings.generation_admission_enabled", False)
 
     # Mock Redis progress publishing methods (avoid Redis dependency)
     async def fake_publish_progress(self, generation_id: UUID, update):